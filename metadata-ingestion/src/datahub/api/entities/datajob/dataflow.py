@@ -21,6 +21,7 @@ from datahub.utilities.urns.data_flow_urn import DataFlowUrn
 if TYPE_CHECKING:
     from datahub.emitter.kafka_emitter import DatahubKafkaEmitter
     from datahub.emitter.rest_emitter import DatahubRestEmitter
+    from datahub.emitter.spool_emitter import DatahubSpoolEmitter
 
 
 @dataclass
@@ -116,7 +117,9 @@ class DataFlow:
 
     def emit(
         self,
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         callback: Optional[Callable[[Exception, str], None]] = None,
     ) -> None:
         """
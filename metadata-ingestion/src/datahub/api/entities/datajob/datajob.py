@@ -26,6 +26,7 @@ from datahub.utilities.urns.dataset_urn import DatasetUrn
 if TYPE_CHECKING:
     from datahub.emitter.kafka_emitter import DatahubKafkaEmitter
     from datahub.emitter.rest_emitter import DatahubRestEmitter
+    from datahub.emitter.spool_emitter import DatahubSpoolEmitter
 
 
 @dataclass
@@ -159,7 +160,9 @@ class DataJob:
 
     def emit(
         self,
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         callback: Optional[Callable[[Exception, str], None]] = None,
     ) -> None:
         """
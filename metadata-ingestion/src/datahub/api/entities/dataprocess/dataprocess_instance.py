@@ -29,6 +29,7 @@ from datahub.utilities.urns.dataset_urn import DatasetUrn
 if TYPE_CHECKING:
     from datahub.emitter.kafka_emitter import DatahubKafkaEmitter
     from datahub.emitter.rest_emitter import DatahubRestEmitter
+    from datahub.emitter.spool_emitter import DatahubSpoolEmitter
 
 
 class DataProcessInstanceKey(DatahubKey):
@@ -106,7 +107,9 @@ class DataProcessInstance:
 
     def emit_process_start(
         self,
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         start_timestamp_millis: int,
         attempt: Optional[int] = None,
         emit_template: bool = True,
@@ -197,7 +200,9 @@ class DataProcessInstance:
 
     def emit_process_end(
         self,
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         end_timestamp_millis: int,
         result: InstanceRunResult,
         result_type: Optional[str] = None,
@@ -261,7 +266,9 @@ class DataProcessInstance:
     @staticmethod
     def _emit_mcp(
         mcp: MetadataChangeProposalWrapper,
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         callback: Optional[Callable[[Exception, str], None]] = None,
     ) -> None:
         """
@@ -273,7 +280,9 @@ class DataProcessInstance:
 
     def emit(
         self,
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         callback: Optional[Callable[[Exception, str], None]] = None,
     ) -> None:
         """
@@ -27,6 +27,7 @@ from datahub.ingestion.run.pipeline import Pipeline
 from datahub.telemetry import telemetry
 from datahub.upgrade import upgrade
 from datahub.utilities import memory_leak_detector
+from datahub.utilities.profiler import profile_to_file
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,12 @@ def ingest() -> None:
 @click.option(
     "--no-spinner", type=bool, is_flag=True, default=False, help="Turn off spinner"
 )
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Profile the ingestion run and write the profile to this file. Files ending in .html or .speedscope.json are written by the pyinstrument sampling profiler (pip install pyinstrument), all others by cProfile.",
+)
 @click.pass_context
 @telemetry.with_telemetry(
     capture_kwargs=[
@@ -120,6 +127,7 @@ def run(
     report_to: str,
     no_default_report: bool,
     no_spinner: bool,
+    profile: Optional[str],
 ) -> None:
     """Ingest metadata into DataHub."""
 
@@ -129,7 +137,8 @@ def run(
         logger.info("Starting metadata ingestion")
         with click_spinner.spinner(disable=no_spinner):
             try:
-                pipeline.run()
+                with profile_to_file(profile):
+                    pipeline.run()
             except Exception as e:
                 logger.info(
                     f"Source ({pipeline.config.source.type}) report:\n{pipeline.source.get_report().as_string()}"
@@ -0,0 +1,55 @@
+from enum import auto
+from typing import List, Optional
+
+import pydantic
+from pydantic import Field
+
+from datahub.configuration._config_enum import ConfigEnum
+from datahub.configuration.common import ConfigModel
+
+
+class HttpCacheMode(ConfigEnum):
+    # Serve fresh responses from the cache, fetch and store everything else.
+    CACHE = auto()
+    # Always fetch from the API and store the responses, e.g. to create a recording for replay.
+    RECORD = auto()
+    # Only serve responses from the cache. Requests that were not recorded fail.
+    REPLAY = auto()
+
+
+class HttpCacheConfig(ConfigModel):
+    mode: HttpCacheMode = Field(
+        default=HttpCacheMode.CACHE,
+        description="One of `CACHE` (serve fresh responses from the cache and fetch the rest), `RECORD` (always fetch and store responses) or `REPLAY` (serve responses only from the cache, without any network access).",
+    )
+    path: str = Field(
+        default="~/.datahub/http_cache/responses.db",
+        description="Path to the SQLite file the responses are persisted in. The same file can be shared across runs and sources, since the responses are keyed by the credentials or the tenant of the source.",
+    )
+    ttl_seconds: Optional[pydantic.PositiveInt] = Field(
+        default=24 * 60 * 60,
+        description="Responses older than this are refetched in `CACHE` mode. Set to null to never expire responses. Ignored in `REPLAY` mode.",
+    )
+    methods: List[str] = Field(
+        default=["GET"],
+        description="HTTP methods whose responses are cached. Add `POST` for read-only APIs that use POST, e.g. GraphQL endpoints.",
+    )
+    ignored_query_params: List[str] = Field(
+        default=["access_token", "api_key", "token"],
+        description="Query parameters that carry credentials. Like the authentication headers, they are only part of the cache key as a hash, and only for sources that don't key their responses by tenant.",
+    )
+    key_headers: List[str] = Field(
+        default=["Accept", "Content-Type"],
+        description="Request headers that are part of the cache key. All other headers are ignored, except for the authentication headers, see `ignored_query_params`.",
+    )
+
+    @pydantic.validator("methods", each_item=True)
+    def methods_must_be_upper_case(cls, v: str) -> str:
+        return v.upper()
+
+
+class HttpCacheConfigMixin(ConfigModel):
+    http_cache: Optional[HttpCacheConfig] = Field(
+        default=None,
+        description="Caches the responses of the source's HTTP API calls on disk. Useful to speed up repeated runs and to replay a run offline when debugging.",
+    )
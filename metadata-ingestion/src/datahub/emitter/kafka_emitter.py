@@ -1,9 +1,17 @@
+import functools
+import io
+import json
 import logging
-from typing import Callable, Dict, Optional, Union
+import struct
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union
 
+import fastavro
 import pydantic
-from confluent_kafka import SerializingProducer
-from confluent_kafka.schema_registry import SchemaRegistryClient
+from confluent_kafka import Producer, SerializingProducer
+from confluent_kafka.schema_registry import Schema, SchemaRegistryClient
 from confluent_kafka.schema_registry.avro import AvroSerializer
 from confluent_kafka.serialization import SerializationContext, StringSerializer
 
@@ -28,6 +36,18 @@ DEFAULT_MCP_KAFKA_TOPIC = "MetadataChangeProposal_v1"
 MCE_KEY = "MetadataChangeEvent"
 MCP_KEY = "MetadataChangeProposal"
 
+# Producer defaults of the high throughput mode, which favour larger, compressed
+# batches over the latency of individual records. They can be overridden through
+# the producer_config.
+HIGH_THROUGHPUT_PRODUCER_CONFIG = {
+    "linger.ms": 100,
+    "batch.num.messages": 10000,
+    "compression.type": "lz4",
+}
+
+# The magic byte and schema id that prefix values in the Confluent wire format.
+_WIRE_FORMAT_HEADER = struct.Struct(">bI")
+
 
 class KafkaEmitterConfig(ConfigModel):
     connection: KafkaProducerConnectionConfig = pydantic.Field(
@@ -47,6 +67,20 @@ class KafkaEmitterConfig(ConfigModel):
         },
     )
 
+    high_throughput: bool = pydantic.Field(
+        default=False,
+        description="Serialize records with an Avro writer and schema ids that are prepared once, "
+        "poll for delivery reports from a background thread instead of after every record, and use "
+        "producer defaults that favour throughput over latency (linger.ms, batch.num.messages and "
+        "compression.type, which the producer_config overrides).",
+    )
+    serialization_workers: pydantic.NonNegativeInt = pydantic.Field(
+        default=0,
+        description="In the high throughput mode, the number of threads that serialize records. "
+        "Records are still produced in order. This lets serialization overlap with the rest of the "
+        "pipeline, e.g. a source waiting on the network. When 0, records are serialized by the caller.",
+    )
+
     @pydantic.validator("topic_routes")
     def validate_topic_routes(cls, v: Dict[str, str]) -> Dict[str, str]:
         assert MCE_KEY in v, f"topic_routes must contain a route for {MCE_KEY}"
@@ -54,6 +88,41 @@ class KafkaEmitterConfig(ConfigModel):
         return v
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_avro_schema(schema_str: str) -> Any:
+    return fastavro.parse_schema(json.loads(schema_str))
+
+
+class AvroValueSerializer:
+    """
+    Serializes records to the Confluent wire format, like AvroSerializer, but registers
+    the schema once up front and reuses the parsed schema for every record.
+    """
+
+    def __init__(
+        self,
+        schema_registry_client: SchemaRegistryClient,
+        schema_str: str,
+        topic: str,
+    ):
+        # AvroSerializer registers the schema under the subject named after the topic.
+        self.schema_id = schema_registry_client.register_schema(
+            f"{topic}-value", Schema(schema_str, schema_type="AVRO")
+        )
+        self._parsed_schema = _parse_avro_schema(schema_str)
+        self._header = _WIRE_FORMAT_HEADER.pack(0, self.schema_id)
+
+    def __call__(self, obj: dict) -> bytes:
+        with io.BytesIO() as fo:
+            fo.write(self._header)
+            fastavro.schemaless_writer(fo, self._parsed_schema, obj)
+            return fo.getvalue()
+
+
+# A record being serialized, as (route key, kafka key, serialized value, callback).
+_PendingRecord = Tuple[str, str, "Future[bytes]", Callable[[Exception, str], None]]
+
+
 class DatahubKafkaEmitter:
     def __init__(self, config: KafkaEmitterConfig):
         self.config = config
@@ -63,6 +132,10 @@ class DatahubKafkaEmitter:
         }
         schema_registry_client = SchemaRegistryClient(schema_registry_conf)
 
+        if self.config.high_throughput:
+            self._init_high_throughput(schema_registry_client)
+            return
+
         def convert_mce_to_dict(
             mce: MetadataChangeEvent, ctx: SerializationContext
         ) -> dict:
@@ -106,6 +179,44 @@ class DatahubKafkaEmitter:
             key: SerializingProducer(value) for (key, value) in producers_config.items()
         }
 
+    def _init_high_throughput(
+        self, schema_registry_client: SchemaRegistryClient
+    ) -> None:
+        self.serializers = {
+            MCE_KEY: AvroValueSerializer(
+                schema_registry_client,
+                getMetadataChangeEventSchema(),
+                self.config.topic_routes[MCE_KEY],
+            ),
+            MCP_KEY: AvroValueSerializer(
+                schema_registry_client,
+                getMetadataChangeProposalSchema(),
+                self.config.topic_routes[MCP_KEY],
+            ),
+        }
+        producer_config: Dict[str, Any] = {
+            "bootstrap.servers": self.config.connection.bootstrap,
+            **HIGH_THROUGHPUT_PRODUCER_CONFIG,
+            **self.config.connection.producer_config,
+        }
+        self.producers = {key: Producer(producer_config) for key in self.serializers}
+
+        self._serialization_executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Deque[_PendingRecord] = deque()
+        if self.config.serialization_workers:
+            self._serialization_executor = ThreadPoolExecutor(
+                max_workers=self.config.serialization_workers,
+                thread_name_prefix="kafka-emitter-serializer",
+            )
+
+        # Delivery reports are served by a background thread, so that the producers
+        # do not need to be polled after every record.
+        self._closed = threading.Event()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop, name="kafka-emitter-poller", daemon=True
+        )
+        self._poll_thread.start()
+
     def emit(
         self,
         item: Union[
@@ -125,6 +236,10 @@ class DatahubKafkaEmitter:
         mce: MetadataChangeEvent,
         callback: Callable[[Exception, str], None],
     ) -> None:
+        if self.config.high_throughput:
+            self._emit_serialized(MCE_KEY, mce.proposedSnapshot.urn, mce, callback)
+            return
+
         # Call poll to trigger any callbacks on success / failure of previous writes
         producer: SerializingProducer = self.producers[MCE_KEY]
         producer.poll(0)
@@ -140,6 +255,11 @@ class DatahubKafkaEmitter:
         mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper],
         callback: Callable[[Exception, str], None],
     ) -> None:
+        if self.config.high_throughput:
+            assert mcp.entityUrn is not None
+            self._emit_serialized(MCP_KEY, mcp.entityUrn, mcp, callback)
+            return
+
         # Call poll to trigger any callbacks on success / failure of previous writes
         producer: SerializingProducer = self.producers[MCP_KEY]
         producer.poll(0)
@@ -150,10 +270,97 @@ class DatahubKafkaEmitter:
             on_delivery=callback,
         )
 
+    def _emit_serialized(
+        self,
+        route_key: str,
+        key: str,
+        item: Union[
+            MetadataChangeEvent, MetadataChangeProposal, MetadataChangeProposalWrapper
+        ],
+        callback: Callable[[Exception, str], None],
+    ) -> None:
+        if self._serialization_executor is None:
+            try:
+                value = self.serializers[route_key](item.to_obj(tuples=True))
+            except Exception as e:
+                callback(e, f"Failed to serialize {key}")
+                return
+            self._produce(route_key, key, value, callback)
+            return
+
+        future = self._serialization_executor.submit(
+            lambda: self.serializers[route_key](item.to_obj(tuples=True))
+        )
+        self._pending.append((route_key, key, future, callback))
+        # Produce the records that are serialized, in order, and bound the number of
+        # records waiting to be produced.
+        max_pending = 100 * self.config.serialization_workers
+        while self._pending and (
+            self._pending[0][2].done() or len(self._pending) > max_pending
+        ):
+            self._produce_pending(*self._pending.popleft())
+
+    def _produce_pending(
+        self,
+        route_key: str,
+        key: str,
+        future: "Future[bytes]",
+        callback: Callable[[Exception, str], None],
+    ) -> None:
+        try:
+            value = future.result()
+        except Exception as e:
+            callback(e, f"Failed to serialize {key}")
+            return
+        self._produce(route_key, key, value, callback)
+
+    def _produce(
+        self,
+        route_key: str,
+        key: str,
+        value: bytes,
+        callback: Callable[[Exception, str], None],
+    ) -> None:
+        producer = self.producers[route_key]
+        while True:
+            try:
+                producer.produce(
+                    topic=self.config.topic_routes[route_key],
+                    key=key.encode("utf-8"),
+                    value=value,
+                    on_delivery=callback,
+                )
+                return
+            except BufferError:
+                # The local queue of the producer is full. Wait for some of it to
+                # be delivered.
+                producer.poll(0.1)
+
+    def _poll_loop(self) -> None:
+        while not self._closed.is_set():
+            for producer in self.producers.values():
+                try:
+                    producer.poll(0.1)
+                except Exception:
+                    # Exceptions raised by the delivery callbacks are re-raised by
+                    # poll(), and must not stop the delivery reports of later records.
+                    logger.exception("Failed to process Kafka delivery reports")
+
     def flush(self) -> None:
+        if self.config.high_throughput:
+            while self._pending:
+                self._produce_pending(*self._pending.popleft())
         for producer in self.producers.values():
             producer.flush()
 
+    def close(self) -> None:
+        self.flush()
+        if self.config.high_throughput:
+            self._closed.set()
+            self._poll_thread.join()
+            if self._serialization_executor is not None:
+                self._serialization_executor.shutdown()
+
 
 def _error_reporting_callback(err: Exception, msg: str) -> None:
     if err:
@@ -3,6 +3,7 @@ import functools
 import json
 import logging
 import os
+import threading
 from json.decoder import JSONDecodeError
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
@@ -69,6 +70,11 @@ class DataHubRestEmitter(Closeable):
         self.server_config: Dict[str, Any] = {}
         self.server_telemetry_id: str = ""
 
+        # Totals across all emit calls, which may run concurrently.
+        self.bytes_sent = 0
+        self.retries = 0
+        self._stats_lock = threading.Lock()
+
         self._session = requests.Session()
 
         self._session.headers.update(
@@ -253,6 +259,7 @@ class DataHubRestEmitter(Closeable):
         )
         try:
             response = self._session.post(url, data=payload)
+            self._record_request_stats(payload, response)
             response.raise_for_status()
         except HTTPError as e:
             try:
@@ -270,6 +277,14 @@ class DataHubRestEmitter(Closeable):
                 "Unable to emit metadata to DataHub GMS", {"message": str(e)}
             ) from e
 
+    def _record_request_stats(self, payload: str, response: requests.Response) -> None:
+        # urllib3 keeps the history of retried attempts on the raw response.
+        retry_history = getattr(getattr(response.raw, "retries", None), "history", ())
+        with self._stats_lock:
+            # json.dumps escapes all non-ASCII characters, so characters are bytes.
+            self.bytes_sent += len(payload)
+            self.retries += len(retry_history or ())
+
     def __repr__(self) -> str:
         token_str = (
             f" with token: {self._token[:4]}**********{self._token[-4:]}"
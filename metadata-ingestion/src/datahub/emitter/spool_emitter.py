@@ -0,0 +1,336 @@
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
+    MetadataChangeEvent,
+    MetadataChangeProposal,
+)
+from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+
+if TYPE_CHECKING:
+    from datahub.emitter.kafka_emitter import DatahubKafkaEmitter
+    from datahub.emitter.rest_emitter import DatahubRestEmitter
+
+logger = logging.getLogger(__name__)
+
+_MAX_RETRY_INTERVAL_SEC = 300
+
+_ITEM_CLASSES: Dict[
+    str, Type[Union[MetadataChangeEvent, MetadataChangeProposal, UsageAggregation]]
+] = {
+    "mce": MetadataChangeEvent,
+    "mcp": MetadataChangeProposal,
+    "usage": UsageAggregation,
+}
+
+_SpoolItem = Union[
+    MetadataChangeEvent,
+    MetadataChangeProposal,
+    MetadataChangeProposalWrapper,
+    UsageAggregation,
+]
+
+# A spooled item, as (id, attempts, kind, payload).
+_SpoolRow = Tuple[int, int, str, str]
+
+
+def _item_kind(item: _SpoolItem) -> str:
+    if isinstance(item, MetadataChangeEvent):
+        return "mce"
+    elif isinstance(item, (MetadataChangeProposal, MetadataChangeProposalWrapper)):
+        return "mcp"
+    elif isinstance(item, UsageAggregation):
+        return "usage"
+    raise ValueError(f"Cannot spool {type(item).__name__}")
+
+
+class DatahubSpoolEmitter:
+    """
+    Emits metadata by appending it to a local SQLite spool, and sends it to DataHub
+    from a background thread.
+
+    emit() only writes to the local spool, so it takes a few milliseconds regardless of
+    how slow or unavailable DataHub is. The background thread sends the spooled items
+    in batches through a single underlying emitter, so that its connection is reused.
+    Items that fail to send stay in the spool and are retried with an exponential
+    backoff, until they fail `max_attempts` times.
+
+    Several processes can share a spool file. Each item is claimed by one process at a
+    time, and items left behind by a process that exited are sent by the next one.
+    """
+
+    def __init__(
+        self,
+        make_emitter: Callable[[], Union["DatahubRestEmitter", "DatahubKafkaEmitter"]],
+        spool_path: str,
+        batch_size: int = 100,
+        flush_interval_sec: float = 1.0,
+        flush_timeout_sec: float = 5.0,
+        max_attempts: int = 10,
+        claim_timeout_sec: float = 300.0,
+    ):
+        """
+        :param make_emitter: Creates the emitter that sends the metadata to DataHub. It is called lazily by the background thread.
+        :param spool_path: The path of the SQLite database used as the spool.
+        :param batch_size: The maximum number of items sent per batch.
+        :param flush_interval_sec: How long the background thread waits for new items when the spool is empty.
+        :param flush_timeout_sec: How long close() and the exit of the process wait for the spool to be sent.
+        :param max_attempts: The number of failed attempts after which an item is dropped.
+        :param claim_timeout_sec: After how long items claimed by a process that did not send them can be claimed again.
+        """
+        self._make_emitter = make_emitter
+        self._emitter: Optional[
+            Union["DatahubRestEmitter", "DatahubKafkaEmitter"]
+        ] = None
+        self.spool_path = spool_path
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_sec
+        self.flush_timeout_sec = flush_timeout_sec
+        self.max_attempts = max_attempts
+        self.claim_timeout_sec = claim_timeout_sec
+
+        # The connection is shared by the callers and the background thread.
+        self._lock = threading.Lock()
+        self._emitter_lock = threading.Lock()
+        # The rows claimed by this emitter that are being sent.
+        self._claimed_ids: Set[int] = set()
+        self._conn = sqlite3.connect(
+            spool_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS spool ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "kind TEXT NOT NULL, "
+            "payload TEXT NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, "
+            "available_at REAL NOT NULL)"
+        )
+
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="datahub-spool-emitter", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def emit(
+        self,
+        item: _SpoolItem,
+        callback: Optional[Callable[[Exception, str], None]] = None,
+    ) -> None:
+        """
+        Appends the item to the spool. The callback is not called, since the item is
+        sent later. Failures to send it are logged by the background thread.
+        """
+        payload = json.dumps(item.to_obj())
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO spool (kind, payload, available_at) VALUES (?, ?, 0)",
+                (_item_kind(item), payload),
+            )
+        self._wakeup.set()
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+
+    def flush(self, timeout_sec: Optional[float] = None) -> None:
+        """
+        Sends the items that are ready to be sent from the calling thread, until the
+        spool is empty or the timeout expires. The timeout is checked before each item,
+        so it is exceeded by at most the time it takes to send one item.
+        """
+        deadline = time.time() + timeout_sec if timeout_sec is not None else None
+        while deadline is None or time.time() < deadline:
+            if not self._send_batch(deadline):
+                break
+
+    def close(self) -> None:
+        if self._stopping:
+            return
+        start = time.time()
+        try:
+            self.flush(self.flush_timeout_sec)
+        except Exception:
+            logger.exception("Failed to flush the spool before closing")
+        self._stopping = True
+        self._wakeup.set()
+        # Wait for the batch that the background thread may be sending.
+        self._thread.join(
+            timeout=max(0.0, self.flush_timeout_sec - (time.time() - start))
+        )
+
+        with self._lock:
+            # Release the rows that the background thread is still sending, so that
+            # the next emitter using the spool does not wait for the claims to expire.
+            self._conn.executemany(
+                "UPDATE spool SET available_at = 0 WHERE id = ?",
+                [(row_id,) for row_id in self._claimed_ids],
+            )
+            pending = self._conn.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+            self._closed = True
+            self._conn.close()
+        if pending:
+            logger.info(
+                f"{pending} items remain in the spool {self.spool_path} and will be sent by the next emitter using it"
+            )
+        if self._emitter is not None and hasattr(self._emitter, "close"):
+            self._emitter.close()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while not self._stopping:
+            try:
+                sent_any = self._send_batch()
+            except Exception:
+                logger.exception("Failed to send a batch of the spool to DataHub")
+                sent_any = False
+            if not sent_any and not self._stopping:
+                self._wakeup.wait(self.flush_interval_sec)
+                self._wakeup.clear()
+
+    def _claim_batch(self) -> List[_SpoolRow]:
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                return []
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows: List[_SpoolRow] = self._conn.execute(
+                    "SELECT id, attempts, kind, payload FROM spool "
+                    "WHERE available_at <= ? ORDER BY id LIMIT ?",
+                    (now, self.batch_size),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE spool SET available_at = ? WHERE id = ?",
+                    [(now + self.claim_timeout_sec, row[0]) for row in rows],
+                )
+                self._conn.execute("COMMIT")
+                self._claimed_ids.update(row[0] for row in rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return rows
+
+    def _get_emitter(self) -> Union["DatahubRestEmitter", "DatahubKafkaEmitter"]:
+        # flush() and close() may send from the calling thread at the same time as
+        # the background thread.
+        with self._emitter_lock:
+            if self._emitter is None:
+                self._emitter = self._make_emitter()
+            return self._emitter
+
+    def _should_stop_sending(self, deadline: Optional[float]) -> bool:
+        if deadline is not None:
+            return time.time() >= deadline
+        # The background thread stops sending once the emitter is closing.
+        return self._stopping
+
+    def _send_batch(self, deadline: Optional[float] = None) -> bool:
+        """
+        Sends one batch of the spool. Returns False if there was nothing to send.
+
+        If the deadline expires, or the emitter is closing, the items of the batch that
+        were not sent yet are released, so that they can be sent later.
+        """
+        rows = self._claim_batch()
+        if not rows:
+            return False
+
+        failures: Dict[int, str] = {}
+        unsent_ids: List[int] = []
+        try:
+            emitter = self._get_emitter()
+            for row_id, _, kind, payload in rows:
+                if self._should_stop_sending(deadline):
+                    unsent_ids.append(row_id)
+                    continue
+
+                def callback(err: Exception, msg: str, row_id: int = row_id) -> None:
+                    if err:
+                        failures[row_id] = str(err)
+
+                try:
+                    item = _ITEM_CLASSES[kind].from_obj(json.loads(payload))
+                    emitter.emit(item, callback)
+                except Exception as e:
+                    failures[row_id] = str(e)
+            if hasattr(emitter, "flush"):
+                # The Kafka emitter sends asynchronously.
+                emitter.flush()
+        except Exception as e:
+            # Without an emitter, none of the items could be sent.
+            for row_id, *_ in rows:
+                failures.setdefault(row_id, str(e))
+
+        self._complete_batch(rows, failures, unsent_ids)
+        return True
+
+    def _complete_batch(
+        self, rows: List[_SpoolRow], failures: Dict[int, str], unsent_ids: List[int]
+    ) -> None:
+        now = time.time()
+        sent_ids = []
+        retries = []
+        dropped_ids = []
+        released_ids = []
+        for row_id, attempts, _, _ in rows:
+            if row_id in unsent_ids:
+                released_ids.append((row_id,))
+            elif row_id not in failures:
+                sent_ids.append((row_id,))
+            elif attempts + 1 >= self.max_attempts:
+                logger.error(
+                    f"Dropping spooled item {row_id} after {attempts + 1} failed attempts: {failures[row_id]}"
+                )
+                dropped_ids.append((row_id,))
+            else:
+                logger.warning(
+                    f"Failed to send spooled item {row_id}, will retry: {failures[row_id]}"
+                )
+                retry_interval = min(
+                    self.flush_interval_sec * 2 ** (attempts + 1),
+                    _MAX_RETRY_INTERVAL_SEC,
+                )
+                retries.append((attempts + 1, now + retry_interval, row_id))
+
+        with self._lock:
+            if self._closed:
+                # The claims were released by close(), so the next emitter using the
+                # spool sends the items again.
+                return
+            self._claimed_ids.difference_update(row[0] for row in rows)
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany("DELETE FROM spool WHERE id = ?", sent_ids)
+                self._conn.executemany("DELETE FROM spool WHERE id = ?", dropped_ids)
+                self._conn.executemany(
+                    "UPDATE spool SET attempts = ?, available_at = ? WHERE id = ?",
+                    retries,
+                )
+                self._conn.executemany(
+                    "UPDATE spool SET available_at = 0 WHERE id = ?", released_ids
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
@@ -10,6 +10,10 @@ class PipelineRunListener(ABC):
         # Perform
         pass
 
+    def on_progress(self, report: Dict[str, Any], ctx: PipelineContext) -> None:
+        # Called periodically while the pipeline is running.
+        pass
+
     @abstractmethod
     def on_completion(
         self,
@@ -1,4 +1,5 @@
 import datetime
+import threading
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Generic, Optional, Type, TypeVar, cast
@@ -7,6 +8,7 @@ from datahub.configuration.common import ConfigModel
 from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope, WorkUnit
 from datahub.ingestion.api.report import Report
+from datahub.utilities.histogram import Histogram
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.type_annotations import get_class_from_annotation
 
@@ -21,14 +23,46 @@ class SinkReport(Report):
     current_time: Optional[datetime.datetime] = None
     total_duration_in_seconds: Optional[float] = None
 
+    # Only sinks that write asynchronously have pending requests.
+    pending_requests: int = 0
+    pending_requests_histogram: Histogram = field(default_factory=Histogram)
+    write_latency_seconds: Histogram = field(default_factory=Histogram)
+    bytes_sent: int = 0
+    retries: int = 0
+
+    def __post_init__(self) -> None:
+        # Asynchronous sinks report from their writer and callback threads.
+        self._lock = threading.Lock()
+
     def report_record_written(self, record_envelope: RecordEnvelope) -> None:
-        self.total_records_written += 1
+        with self._lock:
+            self.total_records_written += 1
+
+    def report_write_latency(self, delta: datetime.timedelta) -> None:
+        with self._lock:
+            self.write_latency_seconds.record(delta.total_seconds())
+
+    def report_bytes_sent(self, num_bytes: int) -> None:
+        with self._lock:
+            self.bytes_sent += num_bytes
+
+    def report_request_submitted(self) -> None:
+        """Must be called before the request is handed over, so that it cannot complete first."""
+        with self._lock:
+            self.pending_requests += 1
+            self.pending_requests_histogram.record(self.pending_requests)
+
+    def report_request_completed(self) -> None:
+        with self._lock:
+            self.pending_requests -= 1
 
     def report_warning(self, info: Any) -> None:
-        self.warnings.append(info)
+        with self._lock:
+            self.warnings.append(info)
 
     def report_failure(self, info: Any) -> None:
-        self.failures.append(info)
+        with self._lock:
+            self.failures.append(info)
 
     def compute_stats(self) -> None:
         super().compute_stats()
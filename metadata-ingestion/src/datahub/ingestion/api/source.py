@@ -1,21 +1,39 @@
 import datetime
+import threading
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, Generic, Iterable, Optional, Set, Type, TypeVar, Union, cast
+from enum import Enum, auto
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic import BaseModel
 
+from datahub.configuration._config_enum import ConfigEnum
 from datahub.configuration.common import ConfigModel
-from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope, WorkUnit
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
+from datahub.utilities.file_backed_collections import (
+    ConnectionWrapper,
+    FileBackedDict,
+)
+from datahub.utilities.hyperloglog import HyperLogLog
 from datahub.utilities.lossy_collections import LossyDict, LossyList
 from datahub.utilities.type_annotations import get_class_from_annotation
+from datahub.utilities.urns.urn import guess_entity_type
 
 
 class SourceCapability(Enum):
@@ -34,12 +52,29 @@ class SourceCapability(Enum):
     CONTAINERS = "Asset Containers"
 
 
+class EntityTrackingMode(ConfigEnum):
+    # Keep every urn in memory, for exact counts of distinct entities.
+    EXACT = auto()
+    # Estimate the counts of distinct entities with HyperLogLog, in constant memory.
+    APPROXIMATE = auto()
+    # Keep every urn in a temporary SQLite file, for exact counts with little memory.
+    DISK = auto()
+
+
 @dataclass
 class SourceReport(Report):
     events_produced: int = 0
     events_produced_per_sec: int = 0
 
+    # How distinct entities are counted. Only samples of the urns are reported,
+    # but the EXACT mode keeps all of them in memory to deduplicate them.
+    _entity_tracking: EntityTrackingMode = EntityTrackingMode.EXACT
     _urns_seen: Set[str] = field(default_factory=set)
+    _urns_seen_on_disk: Optional[FileBackedDict[bool]] = None
+    _distinct_entities: Dict[str, HyperLogLog] = field(
+        default_factory=lambda: defaultdict(HyperLogLog)
+    )
+
     entities: Dict[str, list] = field(default_factory=lambda: defaultdict(LossyList))
     aspects: Dict[str, Dict[str, int]] = field(
         default_factory=lambda: defaultdict(lambda: defaultdict(int))
@@ -54,23 +89,50 @@ class SourceReport(Report):
         if isinstance(wu, MetadataWorkUnit):
             urn = wu.get_urn()
 
-            # Specialized entity reporting.
-            if not isinstance(wu.metadata, MetadataChangeEvent):
-                mcps = [wu.metadata]
+            # Specialized entity reporting. The aspect names are read directly
+            # from MCEs, without decomposing them into MCPs.
+            aspectNames: List[Optional[str]]
+            if isinstance(wu.metadata, MetadataChangeEvent):
+                entityType = guess_entity_type(urn)
+                aspectNames = [
+                    aspect.get_aspect_name()
+                    for aspect in wu.metadata.proposedSnapshot.aspects
+                ]
             else:
-                mcps = list(mcps_from_mce(wu.metadata))
-
-            for mcp in mcps:
-                entityType = mcp.entityType
-                aspectName = mcp.aspectName
+                entityType = wu.metadata.entityType
+                aspectNames = [wu.metadata.aspectName]
 
-                if urn not in self._urns_seen:
-                    self._urns_seen.add(urn)
-                    self.entities[entityType].append(urn)
+            if aspectNames and self._is_new_entity(entityType, urn):
+                self.entities[entityType].append(urn)
 
+            for aspectName in aspectNames:
                 if aspectName is not None:  # usually true
                     self.aspects[entityType][aspectName] += 1
 
+    def _is_new_entity(self, entityType: str, urn: str) -> bool:
+        if self._entity_tracking == EntityTrackingMode.APPROXIMATE:
+            # The sketch never changes for urns that were added before, so
+            # only new urns are sampled. Some new urns are not sampled, the
+            # totals are corrected in compute_stats().
+            return self._distinct_entities[entityType].add(urn)
+        elif self._entity_tracking == EntityTrackingMode.DISK:
+            # Workunits may be reported from several threads, see max_workers.
+            with self._urns_seen_on_disk_lock:
+                if self._urns_seen_on_disk is None:
+                    self._urns_seen_on_disk = FileBackedDict[bool](
+                        shared_connection=ConnectionWrapper(allow_cross_thread=True),
+                        tablename="urns_seen",
+                    )
+                if urn in self._urns_seen_on_disk:
+                    return False
+                self._urns_seen_on_disk[urn] = True
+                return True
+        else:
+            if urn in self._urns_seen:
+                return False
+            self._urns_seen.add(urn)
+            return True
+
     def report_warning(self, key: str, reason: str) -> None:
         warnings = self.warnings.get(key, LossyList())
         warnings.append(reason)
@@ -84,6 +146,22 @@ class SourceReport(Report):
     def __post_init__(self) -> None:
         self.start_time = datetime.datetime.now()
         self.running_time: datetime.timedelta = datetime.timedelta(seconds=0)
+        self._urns_seen_on_disk_lock = threading.Lock()
+
+    def set_entity_tracking(self, entity_tracking: EntityTrackingMode) -> None:
+        """Must be called before any workunit is reported."""
+        assert self.events_produced == 0, "workunits were already reported"
+        self._entity_tracking = entity_tracking
+
+    def close(self) -> None:
+        """Releases the urns tracked on disk. The reported samples are kept."""
+        with self._urns_seen_on_disk_lock:
+            if self._urns_seen_on_disk is not None:
+                connection = self._urns_seen_on_disk.shared_connection
+                self._urns_seen_on_disk.close()
+                if connection:
+                    connection.close()
+                self._urns_seen_on_disk = None
 
     def compute_stats(self) -> None:
         duration = datetime.datetime.now() - self.start_time
@@ -96,6 +174,13 @@ class SourceReport(Report):
         else:
             self.read_rate = 0
 
+        for entityType, distinct_entities in self._distinct_entities.items():
+            samples = self.entities[entityType]
+            estimate = distinct_entities.count()
+            if isinstance(samples, LossyList) and estimate > samples.total_elements:
+                samples.total_elements = estimate
+                samples.sampled = True
+
 
 class CapabilityReport(BaseModel):
     """A report capturing the result of any capability evaluation"""
@@ -3,7 +3,7 @@ import logging
 from dataclasses import dataclass
 from enum import Enum
 from json.decoder import JSONDecodeError
-from typing import Any, Dict, Iterable, List, Optional, Type
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, cast
 
 from avro.schema import RecordSchema
 from deprecated import deprecated
@@ -27,11 +27,17 @@ from datahub.metadata.schema_classes import (
     OwnershipClass,
     SchemaMetadataClass,
     TelemetryClientIdClass,
+    _Aspect,
 )
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.urns.urn import Urn, guess_entity_type
 
 logger = logging.getLogger(__name__)
 
+# GMS (Jetty) rejects requests whose request line and headers exceed 8KB by default,
+# so the URLs of batch gets are kept well below it.
+_MAX_BATCH_GET_URL_LENGTH = 6000
+
 
 telemetry_enabled = get_boolean_env_variable("DATAHUB_TELEMETRY_ENABLED", True)
 
@@ -55,6 +61,60 @@ class DatahubClientConfig(ConfigModel):
 DataHubGraphConfig = DatahubClientConfig
 
 
+class EntityAspects:
+    """
+    The aspects of an entity returned by a batch read. The aspects are decoded when
+    they are first accessed, so that callers only pay for the aspects they use.
+    """
+
+    def __init__(self, urn: str, aspects_json: Dict[str, Dict[str, Any]]):
+        self.urn = urn
+        self._aspects_json = aspects_json
+        self._decoded: Dict[str, _Aspect] = {}
+
+    @property
+    def aspect_names(self) -> List[str]:
+        return list(self._aspects_json.keys())
+
+    def has_aspect(self, aspect_type: Type[_Aspect]) -> bool:
+        return aspect_type.get_aspect_name() in self._aspects_json
+
+    def get_aspect(self, aspect_type: Type[Aspect]) -> Optional[Aspect]:
+        aspect_name = aspect_type.get_aspect_name()
+        if aspect_name not in self._decoded:
+            aspect_json = self._aspects_json.get(aspect_name)
+            if not aspect_json:
+                return None
+            # need to apply a transform to the response to match rest.li and avro serialization
+            post_json_obj = post_json_transform(aspect_json)
+            self._decoded[aspect_name] = aspect_type.from_obj(post_json_obj["value"])
+        return cast(Aspect, self._decoded[aspect_name])
+
+
+def _batch_urns(
+    urns: Iterable[str], batch_size: int, max_ids_length: int
+) -> Iterator[List[str]]:
+    """
+    Splits the urns into batches of at most batch_size urns, whose comma separated list
+    of url-encoded urns fits in max_ids_length. An urn that is too long on its own is
+    still fetched, in a batch of its own.
+    """
+    batch: List[str] = []
+    batch_length = 0
+    for urn in urns:
+        urn_length = len(Urn.url_encode(urn))
+        if batch and (
+            len(batch) >= batch_size or batch_length + 1 + urn_length > max_ids_length
+        ):
+            yield batch
+            batch = []
+            batch_length = 0
+        batch_length += urn_length + (1 if batch else 0)
+        batch.append(urn)
+    if batch:
+        yield batch
+
+
 class DataHubGraph(DatahubRestEmitter):
     def __init__(self, config: DatahubClientConfig) -> None:
         self.config = config
@@ -352,6 +412,62 @@ class DataHubGraph(DatahubRestEmitter):
 
         return result
 
+    def get_entities_aspects(
+        self,
+        entity_urns: Iterable[str],
+        aspect_types: List[Type[_Aspect]],
+        batch_size: int = 50,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, EntityAspects]:
+        """
+        Get multiple aspects for many entities, using the batch get endpoint of GMS.
+        The urns are fetched in batches of up to `batch_size`, with up to `max_workers`
+        batches in flight at a time. A batch is also split when its URL would get too long
+        for GMS, so long urns may be fetched in smaller batches.
+
+        :param entity_urns: The urns of the entities. Duplicates are only fetched once.
+        :param aspect_types: The aspect type classes being requested (e.g. [datahub.metadata.schema_classes.DatasetPropertiesClass])
+        :param batch_size: The maximum number of urns per request.
+        :param max_workers: The number of concurrent requests. Defaults to the max_threads of the client config.
+        :return: A map of urn to the aspects of the entity, which are decoded on access. Entities that do not exist are omitted.
+        :raises OperationalError: if a request fails
+        """
+        assert batch_size >= 1
+        urns = list(dict.fromkeys(entity_urns))
+        aspect_names = [aspect_type.get_aspect_name() for aspect_type in aspect_types]
+        max_ids_length = _MAX_BATCH_GET_URL_LENGTH - len(
+            self._get_batch_get_url("", aspect_names)
+        )
+        batches = [
+            (batch_urns, aspect_names)
+            for batch_urns in _batch_urns(urns, batch_size, max_ids_length)
+        ]
+
+        result: Dict[str, EntityAspects] = {}
+        for future in BackpressureAwareExecutor.map_ordered(
+            self._batch_get_aspects,
+            batches,
+            max_workers=max_workers or self.config.max_threads,
+        ):
+            result.update(future.result())
+        return result
+
+    def _batch_get_aspects(
+        self, entity_urns: List[str], aspect_names: List[str]
+    ) -> Dict[str, EntityAspects]:
+        ids = ",".join(Urn.url_encode(urn) for urn in entity_urns)
+        response_json = self._get_generic(self._get_batch_get_url(ids, aspect_names))
+
+        result: Dict[str, EntityAspects] = {}
+        for urn, entity_json in response_json.get("results", {}).items():
+            aspects_json = entity_json.get("aspects", {})
+            if aspects_json:
+                result[urn] = EntityAspects(urn, aspects_json)
+        return result
+
+    def _get_batch_get_url(self, ids: str, aspect_names: List[str]) -> str:
+        return f"{self._gms_server}/entitiesV2?ids=List({ids})&aspects=List({','.join(aspect_names)})"
+
     def _get_search_endpoint(self):
         return f"{self.config.server}/entities?action=search"
 
@@ -0,0 +1,172 @@
+import logging
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from pydantic import Field
+
+from datahub.configuration.common import ConfigModel
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
+
+logger = logging.getLogger(__name__)
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_QUANTILE_KEY = re.compile(r"^p(\d+)$")
+_INVALID_METRIC_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+class PrometheusReporterConfig(ConfigModel):
+    host: str = Field(
+        default="127.0.0.1",
+        description="The address the metrics endpoint listens on. "
+        "Set it to `0.0.0.0` to expose the metrics outside of the host, e.g. to a Prometheus server in another container.",
+    )
+    port: int = Field(
+        default=9464,
+        description="The port the metrics endpoint listens on. Metrics are served at `/metrics`.",
+    )
+    metric_prefix: str = Field(
+        default="datahub_ingestion",
+        description="The prefix of the names of all exported metrics.",
+    )
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    return ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()
+    )
+
+
+def _is_histogram(value: Any) -> bool:
+    # Histogram.as_obj() produces a dict with a count, a sum and quantiles.
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("count"), int)
+        and "sum" in value
+        and any(_QUANTILE_KEY.match(key) for key in value)
+    )
+
+
+def render_metrics(
+    report: Dict[str, Any], metric_prefix: str, labels: Dict[str, str]
+) -> str:
+    """
+    Renders the numeric fields of the source and sink reports in the Prometheus text
+    exposition format. Histograms are exported as summaries plus a gauge of their
+    maximum, and all other numbers as gauges. Other nested structures are skipped.
+    """
+    lines: List[str] = []
+    for component in ("source", "sink"):
+        component_report = report.get(component, {})
+        component_labels = _format_labels(
+            {**labels, "type": str(component_report.get("type", ""))}
+        )
+        for key, value in component_report.get("report", {}).items():
+            name = _INVALID_METRIC_CHARS.sub("_", f"{metric_prefix}_{component}_{key}")
+            if isinstance(value, bool):
+                continue
+            elif isinstance(value, (int, float)):
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name}{{{component_labels}}} {value}")
+            elif _is_histogram(value):
+                lines.append(f"# TYPE {name} summary")
+                for stat, stat_value in value.items():
+                    match = _QUANTILE_KEY.match(stat)
+                    if match and stat_value is not None:
+                        quantile = int(match.group(1)) / 100
+                        lines.append(
+                            f'{name}{{{component_labels},quantile="{quantile}"}} {stat_value}'
+                        )
+                lines.append(f"{name}_sum{{{component_labels}}} {value['sum']}")
+                lines.append(f"{name}_count{{{component_labels}}} {value['count']}")
+                if value.get("max") is not None:
+                    lines.append(f"# TYPE {name}_max gauge")
+                    lines.append(f"{name}_max{{{component_labels}}} {value['max']}")
+    return "\n".join(lines) + "\n"
+
+
+class PrometheusReporter(PipelineRunListener):
+    """
+    Serves the latest metrics of the pipeline over HTTP, so that long running
+    ingestion jobs can be scraped by Prometheus while they are running.
+    """
+
+    @classmethod
+    def create(
+        cls,
+        config_dict: Dict[str, Any],
+        ctx: PipelineContext,
+    ) -> PipelineRunListener:
+        reporter_config = PrometheusReporterConfig.parse_obj(config_dict)
+        return cls(reporter_config)
+
+    def __init__(self, reporter_config: PrometheusReporterConfig) -> None:
+        self.config = reporter_config
+        self._metrics = ""
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def get_metrics(self) -> str:
+        with self._lock:
+            return self._metrics
+
+    def _update_metrics(self, report: Dict[str, Any], ctx: PipelineContext) -> None:
+        metrics = render_metrics(
+            report,
+            metric_prefix=self.config.metric_prefix,
+            labels={"pipeline_name": ctx.pipeline_name or ""},
+        )
+        with self._lock:
+            self._metrics = metrics
+
+    def on_start(self, ctx: PipelineContext) -> None:
+        reporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = reporter.get_metrics().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", _CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(format, *args)
+
+        self._server = ThreadingHTTPServer(
+            (self.config.host, self.config.port), MetricsHandler
+        )
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever,
+            name="prometheus-reporter",
+            daemon=True,
+        ).start()
+        logger.info(
+            f"Serving ingestion metrics at http://{self.config.host}:{self._server.server_port}/metrics"
+        )
+
+    def on_progress(self, report: Dict[str, Any], ctx: PipelineContext) -> None:
+        self._update_metrics(report, ctx)
+
+    def on_completion(
+        self,
+        status: str,
+        report: Dict[str, Any],
+        ctx: PipelineContext,
+    ) -> None:
+        self._update_metrics(report, ctx)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -1,11 +1,12 @@
 import contextlib
 import itertools
+import json
 import logging
 import os
 import platform
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
 
 import click
@@ -38,6 +39,7 @@ from datahub.metadata.schema_classes import MetadataChangeProposalClass
 from datahub.telemetry import stats, telemetry
 from datahub.utilities.global_warning_util import get_global_warnings
 from datahub.utilities.lossy_collections import LossyDict, LossyList
+from datahub.utilities.perf_timer import StageTimer
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +128,10 @@ class CliReport(Report):
     os_details: str = platform.platform()
     _peak_memory_usage: int = 0
 
+    # The time spent in each stage of the pipeline, excluding the time of the
+    # stages it pulls records from.
+    pipeline_stages: StageTimer = field(default_factory=StageTimer)
+
     def compute_stats(self) -> None:
         mem_usage = psutil.Process(os.getpid()).memory_info().rss
         if self._peak_memory_usage < mem_usage:
@@ -161,6 +167,7 @@ class Pipeline:
         self.reporters: List[PipelineRunListener] = []
         self.num_intermediate_workunits = 0
         self.last_time_printed = int(time.time())
+        self.start_time = time.time()
         self.cli_report = CliReport()
 
         with _add_init_error_context("set up framework context"):
@@ -197,6 +204,9 @@ class Pipeline:
             self.source = source_class.create(
                 self.config.source.dict().get("config", {}), self.ctx
             )
+            self.source.get_report().set_entity_tracking(
+                self.config.report_entity_tracking
+            )
             logger.debug(f"Source type {source_type} ({source_class}) configured")
             logger.info("Source configured successfully.")
 
@@ -275,6 +285,23 @@ class Pipeline:
             except Exception as e:
                 logger.warning("Reporting failed on start", exc_info=e)
 
+    def _notify_reporters_on_ingestion_progress(self) -> None:
+        # The structured report is expensive to build, so only build it for
+        # the reporters that actually consume progress updates.
+        progress_reporters = [
+            reporter
+            for reporter in self.reporters
+            if type(reporter).on_progress is not PipelineRunListener.on_progress
+        ]
+        if not progress_reporters:
+            return
+        report = self._get_structured_report()
+        for reporter in progress_reporters:
+            try:
+                reporter.on_progress(report=report, ctx=self.ctx)
+            except Exception as e:
+                logger.warning("Reporting failed on progress", exc_info=e)
+
     def _notify_reporters_on_ingestion_completion(self) -> None:
         for reporter in self.reporters:
             try:
@@ -326,6 +353,7 @@ class Pipeline:
 
     def run(self) -> None:
         self.final_status = "unknown"
+        self.start_time = time.time()
         self._notify_reporters_on_ingestion_start()
         callback = None
         try:
@@ -336,23 +364,28 @@ class Pipeline:
                     self.ctx, self.config.failure_log.log_config
                 )
             )
+            stage_timer = self.cli_report.pipeline_stages
             for wu in itertools.islice(
-                self.source.get_workunits(),
+                stage_timer.time_iterator("source", self.source.get_workunits()),
                 self.preview_workunits if self.preview_mode else None,
             ):
                 try:
                     if self._time_to_print():
-                        self.pretty_print_summary(currently_running=True)
+                        self._print_progress()
+                        self._notify_reporters_on_ingestion_progress()
                 except Exception as e:
                     logger.warning(f"Failed to print summary {e}")
 
                 if not self.dry_run:
                     self.sink.handle_work_unit_start(wu)
                 try:
-                    record_envelopes = self.extractor.get_records(wu)
+                    record_envelopes = stage_timer.time_iterator(
+                        "extractor", self.extractor.get_records(wu)
+                    )
                     for record_envelope in self.transform(record_envelopes):
                         if not self.dry_run:
-                            self.sink.write_record_async(record_envelope, callback)
+                            with stage_timer.time("sink"):
+                                self.sink.write_record_async(record_envelope, callback)
 
                 except RuntimeError:
                     raise
@@ -366,7 +399,9 @@ class Pipeline:
                 self.extractor.close()
                 if not self.dry_run:
                     self.sink.handle_work_unit_end(wu)
-            self.source.close()
+            with stage_timer.time("source_close"):
+                self.source.close()
+                self.source.get_report().close()
             # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
             for record_envelope in self.transform(
                 [
@@ -379,10 +414,13 @@ class Pipeline:
                     record_envelope.record, EndOfStream
                 ):
                     # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
-                    self.sink.write_record_async(record_envelope, callback)
+                    with stage_timer.time("sink"):
+                        self.sink.write_record_async(record_envelope, callback)
 
-            self.sink.close()
-            self.process_commits()
+            with stage_timer.time("sink_close"):
+                self.sink.close()
+            with stage_timer.time("commit"):
+                self.process_commits()
             self.final_status = "completed"
         except (SystemExit, RuntimeError) as e:
             self.final_status = "cancelled"
@@ -400,8 +438,12 @@ class Pipeline:
         :param records: the records to transform
         :return: the transformed records
         """
-        for transformer in self.transformers:
-            records = transformer.transform(records)
+        stage_timer = self.cli_report.pipeline_stages
+        for i, transformer in enumerate(self.transformers):
+            records = stage_timer.time_iterator(
+                f"transformer_{i}_{type(transformer).__name__}",
+                transformer.transform(records),
+            )
 
         return records
 
@@ -565,6 +607,48 @@ class Pipeline:
             )
             return 0
 
+    def _get_progress(self) -> Dict[str, Any]:
+        # Unlike the structured report, this only reads counters, so it is cheap no
+        # matter how large the reports grow.
+        source_report = self.source.get_report()
+        sink_report = self.sink.get_report()
+        elapsed_seconds = time.time() - self.start_time
+        return {
+            "pipeline_name": self.config.pipeline_name,
+            "run_id": self.config.run_id,
+            "elapsed_seconds": round(elapsed_seconds, 1),
+            "events_produced": source_report.events_produced,
+            "events_produced_per_sec": int(
+                source_report.events_produced / elapsed_seconds
+            )
+            if elapsed_seconds > 0
+            else 0,
+            "records_written": sink_report.total_records_written,
+            "pending_requests": sink_report.pending_requests,
+            "failures": self._approx_all_vals(source_report.failures)
+            + len(sink_report.failures),
+            "warnings": self._approx_all_vals(source_report.warnings)
+            + len(sink_report.warnings)
+            + len(get_global_warnings()),
+        }
+
+    def _print_progress(self) -> None:
+        if self.config.progress_format == "full":
+            self.pretty_print_summary(currently_running=True)
+            return
+
+        progress = self._get_progress()
+        if self.config.progress_format == "json":
+            click.echo(json.dumps(progress))
+        else:
+            click.secho(
+                f"⏳ Pipeline running for {humanfriendly.format_timespan(progress['elapsed_seconds'])}; "
+                f"produced {progress['events_produced']} events ({progress['events_produced_per_sec']}/s), "
+                f"wrote {progress['records_written']} records, {progress['pending_requests']} pending; "
+                f"{progress['failures']} failures and {progress['warnings']} warnings so far",
+                fg=self._get_text_color(running=True, failures=False, warnings=False),
+            )
+
     def _get_structured_report(self) -> Dict[str, Any]:
         return {
             "cli": self.cli_report.as_obj(),
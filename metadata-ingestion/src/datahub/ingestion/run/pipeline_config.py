@@ -4,10 +4,12 @@ import uuid
 from typing import Any, Dict, List, Optional
 
 from pydantic import Field, root_validator, validator
+from typing_extensions import Literal
 
 from datahub.cli.cli_utils import get_url_and_token
 from datahub.configuration import config_loader
 from datahub.configuration.common import ConfigModel, DynamicTypedConfig
+from datahub.ingestion.api.source import EntityTrackingMode
 from datahub.ingestion.graph.client import DatahubClientConfig
 from datahub.ingestion.sink.file import FileSinkConfig
 
@@ -50,6 +52,17 @@ class PipelineConfig(ConfigModel):
     datahub_api: Optional[DatahubClientConfig] = None
     pipeline_name: Optional[str] = None
     failure_log: FailureLoggingConfig = FailureLoggingConfig()
+    progress_format: Literal["summary", "json", "full"] = Field(
+        "summary",
+        description="How the progress of a running pipeline is printed, about every 10 seconds. "
+        "`summary` prints a line of counters, `json` prints the same counters as a compact JSON line, "
+        "and `full` prints the complete source and sink reports. The complete reports are always printed at the end.",
+    )
+    report_entity_tracking: EntityTrackingMode = Field(
+        EntityTrackingMode.EXACT,
+        description="How the source report counts distinct entities. `EXACT` keeps every urn in memory, "
+        "`APPROXIMATE` estimates the counts in constant memory, and `DISK` keeps the urns in a temporary SQLite file.",
+    )
 
     _raw_dict: Optional[
         dict
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import datetime
+from dataclasses import dataclass, field
 from typing import Optional, Union
 
 from datahub.emitter.kafka_emitter import DatahubKafkaEmitter, KafkaEmitterConfig
@@ -20,11 +21,18 @@ class KafkaSinkConfig(KafkaEmitterConfig):
 
 @dataclass
 class _KafkaCallback:
+    # Delivery reports may be served by the emitter's poller thread, so the
+    # report is only updated through the SinkReport methods, which take its lock.
     reporter: SinkReport
     record_envelope: RecordEnvelope
     write_callback: WriteCallback
+    start_time: datetime.datetime = field(default_factory=datetime.datetime.now)
+
+    def __post_init__(self) -> None:
+        self.reporter.report_request_submitted()
 
     def kafka_callback(self, err: Optional[Exception], msg: str) -> None:
+        self.reporter.report_request_completed()
         if err is not None:
             self.reporter.report_failure(err)
             self.write_callback.on_failure(
@@ -32,6 +40,11 @@ class _KafkaCallback:
             )
         else:
             self.reporter.report_record_written(self.record_envelope)
+            self.reporter.report_write_latency(
+                datetime.datetime.now() - self.start_time
+            )
+            # The length of a delivered message is the size of its serialized value.
+            self.reporter.report_bytes_sent(len(msg))
             self.write_callback.on_success(self.record_envelope, {"msg": msg})
 
 
@@ -45,7 +58,8 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
         pass
 
     def handle_work_unit_end(self, workunit: WorkUnit) -> None:
-        self.emitter.flush()
+        if not self.config.high_throughput:
+            self.emitter.flush()
 
     def write_record_async(
         self,
@@ -81,4 +95,4 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
             )
 
     def close(self) -> None:
-        self.emitter.flush()
+        self.emitter.close()
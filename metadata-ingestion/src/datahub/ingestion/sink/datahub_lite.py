@@ -1,3 +1,4 @@
+import datetime
 import logging
 import os
 from typing import Union
@@ -42,8 +43,10 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
             return
 
         try:
+            start_time = datetime.datetime.now()
             self.datahub_lite.write(record)
             self.report.report_record_written(record_envelope)
+            self.report.report_write_latency(datetime.datetime.now() - start_time)
         except Exception as e:
             self.report.report_failure(f"{record_envelope.metadata}: {type(e)}: {e}")
             if write_callback:
@@ -4,7 +4,6 @@ import functools
 import logging
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import timedelta
 from enum import auto
 from threading import BoundedSemaphore
 from typing import Union, cast
@@ -26,6 +25,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.server_config_util import set_gms_config
 
 logger = logging.getLogger(__name__)
@@ -44,14 +44,12 @@ class DatahubRestSinkConfig(DatahubClientConfig):
 @dataclass
 class DataHubRestSinkReport(SinkReport):
     gms_version: str = ""
-    pending_requests: int = 0
+    # The time spent waiting for pending requests to complete when the queue is full.
+    backpressure_wait_time_in_seconds: float = 0.0
 
     def compute_stats(self) -> None:
         super().compute_stats()
 
-    def report_write_latency(self, delta: timedelta) -> None:
-        pass
-
 
 class BoundedExecutor:
     """BoundedExecutor behaves as a ThreadPoolExecutor which will block on
@@ -64,11 +62,15 @@ class BoundedExecutor:
     def __init__(self, bound, max_workers):
         self.executor = ThreadPoolExecutor(max_workers)
         self.semaphore = BoundedSemaphore(bound + max_workers)
+        self.blocked_seconds = 0.0
 
     """See concurrent.futures.Executor#submit"""
 
     def submit(self, fn, *args, **kwargs):
-        self.semaphore.acquire()
+        if not self.semaphore.acquire(blocking=False):
+            with PerfTimer() as timer:
+                self.semaphore.acquire()
+            self.blocked_seconds += timer.elapsed_seconds()
         try:
             future = self.executor.submit(fn, *args, **kwargs)
         except Exception:
@@ -136,7 +138,7 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
         future: concurrent.futures.Future,
     ) -> None:
-        self.report.pending_requests -= 1
+        self.report.report_request_completed()
         if future.cancelled():
             self.report.report_failure({"error": "future was cancelled"})
             write_callback.on_failure(
@@ -193,21 +195,31 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
     ) -> None:
         record = record_envelope.record
         if self.config.mode == SyncOrAsync.ASYNC:
+            self.report.report_request_submitted()
             write_future = self.executor.submit(self.emitter.emit, record)
             write_future.add_done_callback(
                 functools.partial(
                     self._write_done_callback, record_envelope, write_callback
                 )
             )
-            self.report.pending_requests += 1
         else:
             # execute synchronously
             try:
                 (start, end) = self.emitter.emit(record)
+                self.report.report_record_written(record_envelope)
+                self.report.report_write_latency(end - start)
                 write_callback.on_success(record_envelope, success_metadata={})
             except Exception as e:
                 write_callback.on_failure(record_envelope, e, failure_metadata={})
 
+    def get_report(self) -> DataHubRestSinkReport:
+        self.report.bytes_sent = self.emitter.bytes_sent
+        self.report.retries = self.emitter.retries
+        self.report.backpressure_wait_time_in_seconds = round(
+            self.executor.blocked_seconds, 2
+        )
+        return self.report
+
     def close(self):
         self.executor.shutdown(wait=True)
 
@@ -1,3 +1,4 @@
+import datetime
 import json
 import logging
 import pathlib
@@ -55,6 +56,7 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
         ],
         write_callback: WriteCallback,
     ) -> None:
+        start_time = datetime.datetime.now()
         record = record_envelope.record
         obj = _to_obj_for_file(
             record, simplified_structure=not self.config.legacy_nested_json_string
@@ -63,10 +65,14 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
         if self.wrote_something:
             self.file.write(",\n")
 
-        json.dump(obj, self.file, indent=4)
+        # json.dumps escapes all non-ASCII characters, so characters are bytes.
+        serialized = json.dumps(obj, indent=4)
+        self.file.write(serialized)
         self.wrote_something = True
 
         self.report.report_record_written(record_envelope)
+        self.report.report_write_latency(datetime.datetime.now() - start_time)
+        self.report.report_bytes_sent(len(serialized))
         if write_callback:
             write_callback.on_success(record_envelope, {})
 
@@ -1,4 +1,5 @@
 import logging
+import threading
 from collections import defaultdict
 from dataclasses import dataclass, field as dataclass_field
 from typing import (
@@ -17,6 +18,7 @@ from typing import (
 from urllib.parse import urlparse
 
 import botocore.exceptions
+import pydantic
 import yaml
 from pydantic import validator
 from pydantic.fields import Field
@@ -101,6 +103,7 @@ from datahub.metadata.schema_classes import (
     UpstreamClass,
     UpstreamLineageClass,
 )
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.hive_schema_to_avro import get_schema_fields_for_hive_column
 from datahub.utilities.source_helpers import (
     auto_stale_entity_removal,
@@ -113,6 +116,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_PLATFORM = "glue"
 VALID_PLATFORMS = [DEFAULT_PLATFORM, "athena"]
 
+# A table as returned by glue.get_table(), and its partitions if it is partitioned.
+_ProfileSource = Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]]]
+
 
 class GlueSourceConfig(
     StatefulIngestionConfigBase, DatasetSourceConfigMixin, AwsSourceConfig
@@ -160,6 +166,10 @@ class GlueSourceConfig(
         default=None,
         description="Configs to ingest data profiles from glue table",
     )
+    max_workers: pydantic.PositiveInt = Field(
+        default=1,
+        description="Number of threads used to list the tables of several databases, fetch the partitions of tables for profiling and download the scripts of jobs concurrently. Tables are still emitted in the same order. Keep this low enough to stay within the Glue API request quota of the account.",
+    )
     # Custom Stateful Ingestion settings
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = Field(
         default=None, description=""
@@ -202,6 +212,19 @@ class GlueSourceReport(StaleEntityRemovalSourceReport):
     def report_table_dropped(self, table: str) -> None:
         self.filtered.append(table)
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        # Job scripts may be downloaded and parsed by several threads at once.
+        self._lock = threading.RLock()
+
+    def report_warning(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_warning(key, reason)
+
+    def report_failure(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_failure(key, reason)
+
 
 @platform_name("Glue")
 @config_class(GlueSourceConfig)
@@ -636,10 +659,14 @@ class GlueSource(StatefulIngestionSourceBase):
 
     def get_all_tables_and_databases(
         self,
-    ) -> Tuple[Dict, List[Dict]]:
-        def get_tables_from_database(database_name: str) -> List[dict]:
-            new_tables = []
+    ) -> Tuple[Dict, Iterable[Dict]]:
+        """
+        Returns the allowed databases and an iterable of their tables. The tables are
+        listed lazily while they are consumed. With max_workers > 1, the tables of the
+        next databases are listed concurrently, but still returned in database order.
+        """
 
+        def get_tables_from_database(database_name: str) -> Iterable[dict]:
             # see https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/glue.html#Glue.Client.get_tables
             paginator = self.glue_client.get_paginator("get_tables")
 
@@ -651,9 +678,7 @@ class GlueSource(StatefulIngestionSourceBase):
                 paginator_response = paginator.paginate(DatabaseName=database_name)
 
             for page in paginator_response:
-                new_tables += page["TableList"]
-
-            return new_tables
+                yield from page["TableList"]
 
         def get_databases() -> List[Mapping[str, Any]]:
             databases = []
@@ -683,13 +708,20 @@ class GlueSource(StatefulIngestionSourceBase):
             if self.source_config.database_pattern.allowed(database["Name"])
         }
 
-        all_tables: List[dict] = [
-            table
-            for databaseName in databases.keys()
-            for table in get_tables_from_database(databaseName)
-        ]
+        def get_all_tables() -> Iterable[dict]:
+            if self.source_config.max_workers == 1:
+                for database_name in databases:
+                    yield from get_tables_from_database(database_name)
+                return
 
-        return databases, all_tables
+            for future in BackpressureAwareExecutor.map_ordered(
+                lambda database_name: list(get_tables_from_database(database_name)),
+                ((database_name,) for database_name in databases),
+                max_workers=self.source_config.max_workers,
+            ):
+                yield from future.result()
+
+        return databases, get_all_tables()
 
     def get_lineage_if_enabled(
         self, mce: MetadataChangeEventClass
@@ -815,37 +847,47 @@ class GlueSource(StatefulIngestionSourceBase):
         )
         return mcp
 
+    def get_profile_source(self, database_name: str, table_name: str) -> _ProfileSource:
+        # for cross-account ingestion
+        kwargs = dict(
+            DatabaseName=database_name,
+            Name=table_name,
+            CatalogId=self.source_config.catalog_id,
+        )
+        table = self.glue_client.get_table(**{k: v for k, v in kwargs.items() if v})[
+            "Table"
+        ]
+
+        # check if this table is partitioned
+        if not table["PartitionKeys"]:
+            return table, None
+
+        # for cross-account ingestion
+        kwargs = dict(
+            DatabaseName=database_name,
+            TableName=table_name,
+            CatalogId=self.source_config.catalog_id,
+        )
+        response = self.glue_client.get_partitions(
+            **{k: v for k, v in kwargs.items() if v}
+        )
+        return table, response["Partitions"]
+
     def get_profile_if_enabled(
-        self, mce: MetadataChangeEventClass, database_name: str, table_name: str
+        self,
+        mce: MetadataChangeEventClass,
+        database_name: str,
+        table_name: str,
+        profile_source: Optional[_ProfileSource] = None,
     ) -> List[MetadataChangeProposalWrapper]:
         if self.source_config.profiling:
-            # for cross-account ingestion
-            kwargs = dict(
-                DatabaseName=database_name,
-                Name=table_name,
-                CatalogId=self.source_config.catalog_id,
-            )
-            response = self.glue_client.get_table(
-                **{k: v for k, v in kwargs.items() if v}
-            )
+            if profile_source is None:
+                profile_source = self.get_profile_source(database_name, table_name)
+            table, partitions = profile_source
 
-            partition_keys = response["Table"]["PartitionKeys"]
-
-            # check if this table is partitioned
-            if partition_keys:
+            if partitions is not None:
                 # ingest data profile with partitions
-                # for cross-account ingestion
-                kwargs = dict(
-                    DatabaseName=database_name,
-                    TableName=table_name,
-                    CatalogId=self.source_config.catalog_id,
-                )
-                response = self.glue_client.get_partitions(
-                    **{k: v for k, v in kwargs.items() if v}
-                )
-
-                partitions = response["Partitions"]
-                partition_keys = [k["Name"] for k in partition_keys]
+                partition_keys = [k["Name"] for k in table["PartitionKeys"]]
 
                 mcps = []
                 for p in partitions:
@@ -868,8 +910,8 @@ class GlueSource(StatefulIngestionSourceBase):
                 return mcps
             else:
                 # ingest data profile without partition
-                table_stats = response["Table"]["Parameters"]
-                column_stats = response["Table"]["StorageDescriptor"]["Columns"]
+                table_stats = table["Parameters"]
+                column_stats = table["StorageDescriptor"]["Columns"]
                 return [self._create_profile_mcp(mce, table_stats, column_stats)]
 
         return []
@@ -940,20 +982,47 @@ class GlueSource(StatefulIngestionSourceBase):
             auto_status_aspect(self.get_workunits_internal()),
         )
 
+    def _get_allowed_tables(self, tables: Iterable[Dict]) -> Iterable[Dict]:
+        for table in tables:
+            full_table_name = f"{table['DatabaseName']}.{table['Name']}"
+            self.report.report_table_scanned()
+            if not self.source_config.database_pattern.allowed(
+                table["DatabaseName"]
+            ) or not self.source_config.table_pattern.allowed(full_table_name):
+                self.report.report_table_dropped(full_table_name)
+                continue
+            yield table
+
+    def _get_tables_with_profile_sources(
+        self, tables: Iterable[Dict]
+    ) -> Iterable[Tuple[Dict, Optional[_ProfileSource]]]:
+        if not self.source_config.profiling or self.source_config.max_workers == 1:
+            # The profile source is fetched when the table is profiled.
+            for table in tables:
+                yield table, None
+            return
+
+        # Fetch the partitions of the next tables while the current one is processed.
+        def fetch(table: Dict) -> Tuple[Dict, _ProfileSource]:
+            return table, self.get_profile_source(table["DatabaseName"], table["Name"])
+
+        for future in BackpressureAwareExecutor.map_ordered(
+            fetch,
+            ((table,) for table in tables),
+            max_workers=self.source_config.max_workers,
+        ):
+            yield future.result()
+
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
         database_seen = set()
         databases, tables = self.get_all_tables_and_databases()
 
-        for table in tables:
+        for table, profile_source in self._get_tables_with_profile_sources(
+            self._get_allowed_tables(tables)
+        ):
             database_name = table["DatabaseName"]
             table_name = table["Name"]
             full_table_name = f"{database_name}.{table_name}"
-            self.report.report_table_scanned()
-            if not self.source_config.database_pattern.allowed(
-                database_name
-            ) or not self.source_config.table_pattern.allowed(full_table_name):
-                self.report.report_table_dropped(full_table_name)
-                continue
             if database_name not in database_seen:
                 database_seen.add(database_name)
                 yield from self.gen_database_containers(databases[database_name])
@@ -995,7 +1064,9 @@ class GlueSource(StatefulIngestionSourceBase):
                 self.report.report_workunit(mcp_wu)
                 yield mcp_wu
 
-            mcps_profiling = self.get_profile_if_enabled(mce, database_name, table_name)
+            mcps_profiling = self.get_profile_if_enabled(
+                mce, database_name, table_name, profile_source
+            )
             if mcps_profiling:
                 for mcp_index, mcp in enumerate(mcps_profiling):
                     mcp_wu = MetadataWorkUnit(
@@ -1008,10 +1079,33 @@ class GlueSource(StatefulIngestionSourceBase):
         if self.extract_transforms:
             yield from self._transform_extraction()
 
+    def _get_dataflow_graphs(
+        self, script_paths: Iterable[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        # Several jobs may run the same script, so each script is only fetched once.
+        unique_script_paths = list(dict.fromkeys(script_paths))
+        if self.source_config.max_workers == 1:
+            return {path: self.get_dataflow_graph(path) for path in unique_script_paths}
+
+        futures = BackpressureAwareExecutor.map_ordered(
+            self.get_dataflow_graph,
+            ((path,) for path in unique_script_paths),
+            max_workers=self.source_config.max_workers,
+        )
+        return {
+            path: future.result() for path, future in zip(unique_script_paths, futures)
+        }
+
     def _transform_extraction(self) -> Iterable[MetadataWorkUnit]:
         dags: Dict[str, Optional[Dict[str, Any]]] = {}
         flow_names: Dict[str, str] = {}
-        for job in self.get_all_jobs():
+        jobs = self.get_all_jobs()
+        dataflow_graphs = self._get_dataflow_graphs(
+            job["Command"]["ScriptLocation"]
+            for job in jobs
+            if job.get("Command", {}).get("ScriptLocation") is not None
+        )
+        for job in jobs:
             flow_urn = mce_builder.make_data_flow_urn(
                 self.platform, job["Name"], self.env
             )
@@ -1025,7 +1119,7 @@ class GlueSource(StatefulIngestionSourceBase):
             dag: Optional[Dict[str, Any]] = None
 
             if job_script_location is not None:
-                dag = self.get_dataflow_graph(job_script_location)
+                dag = dataflow_graphs[job_script_location]
 
             dags[flow_urn] = dag
             flow_names[flow_urn] = job["Name"]
@@ -266,6 +266,10 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         self.table_refs: Set[str] = set()
         # Maps project -> view_ref -> [upstream_table_ref], for view lineage
         self.view_upstream_tables: Dict[str, Dict[str, List[str]]] = defaultdict(dict)
+        # Maps project -> [(dataset, view)], for the views whose ddl is yet to be parsed
+        self.views_to_parse: Dict[str, List[Tuple[str, BigqueryView]]] = defaultdict(
+            list
+        )
 
         atexit.register(cleanup, config)
 
@@ -641,6 +645,9 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                 )
                 continue
 
+        if self.views_to_parse[project_id]:
+            self.parse_view_lineage(project_id)
+
         if self.config.include_usage_statistics:
             if (
                 self.config.store_last_usage_extraction_timestamp
@@ -674,41 +681,68 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
                 tables=db_tables,
             )
 
+    def parse_view_lineage(self, project_id: str) -> None:
+        # The views of a project are parsed together, so that identical definitions
+        # are parsed once and the parsing can be spread over several processes.
+        views = self.views_to_parse.pop(project_id)
+        logger.info(f"Parsing the ddl of {len(views)} views of {project_id}")
+        views_upstream_tables = self.lineage_extractor.parse_views_lineage(
+            project_id, views
+        )
+        for (dataset_name, view), upstream_tables in zip(views, views_upstream_tables):
+            if upstream_tables is not None:
+                table_ref = str(
+                    BigQueryTableRef(
+                        BigqueryTableIdentifier(project_id, dataset_name, view.name)
+                    )
+                )
+                self.view_upstream_tables[project_id][table_ref] = [
+                    str(BigQueryTableRef(table_id).get_sanitized_table_ref())
+                    for table_id in upstream_tables
+                ]
+
     def generate_lineage(self, project_id: str) -> Iterable[MetadataWorkUnit]:
         logger.info(f"Generate lineage for {project_id}")
         lineage = self.lineage_extractor.calculate_lineage_for_project(project_id)
-
-        if self.config.lineage_parse_view_ddl:
-            for view, upstream_tables in self.view_upstream_tables[project_id].items():
-                # Override upstreams obtained by parsing audit logs as they may contain indirectly referenced tables
-                lineage[view] = {
-                    LineageEdge(
-                        table=table,
-                        auditStamp=datetime.now(),
-                        type=DatasetLineageTypeClass.VIEW,
+        try:
+            if self.config.lineage_parse_view_ddl:
+                for view, upstream_tables in self.view_upstream_tables[
+                    project_id
+                ].items():
+                    # Override upstreams obtained by parsing audit logs as they may contain indirectly referenced tables
+                    lineage.set_edges(
+                        view,
+                        [
+                            LineageEdge(
+                                table=table,
+                                auditStamp=datetime.now(),
+                                type=DatasetLineageTypeClass.VIEW,
+                            )
+                            for table in upstream_tables
+                        ],
                     )
-                    for table in upstream_tables
-                }
 
-        for lineage_key in lineage.keys():
-            if lineage_key not in self.table_refs:
-                continue
+            for lineage_key in lineage.keys():
+                if lineage_key not in self.table_refs:
+                    continue
 
-            table_ref = BigQueryTableRef.from_string_name(lineage_key)
-            dataset_urn = self.gen_dataset_urn(
-                project_id=table_ref.table_identifier.project_id,
-                dataset_name=table_ref.table_identifier.dataset,
-                table=table_ref.table_identifier.get_table_display_name(),
-            )
+                table_ref = BigQueryTableRef.from_string_name(lineage_key)
+                dataset_urn = self.gen_dataset_urn(
+                    project_id=table_ref.table_identifier.project_id,
+                    dataset_name=table_ref.table_identifier.dataset,
+                    table=table_ref.table_identifier.get_table_display_name(),
+                )
 
-            lineage_info = self.lineage_extractor.get_lineage_for_table(
-                bq_table=table_ref,
-                platform=self.platform,
-                lineage_metadata=lineage,
-            )
+                lineage_info = self.lineage_extractor.get_lineage_for_table(
+                    bq_table=table_ref,
+                    platform=self.platform,
+                    lineage_metadata=lineage,
+                )
 
-            if lineage_info:
-                yield from self.gen_lineage(dataset_urn, lineage_info)
+                if lineage_info:
+                    yield from self.gen_lineage(dataset_urn, lineage_info)
+        finally:
+            lineage.close()
 
     def generate_usage_statistics(
         self,
@@ -864,14 +898,7 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             table_ref = str(BigQueryTableRef(table_identifier))
             self.table_refs.add(table_ref)
             if self.config.lineage_parse_view_ddl:
-                upstream_tables = self.lineage_extractor.parse_view_lineage(
-                    project_id, dataset_name, view
-                )
-                if upstream_tables is not None:
-                    self.view_upstream_tables[project_id][table_ref] = [
-                        str(BigQueryTableRef(table_id).get_sanitized_table_ref())
-                        for table_id in upstream_tables
-                    ]
+                self.views_to_parse[project_id].append((dataset_name, view))
 
         view.column_count = len(columns)
         if not view.column_count:
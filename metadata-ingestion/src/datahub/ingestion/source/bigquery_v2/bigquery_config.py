@@ -124,6 +124,16 @@ class BigQueryV2Config(
         description="Sql parse view ddl to get lineage.",
     )
 
+    lineage_parse_view_ddl_max_workers: PositiveInt = Field(
+        default=1,
+        description="Number of processes used to parse the view ddl of a project. With more than one, the views of a project are parsed in a process pool and sql_parser_use_external_process is ignored.",
+    )
+
+    lineage_parse_view_ddl_cache_path: Optional[str] = Field(
+        default=None,
+        description="Path of a SQLite file caching the tables parsed from view ddl, keyed by a hash of the ddl. Reusing the file across runs skips parsing the views whose ddl did not change.",
+    )
+
     lineage_sql_parser_use_raw_names: bool = Field(
         default=False,
         description="This parameter ignores the lowercase pattern stipulated in the SQLParser. NOTE: Ignored if lineage_use_sql_parser is False.",
@@ -40,8 +40,11 @@ class BigQueryV2Report(ProfilingSqlReport):
     bigquery_audit_metadata_datasets_missing: Optional[bool] = None
     lineage_failed_extraction: LossyList[str] = field(default_factory=LossyList)
     lineage_metadata_entries: TopKDict[str, int] = field(default_factory=TopKDict)
-    lineage_mem_size: Dict[str, str] = field(default_factory=TopKDict)
     lineage_extraction_sec: Dict[str, float] = field(default_factory=TopKDict)
+    view_definition_parse_sec: Dict[str, float] = field(default_factory=TopKDict)
+    num_view_definitions_parsed: int = 0
+    num_view_definition_parse_cache_hits: int = 0
+    view_definition_parse_cache_hit_rate: Optional[float] = None
     usage_extraction_sec: Dict[str, float] = field(default_factory=TopKDict)
     usage_failed_extraction: LossyList[str] = field(default_factory=LossyList)
     num_project_datasets_to_scan: Dict[str, int] = field(default_factory=TopKDict)
@@ -1,16 +1,22 @@
-import collections
+import contextlib
+import functools
+import hashlib
+import json
 import logging
+import multiprocessing
+import sqlite3
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 
-import humanfriendly
 from google.cloud.bigquery import Client as BigQueryClient
 from google.cloud.datacatalog import lineage_v1
 from google.cloud.logging_v2.client import Client as GCPLoggingClient
 from ratelimiter import RateLimiter
 
+import datahub
 from datahub.emitter import mce_builder
 from datahub.ingestion.source.bigquery_v2.bigquery_audit import (
     AuditLogEntry,
@@ -34,8 +40,8 @@ from datahub.metadata.schema_classes import (
     UpstreamClass,
     UpstreamLineageClass,
 )
-from datahub.utilities import memory_footprint
 from datahub.utilities.bigquery_sql_parser import BigQuerySQLParser
+from datahub.utilities.lineage_accumulator import LineageAccumulator
 from datahub.utilities.perf_timer import PerfTimer
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -48,6 +54,86 @@ class LineageEdge:
     type: str = DatasetLineageTypeClass.TRANSFORMED
 
 
+# Maps the downstream tables to their upstream edges. Lineage is only table level.
+LineageMap = LineageAccumulator[LineageEdge, None]
+
+
+def _view_definition_key(view_definition: str, use_raw_names: bool) -> str:
+    # The version is part of the key, so that parser changes invalidate the cache.
+    return hashlib.sha256(
+        json.dumps([datahub.__version__, use_raw_names, view_definition]).encode()
+    ).hexdigest()
+
+
+def _parse_view_definition(
+    view_definition: str, use_external_process: bool, use_raw_names: bool
+) -> Tuple[Optional[List[str]], Optional[str]]:
+    """
+    Returns the tables referenced by the view definition, or the parsing error. It is
+    a module level function, so that it can run in a process pool.
+    """
+    try:
+        parser = BigQuerySQLParser(
+            view_definition, use_external_process, use_raw_names=use_raw_names
+        )
+        return parser.get_tables(), None
+    except Exception as e:
+        return None, str(e)
+
+
+class ViewDefinitionParseCache:
+    """
+    Caches the tables parsed from view definitions, keyed by a hash of the definition.
+
+    With a path, the tables are also persisted in a SQLite database, so that later runs
+    don't parse the unchanged definitions again. Definitions that failed to parse are
+    only cached for the current run, since the failure may be transient.
+    """
+
+    _MAX_SQL_VARIABLES = 500
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._tables: Dict[str, Optional[List[str]]] = {}
+        if path:
+            with contextlib.closing(sqlite3.connect(path)) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS view_definition_tables "
+                    "(key TEXT PRIMARY KEY, tables TEXT NOT NULL)"
+                )
+                conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        found = {key: self._tables[key] for key in keys if key in self._tables}
+        missing = [key for key in keys if key not in found]
+        if self.path and missing:
+            with contextlib.closing(sqlite3.connect(self.path)) as conn:
+                for i in range(0, len(missing), self._MAX_SQL_VARIABLES):
+                    chunk = missing[i : i + self._MAX_SQL_VARIABLES]
+                    rows = conn.execute(
+                        "SELECT key, tables FROM view_definition_tables "
+                        f"WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                    for key, tables in rows:
+                        found[key] = self._tables[key] = json.loads(tables)
+        return found
+
+    def put_many(self, tables: Dict[str, Optional[List[str]]]) -> None:
+        self._tables.update(tables)
+        if self.path:
+            with contextlib.closing(sqlite3.connect(self.path)) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO view_definition_tables VALUES (?, ?)",
+                    [
+                        (key, json.dumps(key_tables))
+                        for key, key_tables in tables.items()
+                        if key_tables is not None
+                    ],
+                )
+                conn.commit()
+
+
 class BigqueryLineageExtractor:
     BQ_FILTER_RULE_TEMPLATE_V2 = """
 resource.type=("bigquery_project")
@@ -88,6 +174,9 @@ timestamp < "{end_time}"
         self.config = config
         self.report = report
         self.loaded_project_ids: List[str] = []
+        self.view_definition_parse_cache = ViewDefinitionParseCache(
+            config.lineage_parse_view_ddl_cache_path
+        )
 
     def error(self, log: logging.Logger, key: str, reason: str) -> None:
         self.report.report_failure(key, reason)
@@ -154,9 +243,7 @@ timestamp < "{end_time}"
 
         return textwrap.dedent(query)
 
-    def compute_bigquery_lineage_via_gcp_logging(
-        self, project_id: str
-    ) -> Dict[str, Set[LineageEdge]]:
+    def compute_bigquery_lineage_via_gcp_logging(self, project_id: str) -> LineageMap:
         logger.info(f"Populating lineage info via GCP audit logs for {project_id}")
         try:
             clients: GCPLoggingClient = _make_gcp_logging_client(project_id)
@@ -179,7 +266,7 @@ timestamp < "{end_time}"
 
     def compute_bigquery_lineage_via_exported_bigquery_audit_metadata(
         self,
-    ) -> Dict[str, Set[LineageEdge]]:
+    ) -> LineageMap:
         logger.info("Populating lineage info via exported GCP audit logs")
         try:
             # For exported logs we want to submit queries with the credentials project_id.
@@ -203,7 +290,7 @@ timestamp < "{end_time}"
 
     def compute_bigquery_lineage_via_catalog_lineage_api(
         self, project_id: str
-    ) -> Dict[str, Set[LineageEdge]]:
+    ) -> LineageMap:
         """
         Uses Data Catalog API to request lineage metadata. Please take a look at the API documentation for more details.
 
@@ -213,7 +300,7 @@ timestamp < "{end_time}"
             project_id(str): Google project id. Used to search for tables and datasets.
 
         Returns:
-            Dict[str, Set[str]] - A dictionary, where keys are the downstream table's identifier and values is a set
+            LineageMap - A mapping, where keys are the downstream table's identifier and values is a set
             of upstream tables identifiers.
         """
         logger.info("Populating lineage info via Catalog Data Linage API")
@@ -253,7 +340,7 @@ timestamp < "{end_time}"
                 )
             )
 
-            lineage_map: Dict[str, Set[LineageEdge]] = {}
+            lineage_map = LineageMap()
             curr_date = datetime.now()
             for table in project_tables:
                 logger.info("Creating lineage map for table %s", table)
@@ -286,7 +373,8 @@ timestamp < "{end_time}"
 
                 # Only builds lineage map when the table has upstreams
                 if upstreams:
-                    lineage_map[destination_table_str] = set(
+                    lineage_map.set_edges(
+                        destination_table_str,
                         [
                             LineageEdge(
                                 table=str(
@@ -299,7 +387,7 @@ timestamp < "{end_time}"
                                 auditStamp=curr_date,
                             )
                             for source_table in upstreams
-                        ]
+                        ],
                     )
             return lineage_map
         except Exception as e:
@@ -482,11 +570,9 @@ timestamp < "{end_time}"
                 )
                 yield event
 
-    def _create_lineage_map(
-        self, entries: Iterable[QueryEvent]
-    ) -> Dict[str, Set[LineageEdge]]:
+    def _create_lineage_map(self, entries: Iterable[QueryEvent]) -> LineageMap:
         logger.info("Entering create lineage map function")
-        lineage_map: Dict[str, Set[LineageEdge]] = collections.defaultdict(set)
+        lineage_map = LineageMap()
         for e in entries:
             self.report.num_total_lineage_entries[e.project_id] = (
                 self.report.num_total_lineage_entries.get(e.project_id, 0) + 1
@@ -534,22 +620,24 @@ timestamp < "{end_time}"
             for ref_table in e.referencedTables:
                 ref_table_str = str(ref_table.get_sanitized_table_ref())
                 if ref_table_str != destination_table_str:
-                    lineage_map[destination_table_str].add(
+                    lineage_map.add_edge(
+                        destination_table_str,
                         LineageEdge(
                             table=ref_table_str,
                             auditStamp=e.end_time if e.end_time else datetime.now(),
-                        )
+                        ),
                     )
                     has_table = True
             has_view = False
             for ref_view in e.referencedViews:
                 ref_view_str = str(ref_view.get_sanitized_table_ref())
                 if ref_view_str != destination_table_str:
-                    lineage_map[destination_table_str].add(
+                    lineage_map.add_edge(
+                        destination_table_str,
                         LineageEdge(
                             table=ref_view_str,
                             auditStamp=e.end_time if e.end_time else datetime.now(),
-                        )
+                        ),
                     )
                     has_view = True
             if self.config.lineage_use_sql_parser and has_table and has_view:
@@ -576,13 +664,13 @@ timestamp < "{end_time}"
                         + 1
                     )
                     continue
-                curr_lineage = lineage_map[destination_table_str]
+                curr_lineage = lineage_map.get_edges(destination_table_str)
                 new_lineage = set()
                 for lineage in curr_lineage:
                     name = lineage.table.split("/")[-1]
                     if name in referenced_objs:
                         new_lineage.add(lineage)
-                lineage_map[destination_table_str] = new_lineage
+                lineage_map.set_edges(destination_table_str, new_lineage)
             if not (has_table or has_view):
                 self.report.num_skipped_lineage_entries_other[e.project_id] = (
                     self.report.num_skipped_lineage_entries_other.get(e.project_id, 0)
@@ -595,24 +683,117 @@ timestamp < "{end_time}"
     def parse_view_lineage(
         self, project: str, dataset: str, view: BigqueryView
     ) -> Optional[List[BigqueryTableIdentifier]]:
-        if not view.view_definition:
-            return None
+        return self.parse_views_lineage(project, [(dataset, view)])[0]
 
-        parsed_tables = set()
-        try:
-            parser = BigQuerySQLParser(
-                view.view_definition,
-                self.config.sql_parser_use_external_process,
-                use_raw_names=self.config.lineage_sql_parser_use_raw_names,
+    def parse_views_lineage(
+        self, project: str, views: List[Tuple[str, BigqueryView]]
+    ) -> List[Optional[List[BigqueryTableIdentifier]]]:
+        """
+        Parses the definitions of the (dataset, view) pairs and returns the upstream
+        tables of each view, or None if its definition could not be parsed.
+
+        Each distinct definition is parsed once, unless it is already in the cache, and
+        with more than one lineage_parse_view_ddl_max_workers in a process pool.
+        """
+        use_raw_names = self.config.lineage_sql_parser_use_raw_names
+        keys = [
+            _view_definition_key(view.view_definition, use_raw_names)
+            if view.view_definition
+            else None
+            for _, view in views
+        ]
+
+        with PerfTimer() as timer:
+            parsed = self.view_definition_parse_cache.get_many(
+                {key for key in keys if key is not None}
+            )
+            definitions: Dict[str, str] = {}
+            for key, (_, view) in zip(keys, views):
+                if key is not None and key not in parsed:
+                    definitions[key] = view.view_definition
+            errors: Dict[str, str] = {}
+            new_tables: Dict[str, Optional[List[str]]] = {}
+            for key, (tables, error) in zip(
+                definitions, self._parse_view_definitions(list(definitions.values()))
+            ):
+                new_tables[key] = tables
+                if error is not None:
+                    errors[key] = error
+            self.view_definition_parse_cache.put_many(new_tables)
+            parsed.update(new_tables)
+
+        num_views = sum(key is not None for key in keys)
+        self.report.num_view_definitions_parsed += len(definitions)
+        self.report.num_view_definition_parse_cache_hits += num_views - len(definitions)
+        num_lookups = (
+            self.report.num_view_definitions_parsed
+            + self.report.num_view_definition_parse_cache_hits
+        )
+        if num_lookups:
+            self.report.view_definition_parse_cache_hit_rate = round(
+                self.report.num_view_definition_parse_cache_hits / num_lookups, 3
             )
-            tables = parser.get_tables()
-        except Exception as ex:
-            logger.debug(
-                f"View {view.name} definination sql parsing failed on query: {view.view_definition}. "
-                f"Edge from physical table to view won't be added. The error was {ex}."
+        self.report.view_definition_parse_sec[project] = round(
+            self.report.view_definition_parse_sec.get(project, 0)
+            + timer.elapsed_seconds(),
+            2,
+        )
+
+        views_lineage: List[Optional[List[BigqueryTableIdentifier]]] = []
+        for key, (dataset, view) in zip(keys, views):
+            tables = parsed[key] if key is not None else None
+            if tables is None:
+                if key in errors:
+                    logger.debug(
+                        f"View {view.name} definination sql parsing failed on query: {view.view_definition}. "
+                        f"Edge from physical table to view won't be added. The error was {errors[key]}."
+                    )
+                views_lineage.append(None)
+            else:
+                views_lineage.append(
+                    self._get_view_upstream_tables(project, dataset, view, tables)
+                )
+        return views_lineage
+
+    def _parse_view_definitions(
+        self, definitions: List[str]
+    ) -> List[Tuple[Optional[List[str]], Optional[str]]]:
+        use_raw_names = self.config.lineage_sql_parser_use_raw_names
+        max_workers = min(
+            self.config.lineage_parse_view_ddl_max_workers, len(definitions)
+        )
+        if max_workers <= 1:
+            return [
+                _parse_view_definition(
+                    definition,
+                    self.config.sql_parser_use_external_process,
+                    use_raw_names,
+                )
+                for definition in definitions
+            ]
+
+        # The workers already keep the parser out of the ingestion process, so they
+        # don't start another process per definition. They are spawned rather than
+        # forked, since forking a process with running threads can deadlock.
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            return list(
+                executor.map(
+                    functools.partial(
+                        _parse_view_definition,
+                        use_external_process=False,
+                        use_raw_names=use_raw_names,
+                    ),
+                    definitions,
+                    chunksize=max(1, len(definitions) // (max_workers * 4)),
+                )
             )
-            return None
 
+    def _get_view_upstream_tables(
+        self, project: str, dataset: str, view: BigqueryView, tables: List[str]
+    ) -> List[BigqueryTableIdentifier]:
+        parsed_tables = set()
         for table in tables:
             parts = table.split(".")
             if len(parts) == 1:
@@ -640,11 +821,11 @@ timestamp < "{end_time}"
 
         return list(parsed_tables)
 
-    def _compute_bigquery_lineage(self, project_id: str) -> Dict[str, Set[LineageEdge]]:
+    def _compute_bigquery_lineage(self, project_id: str) -> LineageMap:
         lineage_extractor: BigqueryLineageExtractor = BigqueryLineageExtractor(
             config=self.config, report=self.report
         )
-        lineage_metadata: Dict[str, Set[LineageEdge]]
+        lineage_metadata: LineageMap
         try:
             if self.config.extract_lineage_from_catalog and self.config.include_tables:
                 lineage_metadata = (
@@ -656,7 +837,7 @@ timestamp < "{end_time}"
                 if self.config.use_exported_bigquery_audit_metadata:
                     # Exported bigquery_audit_metadata should contain every projects' audit metada
                     if self.loaded_project_ids:
-                        return {}
+                        return LineageMap()
                     lineage_metadata = (
                         lineage_extractor.compute_bigquery_lineage_via_exported_bigquery_audit_metadata()
                     )
@@ -672,23 +853,16 @@ timestamp < "{end_time}"
             logger.error(
                 f"Unable to extract lineage for project {project_id} due to error {e}"
             )
-            lineage_metadata = {}
-
-        if lineage_metadata is None:
-            lineage_metadata = {}
+            lineage_metadata = LineageMap()
 
-        self.report.lineage_mem_size[project_id] = humanfriendly.format_size(
-            memory_footprint.total_size(lineage_metadata)
-        )
         self.report.lineage_metadata_entries[project_id] = len(lineage_metadata)
         logger.info(f"Built lineage map containing {len(lineage_metadata)} entries.")
-        logger.debug(f"lineage metadata is {lineage_metadata}")
         return lineage_metadata
 
     def get_upstream_tables(
         self,
         bq_table: BigQueryTableRef,
-        lineage_metadata: Dict[str, Set[LineageEdge]],
+        lineage_metadata: Mapping[str, Set[LineageEdge]],
         tables_seen: List[str],
     ) -> Set[LineageEdge]:
         upstreams: Set[LineageEdge] = set()
@@ -718,9 +892,7 @@ timestamp < "{end_time}"
 
         return upstreams
 
-    def calculate_lineage_for_project(
-        self, project_id: str
-    ) -> Dict[str, Set[LineageEdge]]:
+    def calculate_lineage_for_project(self, project_id: str) -> LineageMap:
         with PerfTimer() as timer:
             lineage = self._compute_bigquery_lineage(project_id)
 
@@ -733,7 +905,7 @@ timestamp < "{end_time}"
     def get_lineage_for_table(
         self,
         bq_table: BigQueryTableRef,
-        lineage_metadata: Dict[str, Set[LineageEdge]],
+        lineage_metadata: Mapping[str, Set[LineageEdge]],
         platform: str,
     ) -> Optional[Tuple[UpstreamLineageClass, Dict[str, str]]]:
         upstream_list: List[UpstreamClass] = []
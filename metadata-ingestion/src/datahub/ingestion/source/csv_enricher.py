@@ -1,13 +1,30 @@
 import csv
+import functools
+import io
+import itertools
+import operator
 import pathlib
 import time
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 from urllib import parse
 
 import requests
 
 from datahub.configuration.common import ConfigurationError
+from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.decorators import (
@@ -32,13 +49,18 @@ from datahub.metadata.schema_classes import (
     OwnershipClass,
     OwnershipTypeClass,
     TagAssociationClass,
+    _Aspect,
 )
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.urns.dataset_urn import DatasetUrn
 from datahub.utilities.urns.urn import Urn
 
 DATASET_ENTITY_TYPE = DatasetUrn.ENTITY_TYPE
 ACTOR = "urn:li:corpuser:ingestion"
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 def get_audit_stamp() -> AuditStampClass:
     now = int(time.time() * 1000)
@@ -61,6 +83,43 @@ def sanitize_array_string(s: str) -> str:
     return maybe_remove_suffix(maybe_remove_prefix(s, "["), "]")
 
 
+def get_prefetched_aspect(
+    current_aspects: Dict[str, Optional[_Aspect]], aspect_type: Type[Aspect]
+) -> Optional[Aspect]:
+    return cast(Optional[Aspect], current_aspects.get(aspect_type.ASPECT_NAME))
+
+
+@dataclass
+class ResourceRow:
+    entity_urn: str
+    term_associations: List[GlossaryTermAssociationClass]
+    tag_associations: List[TagAssociationClass]
+    owners: List[OwnerClass]
+    domain: Optional[str]
+    description: Optional[str]
+
+    def merge(self, other: "ResourceRow") -> "ResourceRow":
+        """
+        Combines two rows of the same resource. Terms, tags and owners are added up,
+        while the domain and description of the later row take precedence.
+        """
+        assert self.entity_urn == other.entity_urn
+        term_urns = {term.urn for term in self.term_associations}
+        tag_urns = {tag.tag for tag in self.tag_associations}
+        owner_urns = {owner.owner for owner in self.owners}
+        return ResourceRow(
+            entity_urn=self.entity_urn,
+            term_associations=self.term_associations
+            + [term for term in other.term_associations if term.urn not in term_urns],
+            tag_associations=self.tag_associations
+            + [tag for tag in other.tag_associations if tag.tag not in tag_urns],
+            owners=self.owners
+            + [owner for owner in other.owners if owner.owner not in owner_urns],
+            domain=other.domain or self.domain,
+            description=other.description or self.description,
+        )
+
+
 @dataclass
 class SubResourceRow:
     entity_urn: str
@@ -122,6 +181,7 @@ class CSVEnricherSource(Source):
         self,
         entity_urn: str,
         term_associations: List[GlossaryTermAssociationClass],
+        current_aspects: Optional[Dict[str, Optional[_Aspect]]] = None,
     ) -> Optional[MetadataWorkUnit]:
         # Check if there are glossary terms to add. If not, return None.
         if len(term_associations) <= 0:
@@ -130,7 +190,11 @@ class CSVEnricherSource(Source):
         current_terms: Optional[GlossaryTermsClass] = None
         if self.ctx.graph and not self.should_overwrite:
             # Get the existing terms for the entity from the DataHub graph
-            current_terms = self.ctx.graph.get_glossary_terms(entity_urn=entity_urn)
+            current_terms = (
+                get_prefetched_aspect(current_aspects, GlossaryTermsClass)
+                if current_aspects is not None
+                else self.ctx.graph.get_glossary_terms(entity_urn=entity_urn)
+            )
 
         if not current_terms:
             # If we want to overwrite or there are no existing terms, create a new GlossaryTerms object
@@ -160,6 +224,7 @@ class CSVEnricherSource(Source):
         self,
         entity_urn: str,
         tag_associations: List[TagAssociationClass],
+        current_aspects: Optional[Dict[str, Optional[_Aspect]]] = None,
     ) -> Optional[MetadataWorkUnit]:
         # Check if there are tags to add. If not, return None.
         if len(tag_associations) <= 0:
@@ -168,7 +233,11 @@ class CSVEnricherSource(Source):
         current_tags: Optional[GlobalTagsClass] = None
         if self.ctx.graph and not self.should_overwrite:
             # Get the existing tags for the entity from the DataHub graph
-            current_tags = self.ctx.graph.get_tags(entity_urn=entity_urn)
+            current_tags = (
+                get_prefetched_aspect(current_aspects, GlobalTagsClass)
+                if current_aspects is not None
+                else self.ctx.graph.get_tags(entity_urn=entity_urn)
+            )
 
         if not current_tags:
             # If we want to overwrite or there are no existing tags, create a new GlobalTags object
@@ -196,6 +265,7 @@ class CSVEnricherSource(Source):
         self,
         entity_urn: str,
         owners: List[OwnerClass],
+        current_aspects: Optional[Dict[str, Optional[_Aspect]]] = None,
     ) -> Optional[MetadataWorkUnit]:
         # Check if there are owners to add. If not, return None.
         if len(owners) <= 0:
@@ -204,7 +274,11 @@ class CSVEnricherSource(Source):
         current_ownership: Optional[OwnershipClass] = None
         if self.ctx.graph and not self.should_overwrite:
             # Get the existing owner for the entity from the DataHub graph
-            current_ownership = self.ctx.graph.get_ownership(entity_urn=entity_urn)
+            current_ownership = (
+                get_prefetched_aspect(current_aspects, OwnershipClass)
+                if current_aspects is not None
+                else self.ctx.graph.get_ownership(entity_urn=entity_urn)
+            )
 
         if not current_ownership:
             # If we want to overwrite or there are no existing tags, create a new GlobalTags object
@@ -232,6 +306,7 @@ class CSVEnricherSource(Source):
         self,
         entity_urn: str,
         domain: Optional[str],
+        current_aspects: Optional[Dict[str, Optional[_Aspect]]] = None,
     ) -> Optional[MetadataWorkUnit]:
         # Check if there is a domain to add. If not, return None.
         if not domain:
@@ -240,7 +315,11 @@ class CSVEnricherSource(Source):
         current_domain: Optional[DomainsClass] = None
         if self.ctx.graph and not self.should_overwrite:
             # Get the existing domain for the entity from the DataHub graph
-            current_domain = self.ctx.graph.get_domain(entity_urn=entity_urn)
+            current_domain = (
+                get_prefetched_aspect(current_aspects, DomainsClass)
+                if current_aspects is not None
+                else self.ctx.graph.get_domain(entity_urn=entity_urn)
+            )
 
         if not current_domain:
             # If we want to overwrite or there is no existing domain, create a new object
@@ -255,6 +334,7 @@ class CSVEnricherSource(Source):
         self,
         entity_urn: str,
         description: Optional[str],
+        current_aspects: Optional[Dict[str, Optional[_Aspect]]] = None,
     ) -> Optional[MetadataWorkUnit]:
         # Check if there is a description to add. If not, return None.
         if not description:
@@ -267,9 +347,13 @@ class CSVEnricherSource(Source):
         current_editable_properties: Optional[EditableDatasetPropertiesClass] = None
         if self.ctx.graph and not self.should_overwrite:
             # Get the existing editable properties for the entity from the DataHub graph
-            current_editable_properties = self.ctx.graph.get_aspect(
-                entity_urn=entity_urn,
-                aspect_type=EditableDatasetPropertiesClass,
+            current_editable_properties = (
+                get_prefetched_aspect(current_aspects, EditableDatasetPropertiesClass)
+                if current_aspects is not None
+                else self.ctx.graph.get_aspect(
+                    entity_urn=entity_urn,
+                    aspect_type=EditableDatasetPropertiesClass,
+                )
             )
 
         if not current_editable_properties:
@@ -296,12 +380,14 @@ class CSVEnricherSource(Source):
         owners: List[OwnerClass],
         domain: Optional[str],
         description: Optional[str],
+        current_aspects: Optional[Dict[str, Optional[_Aspect]]] = None,
     ) -> Iterable[MetadataWorkUnit]:
         maybe_terms_wu: Optional[
             MetadataWorkUnit
         ] = self.get_resource_glossary_terms_work_unit(
             entity_urn=entity_urn,
             term_associations=term_associations,
+            current_aspects=current_aspects,
         )
         if maybe_terms_wu:
             self.report.num_glossary_term_workunits_produced += 1
@@ -311,6 +397,7 @@ class CSVEnricherSource(Source):
         maybe_tags_wu: Optional[MetadataWorkUnit] = self.get_resource_tags_work_unit(
             entity_urn=entity_urn,
             tag_associations=tag_associations,
+            current_aspects=current_aspects,
         )
         if maybe_tags_wu:
             self.report.num_tag_workunits_produced += 1
@@ -322,6 +409,7 @@ class CSVEnricherSource(Source):
         ] = self.get_resource_owners_work_unit(
             entity_urn=entity_urn,
             owners=owners,
+            current_aspects=current_aspects,
         )
         if maybe_owners_wu:
             self.report.num_owners_workunits_produced += 1
@@ -333,6 +421,7 @@ class CSVEnricherSource(Source):
         ] = self.get_resource_domain_work_unit(
             entity_urn=entity_urn,
             domain=domain,
+            current_aspects=current_aspects,
         )
         if maybe_domain_wu:
             self.report.num_domain_workunits_produced += 1
@@ -344,6 +433,7 @@ class CSVEnricherSource(Source):
         ] = self.get_resource_description_work_unit(
             entity_urn=entity_urn,
             description=description,
+            current_aspects=current_aspects,
         )
         if maybe_description_wu:
             self.report.num_description_workunits_produced += 1
@@ -444,22 +534,77 @@ class CSVEnricherSource(Source):
             needs_write = True
         return current_editable_schema_metadata, needs_write
 
+    def get_current_aspects(
+        self, resource_row: ResourceRow
+    ) -> Optional[Dict[str, Optional[_Aspect]]]:
+        """
+        Fetches all the aspects that the row modifies in a single request. Returns None
+        if the existing aspects are not needed, because they are overwritten.
+        """
+        if not self.ctx.graph or self.should_overwrite:
+            return None
+
+        aspect_types: List[Type[_Aspect]] = []
+        if resource_row.term_associations:
+            aspect_types.append(GlossaryTermsClass)
+        if resource_row.tag_associations:
+            aspect_types.append(GlobalTagsClass)
+        if resource_row.owners:
+            aspect_types.append(OwnershipClass)
+        if resource_row.domain:
+            aspect_types.append(DomainsClass)
+        if resource_row.description:
+            aspect_types.append(EditableDatasetPropertiesClass)
+        if not aspect_types:
+            return {}
+
+        current_aspects = self.ctx.graph.get_aspects_for_entity(
+            entity_urn=resource_row.entity_urn,
+            aspects=[aspect_type.ASPECT_NAME for aspect_type in aspect_types],
+            aspect_types=aspect_types,
+        )
+        # The entity does not exist yet.
+        return current_aspects or {}
+
+    def get_current_editable_schema_metadata(
+        self, entity_urn: str
+    ) -> Optional[EditableSchemaMetadataClass]:
+        if self.ctx.graph and not self.should_overwrite:
+            # Fetch the current editable schema metadata
+            return self.ctx.graph.get_aspect(
+                entity_urn=entity_urn,
+                aspect_type=EditableSchemaMetadataClass,
+            )
+        return None
+
+    def fetch_concurrently(
+        self, fetch: Callable[[_T], _R], items: Iterable[_T]
+    ) -> Iterable[Tuple[_T, _R]]:
+        """
+        Calls `fetch` for each item on up to max_workers threads, and yields the items
+        with their results in the original order.
+        """
+        if self.should_overwrite or self.config.max_workers == 1:
+            for item in items:
+                yield item, fetch(item)
+            return
+
+        for future in BackpressureAwareExecutor.map_ordered(
+            lambda item: (item, fetch(item)),
+            ((item,) for item in items),
+            max_workers=self.config.max_workers,
+        ):
+            yield future.result()
+
     def get_sub_resource_work_units(self) -> Iterable[MetadataWorkUnit]:
         # Iterate over the map
-        for entity_urn in self.editable_schema_metadata_map:
+        for entity_urn, current_editable_schema_metadata in self.fetch_concurrently(
+            self.get_current_editable_schema_metadata,
+            self.editable_schema_metadata_map,
+        ):
             # Boolean field to tell whether we need to write an MCPW.
             needs_write = False
 
-            current_editable_schema_metadata: Optional[
-                EditableSchemaMetadataClass
-            ] = None
-            if self.ctx.graph and not self.should_overwrite:
-                # Fetch the current editable schema metadata
-                current_editable_schema_metadata = self.ctx.graph.get_aspect(
-                    entity_urn=entity_urn,
-                    aspect_type=EditableSchemaMetadataClass,
-                )
-
             # Create a new editable schema metadata for the dataset if it doesn't exist
             if not current_editable_schema_metadata:
                 current_editable_schema_metadata = EditableSchemaMetadataClass(
@@ -537,34 +682,36 @@ class CSVEnricherSource(Source):
         ]
         return owners
 
-    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+    def read_rows(self) -> Iterable[Dict[str, str]]:
         # As per https://stackoverflow.com/a/49150749/5004662, we want to use
         # the 'utf-8-sig' encoding to handle any BOM character that may be
         # present in the file. Excel is known to add a BOM to CSV files.
         # As per https://stackoverflow.com/a/63508823/5004662,
         # this is also safe with normal files that don't have a BOM.
         parsed_location = parse.urlparse(self.config.filename)
-        keep_rows = []
         if parsed_location.scheme in ("file", ""):
             with open(
                 pathlib.Path(self.config.filename), mode="r", encoding="utf-8-sig"
             ) as f:
-                rows = csv.DictReader(f, delimiter=self.config.delimiter)
-                keep_rows = [row for row in rows]
+                yield from csv.DictReader(f, delimiter=self.config.delimiter)
         else:
             try:
-                resp = requests.get(self.config.filename)
-                decoded_content = resp.content.decode("utf-8-sig")
-                rows = csv.DictReader(
-                    decoded_content.splitlines(), delimiter=self.config.delimiter
-                )
-                keep_rows = [row for row in rows]
+                resp = requests.get(self.config.filename, stream=True)
+                resp.raw.decode_content = True
             except Exception as e:
                 raise ConfigurationError(
                     f"Cannot read remote file {self.config.filename}, error:{e}"
                 )
-
-        for row in keep_rows:
+            # The remote file is decoded and parsed while it is downloaded.
+            with resp, io.TextIOWrapper(resp.raw, encoding="utf-8-sig") as f:
+                yield from csv.DictReader(f, delimiter=self.config.delimiter)
+
+    def get_resource_rows(self) -> Iterable[ResourceRow]:
+        """
+        Parses the rows of the CSV as they are read. Rows that apply to a sub resource
+        are collected in the editable schema metadata map, all other rows are returned.
+        """
+        for row in self.read_rows():
             # We need the resource to move forward
             if not row["resource"]:
                 continue
@@ -595,15 +742,14 @@ class CSVEnricherSource(Source):
             )
 
             if is_resource_row:
-                for wu in self.get_resource_workunits(
+                yield ResourceRow(
                     entity_urn=entity_urn,
                     term_associations=term_associations,
                     tag_associations=tag_associations,
                     owners=owners,
                     domain=domain,
                     description=description,
-                ):
-                    yield wu
+                )
 
             # If this row is not applying changes at the resource level, modify the EditableSchemaMetadata map.
             else:
@@ -627,6 +773,28 @@ class CSVEnricherSource(Source):
                     )
                 )
 
+    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        # Consecutive rows of the same resource are applied together, so that each
+        # aspect is read and written only once.
+        resource_rows = (
+            functools.reduce(ResourceRow.merge, rows)
+            for _, rows in itertools.groupby(
+                self.get_resource_rows(), key=operator.attrgetter("entity_urn")
+            )
+        )
+        for resource_row, current_aspects in self.fetch_concurrently(
+            self.get_current_aspects, resource_rows
+        ):
+            yield from self.get_resource_workunits(
+                entity_urn=resource_row.entity_urn,
+                term_associations=resource_row.term_associations,
+                tag_associations=resource_row.tag_associations,
+                owners=resource_row.owners,
+                domain=resource_row.domain,
+                description=resource_row.description,
+                current_aspects=current_aspects,
+            )
+
         # Yield sub resource work units once the map has been fully populated.
         for wu in self.get_sub_resource_work_units():
             self.report.num_editable_schema_metadata_workunits_produced += 1
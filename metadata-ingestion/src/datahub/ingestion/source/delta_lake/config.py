@@ -13,6 +13,11 @@ from datahub.configuration.source_common import (
 )
 from datahub.ingestion.source.aws.aws_common import AwsConnectionConfig
 from datahub.ingestion.source.aws.s3_util import is_s3_uri
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIncrementalExtractionConfigMixin,
+    StatefulIngestionConfig,
+    StatefulIngestionConfigBase,
+)
 
 # hide annoying debug errors from py4j
 logging.getLogger("py4j").setLevel(logging.ERROR)
@@ -35,7 +40,12 @@ class S3(ConfigModel):
     )
 
 
-class DeltaLakeSourceConfig(PlatformInstanceConfigMixin, EnvConfigMixin):
+class DeltaLakeSourceConfig(
+    PlatformInstanceConfigMixin,
+    EnvConfigMixin,
+    StatefulIngestionConfigBase,
+    StatefulIncrementalExtractionConfigMixin,
+):
     base_path: str = Field(
         description="Path to table (s3 or local file system). If path is not a delta table path "
         "then all subfolders will be scanned to detect and ingest delta tables."
@@ -74,6 +84,16 @@ class DeltaLakeSourceConfig(PlatformInstanceConfigMixin, EnvConfigMixin):
 
     s3: Optional[S3] = Field()
 
+    max_workers: pydantic.PositiveInt = Field(
+        default=1,
+        description="Number of Delta tables loaded concurrently. Loading a table replays its transaction log from the last checkpoint, and reads its history. Tables are still emitted in the same order.",
+    )
+
+    stateful_ingestion: Optional[StatefulIngestionConfig] = Field(
+        default=None,
+        description="Delta Lake Stateful Ingestion Config. With incremental_extraction, the tables whose latest version did not change since the last run are skipped.",
+    )
+
     @cached_property
     def is_s3(self):
         return is_s3_uri(self.base_path or "")
@@ -1,10 +1,18 @@
+import json
+import os
 import pathlib
-from typing import Optional
+import re
+from typing import Iterable, Optional
 
 from deltalake import DeltaTable, PyDeltaTableError
 
+from datahub.ingestion.source.aws.s3_util import get_bucket_name, get_key_prefix
 from datahub.ingestion.source.delta_lake.config import DeltaLakeSourceConfig
 
+_DELTA_LOG_FOLDER = "_delta_log"
+_LAST_CHECKPOINT_FILE = "_last_checkpoint"
+_COMMIT_FILE_PATTERN = re.compile(r"^(\d{20})\.json$")
+
 
 def read_delta_table(
     path: str, delta_lake_config: DeltaLakeSourceConfig
@@ -52,3 +60,100 @@ def read_delta_table(
 
 def get_file_count(delta_table: DeltaTable) -> int:
     return len(delta_table.files())
+
+
+def _get_s3_log_prefix(path: str) -> str:
+    return f"{get_key_prefix(path).rstrip('/')}/{_DELTA_LOG_FOLDER}/"
+
+
+def can_list_delta_log(delta_lake_config: DeltaLakeSourceConfig) -> bool:
+    """
+    Whether the transaction logs can be listed without reading the tables. Without an
+    AWS connection, S3 buckets can't be listed, but DeltaTable can still read the tables
+    with the default credentials.
+    """
+    return not delta_lake_config.is_s3 or (
+        delta_lake_config.s3 is not None and delta_lake_config.s3.aws_config is not None
+    )
+
+
+def is_delta_table_path(path: str, delta_lake_config: DeltaLakeSourceConfig) -> bool:
+    """
+    Checks whether the path has a transaction log, without reading it. Always False if
+    the transaction log can't be listed, see can_list_delta_log().
+    """
+    if not delta_lake_config.is_s3:
+        return os.path.isdir(os.path.join(path, _DELTA_LOG_FOLDER))
+    if delta_lake_config.s3 is None or delta_lake_config.s3.aws_config is None:
+        return False
+    response = delta_lake_config.s3.aws_config.get_s3_client().list_objects_v2(
+        Bucket=get_bucket_name(path), Prefix=_get_s3_log_prefix(path), MaxKeys=1
+    )
+    return response.get("KeyCount", 0) > 0
+
+
+def _get_latest_commit_version(
+    file_names: Iterable[str], checkpoint_version: Optional[int]
+) -> Optional[int]:
+    latest_version = checkpoint_version
+    for file_name in file_names:
+        match = _COMMIT_FILE_PATTERN.match(file_name)
+        if match:
+            version = int(match.group(1))
+            if latest_version is None or version > latest_version:
+                latest_version = version
+    return latest_version
+
+
+def get_latest_version(
+    path: str, delta_lake_config: DeltaLakeSourceConfig
+) -> Optional[int]:
+    """
+    Returns the latest version of the Delta table at the path, without replaying its
+    transaction log. Like DeltaTable, it starts from the last checkpoint and only looks
+    at the commits written after it.
+
+    Returns None if the version can't be determined.
+    """
+    if not delta_lake_config.is_s3:
+        log_path = os.path.join(path, _DELTA_LOG_FOLDER)
+        checkpoint_version: Optional[int] = None
+        try:
+            with open(os.path.join(log_path, _LAST_CHECKPOINT_FILE)) as f:
+                checkpoint_version = int(json.load(f)["version"])
+        except FileNotFoundError:
+            pass
+        # A local listing is cheap, so it is not narrowed down to the commits after the
+        # checkpoint.
+        return _get_latest_commit_version(os.listdir(log_path), checkpoint_version)
+
+    if delta_lake_config.s3 is None or delta_lake_config.s3.aws_config is None:
+        return None
+    s3_client = delta_lake_config.s3.aws_config.get_s3_client()
+    bucket = get_bucket_name(path)
+    log_prefix = _get_s3_log_prefix(path)
+    checkpoint_version = None
+    try:
+        response = s3_client.get_object(
+            Bucket=bucket, Key=f"{log_prefix}{_LAST_CHECKPOINT_FILE}"
+        )
+        checkpoint_version = int(json.loads(response["Body"].read())["version"])
+    except s3_client.exceptions.NoSuchKey:
+        pass
+
+    paginator = s3_client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket,
+        Prefix=log_prefix,
+        StartAfter=f"{log_prefix}{checkpoint_version:020d}"
+        if checkpoint_version is not None
+        else "",
+    )
+    return _get_latest_commit_version(
+        (
+            obj["Key"][len(log_prefix) :]
+            for page in pages
+            for obj in page.get("Contents", [])
+        ),
+        checkpoint_version,
+    )
@@ -2,16 +2,22 @@ import dataclasses
 from dataclasses import field as dataclass_field
 from typing import List
 
-from datahub.ingestion.api.source import SourceReport
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionReport,
+)
 
 
 @dataclasses.dataclass
-class DeltaLakeSourceReport(SourceReport):
+class DeltaLakeSourceReport(StatefulIngestionReport):
     files_scanned = 0
     filtered: List[str] = dataclass_field(default_factory=list)
+    tables_skipped_unchanged: int = 0
 
     def report_file_scanned(self) -> None:
         self.files_scanned += 1
 
     def report_file_dropped(self, file: str) -> None:
         self.filtered.append(file)
+
+    def report_table_skipped_unchanged(self, path: str) -> None:
+        self.tables_skipped_unchanged += 1
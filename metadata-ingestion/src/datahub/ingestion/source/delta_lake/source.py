@@ -1,8 +1,9 @@
 import logging
 import os
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from deltalake import DeltaTable
 
@@ -30,12 +31,21 @@ from datahub.ingestion.source.aws.s3_util import (
 )
 from datahub.ingestion.source.delta_lake.config import DeltaLakeSourceConfig
 from datahub.ingestion.source.delta_lake.delta_lake_utils import (
+    can_list_delta_log,
     get_file_count,
+    get_latest_version,
+    is_delta_table_path,
     read_delta_table,
 )
 from datahub.ingestion.source.delta_lake.report import DeltaLakeSourceReport
 from datahub.ingestion.source.s3.data_lake_utils import ContainerWUCreator
 from datahub.ingestion.source.schema_inference.csv_tsv import tableschema_type_map
+from datahub.ingestion.source.state.incremental_extraction_handler import (
+    IncrementalExtractionHandler,
+)
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIngestionSourceBase,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.common import Status
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
@@ -52,6 +62,7 @@ from datahub.metadata.schema_classes import (
     OtherSchemaClass,
 )
 from datahub.telemetry import telemetry
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 
 logging.getLogger("py4j").setLevel(logging.ERROR)
 logger: logging.Logger = logging.getLogger(__name__)
@@ -74,11 +85,22 @@ OPERATION_STATEMENT_TYPES = {
 }
 
 
+@dataclass
+class _LoadedTable:
+    path: str
+    # None if the table was not loaded.
+    delta_table: Optional[DeltaTable] = None
+    history: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: bool = False
+    # Set if the table could not be loaded because of an error.
+    error: Optional[str] = None
+
+
 @platform_name("Delta Lake", id="delta-lake")
 @config_class(DeltaLakeSourceConfig)
 @support_status(SupportStatus.INCUBATING)
 @capability(SourceCapability.TAGS, "Can extract S3 object/bucket tags if enabled")
-class DeltaLakeSource(Source):
+class DeltaLakeSource(StatefulIngestionSourceBase):
     """
     This plugin extracts:
     - Column types and schema associated with each delta table
@@ -98,8 +120,9 @@ class DeltaLakeSource(Source):
     container_WU_creator: ContainerWUCreator
 
     def __init__(self, config: DeltaLakeSourceConfig, ctx: PipelineContext):
-        super().__init__(ctx)
+        super().__init__(config, ctx)
         self.source_config = config
+        self.platform = config.platform
         self.report = DeltaLakeSourceReport()
         # self.profiling_times_taken = []
         config_report = {
@@ -113,6 +136,13 @@ class DeltaLakeSource(Source):
             config_report,
         )
 
+        self.incremental_extraction_handler = IncrementalExtractionHandler(
+            source=self,
+            config=self.source_config,
+            pipeline_name=self.ctx.pipeline_name,
+            run_id=self.ctx.run_id,
+        )
+
     @classmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Source":
         config = DeltaLakeSourceConfig.parse_obj(config_dict)
@@ -140,17 +170,23 @@ class DeltaLakeSource(Source):
 
         return fields
 
+    def _get_history(self, delta_table: DeltaTable) -> List[Dict[str, Any]]:
+        return delta_table.history(limit=self.source_config.version_history_lookback)
+
     def _create_operation_aspect_wu(
-        self, delta_table: DeltaTable, dataset_urn: str
+        self,
+        delta_table: DeltaTable,
+        dataset_urn: str,
+        history: Optional[List[Dict[str, Any]]] = None,
     ) -> Iterable[MetadataWorkUnit]:
-        for hist in delta_table.history(
-            limit=self.source_config.version_history_lookback
-        ):
+        if history is None:
+            history = self._get_history(delta_table)
+        for hist in history:
             # History schema picked up from https://docs.delta.io/latest/delta-utility.html#retrieve-delta-table-history
             reported_time: int = int(time.time() * 1000)
             last_updated_timestamp: int = hist["timestamp"]
             statement_type = OPERATION_STATEMENT_TYPES.get(
-                hist.get("operation"), OperationTypeClass.CUSTOM
+                hist.get("operation", ""), OperationTypeClass.CUSTOM
             )
             custom_type = (
                 hist.get("operation")
@@ -189,7 +225,10 @@ class DeltaLakeSource(Source):
             yield operational_wu
 
     def ingest_table(
-        self, delta_table: DeltaTable, path: str
+        self,
+        delta_table: DeltaTable,
+        path: str,
+        history: Optional[List[Dict[str, Any]]] = None,
     ) -> Iterable[MetadataWorkUnit]:
         table_name = (
             delta_table.metadata().name
@@ -284,20 +323,91 @@ class DeltaLakeSource(Source):
             self.report.report_workunit(wu)
             yield wu
 
-        yield from self._create_operation_aspect_wu(delta_table, dataset_urn)
+        yield from self._create_operation_aspect_wu(delta_table, dataset_urn, history)
 
-    def process_folder(
+    def get_table_paths(
         self, path: str, get_folders: Callable[[str], Iterable[str]]
-    ) -> Iterable[MetadataWorkUnit]:
+    ) -> Iterable[Tuple[str, Optional[DeltaTable]]]:
+        """
+        Yields the paths of the Delta tables found at or under the path. A folder is only
+        checked for a transaction log here, the tables are loaded by load_table().
+
+        If the transaction logs can't be listed, the folder has to be read as a table
+        instead, and the table is yielded along with its path so it is not read again.
+        """
         logger.debug(f"Processing folder: {path}")
-        delta_table = read_delta_table(path, self.source_config)
-        if delta_table:
-            logger.debug(f"Delta table found at: {path}")
-            for wu in self.ingest_table(delta_table, path):
-                yield wu
+        if can_list_delta_log(self.source_config):
+            if is_delta_table_path(path, self.source_config):
+                yield path, None
+                return
         else:
-            for folder in get_folders(path):
-                yield from self.process_folder(path + "/" + folder, get_folders)
+            delta_table = read_delta_table(path, self.source_config)
+            if delta_table is not None:
+                yield path, delta_table
+                return
+        for folder in get_folders(path):
+            yield from self.get_table_paths(path + "/" + folder, get_folders)
+
+    def load_table(
+        self, path: str, delta_table: Optional[DeltaTable] = None
+    ) -> _LoadedTable:
+        """
+        Loads the Delta table at the path, unless it is given, and its history. This is
+        where the transaction log is replayed, so it may be called by several threads at
+        once.
+        """
+        if self.incremental_extraction_handler.is_checkpointing_enabled():
+            latest_version = (
+                delta_table.version()
+                if delta_table is not None
+                else get_latest_version(path, self.source_config)
+            )
+            if self.incremental_extraction_handler.is_unchanged(path, latest_version):
+                return _LoadedTable(path=path, unchanged=True)
+
+        if delta_table is None:
+            delta_table = read_delta_table(path, self.source_config)
+        if delta_table is None:
+            return _LoadedTable(path=path)
+        return _LoadedTable(
+            path=path, delta_table=delta_table, history=self._get_history(delta_table)
+        )
+
+    def _load_table_or_error(
+        self, path: str, delta_table: Optional[DeltaTable] = None
+    ) -> _LoadedTable:
+        # The errors are reported by process_table(), which runs in the main thread.
+        try:
+            return self.load_table(path, delta_table)
+        except Exception as e:
+            logger.debug(f"Failed to load Delta table at: {path}", exc_info=e)
+            return _LoadedTable(path=path, error=str(e))
+
+    def process_table(self, table: _LoadedTable) -> Iterable[MetadataWorkUnit]:
+        if table.unchanged:
+            logger.debug(f"Skipping unchanged Delta table at: {table.path}")
+            self.incremental_extraction_handler.carry_forward(table.path)
+            self.report.report_table_skipped_unchanged(table.path)
+            return
+        if table.error is not None:
+            self.report.report_failure(
+                table.path, f"Failed to load Delta table: {table.error}"
+            )
+            # The table is compared with the version of the last successful run next time.
+            self.incremental_extraction_handler.carry_forward(table.path)
+            return
+        if table.delta_table is None:
+            logger.debug(f"Could not load Delta table at: {table.path}")
+            return
+
+        logger.debug(f"Delta table found at: {table.path}")
+        urns: Set[str] = set()
+        for wu in self.ingest_table(table.delta_table, table.path, table.history):
+            urns.add(wu.get_urn())
+            yield wu
+        self.incremental_extraction_handler.add_entity(
+            table.path, table.delta_table.version(), urns=urns
+        )
 
     def s3_get_folders(self, path: str) -> Iterable[str]:
         if self.source_config.s3 is not None:
@@ -323,8 +433,26 @@ class DeltaLakeSource(Source):
         get_folders = (
             self.s3_get_folders if self.source_config.is_s3 else self.local_get_folders
         )
-        for wu in self.process_folder(self.source_config.complete_path, get_folders):
-            yield wu
+        tables = self.get_table_paths(self.source_config.complete_path, get_folders)
+
+        if self.incremental_extraction_handler.is_checkpointing_enabled():
+            # Decided once, before the tables are loaded by several threads.
+            self.incremental_extraction_handler.is_full_extraction()
+
+        if self.source_config.max_workers == 1:
+            for path, delta_table in tables:
+                yield from self.process_table(
+                    self._load_table_or_error(path, delta_table)
+                )
+            return
+
+        # The next tables are loaded concurrently, but processed in order.
+        for future in BackpressureAwareExecutor.map_ordered(
+            self._load_table_or_error,
+            tables,
+            max_workers=self.source_config.max_workers,
+        ):
+            yield from self.process_table(future.result())
 
     def get_report(self) -> SourceReport:
         return self.report
@@ -1,15 +1,28 @@
+import copy
 import json
 import logging
+import re
 from collections import defaultdict
 from dataclasses import dataclass, field
 from hashlib import md5
-from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Type
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
+import pydantic
 from elasticsearch import Elasticsearch
 from pydantic import validator
 from pydantic.fields import Field
 
-from datahub.configuration.common import AllowDenyPattern
+from datahub.configuration.common import AllowDenyPattern, ConfigModel
 from datahub.configuration.source_common import (
     EnvConfigMixin,
     PlatformInstanceConfigMixin,
@@ -54,10 +67,15 @@ from datahub.metadata.schema_classes import (
     StringTypeClass,
     SubTypesClass,
 )
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.config_clean import remove_protocol
 
 logger = logging.getLogger(__name__)
 
+# The names of the indices fetched in a single request are sent in the URL, so their
+# total length is kept well below the 4KB limit of the HTTP request line.
+_MAX_INDEX_NAMES_LENGTH = 2048
+
 
 class ElasticToSchemaFieldConverter:
     # FieldPath format version.
@@ -181,6 +199,8 @@ class ElasticToSchemaFieldConverter:
 @dataclass
 class ElasticsearchSourceReport(SourceReport):
     index_scanned: int = 0
+    index_metadata_requests: int = 0
+    index_mappings_reused: int = 0
     filtered: List[str] = field(default_factory=list)
 
     def report_index_scanned(self, index: str) -> None:
@@ -190,6 +210,38 @@ class ElasticsearchSourceReport(SourceReport):
         self.filtered.append(index)
 
 
+class CollapseUrns(ConfigModel):
+    urns_suffix_regex: List[str] = Field(
+        default_factory=list,
+        description="List of regex patterns to remove from the name of the indices. All the indices with the same name after removal are ingested as a single dataset, "
+        "e.g. `-\\d{4}\\.\\d{2}\\.\\d{2}$` for daily indices like `logs-2023.01.01`. "
+        "The patterns are applied in order, so that indices with different suffix formats can be collapsed too.",
+    )
+
+
+def collapse_name(name: str, collapse_urns: CollapseUrns) -> str:
+    for suffix in collapse_urns.urns_suffix_regex:
+        name = re.sub(suffix, "", name)
+    return name
+
+
+def batch_index_names(
+    indices: Iterable[str], max_length: int = _MAX_INDEX_NAMES_LENGTH
+) -> Iterator[List[str]]:
+    """Splits the index names into batches whose comma separated list fits in max_length."""
+    batch: List[str] = []
+    batch_length = 0
+    for index in indices:
+        if batch and batch_length + 1 + len(index) > max_length:
+            yield batch
+            batch = []
+            batch_length = 0
+        batch_length += len(index) + (1 if batch else 0)
+        batch.append(index)
+    if batch:
+        yield batch
+
+
 class ElasticsearchSourceConfig(PlatformInstanceConfigMixin, EnvConfigMixin):
     host: str = Field(
         default="localhost:9200", description="The elastic search host URI."
@@ -247,6 +299,14 @@ class ElasticsearchSourceConfig(PlatformInstanceConfigMixin, EnvConfigMixin):
         default=AllowDenyPattern(allow=[".*"], deny=["^_.*"]),
         description="The regex patterns for filtering index templates to ingest.",
     )
+    collapse_urns: CollapseUrns = Field(
+        default_factory=CollapseUrns,
+        description="Collapses the indices whose names only differ by a suffix, e.g. time-based indices, into a single dataset.",
+    )
+    max_workers: pydantic.PositiveInt = Field(
+        default=1,
+        description="Number of threads used to fetch the metadata of the indices. The metadata is fetched in bulk, for a batch of indices per request.",
+    )
 
     @validator("host")
     def host_colon_port_comma(cls, host_val: str) -> str:
@@ -274,6 +334,8 @@ class ElasticsearchSource(Source):
 
     - Metadata for indexes
     - Column types associated with each index field
+
+    Indices whose names only differ by a suffix, such as daily indices, can be ingested as a single dataset with `collapse_urns`.
     """
 
     def __init__(self, config: ElasticsearchSourceConfig, ctx: PipelineContext):
@@ -292,7 +354,10 @@ class ElasticsearchSource(Source):
             url_prefix=self.source_config.url_prefix,
         )
         self.report = ElasticsearchSourceReport()
+        # Number of indices of each data stream, or of each collapsed index name.
         self.data_stream_partition_count: Dict[str, int] = defaultdict(int)
+        # key: md5 hash of the mappings
+        self._schema_fields_cache: Dict[str, List[SchemaField]] = {}
         self.platform: str = "elasticsearch"
 
     @classmethod
@@ -305,17 +370,21 @@ class ElasticsearchSource(Source):
     def get_workunits(self) -> Iterable[MetadataWorkUnit]:
         indices = self.client.indices.get_alias()
 
+        allowed_indices: List[str] = []
         for index in indices:
             self.report.report_index_scanned(index)
 
             if self.source_config.index_pattern.allowed(index):
-                for mcp in self._extract_mcps(index, is_index=True):
-                    wu = MetadataWorkUnit(id=f"index-{index}", mcp=mcp)
-                    self.report.report_workunit(wu)
-                    yield wu
+                allowed_indices.append(index)
             else:
                 self.report.report_dropped(index)
 
+        for index, raw_index_metadata in self._get_raw_indices(allowed_indices):
+            for mcp in self._extract_mcps(index, raw_index_metadata, is_index=True):
+                wu = MetadataWorkUnit(id=f"index-{index}", mcp=mcp)
+                self.report.report_workunit(wu)
+                yield wu
+
         for mcp in self._get_data_stream_index_count_mcps():
             wu = MetadataWorkUnit(id=f"index-{index}", mcp=mcp)
             self.report.report_workunit(wu)
@@ -324,11 +393,60 @@ class ElasticsearchSource(Source):
             templates = self.client.indices.get_template()
             for template in templates:
                 if self.source_config.index_template_pattern.allowed(template):
-                    for mcp in self._extract_mcps(template, is_index=False):
+                    for mcp in self._extract_mcps(
+                        template, templates[template], is_index=False
+                    ):
                         wu = MetadataWorkUnit(id=f"template-{template}", mcp=mcp)
                         self.report.report_workunit(wu)
                         yield wu
 
+    def _get_raw_index_batch(self, indices: List[str]) -> Dict[str, Any]:
+        # Indices deleted since they were listed, e.g. by an ILM policy, are skipped.
+        return self.client.indices.get(index=",".join(indices), ignore_unavailable=True)
+
+    def _get_raw_indices(
+        self, indices: List[str]
+    ) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        """
+        Fetches the metadata of the indices in bulk, and yields it in the order of the indices.
+        """
+        batches = list(batch_index_names(indices))
+        if self.source_config.max_workers == 1:
+            raw_index_batches: Iterable[Dict[str, Any]] = (
+                self._get_raw_index_batch(batch) for batch in batches
+            )
+        else:
+            raw_index_batches = (
+                future.result()
+                for future in BackpressureAwareExecutor.map_ordered(
+                    self._get_raw_index_batch,
+                    ((batch,) for batch in batches),
+                    max_workers=self.source_config.max_workers,
+                )
+            )
+
+        for batch, raw_index_batch in zip(batches, raw_index_batches):
+            self.report.index_metadata_requests += 1
+            for index in batch:
+                if index not in raw_index_batch:
+                    logger.debug(f"Skipping index {index}, which no longer exists")
+                    continue
+                yield index, raw_index_batch[index]
+
+    def _get_schema_fields(
+        self, md5_hash: str, index_mappings: Dict[str, Any]
+    ) -> List[SchemaField]:
+        # Time-based indices mostly share the same mappings, so the fields are only
+        # generated once for each distinct mapping. They are copied for each dataset,
+        # since transformers may update them in place.
+        if md5_hash in self._schema_fields_cache:
+            self.report.index_mappings_reused += 1
+        else:
+            self._schema_fields_cache[md5_hash] = list(
+                ElasticToSchemaFieldConverter.get_schema_fields(index_mappings)
+            )
+        return copy.deepcopy(self._schema_fields_cache[md5_hash])
+
     def _get_data_stream_index_count_mcps(
         self,
     ) -> Iterable[MetadataChangeProposalWrapper]:
@@ -347,34 +465,30 @@ class ElasticsearchSource(Source):
             )
 
     def _extract_mcps(
-        self, index: str, is_index: bool = True
+        self, index: str, raw_index_metadata: Dict[str, Any], is_index: bool = True
     ) -> Iterable[MetadataChangeProposalWrapper]:
         logger.debug(f"index='{index}', is_index={is_index}")
 
         if is_index:
-            raw_index = self.client.indices.get(index=index)
-            raw_index_metadata = raw_index[index]
-
-            # 0. Dedup data_streams.
+            # 0. Dedup data_streams and collapsed indices.
             data_stream = raw_index_metadata.get("data_stream")
-            if data_stream:
-                index = data_stream
+            if data_stream or self.source_config.collapse_urns.urns_suffix_regex:
+                # An index whose name is unchanged by the suffix patterns still shares
+                # its dataset with the indices that collapse to its name.
+                index = data_stream or collapse_name(
+                    index, self.source_config.collapse_urns
+                )
                 self.data_stream_partition_count[index] += 1
                 if self.data_stream_partition_count[index] > 1:
                     # This is a duplicate, skip processing it further.
                     return
-        else:
-            raw_index = self.client.indices.get_template(name=index)
-            raw_index_metadata = raw_index[index]
 
         # 1. Construct and emit the schemaMetadata aspect
         # 1.1 Generate the schema fields from ES mappings.
         index_mappings = raw_index_metadata["mappings"]
         index_mappings_json_str: str = json.dumps(index_mappings)
         md5_hash = md5(index_mappings_json_str.encode()).hexdigest()
-        schema_fields = list(
-            ElasticToSchemaFieldConverter.get_schema_fields(index_mappings)
-        )
+        schema_fields = self._get_schema_fields(md5_hash, index_mappings)
         if not schema_fields:
             return
 
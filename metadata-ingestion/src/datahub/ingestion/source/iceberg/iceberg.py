@@ -57,6 +57,7 @@ from datahub.metadata.schema_classes import (
     OwnershipClass,
     OwnershipTypeClass,
 )
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.source_helpers import (
     auto_stale_entity_removal,
     auto_status_aspect,
@@ -118,6 +119,7 @@ class IcebergSource(StatefulIngestionSourceBase):
         self.report: IcebergSourceReport = IcebergSourceReport()
         self.config: IcebergSourceConfig = config
         self.iceberg_client: FilesystemTables = config.filesystem_tables
+        self.profiler = IcebergProfiler(self.report, self.config.profiling)
 
         self.stale_entity_removal_handler = StaleEntityRemovalHandler(
             source=self,
@@ -139,27 +141,45 @@ class IcebergSource(StatefulIngestionSourceBase):
         )
 
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
+        if self.config.max_workers == 1:
+            for dataset_path, dataset_name in self._allowed_paths():
+                yield from self._process_dataset(dataset_path, dataset_name)
+            return
+
+        # Tables are loaded and profiled concurrently, but emitted in order.
+        for future in BackpressureAwareExecutor.map_ordered(
+            lambda dataset_path, dataset_name: list(
+                self._process_dataset(dataset_path, dataset_name)
+            ),
+            self._allowed_paths(),
+            max_workers=self.config.max_workers,
+        ):
+            yield from future.result()
+
+    def _allowed_paths(self) -> Iterable[Tuple[str, str]]:
         for dataset_path, dataset_name in self.config.get_paths():  # Tuple[str, str]
-            try:
-                if not self.config.table_pattern.allowed(dataset_name):
-                    # Path contained a valid Iceberg table, but is rejected by pattern.
-                    self.report.report_dropped(dataset_name)
-                    continue
-
-                # Try to load an Iceberg table.  Might not contain one, this will be caught by NoSuchTableException.
-                table: Table = self.iceberg_client.load(dataset_path)
-                yield from self._create_iceberg_workunit(dataset_name, table)
-            except NoSuchTableException:
-                # Path did not contain a valid Iceberg table. Silently ignore this.
-                LOGGER.debug(
-                    f"Path {dataset_path} does not contain table {dataset_name}"
-                )
-                pass
-            except Exception as e:
-                self.report.report_failure("general", f"Failed to create workunit: {e}")
-                LOGGER.exception(
-                    f"Exception while processing table {dataset_path}, skipping it.",
-                )
+            if not self.config.table_pattern.allowed(dataset_name):
+                # Path contained a valid Iceberg table, but is rejected by pattern.
+                self.report.report_dropped(dataset_name)
+                continue
+            yield dataset_path, dataset_name
+
+    def _process_dataset(
+        self, dataset_path: str, dataset_name: str
+    ) -> Iterable[MetadataWorkUnit]:
+        try:
+            # Try to load an Iceberg table.  Might not contain one, this will be caught by NoSuchTableException.
+            table: Table = self.iceberg_client.load(dataset_path)
+            yield from self._create_iceberg_workunit(dataset_name, table)
+        except NoSuchTableException:
+            # Path did not contain a valid Iceberg table. Silently ignore this.
+            LOGGER.debug(f"Path {dataset_path} does not contain table {dataset_name}")
+            pass
+        except Exception as e:
+            self.report.report_failure("general", f"Failed to create workunit: {e}")
+            LOGGER.exception(
+                f"Exception while processing table {dataset_path}, skipping it.",
+            )
 
     def _create_iceberg_workunit(
         self, dataset_name: str, table: Table
@@ -213,8 +233,7 @@ class IcebergSource(StatefulIngestionSourceBase):
             yield dpi_aspect
 
         if self.config.profiling.enabled:
-            profiler = IcebergProfiler(self.report, self.config.profiling)
-            yield from profiler.profile_table(dataset_name, dataset_urn, table)
+            yield from self.profiler.profile_table(dataset_name, dataset_urn, table)
 
     def _get_ownership_aspect(self, table: Table) -> Optional[OwnershipClass]:
         owners = []
@@ -1,4 +1,5 @@
 import os
+import threading
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -14,6 +15,7 @@ from datahub.configuration.common import (
     ConfigurationError,
 )
 from datahub.configuration.source_common import DatasetSourceConfigMixin
+from datahub.ingestion.api.common import WorkUnit
 from datahub.ingestion.source.azure.azure_common import AdlsSourceConfig
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalSourceReport,
@@ -41,6 +43,14 @@ class IcebergProfilingConfig(ConfigModel):
         default=True,
         description="Whether to profile for the max value of numeric columns.",
     )
+    max_workers: pydantic.PositiveInt = Field(
+        default=1,
+        description="Number of threads used to read the manifests of a table concurrently.",
+    )
+    manifest_stats_cache_path: Optional[str] = Field(
+        default=None,
+        description="Path of a SQLite file caching the stats of manifests, keyed by manifest path. Reusing the file across runs only reads the manifests added to a table since the previous run.",
+    )
     # Stats we cannot compute without looking at data
     # include_field_mean_value: bool = True
     # include_field_median_value: bool = True
@@ -81,6 +91,10 @@ class IcebergSourceConfig(StatefulIngestionConfigBase, DatasetSourceConfigMixin)
         description="Iceberg table property to look for a `CorpGroup` owner.  Can only hold a single group value.  If property has no value, no owner information will be emitted.",
     )
     profiling: IcebergProfilingConfig = IcebergProfilingConfig()
+    max_workers: pydantic.PositiveInt = Field(
+        default=1,
+        description="Number of tables loaded and profiled concurrently. Tables are still emitted in the same order.",
+    )
 
     @root_validator()
     def _ensure_one_filesystem_is_configured(
@@ -175,12 +189,38 @@ class IcebergSourceReport(StaleEntityRemovalSourceReport):
     tables_scanned: int = 0
     entities_profiled: int = 0
     filtered: List[str] = field(default_factory=list)
+    manifests_read: int = 0
+    manifests_cached: int = 0
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        # Tables may be processed by several threads at once.
+        self._lock = threading.RLock()
 
     def report_table_scanned(self, name: str) -> None:
-        self.tables_scanned += 1
+        with self._lock:
+            self.tables_scanned += 1
 
     def report_dropped(self, ent_name: str) -> None:
         self.filtered.append(ent_name)
 
     def report_entity_profiled(self, name: str) -> None:
-        self.entities_profiled += 1
+        with self._lock:
+            self.entities_profiled += 1
+
+    def report_manifests_read(self, num_read: int, num_cached: int) -> None:
+        with self._lock:
+            self.manifests_read += num_read
+            self.manifests_cached += num_cached
+
+    def report_workunit(self, wu: WorkUnit) -> None:
+        with self._lock:
+            super().report_workunit(wu)
+
+    def report_warning(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_warning(key, reason)
+
+    def report_failure(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_failure(key, reason)
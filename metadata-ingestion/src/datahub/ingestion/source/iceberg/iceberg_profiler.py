@@ -1,5 +1,12 @@
+import collections
+import contextlib
+import hashlib
+import pickle
+import sqlite3
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, Iterable, Union, cast
+from typing import Any, Callable, Counter, Dict, Iterable, List, Optional, Union, cast
 
 from iceberg.api import types as IcebergTypes
 from iceberg.api.data_file import DataFile
@@ -24,6 +31,73 @@ from datahub.metadata.schema_classes import (
     DatasetFieldProfileClass,
     DatasetProfileClass,
 )
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
+
+
+@dataclass
+class ManifestStats:
+    """The field stats aggregated over the data files of a manifest."""
+
+    record_count: int = 0
+    null_counts: Counter[int] = field(default_factory=collections.Counter)
+    min_bounds: Dict[int, Any] = field(default_factory=dict)
+    max_bounds: Dict[int, Any] = field(default_factory=dict)
+
+    def merge(self, other: "ManifestStats") -> None:
+        self.record_count += other.record_count
+        self.null_counts.update(other.null_counts)
+        _merge_bounds(min, self.min_bounds, other.min_bounds)
+        _merge_bounds(max, self.max_bounds, other.max_bounds)
+
+
+def _merge_bounds(
+    aggregator: Callable, aggregated_values: Dict[int, Any], values: Dict[int, Any]
+) -> None:
+    for field_id, value in values.items():
+        agg_value = aggregated_values.get(field_id)
+        aggregated_values[field_id] = (
+            aggregator(agg_value, value) if agg_value is not None else value
+        )
+
+
+class ManifestStatsCache:
+    """
+    Persists the stats of manifests in a SQLite database, keyed by their path, so that
+    later runs only read the manifests added since. Manifests are immutable, so their
+    stats can be reused by every snapshot that still references them.
+
+    Without a path, nothing is cached. It is safe to use from several threads.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        if path:
+            with contextlib.closing(sqlite3.connect(path)) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS manifest_stats "
+                    "(key TEXT PRIMARY KEY, stats BLOB NOT NULL)"
+                )
+                conn.commit()
+
+    def get(self, key: str) -> Optional[ManifestStats]:
+        if not self.path:
+            return None
+        with self._lock, contextlib.closing(sqlite3.connect(self.path)) as conn:
+            row = conn.execute(
+                "SELECT stats FROM manifest_stats WHERE key = ?", (key,)
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def put_many(self, stats: Dict[str, ManifestStats]) -> None:
+        if not self.path or not stats:
+            return
+        with self._lock, contextlib.closing(sqlite3.connect(self.path)) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO manifest_stats VALUES (?, ?)",
+                [(key, pickle.dumps(value)) for key, value in stats.items()],
+            )
+            conn.commit()
 
 
 class IcebergProfiler:
@@ -35,38 +109,120 @@ class IcebergProfiler:
         self.report: IcebergSourceReport = report
         self.config: IcebergProfilingConfig = config
         self.platform: str = "iceberg"
+        self.manifest_stats_cache = ManifestStatsCache(config.manifest_stats_cache_path)
 
-    def _aggregate_counts(
-        self,
-        aggregated_count: Dict[int, int],
-        manifest_counts: Dict[int, int],
-    ) -> Dict[int, int]:
-        return {
-            k: aggregated_count.get(k, 0) + manifest_counts.get(k, 0)
-            for k in set(aggregated_count) | set(manifest_counts)
-        }
-
-    def _aggregate_bounds(
+    def _stats_fingerprint(self, numeric_fields: Dict[int, NestedField]) -> str:
+        # The stats of a manifest depend on the profiled stats, and on the types used to
+        # decode the bounds of its fields.
+        return hashlib.sha256(
+            repr(
+                (
+                    self.config.include_field_null_count,
+                    self.config.include_field_min_value,
+                    self.config.include_field_max_value,
+                    sorted(
+                        (field_id, str(field.type))
+                        for field_id, field in numeric_fields.items()
+                    ),
+                )
+            ).encode()
+        ).hexdigest()[:16]
+
+    def _decode_bounds(
         self,
-        schema: Schema,
+        numeric_fields: Dict[int, NestedField],
         aggregator: Callable,
         aggregated_values: Dict[int, Any],
-        manifest_values: Dict[int, Any],
+        manifest_values: Optional[Dict[int, Any]],
     ) -> None:
-        for field_id, value_encoded in manifest_values.items():  # type: int, Any
-            field: NestedField = schema.find_field(field_id)
+        for field_id, value_encoded in (manifest_values or {}).items():
             # Bounds in manifests can reference historical field IDs that are not part of the current schema.
             # We simply not profile those since we only care about the current snapshot.
-            if field and IcebergProfiler._is_numeric_type(field.type):
+            field = numeric_fields.get(field_id)
+            if field is not None:
                 value_decoded = Conversions.from_byte_buffer(field.type, value_encoded)
                 if value_decoded:
                     agg_value = aggregated_values.get(field_id)
                     aggregated_values[field_id] = (
                         aggregator(agg_value, value_decoded)
-                        if agg_value
+                        if agg_value is not None
                         else value_decoded
                     )
 
+    def _read_manifest_stats(
+        self,
+        table: BaseTable,
+        manifest: ManifestFile,
+        numeric_fields: Dict[int, NestedField],
+    ) -> ManifestStats:
+        manifest_input_file = FileSystemInputFile.from_location(
+            manifest.manifest_path, table.ops.conf
+        )
+        manifest_reader = ManifestReader.read(manifest_input_file)
+        stats = ManifestStats()
+        data_file: DataFile
+        for data_file in manifest_reader.iterator():
+            if self.config.include_field_null_count:
+                stats.null_counts.update(data_file.null_value_counts())
+            if self.config.include_field_min_value:
+                self._decode_bounds(
+                    numeric_fields, min, stats.min_bounds, data_file.lower_bounds()
+                )
+            if self.config.include_field_max_value:
+                self._decode_bounds(
+                    numeric_fields, max, stats.max_bounds, data_file.upper_bounds()
+                )
+            stats.record_count += data_file.record_count()
+        return stats
+
+    def _aggregate_manifest_stats(
+        self, table: BaseTable, manifests: List[ManifestFile]
+    ) -> ManifestStats:
+        """
+        Aggregates the stats of the manifests. The manifests that are not cached are read
+        concurrently, by up to `max_workers` threads.
+        """
+        schema: Schema = table.schema()
+        numeric_fields: Dict[int, NestedField] = {}
+        for field_id in schema._id_to_name:
+            field: NestedField = schema.find_field(field_id)
+            if field and IcebergProfiler._is_numeric_type(field.type):
+                numeric_fields[field_id] = field
+        fingerprint = self._stats_fingerprint(numeric_fields)
+
+        aggregated = ManifestStats()
+        missing: List[ManifestFile] = []
+        for manifest in manifests:
+            stats = self.manifest_stats_cache.get(
+                f"{manifest.manifest_path}#{fingerprint}"
+            )
+            if stats is None:
+                missing.append(manifest)
+            else:
+                aggregated.merge(stats)
+        self.report.report_manifests_read(
+            len(missing), num_cached=len(manifests) - len(missing)
+        )
+
+        new_stats: Dict[str, ManifestStats] = {}
+        if self.config.max_workers == 1:
+            for manifest in missing:
+                new_stats[
+                    f"{manifest.manifest_path}#{fingerprint}"
+                ] = self._read_manifest_stats(table, manifest, numeric_fields)
+        else:
+            futures = BackpressureAwareExecutor.map_ordered(
+                self._read_manifest_stats,
+                ((table, manifest, numeric_fields) for manifest in missing),
+                max_workers=self.config.max_workers,
+            )
+            for manifest, future in zip(missing, futures):
+                new_stats[f"{manifest.manifest_path}#{fingerprint}"] = future.result()
+        for stats in new_stats.values():
+            aggregated.merge(stats)
+        self.manifest_stats_cache.put_many(new_stats)
+        return aggregated
+
     def profile_table(
         self,
         dataset_name: str,
@@ -112,41 +268,16 @@ class IcebergProfiler:
 
         field_paths: Dict[int, str] = table.schema()._id_to_name
         current_snapshot: Snapshot = table.current_snapshot()
-        total_count: int = 0
-        null_counts: Dict[int, int] = {}
-        min_bounds: Dict[int, Any] = {}
-        max_bounds: Dict[int, Any] = {}
-        manifest: ManifestFile
         try:
-            for manifest in current_snapshot.manifests:
-                manifest_input_file = FileSystemInputFile.from_location(
-                    manifest.manifest_path, table.ops.conf
-                )
-                manifest_reader = ManifestReader.read(manifest_input_file)
-                data_file: DataFile
-                for data_file in manifest_reader.iterator():
-                    if self.config.include_field_null_count:
-                        null_counts = self._aggregate_counts(
-                            null_counts, data_file.null_value_counts()
-                        )
-                    if self.config.include_field_min_value:
-                        self._aggregate_bounds(
-                            table.schema(),
-                            min,
-                            min_bounds,
-                            data_file.lower_bounds(),
-                        )
-                    if self.config.include_field_max_value:
-                        self._aggregate_bounds(
-                            table.schema(),
-                            max,
-                            max_bounds,
-                            data_file.upper_bounds(),
-                        )
-                    total_count += data_file.record_count()
+            stats = self._aggregate_manifest_stats(
+                table, list(current_snapshot.manifests)
+            )
         # TODO Work on error handling to provide better feedback.  Iceberg exceptions are weak...
         except FileSystemNotFound as e:
             raise Exception("Error loading table manifests") from e
+        null_counts: Dict[int, int] = stats.null_counts
+        min_bounds: Dict[int, Any] = stats.min_bounds
+        max_bounds: Dict[int, Any] = stats.max_bounds
         if row_count:
             # Iterating through fieldPaths introduces unwanted stats for list element fields...
             for field_id, field_path in field_paths.items():
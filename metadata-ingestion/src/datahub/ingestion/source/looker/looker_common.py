@@ -958,6 +958,7 @@ class LookerDashboardSourceReport(StaleEntityRemovalSourceReport):
     dashboards_scanned: int = 0
     looks_scanned: int = 0
     filtered_dashboards: LossyList[str] = dataclasses_field(default_factory=LossyList)
+    dashboards_skipped_unchanged: int = 0
     filtered_looks: LossyList[str] = dataclasses_field(default_factory=LossyList)
     dashboards_scanned_for_usage: int = 0
     charts_scanned_for_usage: int = 0
@@ -983,6 +984,9 @@ class LookerDashboardSourceReport(StaleEntityRemovalSourceReport):
     def report_dashboards_scanned(self) -> None:
         self.dashboards_scanned += 1
 
+    def report_dashboards_skipped_unchanged(self, dashboard_id: str) -> None:
+        self.dashboards_skipped_unchanged += 1
+
     def report_charts_scanned(self) -> None:
         self.looks_scanned += 1
 
@@ -1027,7 +1031,10 @@ class LookerDashboardSourceReport(StaleEntityRemovalSourceReport):
     def compute_stats(self) -> None:
         if self.total_dashboards:
             self.dashboard_process_percentage_completion = round(
-                100 * self.dashboards_scanned / self.total_dashboards, 2
+                100
+                * (self.dashboards_scanned + self.dashboards_skipped_unchanged)
+                / self.total_dashboards,
+                2,
             )
         if self._looker_explore_registry:
             self.explore_registry_stats = self._looker_explore_registry.compute_stats()
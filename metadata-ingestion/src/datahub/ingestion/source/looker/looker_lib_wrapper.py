@@ -2,8 +2,20 @@
 import json
 import logging
 import os
+import time
 from functools import lru_cache
-from typing import Dict, List, MutableMapping, Optional, Sequence, Set, Union, cast
+from typing import (
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import looker_sdk
 from looker_sdk.error import SDKError
@@ -21,9 +33,22 @@ from pydantic import BaseModel, Field
 
 from datahub.configuration import ConfigModel
 from datahub.configuration.common import ConfigurationError
+from datahub.utilities.backpressure_aware_executor import AdaptiveConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Throttled calls are retried with an exponential backoff, capped at a minute.
+_MAX_RATE_LIMIT_ATTEMPTS = 6
+_MAX_RATE_LIMIT_BACKOFF_SEC = 60
+
+
+def is_rate_limit_error(e: SDKError) -> bool:
+    """Looker returns HTTP 429 once the API rate limit of the instance is exceeded."""
+    message = str(e)
+    return "429" in message or "Too Many Requests" in message
+
 
 class TransportOptionsConfig(ConfigModel):
     timeout: int
@@ -56,13 +81,19 @@ class LookerAPIStats(BaseModel):
     lookml_model_calls: int = 0
     all_dashboards_calls: int = 0
     search_dashboards_calls: int = 0
+    rate_limited_calls: int = 0
 
 
 class LookerAPI:
     """A holder class for a Looker client"""
 
-    def __init__(self, config: LookerAPIConfig) -> None:
+    def __init__(
+        self,
+        config: LookerAPIConfig,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> None:
         self.config = config
+        self.concurrency_limiter = concurrency_limiter
         # The Looker SDK looks wants these as environment variables
         os.environ["LOOKERSDK_CLIENT_ID"] = config.client_id
         os.environ["LOOKERSDK_CLIENT_SECRET"] = config.client_secret
@@ -89,6 +120,34 @@ class LookerAPI:
 
         self.client_stats = LookerAPIStats()
 
+    def _call_with_rate_limit_retry(self, fn: Callable[[], _T]) -> _T:
+        """
+        Retries a call while Looker throttles it, with an exponential backoff. The backoff
+        is applied through the concurrency limiter if there is one, so that it pauses all
+        the calls holding a slot of the limiter. The last error is raised once the attempts
+        are exhausted.
+        """
+        attempt = 1
+        while True:
+            try:
+                if self.concurrency_limiter is None:
+                    return fn()
+                with self.concurrency_limiter.slot():
+                    return fn()
+            except SDKError as e:
+                if not is_rate_limit_error(e):
+                    raise
+                self.client_stats.rate_limited_calls += 1
+                backoff = min(2.0 ** (attempt - 1), _MAX_RATE_LIMIT_BACKOFF_SEC)
+                if self.concurrency_limiter is not None:
+                    self.concurrency_limiter.on_throttled(backoff)
+                if attempt >= _MAX_RATE_LIMIT_ATTEMPTS:
+                    raise
+                logger.info(f"Throttled by Looker, retrying in {backoff:.0f} seconds")
+                if self.concurrency_limiter is None:
+                    time.sleep(backoff)
+                attempt += 1
+
     @staticmethod
     def __fields_mapper(fields: Union[str, List[str]]) -> str:
         """Helper method to turn single string or list of fields into Looker API compatible fields param"""
@@ -139,16 +198,20 @@ class LookerAPI:
 
     def dashboard(self, dashboard_id: str, fields: Union[str, List[str]]) -> Dashboard:
         self.client_stats.dashboard_calls += 1
-        return self.client.dashboard(
-            dashboard_id=dashboard_id,
-            fields=self.__fields_mapper(fields),
-            transport_options=self.transport_options,
+        return self._call_with_rate_limit_retry(
+            lambda: self.client.dashboard(
+                dashboard_id=dashboard_id,
+                fields=self.__fields_mapper(fields),
+                transport_options=self.transport_options,
+            )
         )
 
     def lookml_model_explore(self, model, explore_name):
         self.client_stats.explore_calls += 1
-        return self.client.lookml_model_explore(
-            model, explore_name, transport_options=self.transport_options
+        return self._call_with_rate_limit_retry(
+            lambda: self.client.lookml_model_explore(
+                model, explore_name, transport_options=self.transport_options
+            )
         )
 
     @lru_cache(maxsize=1000)
@@ -1,4 +1,3 @@
-import concurrent.futures
 import datetime
 import json
 import logging
@@ -19,7 +18,13 @@ from typing import (
 )
 
 from looker_sdk.error import SDKError
-from looker_sdk.sdk.api40.models import Dashboard, DashboardElement, FolderBase, Query
+from looker_sdk.sdk.api40.models import (
+    Dashboard,
+    DashboardBase,
+    DashboardElement,
+    FolderBase,
+    Query,
+)
 from pydantic import Field, validator
 
 import datahub.emitter.mce_builder as builder
@@ -62,13 +67,21 @@ from datahub.ingestion.source.looker.looker_common import (
 from datahub.ingestion.source.looker.looker_lib_wrapper import (
     LookerAPI,
     LookerAPIConfig,
+    is_rate_limit_error,
 )
 from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
+from datahub.ingestion.source.state.incremental_extraction_handler import (
+    IncrementalExtractionHandler,
+)
+from datahub.ingestion.source.state.incremental_extraction_state import (
+    IncrementalEntityState,
+)
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalHandler,
     StatefulStaleMetadataRemovalConfig,
 )
 from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIncrementalExtractionConfigMixin,
     StatefulIngestionConfigBase,
     StatefulIngestionSourceBase,
 )
@@ -93,18 +106,32 @@ from datahub.metadata.schema_classes import (
     OwnershipClass,
     OwnershipTypeClass,
 )
+from datahub.utilities.backpressure_aware_executor import (
+    AdaptiveConcurrencyLimiter,
+    BackpressureAwareExecutor,
+)
 from datahub.utilities.source_helpers import (
     auto_stale_entity_removal,
     auto_status_aspect,
 )
+from datahub.utilities.urns.urn import guess_entity_type
 
 logger = logging.getLogger(__name__)
 
 
+class DashboardRateLimitedError(Exception):
+    """Raised for a dashboard that Looker kept throttling after all the retries."""
+
+    def __init__(self, dashboard_id: str):
+        super().__init__(f"Looker kept rate limiting dashboard {dashboard_id}")
+        self.dashboard_id = dashboard_id
+
+
 class LookerDashboardSourceConfig(
     LookerAPIConfig,
     LookerCommonConfig,
     StatefulIngestionConfigBase,
+    StatefulIncrementalExtractionConfigMixin,
     EnvConfigMixin,
 ):
     _removed_github_info = pydantic_removed_field("github_info")
@@ -205,7 +232,13 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
         super().__init__(config, ctx)
         self.source_config = config
         self.reporter = LookerDashboardSourceReport()
-        self.looker_api: LookerAPI = LookerAPI(self.source_config)
+        # Limits the concurrent Looker API calls, backing off when Looker throttles us.
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            max_concurrency=self.source_config.max_threads
+        )
+        self.looker_api: LookerAPI = LookerAPI(
+            self.source_config, concurrency_limiter=self.concurrency_limiter
+        )
         self.user_registry = LookerUserRegistry(self.looker_api)
         self.explore_registry = LookerExploreRegistry(self.looker_api, self.reporter)
         self.reporter._looker_explore_registry = self.explore_registry
@@ -243,6 +276,12 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
             pipeline_name=self.ctx.pipeline_name,
             run_id=self.ctx.run_id,
         )
+        self.incremental_extraction_handler = IncrementalExtractionHandler(
+            source=self,
+            config=self.source_config,
+            pipeline_name=self.ctx.pipeline_name,
+            run_id=self.ctx.run_id,
+        )
 
     @staticmethod
     def test_connection(config_dict: dict) -> TestConnectionReport:
@@ -760,28 +799,21 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
     def _make_explore_metadata_events(
         self,
     ) -> Iterable[Union[MetadataChangeEvent, MetadataChangeProposalWrapper]]:
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.source_config.max_threads
-        ) as async_executor:
-            self.reporter.total_explores = len(self.explores_to_fetch_set)
-
-            explore_futures = {
-                async_executor.submit(self.fetch_one_explore, model, explore): (
-                    model,
-                    explore,
-                )
-                for (model, explore) in self.explores_to_fetch_set
-            }
+        self.reporter.total_explores = len(self.explores_to_fetch_set)
 
-            for future in concurrent.futures.as_completed(explore_futures):
-                events, explore_id, start_time, end_time = future.result()
-                del explore_futures[future]
-                self.reporter.explores_scanned += 1
-                yield from events
-                self.reporter.report_upstream_latency(start_time, end_time)
-                logger.debug(
-                    f"Running time of fetch_one_explore for {explore_id}: {(end_time - start_time).total_seconds()}"
-                )
+        for future in BackpressureAwareExecutor.map(
+            self.fetch_one_explore,
+            list(self.explores_to_fetch_set),
+            max_workers=self.source_config.max_threads,
+            concurrency_limiter=self.concurrency_limiter,
+        ):
+            events, explore_id, start_time, end_time = future.result()
+            self.reporter.explores_scanned += 1
+            yield from events
+            self.reporter.report_upstream_latency(start_time, end_time)
+            logger.debug(
+                f"Running time of fetch_one_explore for {explore_id}: {(end_time - start_time).total_seconds()}"
+            )
 
     def fetch_one_explore(
         self, model: str, explore: str
@@ -1097,6 +1129,7 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
     ) -> Tuple[
         List[MetadataWorkUnit],
         Optional[Dashboard],
+        List[str],
         str,
         datetime.datetime,
         datetime.datetime,
@@ -1105,19 +1138,23 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
         assert dashboard_id is not None
         if not self.source_config.dashboard_pattern.allowed(dashboard_id):
             self.reporter.report_dashboards_dropped(dashboard_id)
-            return [], None, dashboard_id, start_time, datetime.datetime.now()
+            return [], None, [], dashboard_id, start_time, datetime.datetime.now()
         try:
             dashboard_object: Dashboard = self.looker_api.dashboard(
                 dashboard_id=dashboard_id,
                 fields=fields,
             )
-        except SDKError:
+        except SDKError as e:
+            if is_rate_limit_error(e):
+                # Still throttled after all the retries. This is raised, so that the
+                # call isn't counted as a success by the concurrency limiter.
+                raise DashboardRateLimitedError(dashboard_id) from e
             # A looker dashboard could be deleted in between the list and the get
             self.reporter.report_warning(
                 dashboard_id,
                 f"Error occurred while loading dashboard {dashboard_id}. Skipping.",
             )
-            return [], None, dashboard_id, start_time, datetime.datetime.now()
+            return [], None, [], dashboard_id, start_time, datetime.datetime.now()
 
         if self.source_config.skip_personal_folders:
             if dashboard_object.folder is not None and (
@@ -1128,7 +1165,7 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
                     dashboard_id, "Dropped due to being a personal folder"
                 )
                 self.reporter.report_dashboards_dropped(dashboard_id)
-                return [], None, dashboard_id, start_time, datetime.datetime.now()
+                return [], None, [], dashboard_id, start_time, datetime.datetime.now()
 
         looker_dashboard = self._get_looker_dashboard(dashboard_object, self.looker_api)
         mces = self._make_dashboard_and_chart_mces(looker_dashboard)
@@ -1150,11 +1187,135 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
         return (
             workunits,
             dashboard_object,
+            self._get_incremental_references(looker_dashboard),
             dashboard_id,
             start_time,
             datetime.datetime.now(),
         )
 
+    def _list_dashboards(
+        self,
+    ) -> Tuple[
+        Sequence[Union[DashboardBase, Dashboard]],
+        Sequence[Dashboard],
+        Dict[str, Dashboard],
+    ]:
+        """
+        Lists the dashboards and deleted dashboards to process. For an incremental run, the listing
+        also returns the dashboards that are unchanged since the last run, keyed by dashboard id.
+        """
+        incremental_run = (
+            self.incremental_extraction_handler.is_checkpointing_enabled()
+            and not self.incremental_extraction_handler.is_full_extraction()
+        )
+        # For an incremental run, the listing also fetches the fields required to decide
+        # whether a dashboard changed and to compute its usage without loading it.
+        listing_fields = (
+            ["id", "updated_at", "favorite_count", "view_count", "last_viewed_at"]
+            if incremental_run
+            else ["id"]
+        )
+        dashboards: Sequence[Union[DashboardBase, Dashboard]]
+        if incremental_run:
+            dashboards = self.looker_api.search_dashboards(
+                fields=listing_fields, deleted="false"
+            )
+        else:
+            dashboards = self.looker_api.all_dashboards(fields="id")
+        deleted_dashboards = (
+            self.looker_api.search_dashboards(fields=listing_fields, deleted="true")
+            if self.source_config.include_deleted
+            else []
+        )
+        if deleted_dashboards != []:
+            logger.debug(f"Deleted Dashboards = {deleted_dashboards}")
+
+        unchanged_dashboards: Dict[str, Dashboard] = {}
+        if incremental_run:
+            for dashboard in [*dashboards, *deleted_dashboards]:
+                assert isinstance(dashboard, Dashboard)
+                if (
+                    dashboard.id is not None
+                    and self.incremental_extraction_handler.is_unchanged(
+                        dashboard.id, self._get_last_modified_millis(dashboard)
+                    )
+                ):
+                    unchanged_dashboards[dashboard.id] = dashboard
+
+        return dashboards, deleted_dashboards, unchanged_dashboards
+
+    @staticmethod
+    def _get_last_modified_millis(dashboard: Dashboard) -> Optional[int]:
+        if dashboard.updated_at is None:
+            return None
+        return round(dashboard.updated_at.timestamp() * 1000)
+
+    @staticmethod
+    def _get_incremental_references(looker_dashboard: LookerDashboard) -> List[str]:
+        """
+        Collects the explores and looks a dashboard depends on, so that they can still be
+        processed when the dashboard itself is skipped by incremental extraction.
+        """
+        references: Set[str] = set()
+        for element in looker_dashboard.dashboard_elements:
+            for explore in element.upstream_explores:
+                if explore.model_name and explore.name:
+                    references.add(f"explore:{explore.model_name}:{explore.name}")
+            for input_field in element.input_fields or []:
+                if input_field.model and input_field.explore:
+                    references.add(f"explore:{input_field.model}:{input_field.explore}")
+            if element.look_id is not None:
+                references.add(f"look:{element.look_id}")
+        return sorted(references)
+
+    def _carry_forward_entity_state(
+        self, dashboard_id: str
+    ) -> Optional[IncrementalEntityState]:
+        """Copies the state of a dashboard and its urns from the last run, if any."""
+        entity_state = self.incremental_extraction_handler.carry_forward(dashboard_id)
+        if entity_state is not None:
+            for urn in entity_state.urns:
+                entity_type = guess_entity_type(urn)
+                self.stale_entity_removal_handler.add_entity_to_state(entity_type, urn)
+        return entity_state
+
+    def _carry_forward_dashboard(
+        self, dashboard: Dashboard
+    ) -> Optional[looker_usage.LookerDashboardForUsage]:
+        """
+        Re-registers the state of a dashboard that was skipped by incremental extraction.
+        Returns the usage model for the dashboard, built from the listing and the previous state.
+        """
+        assert dashboard.id is not None
+        entity_state = self._carry_forward_entity_state(dashboard.id)
+        if entity_state is None:
+            return None
+
+        self.reporter.report_dashboards_skipped_unchanged(dashboard.id)
+
+        looks: List[looker_usage.LookerChartForUsage] = []
+        for reference in entity_state.references:
+            kind, _, value = reference.partition(":")
+            if kind == "explore":
+                model, _, explore = value.partition(":")
+                self.add_explore_to_fetch(
+                    model=model, explore=explore, via=f"dashboard:{dashboard.id}"
+                )
+            elif kind == "look":
+                looks.append(
+                    looker_usage.LookerChartForUsage(id=value, view_count=None)
+                )
+
+        return looker_usage.LookerDashboardForUsage(
+            id=dashboard.id,
+            view_count=dashboard.view_count,
+            favorite_count=dashboard.favorite_count,
+            last_viewed_at=round(dashboard.last_viewed_at.timestamp() * 1000)
+            if dashboard.last_viewed_at
+            else None,
+            looks=looks,
+        )
+
     def extract_usage_stat(
         self, looker_dashboards: List[looker_usage.LookerDashboardForUsage]
     ) -> List[MetadataChangeProposalWrapper]:
@@ -1190,16 +1351,59 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
             auto_status_aspect(self.get_workunits_internal()),
         )
 
+    def _fetch_dashboards(
+        self,
+        dashboard_ids: List[str],
+        fields: List[str],
+        looker_dashboards_for_usage: List[looker_usage.LookerDashboardForUsage],
+    ) -> Iterable[MetadataWorkUnit]:
+        # Dashboards are fetched within a bounded window, so that only a few
+        # dashboards' workunits are held in memory at any point in time.
+        for job in BackpressureAwareExecutor.map(
+            self.process_dashboard,
+            ((dashboard_id, fields) for dashboard_id in dashboard_ids),
+            max_workers=self.source_config.max_threads,
+            concurrency_limiter=self.concurrency_limiter,
+        ):
+            try:
+                (
+                    work_units,
+                    dashboard_object,
+                    references,
+                    dashboard_id,
+                    start_time,
+                    end_time,
+                ) = job.result()
+            except DashboardRateLimitedError as e:
+                self.reporter.report_failure(e.dashboard_id, str(e.__cause__ or e))
+                # Keep the dashboard from the last run, so that it is not soft-deleted
+                # as a stale entity.
+                self._carry_forward_entity_state(e.dashboard_id)
+                continue
+            logger.debug(
+                f"Running time of process_dashboard for {dashboard_id} = {(end_time - start_time).total_seconds()}"
+            )
+            self.reporter.report_upstream_latency(start_time, end_time)
+
+            for mwu in work_units:
+                yield mwu
+                self.reporter.report_workunit(mwu)
+            if dashboard_object is not None:
+                looker_dashboards_for_usage.append(
+                    looker_usage.LookerDashboardForUsage.from_dashboard(
+                        dashboard_object
+                    )
+                )
+                self.incremental_extraction_handler.add_entity(
+                    dashboard_id,
+                    self._get_last_modified_millis(dashboard_object),
+                    urns=[mwu.get_urn() for mwu in work_units],
+                    references=references,
+                )
+
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
         self.reporter.report_stage_start("list_dashboards")
-        dashboards = self.looker_api.all_dashboards(fields="id")
-        deleted_dashboards = (
-            self.looker_api.search_dashboards(fields="id", deleted="true")
-            if self.source_config.include_deleted
-            else []
-        )
-        if deleted_dashboards != []:
-            logger.debug(f"Deleted Dashboards = {deleted_dashboards}")
+        dashboards, deleted_dashboards, unchanged_dashboards = self._list_dashboards()
 
         dashboard_ids = [dashboard_base.id for dashboard_base in dashboards]
         dashboard_ids.extend(
@@ -1244,40 +1448,22 @@ class LookerDashboardSource(TestableSource, StatefulIngestionSourceBase):
         looker_dashboards_for_usage: List[looker_usage.LookerDashboardForUsage] = []
         self.reporter.report_stage_start("dashboard_chart_metadata")
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.source_config.max_threads
-        ) as async_executor:
-            async_workunits = {}
-            for dashboard_id in dashboard_ids:
-                if dashboard_id is not None:
-                    job = async_executor.submit(
-                        self.process_dashboard, dashboard_id, fields
-                    )
-                    async_workunits[job] = dashboard_id
-
-            for job in concurrent.futures.as_completed(async_workunits):
-                (
-                    work_units,
-                    dashboard_object,
-                    dashboard_id,
-                    start_time,
-                    end_time,
-                ) = job.result()
-                del async_workunits[job]
-                logger.debug(
-                    f"Running time of process_dashboard for {dashboard_id} = {(end_time - start_time).total_seconds()}"
+        dashboard_ids_to_fetch: List[str] = []
+        for dashboard_id in dashboard_ids:
+            if dashboard_id is None:
+                continue
+            if dashboard_id in unchanged_dashboards:
+                dashboard_for_usage = self._carry_forward_dashboard(
+                    unchanged_dashboards[dashboard_id]
                 )
-                self.reporter.report_upstream_latency(start_time, end_time)
-
-                for mwu in work_units:
-                    yield mwu
-                    self.reporter.report_workunit(mwu)
-                if dashboard_object is not None:
-                    looker_dashboards_for_usage.append(
-                        looker_usage.LookerDashboardForUsage.from_dashboard(
-                            dashboard_object
-                        )
-                    )
+                if dashboard_for_usage is not None:
+                    looker_dashboards_for_usage.append(dashboard_for_usage)
+                    continue
+            dashboard_ids_to_fetch.append(dashboard_id)
+
+        yield from self._fetch_dashboards(
+            dashboard_ids_to_fetch, fields, looker_dashboards_for_usage
+        )
 
         self.reporter.report_stage_end("dashboard_chart_metadata")
 
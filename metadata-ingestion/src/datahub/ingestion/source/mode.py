@@ -1,5 +1,6 @@
 import re
 import time
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Dict, Iterable, Optional, Tuple, Union
 
@@ -14,6 +15,7 @@ from tenacity import retry_if_exception_type, stop_after_attempt, wait_exponenti
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import ConfigModel
+from datahub.configuration.http_cache import HttpCacheConfigMixin
 from datahub.configuration.source_common import DatasetLineageProviderConfigBase
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.api.decorators import (
@@ -47,6 +49,7 @@ from datahub.metadata.schema_classes import (
     OwnershipTypeClass,
 )
 from datahub.utilities import config_clean
+from datahub.utilities.http_cache import HttpCacheStats, mount_http_cache
 
 
 class ModeAPIConfig(ConfigModel):
@@ -62,7 +65,7 @@ class ModeAPIConfig(ConfigModel):
     )
 
 
-class ModeConfig(DatasetLineageProviderConfigBase):
+class ModeConfig(DatasetLineageProviderConfigBase, HttpCacheConfigMixin):
     # See https://mode.com/developer/api-reference/authentication/
     # for authentication
     connect_uri: str = Field(
@@ -94,6 +97,11 @@ class HTTPError429(HTTPError):
     pass
 
 
+@dataclass
+class ModeSourceReport(SourceReport):
+    http_cache_stats: Optional[HttpCacheStats] = None
+
+
 @platform_name("Mode")
 @config_class(ModeConfig)
 @support_status(SupportStatus.CERTIFIED)
@@ -158,7 +166,7 @@ class ModeSource(Source):
     """
 
     config: ModeConfig
-    report: SourceReport
+    report: ModeSourceReport
     tool = "mode"
 
     def __hash__(self):
@@ -167,7 +175,7 @@ class ModeSource(Source):
     def __init__(self, ctx: PipelineContext, config: ModeConfig):
         super().__init__(ctx)
         self.config = config
-        self.report = SourceReport()
+        self.report = ModeSourceReport()
 
         self.session = requests.session()
         self.session.auth = HTTPBasicAuth(
@@ -180,6 +188,9 @@ class ModeSource(Source):
                 "Accept": "application/hal+json",
             }
         )
+        http_cache = mount_http_cache(self.session, self.config.http_cache)
+        if http_cache is not None:
+            self.report.http_cache_stats = http_cache.stats
 
         # Test the connection
         try:
@@ -802,5 +813,5 @@ class ModeSource(Source):
         yield from self.emit_dashboard_mces()
         yield from self.emit_chart_mces()
 
-    def get_report(self) -> SourceReport:
+    def get_report(self) -> ModeSourceReport:
         return self.report
@@ -1,6 +1,17 @@
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Tuple, Type, Union, ValuesView
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    ValuesView,
+)
 
 import bson
 import pymongo
@@ -23,8 +34,9 @@ from datahub.ingestion.api.decorators import (
 from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.schema_inference.object import (
+    ObjectSchemaBuilder,
     SchemaDescription,
-    construct_schema,
+    infer_field_type,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.metadata.snapshot import DatasetSnapshot
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import MetadataChangeEvent
@@ -44,6 +56,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     UnionTypeClass,
 )
 from datahub.metadata.schema_classes import DatasetPropertiesClass
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +107,15 @@ class MongoDBConfig(EnvConfigMixin):
         default=AllowDenyPattern.allow_all(),
         description="regex patterns for collections to filter in ingestion.",
     )
+    server_side_type_discovery: bool = Field(
+        default=False,
+        description="Whether to discover the field types with an aggregation on the server, instead of reading the sampled documents. "
+        "This keeps very wide documents off the client, but only the top-level fields are discovered.",
+    )
+    max_workers: PositiveInt = Field(
+        default=1,
+        description="Number of collections to infer the schema of in parallel.",
+    )
 
     @validator("maxDocumentSize")
     def check_max_doc_size_filter_is_valid(cls, doc_size_filter_value):
@@ -144,6 +166,50 @@ _field_type_mapping: Dict[Union[Type, str], Type] = {
     "mixed": UnionTypeClass,
 }
 
+# map the type aliases returned by the $type aggregation operator to PyMongo types
+# See https://www.mongodb.com/docs/manual/reference/operator/aggregation/type/.
+BSON_TYPE_ALIAS_TO_PYMONGO_TYPE: Dict[str, Type] = {
+    "array": list,
+    "object": dict,
+    "null": type(None),
+    "bool": bool,
+    "int": int,
+    "long": bson.int64.Int64,
+    "double": float,
+    "string": str,
+    "date": bson.datetime.datetime,
+    "timestamp": bson.timestamp.Timestamp,
+    "dbPointer": bson.dbref.DBRef,
+    "objectId": bson.objectid.ObjectId,
+}
+
+
+def get_sampling_aggregations(
+    use_random_sampling: bool,
+    max_document_size: int,
+    is_version_gte_4_4: bool,
+    sample_size: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Returns the aggregation stages that select the documents to infer the schema from.
+    """
+
+    aggregations: List[Dict] = []
+    if is_version_gte_4_4:
+        doc_size_field = "temporary_doc_size_field"
+        # create a temporary field to store the size of the document. filter on it and then remove it.
+        aggregations = [
+            {"$addFields": {doc_size_field: {"$bsonSize": "$$ROOT"}}},
+            {"$match": {doc_size_field: {"$lt": max_document_size}}},
+            {"$project": {doc_size_field: 0}},
+        ]
+    if use_random_sampling:
+        # get sample documents in collection
+        aggregations.append({"$sample": {"size": sample_size}})
+    else:
+        aggregations.append({"$limit": sample_size})
+    return aggregations
+
 
 def construct_schema_pymongo(
     collection: pymongo.collection.Collection,
@@ -154,7 +220,10 @@ def construct_schema_pymongo(
     sample_size: Optional[int] = None,
 ) -> Dict[Tuple[str, ...], SchemaDescription]:
     """
-    Calls construct_schema on a PyMongo collection.
+    Infers the schema of a PyMongo collection from a sample of its documents.
+
+    The documents are streamed from the aggregation cursor, one batch at a time, so
+    only the schema is kept in memory regardless of the sample size.
 
     Returned schema is keyed by tuples of nested field names, with each
     value containing 'types', 'count', 'nullable', 'delimited_name', and 'type' attributes.
@@ -172,27 +241,103 @@ def construct_schema_pymongo(
             maximum size of the document that will be considered for generating the schema.
     """
 
-    aggregations: List[Dict] = []
-    if is_version_gte_4_4:
-        doc_size_field = "temporary_doc_size_field"
-        # create a temporary field to store the size of the document. filter on it and then remove it.
-        aggregations = [
-            {"$addFields": {doc_size_field: {"$bsonSize": "$$ROOT"}}},
-            {"$match": {doc_size_field: {"$lt": max_document_size}}},
-            {"$project": {doc_size_field: 0}},
-        ]
-    if use_random_sampling:
-        # get sample documents in collection
-        aggregations.append({"$sample": {"size": sample_size}})
-        documents = collection.aggregate(
-            aggregations,
-            allowDiskUse=True,
+    aggregations = get_sampling_aggregations(
+        use_random_sampling, max_document_size, is_version_gte_4_4, sample_size
+    )
+    builder = ObjectSchemaBuilder(delimiter)
+    with collection.aggregate(aggregations, allowDiskUse=True) as documents:
+        builder.add_documents(documents)
+    return builder.build()
+
+
+def construct_schema_from_type_counts(
+    document_count: int, type_counts: Iterable[Dict[str, Any]]
+) -> Dict[Tuple[str, ...], SchemaDescription]:
+    """
+    Builds a schema from the output of the type discovery aggregation of
+    `construct_schema_pymongo_server_side`, in the format of `construct_schema`.
+
+    Parameters
+    ----------
+        document_count:
+            number of documents the types were discovered from
+        type_counts:
+            documents with the field name and BSON type alias as `_id`, and the number
+            of documents in which the field has that type as `count`
+    """
+
+    schema: Dict[Tuple[str, ...], SchemaDescription] = {}
+    for type_count in type_counts:
+        field_name: str = type_count["_id"]["name"]
+        # don't record null values (counted towards nullable)
+        if type_count["_id"]["type"] in {"null", "missing"}:
+            continue
+        field_type: Union[Type, str] = BSON_TYPE_ALIAS_TO_PYMONGO_TYPE.get(
+            type_count["_id"]["type"], type_count["_id"]["type"]
         )
-    else:
-        aggregations.append({"$limit": sample_size})
-        documents = collection.aggregate(aggregations, allowDiskUse=True)
 
-    return construct_schema(list(documents), delimiter)
+        field_path = (field_name,)
+        if field_path not in schema:
+            schema[field_path] = {
+                "types": Counter(),
+                "count": 0,
+                "nullable": True,
+                "delimited_name": field_name,
+                "type": "mixed",
+            }
+        schema[field_path]["types"].update({field_type: type_count["count"]})  # type: ignore
+        schema[field_path]["count"] += type_count["count"]
+
+    for field_description in schema.values():
+        field_description["nullable"] = field_description["count"] < document_count
+        field_description["type"] = infer_field_type(field_description["types"])
+    return schema
+
+
+def construct_schema_pymongo_server_side(
+    collection: pymongo.collection.Collection,
+    use_random_sampling: bool,
+    max_document_size: int,
+    is_version_gte_4_4: bool,
+    sample_size: Optional[int] = None,
+) -> Dict[Tuple[str, ...], SchemaDescription]:
+    """
+    Infers the schema of the top-level fields of a PyMongo collection, counting the
+    types of the fields of the sampled documents on the server.
+
+    Only the type counts are sent back, instead of the documents themselves. Nested
+    documents and arrays are reported as a single field of type `OBJECT` or `ARRAY`.
+    """
+
+    aggregations = get_sampling_aggregations(
+        use_random_sampling, max_document_size, is_version_gte_4_4, sample_size
+    )
+    aggregations += [
+        {"$project": {"fields": {"$objectToArray": "$$ROOT"}}},
+        {
+            "$facet": {
+                "documents": [{"$count": "count"}],
+                "types": [
+                    {"$unwind": "$fields"},
+                    {
+                        "$group": {
+                            "_id": {
+                                "name": "$fields.k",
+                                "type": {"$type": "$fields.v"},
+                            },
+                            "count": {"$sum": 1},
+                        }
+                    },
+                ],
+            }
+        },
+    ]
+    with collection.aggregate(aggregations, allowDiskUse=True) as results:
+        result = next(results)
+
+    # $count returns no document at all for an empty collection
+    document_count = result["documents"][0]["count"] if result["documents"] else 0
+    return construct_schema_from_type_counts(document_count, result["types"])
 
 
 @platform_name("MongoDB")
@@ -214,6 +359,8 @@ class MongoDBSource(Source):
 
     Really large schemas will be further truncated to a maximum of 300 schema fields. This is configurable using the `maxSchemaSize` parameter.
 
+    The sampled documents are streamed from the server, so the memory used for schema inference doesn't grow with `schemaSamplingSize`. For collections with very wide documents, `server_side_type_discovery: True` counts the types of the top-level fields on the server instead. The schemas of several collections can be inferred in parallel by setting `max_workers`.
+
     """
 
     config: MongoDBConfig
@@ -295,9 +442,10 @@ class MongoDBSource(Source):
 
         return SchemaFieldDataType(type=TypeClass())
 
-    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
-        platform = "mongodb"
-
+    def get_collections(self) -> Iterable[Tuple[str, str]]:
+        """
+        Yields the database and collection names of the allowed collections.
+        """
         database_names: List[str] = self.mongo_client.list_database_names()
 
         # traverse databases in sorted order so output is consistent
@@ -319,97 +467,148 @@ class MongoDBSource(Source):
                     self.report.report_dropped(dataset_name)
                     continue
 
-                dataset_urn = f"urn:li:dataset:(urn:li:dataPlatform:{platform},{dataset_name},{self.config.env})"
+                yield database_name, collection_name
+
+    def infer_collection_schema(
+        self, database_name: str, collection_name: str, is_version_gte_4_4: bool
+    ) -> Dict[Tuple[str, ...], SchemaDescription]:
+        # This only reads from the collection, so that it can run in worker threads.
+        assert self.config.maxDocumentSize is not None
+        collection = self.mongo_client[database_name][collection_name]
+        if self.config.server_side_type_discovery:
+            return construct_schema_pymongo_server_side(
+                collection,
+                use_random_sampling=self.config.useRandomSampling,
+                max_document_size=self.config.maxDocumentSize,
+                is_version_gte_4_4=is_version_gte_4_4,
+                sample_size=self.config.schemaSamplingSize,
+            )
+        return construct_schema_pymongo(
+            collection,
+            delimiter=".",
+            use_random_sampling=self.config.useRandomSampling,
+            max_document_size=self.config.maxDocumentSize,
+            is_version_gte_4_4=is_version_gte_4_4,
+            sample_size=self.config.schemaSamplingSize,
+        )
 
-                dataset_snapshot = DatasetSnapshot(
-                    urn=dataset_urn,
-                    aspects=[],
+    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        collections = self.get_collections()
+        if not self.config.enableSchemaInference:
+            for database_name, collection_name in collections:
+                yield self.create_workunit(database_name, collection_name, None)
+            return
+
+        is_version_gte_4_4 = self.is_server_version_gte_4_4()
+        if self.config.max_workers == 1:
+            for database_name, collection_name in collections:
+                collection_schema = self.infer_collection_schema(
+                    database_name, collection_name, is_version_gte_4_4
                 )
+                yield self.create_workunit(
+                    database_name, collection_name, collection_schema
+                )
+            return
+
+        # The schemas are inferred in parallel, but the workunits are still created in
+        # the sorted order of the collections.
+        collections_list = list(collections)
+        for (database_name, collection_name), future in zip(
+            collections_list,
+            BackpressureAwareExecutor.map_ordered(
+                self.infer_collection_schema,
+                (
+                    (database_name, collection_name, is_version_gte_4_4)
+                    for database_name, collection_name in collections_list
+                ),
+                max_workers=self.config.max_workers,
+            ),
+        ):
+            yield self.create_workunit(database_name, collection_name, future.result())
+
+    def create_workunit(
+        self,
+        database_name: str,
+        collection_name: str,
+        collection_schema: Optional[Dict[Tuple[str, ...], SchemaDescription]],
+    ) -> MetadataWorkUnit:
+        platform = "mongodb"
+        dataset_name = f"{database_name}.{collection_name}"
+        dataset_urn = f"urn:li:dataset:(urn:li:dataPlatform:{platform},{dataset_name},{self.config.env})"
 
-                dataset_properties = DatasetPropertiesClass(
-                    tags=[],
-                    customProperties={},
+        dataset_snapshot = DatasetSnapshot(
+            urn=dataset_urn,
+            aspects=[],
+        )
+
+        dataset_properties = DatasetPropertiesClass(
+            tags=[],
+            customProperties={},
+        )
+        dataset_snapshot.aspects.append(dataset_properties)
+
+        if collection_schema is not None:
+            # initialize the schema for the collection
+            canonical_schema: List[SchemaField] = []
+            max_schema_size = self.config.maxSchemaSize
+            collection_schema_size = len(collection_schema.values())
+            collection_fields: Union[
+                List[SchemaDescription], ValuesView[SchemaDescription]
+            ] = collection_schema.values()
+            assert max_schema_size is not None
+            if collection_schema_size > max_schema_size:
+                # downsample the schema, using frequency as the sort key
+                self.report.report_warning(
+                    key=dataset_urn,
+                    reason=f"Downsampling the collection schema because it has {collection_schema_size} fields. Threshold is {max_schema_size}",
                 )
-                dataset_snapshot.aspects.append(dataset_properties)
-
-                if self.config.enableSchemaInference:
-                    assert self.config.maxDocumentSize is not None
-                    collection_schema = construct_schema_pymongo(
-                        database[collection_name],
-                        delimiter=".",
-                        use_random_sampling=self.config.useRandomSampling,
-                        max_document_size=self.config.maxDocumentSize,
-                        is_version_gte_4_4=self.is_server_version_gte_4_4(),
-                        sample_size=self.config.schemaSamplingSize,
-                    )
-
-                    # initialize the schema for the collection
-                    canonical_schema: List[SchemaField] = []
-                    max_schema_size = self.config.maxSchemaSize
-                    collection_schema_size = len(collection_schema.values())
-                    collection_fields: Union[
-                        List[SchemaDescription], ValuesView[SchemaDescription]
-                    ] = collection_schema.values()
-                    assert max_schema_size is not None
-                    if collection_schema_size > max_schema_size:
-                        # downsample the schema, using frequency as the sort key
-                        self.report.report_warning(
-                            key=dataset_urn,
-                            reason=f"Downsampling the collection schema because it has {collection_schema_size} fields. Threshold is {max_schema_size}",
-                        )
-                        collection_fields = sorted(
-                            collection_schema.values(),
-                            key=lambda x: x["count"],
-                            reverse=True,
-                        )[0:max_schema_size]
-                        # Add this information to the custom properties so user can know they are looking at downsampled schema
-                        dataset_properties.customProperties[
-                            "schema.downsampled"
-                        ] = "True"
-                        dataset_properties.customProperties[
-                            "schema.totalFields"
-                        ] = f"{collection_schema_size}"
-
-                    logger.debug(
-                        f"Size of collection fields = {len(collection_fields)}"
-                    )
-                    # append each schema field (sort so output is consistent)
-                    for schema_field in sorted(
-                        collection_fields, key=lambda x: x["delimited_name"]
-                    ):
-                        field = SchemaField(
-                            fieldPath=schema_field["delimited_name"],
-                            nativeDataType=self.get_pymongo_type_string(
-                                schema_field["type"], dataset_name
-                            ),
-                            type=self.get_field_type(
-                                schema_field["type"], dataset_name
-                            ),
-                            description=None,
-                            nullable=schema_field["nullable"],
-                            recursive=False,
-                        )
-                        canonical_schema.append(field)
-
-                    # create schema metadata object for collection
-                    schema_metadata = SchemaMetadata(
-                        schemaName=collection_name,
-                        platform=f"urn:li:dataPlatform:{platform}",
-                        version=0,
-                        hash="",
-                        platformSchema=SchemalessClass(),
-                        fields=canonical_schema,
-                    )
-
-                    dataset_snapshot.aspects.append(schema_metadata)
-
-                # TODO: use list_indexes() or index_information() to get index information
-                # See https://pymongo.readthedocs.io/en/stable/api/pymongo/collection.html#pymongo.collection.Collection.list_indexes.
-
-                mce = MetadataChangeEvent(proposedSnapshot=dataset_snapshot)
-                wu = MetadataWorkUnit(id=dataset_name, mce=mce)
-                self.report.report_workunit(wu)
-                yield wu
+                collection_fields = sorted(
+                    collection_schema.values(),
+                    key=lambda x: x["count"],
+                    reverse=True,
+                )[0:max_schema_size]
+                # Add this information to the custom properties so user can know they are looking at downsampled schema
+                dataset_properties.customProperties["schema.downsampled"] = "True"
+                dataset_properties.customProperties[
+                    "schema.totalFields"
+                ] = f"{collection_schema_size}"
+
+            logger.debug(f"Size of collection fields = {len(collection_fields)}")
+            # append each schema field (sort so output is consistent)
+            for schema_field in sorted(
+                collection_fields, key=lambda x: x["delimited_name"]
+            ):
+                field = SchemaField(
+                    fieldPath=schema_field["delimited_name"],
+                    nativeDataType=self.get_pymongo_type_string(
+                        schema_field["type"], dataset_name
+                    ),
+                    type=self.get_field_type(schema_field["type"], dataset_name),
+                    description=None,
+                    nullable=schema_field["nullable"],
+                    recursive=False,
+                )
+                canonical_schema.append(field)
+
+            # create schema metadata object for collection
+            schema_metadata = SchemaMetadata(
+                schemaName=collection_name,
+                platform=f"urn:li:dataPlatform:{platform}",
+                version=0,
+                hash="",
+                platformSchema=SchemalessClass(),
+                fields=canonical_schema,
+            )
+
+            dataset_snapshot.aspects.append(schema_metadata)
+
+        # TODO: use list_indexes() or index_information() to get index information
+        # See https://pymongo.readthedocs.io/en/stable/api/pymongo/collection.html#pymongo.collection.Collection.list_indexes.
+
+        mce = MetadataChangeEvent(proposedSnapshot=dataset_snapshot)
+        wu = MetadataWorkUnit(id=dataset_name, mce=mce)
+        self.report.report_workunit(wu)
+        return wu
 
     def is_server_version_gte_4_4(self) -> bool:
         try:
@@ -9,6 +9,7 @@ from pydantic.class_validators import root_validator
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import AllowDenyPattern, ConfigModel
+from datahub.configuration.http_cache import HttpCacheConfigMixin
 from datahub.configuration.pydantic_field_deprecation import pydantic_field_deprecated
 from datahub.configuration.source_common import DEFAULT_ENV, DatasetSourceConfigMixin
 from datahub.ingestion.source.common.subtypes import BIAssetSubTypes
@@ -19,6 +20,7 @@ from datahub.ingestion.source.state.stale_entity_removal_handler import (
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfigBase,
 )
+from datahub.utilities.http_cache import HttpCacheStats
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +150,11 @@ class PowerBiDashboardSourceReport(StaleEntityRemovalSourceReport):
     filtered_dashboards: List[str] = dataclass_field(default_factory=list)
     filtered_charts: List[str] = dataclass_field(default_factory=list)
     number_of_workspaces: int = 0
+    m_query_parse_sec: float = 0.0
+    num_m_query_parsed: int = 0
+    num_m_query_parse_cache_hits: int = 0
+    m_query_parse_timeouts: int = 0
+    http_cache_stats: Optional[HttpCacheStats] = None
 
     def report_dashboards_scanned(self, count: int = 1) -> None:
         self.dashboards_scanned += count
@@ -164,6 +171,16 @@ class PowerBiDashboardSourceReport(StaleEntityRemovalSourceReport):
     def report_number_of_workspaces(self, number_of_workspaces: int) -> None:
         self.number_of_workspaces = number_of_workspaces
 
+    def report_m_query_parsed(
+        self, elapsed_sec: float, cache_hit: bool, timed_out: bool = False
+    ) -> None:
+        self.m_query_parse_sec += elapsed_sec
+        self.num_m_query_parsed += 1
+        if cache_hit:
+            self.num_m_query_parse_cache_hits += 1
+        if timed_out:
+            self.m_query_parse_timeouts += 1
+
 
 def default_for_dataset_type_mapping() -> Dict[str, str]:
     dict_: dict = {}
@@ -189,7 +206,7 @@ class PlatformDetail(ConfigModel):
 
 
 class PowerBiDashboardSourceConfig(
-    StatefulIngestionConfigBase, DatasetSourceConfigMixin
+    StatefulIngestionConfigBase, DatasetSourceConfigMixin, HttpCacheConfigMixin
 ):
     platform_name: str = pydantic.Field(
         default=Constant.PLATFORM_NAME, hidden_from_docs=True
@@ -278,6 +295,13 @@ class PowerBiDashboardSourceConfig(
         default=True,
         description="Whether PowerBI native query should be parsed to extract lineage",
     )
+    # timeout for parsing a M-Query expression
+    m_query_parse_timeout: Optional[int] = pydantic.Field(
+        default=None,
+        description="Timeout in seconds for parsing the M-Query expression of a table. The lineage of tables whose "
+        "expression takes longer to parse is skipped. When set, the expressions are parsed in a separate worker "
+        "process, which adds some overhead. By default, there is no timeout.",
+    )
 
     # convert PowerBI dataset URN to lower-case
     convert_urns_to_lowercase: bool = pydantic.Field(
@@ -290,6 +314,13 @@ class PowerBiDashboardSourceConfig(
         default=True,
         description="Whether to convert the urns of ingested lineage dataset to lowercase",
     )
+    # Number of threads used to fetch the metadata from PowerBI
+    max_workers: pydantic.PositiveInt = pydantic.Field(
+        default=1,
+        description="Number of workspaces scanned at a time. The datasets, dashboard tiles, report pages and users "
+        "of a workspace are also fetched with up to this many threads. The number of concurrent requests to the "
+        "PowerBI API is bounded by this value, and reduced whenever the API throttles them.",
+    )
     # Configuration for stateful ingestion
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = pydantic.Field(
         default=None, description="PowerBI Stateful Ingestion Config."
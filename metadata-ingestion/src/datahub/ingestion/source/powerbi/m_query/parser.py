@@ -1,7 +1,10 @@
 import functools
 import importlib.resources as pkg_resource
 import logging
-from typing import Dict, List
+import multiprocessing
+import multiprocessing.pool
+import threading
+from typing import Dict, List, Optional, Union
 
 import lark
 from lark import Lark, Tree
@@ -12,9 +15,33 @@ from datahub.ingestion.source.powerbi.m_query.data_classes import (
     TRACE_POWERBI_MQUERY_PARSER,
 )
 from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Table
+from datahub.utilities.perf_timer import PerfTimer
 
 logger = logging.getLogger(__name__)
 
+# Many tables share the same templated expression, so the parse results of the most
+# recently parsed expressions are kept, including the failures.
+_PARSE_CACHE_MAX_SIZE = 1000
+
+
+class MQueryParseError(Exception):
+    """
+    A failure to parse an m-query expression. Unlike the lark errors, it can be sent
+    back from the worker process.
+    """
+
+    def __init__(self, reason: str, details: str) -> None:
+        super().__init__(reason, details)
+        self.reason = reason
+        self.details = details
+
+    def __str__(self) -> str:
+        return self.details
+
+
+class MQueryParseTimeoutError(MQueryParseError):
+    pass
+
 
 @functools.lru_cache(maxsize=1)
 def get_lark_parser() -> Lark:
@@ -26,12 +53,16 @@ def get_lark_parser() -> Lark:
     return Lark(grammar, start="let_expression", regex=True)
 
 
+def _normalize_expression(expression: str) -> str:
+    # Replace U+00a0 NO-BREAK SPACE with a normal space.
+    # Sometimes PowerBI returns expressions with this character and it breaks the parser.
+    return expression.replace("\u00a0", " ")
+
+
 def _parse_expression(expression: str) -> Tree:
     lark_parser: Lark = get_lark_parser()
 
-    # Replace U+00a0 NO-BREAK SPACE with a normal space.
-    # Sometimes PowerBI returns expressions with this character and it breaks the parser.
-    expression = expression.replace("\u00a0", " ")
+    expression = _normalize_expression(expression)
 
     logger.debug(f"Parsing expression = {expression}")
     parse_tree: Tree = lark_parser.parse(expression)
@@ -42,11 +73,118 @@ def _parse_expression(expression: str) -> Tree:
     return parse_tree
 
 
+def _parse_expression_or_raise_parse_error(expression: str) -> Tree:
+    try:
+        return _parse_expression(expression)
+    except lark.exceptions.UnexpectedCharacters as e:
+        raise MQueryParseError("Unsupported m-query expression", str(e))
+    except Exception as e:
+        raise MQueryParseError("Failed to parse m-query expression", str(e))
+
+
+class MQueryParsePool:
+    """
+    Parses expressions in a worker process, so that the parsing of an expression can be
+    stopped after parse_timeout seconds. The worker process is started lazily and must
+    be released with close() by the owner of the pool.
+    """
+
+    def __init__(self, parse_timeout: float) -> None:
+        self.parse_timeout = parse_timeout
+        # Sources may have running threads, which are not safe to fork.
+        self._context = multiprocessing.get_context("spawn")
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+        self._lock = threading.Lock()
+
+    def parse(self, expression: str) -> Tree:
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._context.Pool(processes=1)
+
+            result = self._pool.apply_async(
+                _parse_expression_or_raise_parse_error, (expression,)
+            )
+            try:
+                return result.get(timeout=self.parse_timeout)
+            except multiprocessing.TimeoutError:
+                # The worker process is still parsing the expression, so it is stopped
+                # and a new one is started for the next expression.
+                self._terminate()
+                raise MQueryParseTimeoutError(
+                    "Timed out parsing m-query expression",
+                    f"The parsing took longer than {self.parse_timeout} seconds",
+                )
+
+    def _terminate(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._terminate()
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_MAX_SIZE)
+def _parse_normalized_expression(
+    expression: str, parse_pool: Optional[MQueryParsePool]
+) -> Union[Tree, MQueryParseError]:
+    try:
+        if parse_pool is None:
+            return _parse_expression_or_raise_parse_error(expression)
+        return parse_pool.parse(expression)
+    except MQueryParseError as e:
+        return e
+
+
+def _parse_expression_with_cache(
+    expression: str, parse_pool: Optional[MQueryParsePool] = None
+) -> Tree:
+    """
+    Parses the expression, or returns the cached parse tree of the same expression. The
+    parse tree is shared, so it must not be modified.
+
+    Raises a MQueryParseTimeoutError if the parsing takes longer than the timeout of
+    the parse_pool, and a MQueryParseError if the expression cannot be parsed.
+    """
+
+    result = _parse_normalized_expression(_normalize_expression(expression), parse_pool)
+    if isinstance(result, MQueryParseError):
+        raise result
+    return result
+
+
+def _parse_expression_with_report(
+    expression: str,
+    reporter: PowerBiDashboardSourceReport,
+    parse_pool: Optional[MQueryParsePool] = None,
+) -> Tree:
+    cache_hits = _parse_normalized_expression.cache_info().hits
+    timer = PerfTimer()
+    timed_out = False
+    try:
+        with timer:
+            return _parse_expression_with_cache(expression, parse_pool=parse_pool)
+    except MQueryParseTimeoutError:
+        timed_out = True
+        raise
+    finally:
+        cache_hit = _parse_normalized_expression.cache_info().hits > cache_hits
+        # A cached timeout did not spend any time in the parser again.
+        reporter.report_m_query_parsed(
+            timer.elapsed_seconds(),
+            cache_hit=cache_hit,
+            timed_out=timed_out and not cache_hit,
+        )
+
+
 def get_upstream_tables(
     table: Table,
     reporter: PowerBiDashboardSourceReport,
     native_query_enabled: bool = True,
     parameters: Dict[str, str] = {},
+    parse_pool: Optional[MQueryParsePool] = None,
 ) -> List[resolver.DataPlatformTable]:
     if table.expression is None:
         logger.debug(f"Expression is none for table {table.full_name}")
@@ -55,7 +193,9 @@ def get_upstream_tables(
     parameters = parameters or {}
 
     try:
-        parse_tree: Tree = _parse_expression(table.expression)
+        parse_tree: Tree = _parse_expression_with_report(
+            table.expression, reporter, parse_pool=parse_pool
+        )
 
         valid, message = validator.validate_parse_tree(
             parse_tree, native_query_enabled=native_query_enabled
@@ -68,8 +208,8 @@ def get_upstream_tables(
     except (
         BaseException
     ) as e:  # TODO: Debug why BaseException is needed here and below.
-        if isinstance(e, lark.exceptions.UnexpectedCharacters):
-            message = "Unsupported m-query expression"
+        if isinstance(e, MQueryParseError):
+            message = e.reason
         else:
             message = "Failed to parse m-query expression"
 
@@ -99,10 +99,12 @@ class Mapper:
         config: PowerBiDashboardSourceConfig,
         reporter: PowerBiDashboardSourceReport,
         dataplatform_instance_resolver: AbstractDataPlatformInstanceResolver,
+        m_query_parse_pool: Optional[parser.MQueryParsePool] = None,
     ):
         self.__config = config
         self.__reporter = reporter
         self.__dataplatform_instance_resolver = dataplatform_instance_resolver
+        self.__m_query_parse_pool = m_query_parse_pool
 
     @staticmethod
     def urn_to_lowercase(value: str, flag: bool) -> str:
@@ -160,7 +162,10 @@ class Mapper:
 
         upstreams: List[UpstreamClass] = []
         upstream_tables: List[resolver.DataPlatformTable] = parser.get_upstream_tables(
-            table, self.__reporter, parameters=parameters
+            table,
+            self.__reporter,
+            parameters=parameters,
+            parse_pool=self.__m_query_parse_pool,
         )
         logger.debug(
             f"PowerBI virtual table {table.full_name} and it's upstream dataplatform tables = {upstream_tables}"
@@ -911,6 +916,7 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
         )
         try:
             self.powerbi_client = PowerBiAPI(self.source_config)
+            self.reporter.http_cache_stats = self.powerbi_client.http_cache_stats
         except Exception as e:
             logger.warning(e)
             exit(
@@ -918,7 +924,17 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
             )  # Exit pipeline as we are not able to connect to PowerBI API Service. This exit will avoid raising
             # unwanted stacktrace on console
 
-        self.mapper = Mapper(config, self.reporter, self.dataplatform_instance_resolver)
+        self.m_query_parse_pool: Optional[parser.MQueryParsePool] = None
+        if self.source_config.m_query_parse_timeout is not None:
+            self.m_query_parse_pool = parser.MQueryParsePool(
+                self.source_config.m_query_parse_timeout
+            )
+        self.mapper = Mapper(
+            config,
+            self.reporter,
+            self.dataplatform_instance_resolver,
+            m_query_parse_pool=self.m_query_parse_pool,
+        )
 
         # Create and register the stateful ingestion use-case handler.
         self.stale_entity_removal_handler = StaleEntityRemovalHandler(
@@ -971,10 +987,9 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
         # Validate dataset type mapping
         self.validate_dataset_type_mapping()
         # Fetch PowerBi workspace for given workspace identifier
-        for workspace in self.get_allowed_workspaces():
-            logger.info(f"Scanning workspace id: {workspace.id}")
-            self.powerbi_client.fill_workspace(workspace, self.reporter)
-
+        for workspace in self.powerbi_client.fill_workspaces(
+            self.get_allowed_workspaces(), self.reporter
+        ):
             if self.source_config.extract_workspaces_to_containers:
                 workspace_workunits = self.mapper.generate_container_for_workspace(
                     workspace
@@ -1017,3 +1032,9 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
 
     def get_report(self) -> SourceReport:
         return self.reporter
+
+    def close(self) -> None:
+        self.powerbi_client.close()
+        if self.m_query_parse_pool is not None:
+            self.m_query_parse_pool.close()
+        super().close()
@@ -1,8 +1,10 @@
 import logging
 import math
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
 
 import msal
 import requests
@@ -10,6 +12,7 @@ from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
 from datahub.configuration.common import ConfigurationError
+from datahub.configuration.http_cache import HttpCacheConfig
 from datahub.ingestion.source.powerbi.config import Constant
 from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import (
     Dashboard,
@@ -21,10 +24,16 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import (
     Workspace,
     new_powerbi_dataset,
 )
+from datahub.utilities.backpressure_aware_executor import AdaptiveConcurrencyLimiter
+from datahub.utilities.http_cache import HttpCacheStats, mount_http_cache
+from datahub.utilities.throttled_session import ThrottledSession
 
 # Logger instance
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 def is_permission_error(e: Exception) -> bool:
     if not isinstance(e, requests.exceptions.HTTPError):
@@ -33,6 +42,39 @@ def is_permission_error(e: Exception) -> bool:
     return e.response.status_code == 401 or e.response.status_code == 403
 
 
+class RequestExecutor:
+    """
+    Makes the independent requests of a workspace, e.g. one per report, on a bounded
+    thread pool. The requests made by a request of the pool are made sequentially by
+    its thread, so that the pool never waits on itself.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="powerbi-request"
+            )
+            if max_workers > 1
+            else None
+        )
+        self._local = threading.local()
+
+    def map(self, fn: Callable[[_T], _R], items: Iterable[_T]) -> List[_R]:
+        """Like Executor.map(), but returns the results as a list, in order."""
+        if self._executor is None or getattr(self._local, "in_pool", False):
+            return [fn(item) for item in items]
+
+        def run_in_pool(item: _T) -> _R:
+            self._local.in_pool = True
+            return fn(item)
+
+        return list(self._executor.map(run_in_pool, items))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
 class DataResolverBase(ABC):
     SCOPE: str = "https://analysis.windows.net/powerbi/api/.default"
     BASE_URL: str = "https://api.powerbi.com/v1.0/myorg/groups"
@@ -45,6 +87,10 @@ class DataResolverBase(ABC):
         client_id: str,
         client_secret: str,
         tenant_id: str,
+        http_cache: Optional[HttpCacheConfig] = None,
+        http_cache_stats: Optional[HttpCacheStats] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        request_executor: Optional[RequestExecutor] = None,
     ):
         self.__access_token: Optional[str] = None
         self.__tenant_id = tenant_id
@@ -59,7 +105,12 @@ class DataResolverBase(ABC):
         self.get_access_token()
 
         logger.info("Connected to {}".format(self._get_authority_url()))
-        self._request_session = requests.Session()
+        self._request_executor = request_executor or RequestExecutor()
+        # The session is shared by the threads of the request executor and of the
+        # workspaces. It bounds their concurrent requests, and retries the throttled
+        # ones after the delay given by PowerBI.
+        limiter = concurrency_limiter or AdaptiveConcurrencyLimiter(max_concurrency=1)
+        self._request_session = ThrottledSession(limiter)
         # set re-try parameter for request_session
         self._request_session.mount(
             "https://",
@@ -68,10 +119,21 @@ class DataResolverBase(ABC):
                     total=3,
                     backoff_factor=1,
                     allowed_methods=None,
-                    status_forcelist=[429, 500, 502, 503, 504],
-                )
+                    status_forcelist=[500, 502, 503, 504],
+                ),
+                pool_maxsize=max(
+                    requests.adapters.DEFAULT_POOLSIZE, limiter.max_concurrency
+                ),
             ),
         )
+        # The access token changes on every run, so the cached responses are keyed by
+        # the tenant and the client instead.
+        mount_http_cache(
+            self._request_session,
+            http_cache,
+            namespace=f"powerbi:{tenant_id}:{client_id}",
+            stats=http_cache_stats,
+        )
 
     @abstractmethod
     def get_groups_endpoint(self) -> str:
@@ -245,8 +307,8 @@ class DataResolverBase(ABC):
             logger.debug(f"Request response = {response_dict}")
             return response_dict.get(Constant.VALUE, [])
 
-        reports: List[Report] = [
-            Report(
+        def new_report(raw_instance: Any) -> Report:
+            return Report(
                 id=raw_instance.get(Constant.ID),
                 name=raw_instance.get(Constant.NAME),
                 webUrl=raw_instance.get(Constant.WEB_URL),
@@ -259,8 +321,8 @@ class DataResolverBase(ABC):
                 tags=[],  # It will be fetched using Admin Fetcher based on condition
                 dataset=workspace.datasets.get(raw_instance.get(Constant.DATASET_ID)),
             )
-            for raw_instance in fetch_reports()
-        ]
+
+        reports: List[Report] = self._request_executor.map(new_report, fetch_reports())
 
         return reports
 
@@ -1,7 +1,7 @@
 import json
 import logging
 import sys
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import requests
 
@@ -22,7 +22,13 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import (
 from datahub.ingestion.source.powerbi.rest_api_wrapper.data_resolver import (
     AdminAPIResolver,
     RegularAPIResolver,
+    RequestExecutor,
 )
+from datahub.utilities.backpressure_aware_executor import (
+    AdaptiveConcurrencyLimiter,
+    BackpressureAwareExecutor,
+)
+from datahub.utilities.http_cache import HttpCacheStats
 
 # Logger instance
 logger = logging.getLogger(__name__)
@@ -32,16 +38,34 @@ class PowerBiAPI:
     def __init__(self, config: PowerBiDashboardSourceConfig) -> None:
         self.__config: PowerBiDashboardSourceConfig = config
 
+        # Limits the concurrent PowerBI API calls, backing off when PowerBI throttles us.
+        self.__concurrency_limiter = AdaptiveConcurrencyLimiter(
+            max_concurrency=self.__config.max_workers
+        )
+        self.__request_executor = RequestExecutor(max_workers=self.__config.max_workers)
+        # Shared by the caches of both resolvers.
+        self.http_cache_stats: Optional[HttpCacheStats] = (
+            HttpCacheStats() if self.__config.http_cache is not None else None
+        )
+
         self.__regular_api_resolver = RegularAPIResolver(
             client_id=self.__config.client_id,
             client_secret=self.__config.client_secret,
             tenant_id=self.__config.tenant_id,
+            http_cache=self.__config.http_cache,
+            http_cache_stats=self.http_cache_stats,
+            concurrency_limiter=self.__concurrency_limiter,
+            request_executor=self.__request_executor,
         )
 
         self.__admin_api_resolver = AdminAPIResolver(
             client_id=self.__config.client_id,
             client_secret=self.__config.client_secret,
             tenant_id=self.__config.tenant_id,
+            http_cache=self.__config.http_cache,
+            http_cache_stats=self.http_cache_stats,
+            concurrency_limiter=self.__concurrency_limiter,
+            request_executor=self.__request_executor,
         )
 
     def log_http_error(self, message: str) -> Any:
@@ -162,10 +186,14 @@ class PowerBiAPI:
                 )
                 return
 
-            for report in reports:
-                report.users = self.get_report_users(
+            reports_users = self.__request_executor.map(
+                lambda report: self.get_report_users(
                     workspace_id=workspace.id, report_id=report.id
-                )
+                ),
+                reports,
+            )
+            for report, users in zip(reports, reports_users):
+                report.users = users
 
         def fill_tags() -> None:
             if self.__config.extract_endorsements_to_tags is False:
@@ -271,16 +299,18 @@ class PowerBiAPI:
 
         logger.debug("Processing scan result for datasets")
 
-        for dataset_dict in datasets:
+        workspace_id: str = scan_result[Constant.ID]
+
+        def fetch_dataset(dataset_dict: dict) -> PowerBIDataset:
             dataset_instance: PowerBIDataset = self._get_resolver().get_dataset(
-                workspace_id=scan_result[Constant.ID],
+                workspace_id=workspace_id,
                 dataset_id=dataset_dict[Constant.ID],
             )
 
             # fetch + set dataset parameters
             try:
                 dataset_parameters = self._get_resolver().get_dataset_parameters(
-                    workspace_id=scan_result[Constant.ID],
+                    workspace_id=workspace_id,
                     dataset_id=dataset_dict[Constant.ID],
                 )
                 dataset_instance.parameters = dataset_parameters
@@ -289,6 +319,12 @@ class PowerBiAPI:
                     f"Unable to fetch dataset parameters for {dataset_dict[Constant.ID]}: {e}"
                 )
 
+            return dataset_instance
+
+        dataset_instances: List[PowerBIDataset] = self.__request_executor.map(
+            fetch_dataset, datasets
+        )
+        for dataset_dict, dataset_instance in zip(datasets, dataset_instances):
             if self.__config.extract_endorsements_to_tags:
                 dataset_instance.tags = self._parse_endorsement(
                     dataset_dict.get(Constant.ENDORSEMENT_DETAIL, None)
@@ -345,10 +381,14 @@ class PowerBiAPI:
         def fill_dashboards() -> None:
             workspace.dashboards = self._get_resolver().get_dashboards(workspace)
             # set tiles of Dashboard
-            for dashboard in workspace.dashboards:
-                dashboard.tiles = self._get_resolver().get_tiles(
+            dashboards_tiles = self.__request_executor.map(
+                lambda dashboard: self._get_resolver().get_tiles(
                     workspace, dashboard=dashboard
-                )
+                ),
+                workspace.dashboards,
+            )
+            for dashboard, tiles in zip(workspace.dashboards, dashboards_tiles):
+                dashboard.tiles = tiles
 
         def fill_reports() -> None:
             if self.__config.extract_reports is False:
@@ -380,3 +420,32 @@ class PowerBiAPI:
         )  # First try to fill the admin detail as some regular metadata contains lineage to admin metadata
 
         self._fill_regular_metadata_detail(workspace=workspace)
+
+    def fill_workspaces(
+        self, workspaces: Iterable[Workspace], reporter: PowerBiDashboardSourceReport
+    ) -> Iterable[Workspace]:
+        """
+        Fills the workspaces, up to max_workers at a time, and yields them in order as
+        they are filled.
+        """
+
+        def fill_workspace(workspace: Workspace) -> Workspace:
+            logger.info(f"Scanning workspace id: {workspace.id}")
+            self.fill_workspace(workspace, reporter)
+            return workspace
+
+        if self.__config.max_workers == 1:
+            for workspace in workspaces:
+                yield fill_workspace(workspace)
+            return
+
+        args_list: Iterable[Tuple[Workspace]] = (
+            (workspace,) for workspace in workspaces
+        )
+        for future in BackpressureAwareExecutor.map_ordered(
+            fill_workspace, args_list, max_workers=self.__config.max_workers
+        ):
+            yield future.result()
+
+    def close(self) -> None:
+        self.__request_executor.shutdown()
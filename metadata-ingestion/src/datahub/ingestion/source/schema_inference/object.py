@@ -1,5 +1,14 @@
 from collections import Counter
-from typing import Any, Counter as CounterType, Dict, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Counter as CounterType,
+    Dict,
+    Iterable,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from mypy_extensions import TypedDict
 
@@ -80,30 +89,40 @@ def is_nullable_collection(
     return any(is_field_nullable(doc, field_path) for doc in collection)
 
 
-def construct_schema(
-    collection: Sequence[Dict[str, Any]], delimiter: str
-) -> Dict[Tuple[str, ...], SchemaDescription]:
+def infer_field_type(field_types: CounterType[type]) -> Union[type, str]:
+    """
+    Collapse the types seen for a field into a single type, or `mixed` if they differ.
     """
-    Construct (infer) a schema from a collection of documents.
 
-    For each field (represented as a tuple to handle nested items), reports the following:
-        - `types`: Python types of field values
-        - `count`: Number of times the field was encountered
-        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
-        - `nullable`: if field is ever null/missing
-        - `delimited_name`: name of the field, joined by a given delimiter
+    # if single type detected, mark that as the type to go with
+    if len(field_types.keys()) == 1:
+        return next(iter(field_types))
+    elif set(field_types.keys()) == {int, float}:
+        # If there's only floats and ints, it's not really a mixed type.
+        return float
+    return "mixed"
 
-    Parameters
-    ----------
-        collection:
-            collection to construct schema over.
-        delimiter:
-            string to concatenate field names by
+
+class ObjectSchemaBuilder:
     """
+    Infers a schema from a stream of documents, one document at a time.
 
-    schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+    Only the schema itself is kept in memory, so the documents can be read lazily,
+    e.g. from a database cursor. The nullability of each field is tracked by counting
+    the documents in which it is not nullable, instead of scanning all the documents
+    again once the schema is known.
+    """
 
-    def append_to_schema(doc: Dict[str, Any], parent_prefix: Tuple[str, ...]) -> None:
+    def __init__(self, delimiter: str):
+        self.delimiter = delimiter
+        self.document_count = 0
+        self._schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+        # number of documents in which each field is present and not null
+        self._non_nullable_counts: CounterType[Tuple[str, ...]] = Counter()
+
+    def _append_to_schema(
+        self, doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+    ) -> None:
         """
         Recursively update the schema with a document, which may/may not contain nested fields.
 
@@ -120,50 +139,111 @@ def construct_schema(
 
             # if nested value, look at the types within
             if isinstance(value, dict):
-                append_to_schema(value, new_parent_prefix)
+                self._append_to_schema(value, new_parent_prefix)
             # if array of values, check what types are within
             if isinstance(value, list):
                 for item in value:
                     # if dictionary, add it as a nested object
                     if isinstance(item, dict):
-                        append_to_schema(item, new_parent_prefix)
+                        self._append_to_schema(item, new_parent_prefix)
 
             # don't record None values (counted towards nullable)
             if value is not None:
-                if new_parent_prefix not in schema:
-                    schema[new_parent_prefix] = {
+                if new_parent_prefix not in self._schema:
+                    self._schema[new_parent_prefix] = {
                         "types": Counter([type(value)]),
                         "count": 1,
                     }
 
                 else:
                     # update the type count
-                    schema[new_parent_prefix]["types"].update({type(value): 1})
-                    schema[new_parent_prefix]["count"] += 1
-
-    for document in collection:
-        append_to_schema(document, ())
-
-    extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
-
-    for field_path in schema.keys():
-        field_types = schema[field_path]["types"]
-        field_type: Union[str, type] = "mixed"
-
-        # if single type detected, mark that as the type to go with
-        if len(field_types.keys()) == 1:
-            field_type = next(iter(field_types))
-        elif set(field_types.keys()) == {int, float}:
-            # If there's only floats and ints, it's not really a mixed type.
-            field_type = float
-        field_extended: SchemaDescription = {
-            "types": schema[field_path]["types"],
-            "count": schema[field_path]["count"],
-            "nullable": is_nullable_collection(collection, field_path),
-            "delimited_name": delimiter.join(field_path),
-            "type": field_type,
-        }
-
-        extended_schema[field_path] = field_extended
-
-    return extended_schema
+                    self._schema[new_parent_prefix]["types"].update({type(value): 1})
+                    self._schema[new_parent_prefix]["count"] += 1
+
+    @classmethod
+    def _get_non_nullable_fields(
+        cls, doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+    ) -> Set[Tuple[str, ...]]:
+        """
+        Return the fields of a document that are not nullable, as defined by `is_field_nullable`.
+        """
+
+        fields: Set[Tuple[str, ...]] = set()
+        for key, value in doc.items():
+            if value is None:
+                continue
+            new_parent_prefix = parent_prefix + (key,)
+            fields.add(new_parent_prefix)
+
+            if isinstance(value, dict):
+                fields.update(cls._get_non_nullable_fields(value, new_parent_prefix))
+            # a nested field of a list is only non-nullable if it is in every member,
+            # and empty lists count as nullable
+            elif isinstance(value, list) and value:
+                if all(isinstance(item, dict) for item in value):
+                    fields.update(
+                        set.intersection(
+                            *(
+                                cls._get_non_nullable_fields(item, new_parent_prefix)
+                                for item in value
+                            )
+                        )
+                    )
+        return fields
+
+    def add_document(self, doc: Dict[str, Any]) -> None:
+        self._append_to_schema(doc, ())
+        self._non_nullable_counts.update(self._get_non_nullable_fields(doc, ()))
+        self.document_count += 1
+
+    def add_documents(self, docs: Iterable[Dict[str, Any]]) -> None:
+        for doc in docs:
+            self.add_document(doc)
+
+    def build(self) -> Dict[Tuple[str, ...], SchemaDescription]:
+        """
+        Return the schema of the documents added so far, in the format of `construct_schema`.
+        """
+
+        extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
+
+        for field_path, field_description in self._schema.items():
+            field_extended: SchemaDescription = {
+                "types": field_description["types"],
+                "count": field_description["count"],
+                "nullable": self._non_nullable_counts[field_path] < self.document_count,
+                "delimited_name": self.delimiter.join(field_path),
+                "type": infer_field_type(field_description["types"]),
+            }
+
+            extended_schema[field_path] = field_extended
+
+        return extended_schema
+
+
+def construct_schema(
+    collection: Iterable[Dict[str, Any]], delimiter: str
+) -> Dict[Tuple[str, ...], SchemaDescription]:
+    """
+    Construct (infer) a schema from a collection of documents.
+
+    For each field (represented as a tuple to handle nested items), reports the following:
+        - `types`: Python types of field values
+        - `count`: Number of times the field was encountered
+        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
+        - `nullable`: if field is ever null/missing
+        - `delimited_name`: name of the field, joined by a given delimiter
+
+    The collection is only iterated over once, so it can be a generator.
+
+    Parameters
+    ----------
+        collection:
+            collection to construct schema over.
+        delimiter:
+            string to concatenate field names by
+    """
+
+    builder = ObjectSchemaBuilder(delimiter)
+    builder.add_documents(collection)
+    return builder.build()
@@ -1,7 +1,7 @@
 import json
 import logging
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, FrozenSet, Iterable, List, Optional, Set
 
 from pydantic import Field
@@ -36,6 +36,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.dataset import (
     UpstreamLineage,
 )
 from datahub.metadata.schema_classes import DatasetLineageTypeClass, UpstreamClass
+from datahub.utilities.lineage_accumulator import LineageAccumulator
 from datahub.utilities.perf_timer import PerfTimer
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -67,18 +68,10 @@ class SnowflakeColumnFineGrainedLineage:
     inputColumns: FrozenSet[SnowflakeColumnId]
     # Transform function, query etc can be added here
 
-
-@dataclass
-class SnowflakeColumnUpstreams:
-    """All upstreams of a column"""
-
-    upstreams: Set[SnowflakeColumnFineGrainedLineage] = field(
-        default_factory=set, init=False
-    )
-
-    def update_column_lineage(
-        self, directSourceColumns: List[SnowflakeColumnReference]
-    ) -> None:
+    @classmethod
+    def from_column_references(
+        cls, directSourceColumns: List[SnowflakeColumnReference]
+    ) -> Optional["SnowflakeColumnFineGrainedLineage"]:
         input_columns = frozenset(
             [
                 SnowflakeColumnId(
@@ -91,10 +84,8 @@ class SnowflakeColumnUpstreams:
             ]
         )
         if not input_columns:
-            return
-        upstream = SnowflakeColumnFineGrainedLineage(inputColumns=input_columns)
-        if upstream not in self.upstreams:
-            self.upstreams.add(upstream)
+            return None
+        return cls(inputColumns=input_columns)
 
 
 @dataclass
@@ -135,32 +126,6 @@ class SnowflakeUpstreamTable:
         return table_with_upstreams
 
 
-@dataclass
-class SnowflakeTableLineage:
-    # key: upstream table name
-    upstreamTables: Dict[str, SnowflakeUpstreamTable] = field(
-        default_factory=dict, init=False
-    )
-
-    # key: downstream column name
-    columnLineages: Dict[str, SnowflakeColumnUpstreams] = field(
-        default_factory=lambda: defaultdict(SnowflakeColumnUpstreams), init=False
-    )
-
-    def update_lineage(
-        self, table: SnowflakeUpstreamTable, include_column_lineage: bool = True
-    ) -> None:
-        if table.upstreamDataset not in self.upstreamTables.keys():
-            self.upstreamTables[table.upstreamDataset] = table
-
-        if include_column_lineage and table.downstreamColumns:
-            for col in table.downstreamColumns:
-                if col.directSourceColumns:
-                    self.columnLineages[col.columnName].update_column_lineage(
-                        col.directSourceColumns
-                    )
-
-
 class SnowflakeLineageExtractor(
     SnowflakeQueryMixin, SnowflakeConnectionMixin, SnowflakeCommonMixin
 ):
@@ -178,9 +143,11 @@ class SnowflakeLineageExtractor(
     """
 
     def __init__(self, config: SnowflakeV2Config, report: SnowflakeV2Report) -> None:
-        self._lineage_map: Dict[str, SnowflakeTableLineage] = defaultdict(
-            SnowflakeTableLineage
-        )
+        # Maps the downstream datasets to their upstream datasets and the fine grained
+        # upstreams of their columns.
+        self._lineage_map: LineageAccumulator[
+            str, SnowflakeColumnFineGrainedLineage
+        ] = LineageAccumulator()
         self._external_lineage_map: Dict[str, Set[str]] = defaultdict(set)
         self.config = config
         self.platform = "snowflake"
@@ -262,9 +229,10 @@ class SnowflakeLineageExtractor(
     def _get_upstream_lineage_info(
         self, dataset_name: str
     ) -> Optional[UpstreamLineage]:
-        lineage = self._lineage_map[dataset_name]
+        upstream_datasets = self._lineage_map.get_edges(dataset_name)
+        column_lineages = self._lineage_map.get_column_edges(dataset_name)
         external_lineage = self._external_lineage_map[dataset_name]
-        if not (lineage.upstreamTables or lineage.columnLineages or external_lineage):
+        if not (upstream_datasets or column_lineages or external_lineage):
             logger.debug(f"No lineage found for {dataset_name}")
             return None
 
@@ -278,10 +246,12 @@ class SnowflakeLineageExtractor(
             self.config.env,
         )
         # Populate the table-lineage in aspect
-        self.update_upstream_tables_lineage(upstream_tables, lineage)
+        self.update_upstream_tables_lineage(upstream_tables, upstream_datasets)
 
         # Populate the column-lineage in aspect
-        self.update_upstream_columns_lineage(dataset_urn, finegrained_lineages, lineage)
+        self.update_upstream_columns_lineage(
+            dataset_urn, finegrained_lineages, column_lineages
+        )
 
         # Populate the external-table-lineage(s3->snowflake) in aspect
         self.update_external_tables_lineage(upstream_tables, external_lineage)
@@ -450,17 +420,17 @@ class SnowflakeLineageExtractor(
             )
         ):
             return
-        self._lineage_map[key].update_lineage(
+        self._update_lineage(
+            key,
             # (<upstream_table_name>, <json_list_of_upstream_columns>, <json_list_of_downstream_columns>)
             SnowflakeUpstreamTable.from_dict(
                 upstream_table_name,
                 db_row["UPSTREAM_TABLE_COLUMNS"],
                 db_row["DOWNSTREAM_TABLE_COLUMNS"],
             ),
-            self.config.include_column_lineage,
         )
         self.report.num_table_to_table_edges_scanned += 1
-        logger.debug(f"Lineage[Table(Down)={key}]:Table(Up)={self._lineage_map[key]}")
+        logger.debug(f"Lineage[Table(Down)={key}]:Table(Up)={upstream_table_name}")
 
     def _populate_view_upstream_lineage(self) -> None:
         # NOTE: This query captures only the upstream lineage of a view (with no column lineage).
@@ -504,10 +474,10 @@ class SnowflakeLineageExtractor(
         ):
             return
             # key is the downstream view name
-        self._lineage_map[view_name].update_lineage(
+        self._update_lineage(
+            view_name,
             # (<upstream_table_name>, <empty_json_list_of_upstream_table_columns>, <empty_json_list_of_downstream_view_columns>)
             SnowflakeUpstreamTable.from_dict(view_upstream, None, None),
-            self.config.include_column_lineage,
         )
         self.report.num_table_to_view_edges_scanned += 1
         logger.debug(
@@ -561,28 +531,41 @@ class SnowflakeLineageExtractor(
             return
 
             # Capture view->downstream table lineage.
-        self._lineage_map[downstream_table].update_lineage(
+        self._update_lineage(
+            downstream_table,
             # (<upstream_view_name>, <json_list_of_upstream_view_columns>, <json_list_of_downstream_columns>)
             SnowflakeUpstreamTable.from_dict(
                 view_name,
                 db_row["VIEW_COLUMNS"],
                 db_row["DOWNSTREAM_TABLE_COLUMNS"],
             ),
-            self.config.include_column_lineage,
         )
         self.report.num_view_to_table_edges_scanned += 1
 
         logger.debug(
-            f"View->Table: Lineage[Table(Down)={downstream_table}]:View(Up)={self._lineage_map[downstream_table]}"
+            f"View->Table: Lineage[Table(Down)={downstream_table}]:View(Up)={view_name}"
         )
 
+    def _update_lineage(self, downstream: str, table: SnowflakeUpstreamTable) -> None:
+        self._lineage_map.add_edge(downstream, table.upstreamDataset)
+
+        if self.config.include_column_lineage and table.downstreamColumns:
+            for col in table.downstreamColumns:
+                if col.directSourceColumns:
+                    column_lineage = (
+                        SnowflakeColumnFineGrainedLineage.from_column_references(
+                            col.directSourceColumns
+                        )
+                    )
+                    if column_lineage is not None:
+                        self._lineage_map.add_column_edge(
+                            downstream, col.columnName, column_lineage
+                        )
+
     def update_upstream_tables_lineage(
-        self, upstream_tables: List[UpstreamClass], lineage: SnowflakeTableLineage
+        self, upstream_tables: List[UpstreamClass], upstream_datasets: Set[str]
     ) -> None:
-        for lineage_entry in sorted(
-            lineage.upstreamTables.values(), key=lambda x: x.upstreamDataset
-        ):
-            upstream_table_name = lineage_entry.upstreamDataset
+        for upstream_table_name in sorted(upstream_datasets):
             upstream_table_urn = builder.make_dataset_urn_with_platform_instance(
                 self.platform,
                 upstream_table_name,
@@ -599,10 +582,10 @@ class SnowflakeLineageExtractor(
         self,
         dataset_urn: str,
         finegrained_lineages: List[FineGrainedLineage],
-        lineage: SnowflakeTableLineage,
+        column_lineages: Dict[str, Set[SnowflakeColumnFineGrainedLineage]],
     ) -> None:
         # For every column for which upstream lineage is available
-        for col, col_upstreams in lineage.columnLineages.items():
+        for col, col_upstreams in column_lineages.items():
             # For every upstream of column
             self.update_upstream_columns_lineage_of_column(
                 dataset_urn, col, finegrained_lineages, col_upstreams
@@ -613,9 +596,9 @@ class SnowflakeLineageExtractor(
         dataset_urn: str,
         col: str,
         finegrained_lineages: List[FineGrainedLineage],
-        col_upstreams: SnowflakeColumnUpstreams,
+        col_upstreams: Set[SnowflakeColumnFineGrainedLineage],
     ) -> None:
-        for fine_upstream in col_upstreams.upstreams:
+        for fine_upstream in col_upstreams:
             finegrained_lineage_entry = self.build_finegrained_lineage(
                 dataset_urn, col, fine_upstream
             )
@@ -53,6 +53,7 @@ from datahub.metadata.schema_classes import (
     DatasetSnapshotClass,
     UpstreamClass,
 )
+from datahub.utilities.lineage_accumulator import LineageAccumulator
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -515,6 +516,11 @@ class RedshiftSource(SQLAlchemySource):
         self.catalog_metadata: Dict = {}
         self.config: RedshiftConfig = config
         self._lineage_map: Optional[Dict[str, LineageItem]] = None
+        # The upstreams of the datasets in _lineage_map, which are accumulated on disk
+        # since they grow with the query history.
+        self._lineage_upstreams: Optional[
+            LineageAccumulator[LineageDataset, None]
+        ] = None
         self._all_tables_set: Optional[Set[str]] = None
         self.report: RedshiftReport = RedshiftReport()
 
@@ -726,10 +732,11 @@ class RedshiftSource(SQLAlchemySource):
         :type query: str
         :param lineage_type: The way the lineage should be processed
         :type lineage_type: LineageType
-        return: The method does not return with anything as it directly modify the self._lineage_map property.
+        return: The method does not return with anything as it directly modify the self._lineage_map and self._lineage_upstreams properties.
         :rtype: None
         """
         assert self._lineage_map is not None
+        assert self._lineage_upstreams is not None
 
         if not self._all_tables_set:
             self._all_tables_set = self._get_all_tables()
@@ -820,23 +827,14 @@ class RedshiftSource(SQLAlchemySource):
 
                     target.upstreams.add(source)
 
-                # Merging downstreams if dataset already exists and has downstreams
-                if target.dataset.path in self._lineage_map:
-                    self._lineage_map[
-                        target.dataset.path
-                    ].upstreams = self._lineage_map[
-                        target.dataset.path
-                    ].upstreams.union(
-                        target.upstreams
-                    )
+                logger.info(f"Lineage[{target}]")
 
-                else:
+                # Merging downstreams if dataset already exists and has downstreams
+                self._lineage_upstreams.add_edges(target.dataset.path, target.upstreams)
+                if target.dataset.path not in self._lineage_map:
+                    target.upstreams = set()
                     self._lineage_map[target.dataset.path] = target
 
-                logger.info(
-                    f"Lineage[{target}]:{self._lineage_map[target.dataset.path]}"
-                )
-
         except Exception as e:
             self.warn(logger, f"extract-{lineage_type.name}", f"Error was {e}")
 
@@ -1058,6 +1056,8 @@ class RedshiftSource(SQLAlchemySource):
 
         if not self._lineage_map:
             self._lineage_map = defaultdict()
+        if self._lineage_upstreams is None:
+            self._lineage_upstreams = LineageAccumulator()
 
         if self.config.table_lineage_mode == LineageMode.STL_SCAN_BASED:
             # Populate table level lineage by getting upstream tables from stl_scan redshift table
@@ -1116,6 +1116,7 @@ class RedshiftSource(SQLAlchemySource):
             logger.debug("Populating lineage")
             self._populate_lineage()
         assert self._lineage_map is not None
+        assert self._lineage_upstreams is not None
 
         upstream_lineage: List[UpstreamClass] = []
         custom_properties: Dict[str, str] = {}
@@ -1129,7 +1130,7 @@ class RedshiftSource(SQLAlchemySource):
                 custom_properties["lineage_sql_parser_failed_queries"] = ",".join(
                     item.query_parser_failed_sqls
                 )
-            for upstream in item.upstreams:
+            for upstream in self._lineage_upstreams.get_edges(dataset_key.name):
                 upstream_table = UpstreamClass(
                     dataset=builder.make_dataset_urn_with_platform_instance(
                         upstream.platform.value,
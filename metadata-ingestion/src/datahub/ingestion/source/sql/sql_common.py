@@ -1,5 +1,6 @@
 import datetime
 import logging
+import threading
 import traceback
 from collections import OrderedDict
 from dataclasses import dataclass, field
@@ -19,6 +20,7 @@ from typing import (
 
 import sqlalchemy.dialects.postgresql.base
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Connection
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.sql import sqltypes as types
@@ -31,7 +33,7 @@ from datahub.emitter.mce_builder import (
     make_tag_urn,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.api.common import PipelineContext, WorkUnit
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.common.subtypes import (
     DatasetContainerSubTypes,
@@ -88,6 +90,7 @@ from datahub.metadata.schema_classes import (
     ViewPropertiesClass,
 )
 from datahub.telemetry import telemetry
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.registries.domain_registry import DomainRegistry
 from datahub.utilities.source_helpers import (
@@ -162,22 +165,42 @@ class SQLSourceReport(StaleEntityRemovalSourceReport):
 
     query_combiner: Optional[SQLAlchemyQueryCombinerReport] = None
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        # Tables and views may be processed by several threads, see max_workers.
+        self._lock = threading.RLock()
+
+    def report_workunit(self, wu: WorkUnit) -> None:
+        with self._lock:
+            super().report_workunit(wu)
+
+    def report_warning(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_warning(key, reason)
+
+    def report_failure(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_failure(key, reason)
+
     def report_entity_scanned(self, name: str, ent_type: str = "table") -> None:
         """
         Entity could be a view or a table
         """
-        if ent_type == "table":
-            self.tables_scanned += 1
-        elif ent_type == "view":
-            self.views_scanned += 1
-        else:
-            raise KeyError(f"Unknown entity {ent_type}.")
+        with self._lock:
+            if ent_type == "table":
+                self.tables_scanned += 1
+            elif ent_type == "view":
+                self.views_scanned += 1
+            else:
+                raise KeyError(f"Unknown entity {ent_type}.")
 
     def report_entity_profiled(self, name: str) -> None:
-        self.entities_profiled += 1
+        with self._lock:
+            self.entities_profiled += 1
 
     def report_dropped(self, ent_name: str) -> None:
-        self.filtered.append(ent_name)
+        with self._lock:
+            self.filtered.append(ent_name)
 
     def report_from_query_combiner(
         self, query_combiner_report: SQLAlchemyQueryCombinerReport
@@ -315,6 +338,35 @@ config_options_to_report = [
 ]
 
 
+class _WorkerInspectors:
+    """
+    Hands out one inspector per worker thread, each on its own connection of the
+    engine's pool. Inspectors and connections must not be shared across threads.
+    """
+
+    def __init__(self, inspector: Inspector):
+        self.engine = inspector.engine
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[Connection] = []
+
+    def get(self) -> Inspector:
+        inspector: Optional[Inspector] = getattr(self._local, "inspector", None)
+        if inspector is None:
+            conn = self.engine.connect()
+            with self._lock:
+                self._connections.append(conn)
+            inspector = inspect(conn)
+            self._local.inspector = inspector
+        return inspector
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
 class SQLAlchemySource(StatefulIngestionSourceBase):
     """A Base class for all SQL Sources that use SQLAlchemy to extend"""
 
@@ -488,6 +540,8 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
             sql_config.options.setdefault(
                 "max_overflow", sql_config.profiling.max_workers
             )
+        if sql_config.max_workers > 1:
+            sql_config.options.setdefault("max_overflow", sql_config.max_workers)
 
         for inspector in self.get_inspectors():
             profiler = None
@@ -591,48 +645,107 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
     def normalise_dataset_name(self, dataset_name: str) -> str:
         return dataset_name
 
-    def loop_tables(  # noqa: C901
+    def loop_tables(
         self,
         inspector: Inspector,
         schema: str,
         sql_config: SQLAlchemyConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
-        tables_seen: Set[str] = set()
         try:
-            for table in inspector.get_table_names(schema):
-                schema, table = self.standardize_schema_table_names(
-                    schema=schema, entity=table
-                )
-                dataset_name = self.get_identifier(
-                    schema=schema, entity=table, inspector=inspector
-                )
+            yield from self._process_entities(
+                inspector,
+                self._get_tables_to_process(inspector, schema, sql_config),
+                lambda dataset_name, inspector, schema, table: self._process_table(
+                    dataset_name, inspector, schema, table, sql_config
+                ),
+                ent_type="table",
+            )
+        except Exception as e:
+            self.report.report_failure(f"{schema}", f"Tables error: {e}")
+
+    def _get_tables_to_process(
+        self,
+        inspector: Inspector,
+        schema: str,
+        sql_config: SQLAlchemyConfig,
+    ) -> Iterable[Tuple[str, str, str]]:
+        tables_seen: Set[str] = set()
+        for table in inspector.get_table_names(schema):
+            schema, table = self.standardize_schema_table_names(
+                schema=schema, entity=table
+            )
+            dataset_name = self.get_identifier(
+                schema=schema, entity=table, inspector=inspector
+            )
+
+            dataset_name = self.normalise_dataset_name(dataset_name)
+
+            if dataset_name not in tables_seen:
+                tables_seen.add(dataset_name)
+            else:
+                logger.debug(f"{dataset_name} has already been seen, skipping...")
+                continue
+
+            self.report.report_entity_scanned(dataset_name, ent_type="table")
+            if not sql_config.table_pattern.allowed(dataset_name):
+                self.report.report_dropped(dataset_name)
+                continue
 
-                dataset_name = self.normalise_dataset_name(dataset_name)
+            yield dataset_name, schema, table
 
-                if dataset_name not in tables_seen:
-                    tables_seen.add(dataset_name)
-                else:
-                    logger.debug(f"{dataset_name} has already been seen, skipping...")
-                    continue
+    def _process_entities(
+        self,
+        inspector: Inspector,
+        entities: Iterable[Tuple[str, str, str]],
+        process_entity: Callable[
+            [str, Inspector, str, str], Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]
+        ],
+        ent_type: str,
+    ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
+        """
+        Runs process_entity for every (dataset_name, schema, entity) tuple. With
+        max_workers > 1, the entities are processed concurrently, each worker with
+        an inspector on its own connection. The workunits of an entity are always
+        emitted together and in order, but entities are emitted as they complete.
+        """
 
-                self.report.report_entity_scanned(dataset_name, ent_type="table")
-                if not sql_config.table_pattern.allowed(dataset_name):
-                    self.report.report_dropped(dataset_name)
-                    continue
+        def report_error(schema: str, entity: str, e: Exception) -> None:
+            logger.warning(
+                f"Unable to ingest {'view ' if ent_type == 'view' else ''}{schema}.{entity} due to an exception.\n {traceback.format_exc()}"
+            )
+            self.report.report_warning(f"{schema}.{entity}", f"Ingestion error: {e}")
 
+        if self.config.max_workers <= 1:
+            for dataset_name, schema, entity in entities:
                 try:
-                    yield from self._process_table(
-                        dataset_name, inspector, schema, table, sql_config
-                    )
+                    yield from process_entity(dataset_name, inspector, schema, entity)
                 except Exception as e:
-                    logger.warning(
-                        f"Unable to ingest {schema}.{table} due to an exception.\n {traceback.format_exc()}"
-                    )
-                    self.report.report_warning(
-                        f"{schema}.{table}", f"Ingestion error: {e}"
+                    report_error(schema, entity, e)
+            return
+
+        def process(
+            dataset_name: str, schema: str, entity: str
+        ) -> List[Union[SqlWorkUnit, MetadataWorkUnit]]:
+            try:
+                return list(
+                    process_entity(
+                        dataset_name, worker_inspectors.get(), schema, entity
                     )
-        except Exception as e:
-            self.report.report_failure(f"{schema}", f"Tables error: {e}")
+                )
+            except Exception as e:
+                report_error(schema, entity, e)
+                return []
+
+        worker_inspectors = _WorkerInspectors(inspector)
+        try:
+            for future in BackpressureAwareExecutor.map(
+                process,
+                entities,
+                max_workers=self.config.max_workers,
+            ):
+                yield from future.result()
+        finally:
+            worker_inspectors.close()
 
     def add_information_for_schema(self, inspector: Inspector, schema: str) -> None:
         pass
@@ -890,38 +1003,43 @@ class SQLAlchemySource(StatefulIngestionSourceBase):
         sql_config: SQLAlchemyConfig,
     ) -> Iterable[Union[SqlWorkUnit, MetadataWorkUnit]]:
         try:
-            for view in inspector.get_view_names(schema):
-                schema, view = self.standardize_schema_table_names(
-                    schema=schema, entity=view
-                )
-                dataset_name = self.get_identifier(
-                    schema=schema, entity=view, inspector=inspector
-                )
-                dataset_name = self.normalise_dataset_name(dataset_name)
+            yield from self._process_entities(
+                inspector,
+                self._get_views_to_process(inspector, schema, sql_config),
+                lambda dataset_name, inspector, schema, view: self._process_view(
+                    dataset_name=dataset_name,
+                    inspector=inspector,
+                    schema=schema,
+                    view=view,
+                    sql_config=sql_config,
+                ),
+                ent_type="view",
+            )
+        except Exception as e:
+            self.report.report_failure(f"{schema}", f"Views error: {e}")
 
-                self.report.report_entity_scanned(dataset_name, ent_type="view")
+    def _get_views_to_process(
+        self,
+        inspector: Inspector,
+        schema: str,
+        sql_config: SQLAlchemyConfig,
+    ) -> Iterable[Tuple[str, str, str]]:
+        for view in inspector.get_view_names(schema):
+            schema, view = self.standardize_schema_table_names(
+                schema=schema, entity=view
+            )
+            dataset_name = self.get_identifier(
+                schema=schema, entity=view, inspector=inspector
+            )
+            dataset_name = self.normalise_dataset_name(dataset_name)
 
-                if not sql_config.view_pattern.allowed(dataset_name):
-                    self.report.report_dropped(dataset_name)
-                    continue
+            self.report.report_entity_scanned(dataset_name, ent_type="view")
 
-                try:
-                    yield from self._process_view(
-                        dataset_name=dataset_name,
-                        inspector=inspector,
-                        schema=schema,
-                        view=view,
-                        sql_config=sql_config,
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Unable to ingest view {schema}.{view} due to an exception.\n {traceback.format_exc()}"
-                    )
-                    self.report.report_warning(
-                        f"{schema}.{view}", f"Ingestion error: {e}"
-                    )
-        except Exception as e:
-            self.report.report_failure(f"{schema}", f"Views error: {e}")
+            if not sql_config.view_pattern.allowed(dataset_name):
+                self.report.report_dropped(dataset_name)
+                continue
+
+            yield dataset_name, schema, view
 
     def _process_view(
         self,
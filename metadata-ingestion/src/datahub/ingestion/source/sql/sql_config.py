@@ -62,6 +62,11 @@ class SQLAlchemyConfig(StatefulIngestionConfigBase, DatasetSourceConfigMixin):
         description="If the source supports it, include table lineage to the underlying storage location.",
     )
 
+    max_workers: pydantic.PositiveInt = Field(
+        default=1,
+        description="Number of tables and views whose metadata is extracted concurrently. Each worker uses its own connection from the engine's connection pool. Increasing this speeds up databases with many tables, where extraction is dominated by the round trips of the per-table queries. Profiling concurrency is configured separately by `profiling.max_workers`.",
+    )
+
     profiling: GEProfilingConfig = GEProfilingConfig()
     # Custom Stateful Ingestion settings
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = None
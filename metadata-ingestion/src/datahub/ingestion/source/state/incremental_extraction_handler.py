@@ -0,0 +1,200 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, cast
+
+import pydantic
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
+from datahub.ingestion.source.state.checkpoint import Checkpoint
+from datahub.ingestion.source.state.incremental_extraction_state import (
+    IncrementalEntityState,
+    IncrementalExtractionCheckpointState,
+)
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIncrementalExtractionConfigMixin,
+    StatefulIngestionConfig,
+    StatefulIngestionConfigBase,
+    StatefulIngestionSourceBase,
+)
+from datahub.ingestion.source.state.use_case_handler import (
+    StatefulIngestionUsecaseHandlerBase,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class IncrementalExtractionHandler(
+    StatefulIngestionUsecaseHandlerBase[IncrementalExtractionCheckpointState]
+):
+    """
+    The stateful ingestion helper class that handles incremental extraction based on last modified timestamps.
+    Sources look up each object's last modified time in the previous state and only fetch objects
+    that are new or changed. Unchanged objects are carried forward into the current state, and the urns
+    emitted for them in an earlier run are returned so that the source can keep them out of stale entity removal.
+    A full extraction is forced periodically, as configured by `full_extraction_interval_days`.
+    """
+
+    def __init__(
+        self,
+        source: StatefulIngestionSourceBase,
+        config: StatefulIngestionConfigBase[StatefulIngestionConfig],
+        pipeline_name: Optional[str],
+        run_id: str,
+    ):
+        # Narrowing config itself to the mixin would make the rest of the method
+        # unreachable for mypy, since the two config classes are unrelated.
+        incremental_config = cast(StatefulIncrementalExtractionConfigMixin, config)
+        assert isinstance(incremental_config, StatefulIncrementalExtractionConfigMixin)
+        self.source: StatefulIngestionSourceBase = source
+        self.stateful_ingestion_config: Optional[
+            StatefulIngestionConfig
+        ] = config.stateful_ingestion
+        self.full_extraction_interval: timedelta = timedelta(
+            days=incremental_config.full_extraction_interval_days
+        )
+        self.pipeline_name: Optional[str] = pipeline_name
+        self.run_id: str = run_id
+        self.checkpointing_enabled: bool = (
+            source.is_stateful_ingestion_configured()
+            and incremental_config.incremental_extraction
+        )
+        self._job_id: JobId = self._init_job_id()
+        self._is_full_extraction: Optional[bool] = None
+        self.source.register_stateful_ingestion_usecase_handler(self)
+
+    def _ignore_old_state(self) -> bool:
+        if (
+            self.stateful_ingestion_config is not None
+            and self.stateful_ingestion_config.ignore_old_state
+        ):
+            return True
+        return False
+
+    def _ignore_new_state(self) -> bool:
+        if (
+            self.stateful_ingestion_config is not None
+            and self.stateful_ingestion_config.ignore_new_state
+        ):
+            return True
+        return False
+
+    def _init_job_id(self) -> JobId:
+        platform: Optional[str] = getattr(self.source, "platform", None)
+        job_name_suffix = "incremental_extraction"
+        return JobId(f"{platform}_{job_name_suffix}" if platform else job_name_suffix)
+
+    @property
+    def job_id(self) -> JobId:
+        return self._job_id
+
+    def is_checkpointing_enabled(self) -> bool:
+        return self.checkpointing_enabled
+
+    def create_checkpoint(
+        self,
+    ) -> Optional[Checkpoint[IncrementalExtractionCheckpointState]]:
+        if not self.is_checkpointing_enabled() or self._ignore_new_state():
+            return None
+
+        assert self.pipeline_name is not None
+        last_state = self.get_last_state()
+        return Checkpoint(
+            job_name=self.job_id,
+            pipeline_name=self.pipeline_name,
+            run_id=self.run_id,
+            state=IncrementalExtractionCheckpointState(
+                last_full_extraction=get_sys_time()
+                if self.is_full_extraction()
+                else last_state.last_full_extraction
+                if last_state
+                else None
+            ),
+        )
+
+    def get_current_state(self) -> Optional[IncrementalExtractionCheckpointState]:
+        if not self.is_checkpointing_enabled() or self._ignore_new_state():
+            return None
+        cur_checkpoint = self.source.get_current_checkpoint(self.job_id)
+        assert cur_checkpoint is not None
+        return cast(IncrementalExtractionCheckpointState, cur_checkpoint.state)
+
+    def get_last_state(self) -> Optional[IncrementalExtractionCheckpointState]:
+        if not self.is_checkpointing_enabled() or self._ignore_old_state():
+            return None
+        last_checkpoint = self.source.get_last_checkpoint(
+            self.job_id, IncrementalExtractionCheckpointState
+        )
+        if last_checkpoint and last_checkpoint.state:
+            return cast(IncrementalExtractionCheckpointState, last_checkpoint.state)
+
+        return None
+
+    def is_full_extraction(self) -> bool:
+        """
+        Returns True if every object must be fetched in this run, either because incremental extraction
+        is disabled, there is no previous state, or the last full extraction is too old.
+        """
+        if self._is_full_extraction is None:
+            last_state = self.get_last_state()
+            if last_state is None or last_state.last_full_extraction is None:
+                self._is_full_extraction = True
+            else:
+                last_full_extraction = datetime.fromtimestamp(
+                    last_state.last_full_extraction / 1000, tz=timezone.utc
+                )
+                self._is_full_extraction = (
+                    datetime.now(tz=timezone.utc) - last_full_extraction
+                    >= self.full_extraction_interval
+                )
+            if self.is_checkpointing_enabled():
+                logger.info(
+                    f"Incremental extraction for job {self.job_id}: "
+                    f"{'full' if self._is_full_extraction else 'incremental'} run"
+                )
+        return self._is_full_extraction
+
+    def is_unchanged(
+        self, key: str, last_modified: Optional[pydantic.NonNegativeInt]
+    ) -> bool:
+        """
+        Returns True if the object identified by `key` can be skipped in this run, i.e. it was
+        successfully processed in the last run and has not been modified since.
+        """
+        if last_modified is None or self.is_full_extraction():
+            return False
+        last_state = self.get_last_state()
+        if last_state is None:
+            return False
+        previous = last_state.entities.get(key)
+        return previous is not None and last_modified <= previous.last_modified
+
+    def add_entity(
+        self,
+        key: str,
+        last_modified: Optional[pydantic.NonNegativeInt],
+        urns: Iterable[str],
+        references: Iterable[str] = (),
+    ) -> None:
+        cur_state = self.get_current_state()
+        if cur_state is None or last_modified is None:
+            return
+        cur_state.entities[key] = IncrementalEntityState(
+            last_modified=last_modified,
+            urns=sorted(set(urns)),
+            references=sorted(set(references)),
+        )
+
+    def carry_forward(self, key: str) -> Optional[IncrementalEntityState]:
+        """
+        Copies the state of an unchanged object from the last run into the current run,
+        and returns it so that the source can re-register its urns and references.
+        """
+        last_state = self.get_last_state()
+        if last_state is None or key not in last_state.entities:
+            return None
+        entity_state = last_state.entities[key]
+        cur_state = self.get_current_state()
+        if cur_state is not None:
+            cur_state.entities[key] = entity_state
+        return entity_state
@@ -0,0 +1,31 @@
+from typing import Dict, List, Optional
+
+import pydantic
+
+from datahub.configuration.common import ConfigModel
+from datahub.ingestion.source.state.checkpoint import CheckpointStateBase
+
+
+class IncrementalEntityState(ConfigModel):
+    """
+    The state tracked for a single source-side object (e.g. a Looker dashboard).
+    """
+
+    # Last modified timestamp millis reported by the source system.
+    last_modified: pydantic.NonNegativeInt
+    # The urns that were emitted while processing this object.
+    urns: List[str] = pydantic.Field(default_factory=list)
+    # Opaque, source-specific keys of dependent objects that must still be processed
+    # when this object is skipped (e.g. the explores referenced by a Looker dashboard).
+    references: List[str] = pydantic.Field(default_factory=list)
+
+
+class IncrementalExtractionCheckpointState(CheckpointStateBase):
+    """
+    Base class for representing the checkpoint state for sources that support incremental extraction.
+    Stores the last modified timestamp and the emitted urns per source object, keyed by a source-specific id.
+    """
+
+    entities: Dict[str, IncrementalEntityState] = pydantic.Field(default_factory=dict)
+    # Timestamp millis of the last run that processed every object.
+    last_full_extraction: Optional[pydantic.PositiveInt] = None
@@ -155,6 +155,28 @@ class StatefulUsageConfigMixin(BaseTimeWindowConfig):
         return values
 
 
+class StatefulIncrementalExtractionConfigMixin(ConfigModel):
+    incremental_extraction: bool = Field(
+        default=False,
+        description="Only fetch objects whose last modified time changed since the last successful run. Unchanged objects are carried forward in the state so that they are not soft-deleted.",
+    )
+    full_extraction_interval_days: pydantic.PositiveInt = Field(
+        default=7,
+        description="Used only if incremental_extraction is set to True. Forces a full extraction of all objects if the last full extraction is older than this many days.",
+    )
+
+    @root_validator(pre=False)
+    def incremental_extraction_stateful_option_validator(cls, values: Dict) -> Dict:
+        sti = values.get("stateful_ingestion")
+        if not sti or not sti.enabled:
+            if values.get("incremental_extraction"):
+                logger.warning(
+                    "Stateful ingestion is disabled, disabling incremental_extraction config option as well"
+                )
+                values["incremental_extraction"] = False
+        return values
+
+
 @dataclass
 class StatefulIngestionReport(SourceReport):
     pass
@@ -1,12 +1,15 @@
 import json
 import logging
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import dateutil.parser as dp
+import pydantic
 import tableauserverclient as TSC
 from pydantic import root_validator, validator
 from pydantic.fields import Field
@@ -122,6 +125,7 @@ from datahub.metadata.schema_classes import (
     ViewPropertiesClass,
 )
 from datahub.utilities import config_clean
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.source_helpers import (
     auto_stale_entity_removal,
     auto_status_aspect,
@@ -295,6 +299,12 @@ class TableauConfig(
         default=1,
         description="[advanced] Number of workbooks to query at a time using the Tableau API.",
     )
+    max_workers: pydantic.PositiveInt = Field(
+        default=1,
+        description="[advanced] Number of concurrent queries to the Tableau Metadata API. "
+        "When greater than 1, the pages of each object type are fetched concurrently, and sheets, "
+        "dashboards and embedded data sources are fetched in parallel.",
+    )
 
     env: str = Field(
         default=builder.DEFAULT_ENV,
@@ -353,6 +363,30 @@ class ProjectKey(PlatformKey):
     project_id: str
 
 
+@dataclass
+class TableauSourceReport(StaleEntityRemovalSourceReport):
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        # Pages of the Metadata API may be fetched by several threads at once.
+        self._lock = threading.RLock()
+
+    def report_warning(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_warning(key, reason)
+
+    def report_failure(self, key: str, reason: str) -> None:
+        with self._lock:
+            super().report_failure(key, reason)
+
+
+class NodeLimitExceededError(Exception):
+    """A page of a Metadata API query was truncated, as it exceeded the node limit."""
+
+
+# The objects of a page, with the total count and whether there is a next page.
+_ConnectionObjectsPage = Tuple[List[dict], int, bool]
+
+
 @dataclass
 class UsageStat:
     view_count: int
@@ -386,7 +420,7 @@ class TableauProject:
 @capability(SourceCapability.LINEAGE_COARSE, "Enabled by default")
 class TableauSource(StatefulIngestionSourceBase):
     config: TableauConfig
-    report: StaleEntityRemovalSourceReport
+    report: TableauSourceReport
     platform = "tableau"
     server: Optional[Server]
     upstream_tables: Dict[str, Tuple[Any, Optional[str], bool]] = {}
@@ -405,7 +439,7 @@ class TableauSource(StatefulIngestionSourceBase):
         super().__init__(config, ctx)
 
         self.config = config
-        self.report = StaleEntityRemovalSourceReport()
+        self.report = TableauSourceReport()
         self.server = None
         self.upstream_tables = {}
         self.tableau_stat_registry = {}
@@ -428,6 +462,17 @@ class TableauSource(StatefulIngestionSourceBase):
         # when emitting custom SQL data sources.
         self.custom_sql_ids_being_used: List[str] = []
 
+        # The page size of each connection type, once reduced because its pages
+        # exceeded the node limit of the Metadata API.
+        self.reduced_page_sizes: Dict[str, int] = {}
+        # Connection objects being fetched ahead of their emit_* method, by connection
+        # type and query filter.
+        self.prefetched_connection_objects: Dict[
+            Tuple[str, str], "Future[List[dict]]"
+        ] = {}
+        self._query_semaphore = threading.BoundedSemaphore(self.config.max_workers)
+        self._page_size_lock = threading.Lock()
+
         # Create and register the stateful ingestion use-case handlers.
         self.stale_entity_removal_handler = StaleEntityRemovalHandler(
             source=self,
@@ -613,14 +658,16 @@ class TableauSource(StatefulIngestionSourceBase):
         count: int = 0,
         offset: int = 0,
         retry_on_auth_error: bool = True,
+        allow_partial_results: bool = True,
     ) -> Tuple[dict, int, int]:
         logger.debug(
             f"Query {connection_type} to get {count} objects with offset {offset}"
         )
         try:
-            query_data = query_metadata(
-                self.server, query, connection_type, count, offset, query_filter
-            )
+            with self._query_semaphore:
+                query_data = query_metadata(
+                    self.server, query, connection_type, count, offset, query_filter
+                )
         except NonXMLResponseError:
             if not retry_on_auth_error:
                 raise
@@ -630,7 +677,13 @@ class TableauSource(StatefulIngestionSourceBase):
             # will be thrown and we need to re-authenticate and retry.
             self._authenticate()
             return self.get_connection_object_page(
-                query, connection_type, query_filter, count, offset, False
+                query,
+                connection_type,
+                query_filter,
+                count,
+                offset,
+                False,
+                allow_partial_results,
             )
 
         if tableau_constant.ERRORS in query_data:
@@ -645,6 +698,14 @@ class TableauSource(StatefulIngestionSourceBase):
                 == tableau_constant.WARNING
                 for error in errors
             ):
+                if not allow_partial_results and any(
+                    (error.get(tableau_constant.EXTENSIONS) or {}).get(
+                        tableau_constant.CODE
+                    )
+                    == tableau_constant.NODE_LIMIT_EXCEEDED
+                    for error in errors
+                ):
+                    raise NodeLimitExceededError(f"Query {connection_type}: {errors}")
                 self.report.report_warning(key=connection_type, reason=f"{errors}")
             else:
                 raise RuntimeError(f"Query {connection_type} error: {errors}")
@@ -671,12 +732,42 @@ class TableauSource(StatefulIngestionSourceBase):
         # Calls the get_connection_object_page function to get the objects,
         # and automatically handles pagination.
 
-        page_size = page_size_override or self.config.page_size
+        prefetched = self.prefetched_connection_objects.pop(
+            (connection_type, query_filter), None
+        )
+        if prefetched is not None:
+            yield from prefetched.result()
+        else:
+            yield from self._query_connection_objects(
+                query,
+                connection_type,
+                query_filter,
+                page_size_override or self.config.page_size,
+            )
 
+    def _query_connection_objects(
+        self,
+        query: str,
+        connection_type: str,
+        query_filter: str,
+        page_size: int,
+    ) -> Iterable[dict]:
         total_count = page_size
         has_next_page = 1
         offset = 0
         while has_next_page:
+            page_size = self.reduced_page_sizes.get(connection_type, page_size)
+            if self.config.max_workers > 1 and 0 < offset < total_count:
+                # The first page tells the total count, so the offsets of all the
+                # remaining pages are known and they can be fetched concurrently.
+                remaining_pages = self._get_connection_object_pages_concurrently(
+                    query, connection_type, query_filter, page_size, offset, total_count
+                )
+                offset = total_count
+                for connection_objects, total_count, has_next_page in remaining_pages:
+                    yield from connection_objects
+                continue
+
             count = (
                 page_size if offset + page_size < total_count else total_count - offset
             )
@@ -684,7 +775,7 @@ class TableauSource(StatefulIngestionSourceBase):
                 connection_objects,
                 total_count,
                 has_next_page,
-            ) = self.get_connection_object_page(
+            ) = self._get_connection_objects_page(
                 query,
                 connection_type,
                 query_filter,
@@ -694,9 +785,82 @@ class TableauSource(StatefulIngestionSourceBase):
 
             offset += count
 
-            for obj in connection_objects.get(tableau_constant.NODES, []):
+            for obj in connection_objects:
                 yield obj
 
+    def _get_connection_objects_page(
+        self,
+        query: str,
+        connection_type: str,
+        query_filter: str,
+        count: int,
+        offset: int,
+    ) -> _ConnectionObjectsPage:
+        # Pages that exceed the node limit of the Metadata API are truncated. They
+        # are split in halves until they fit, or until they contain a single object.
+        try:
+            (
+                connection_object,
+                total_count,
+                has_next_page,
+            ) = self.get_connection_object_page(
+                query,
+                connection_type,
+                query_filter,
+                count,
+                offset,
+                allow_partial_results=count <= 1,
+            )
+            return (
+                connection_object.get(tableau_constant.NODES, []),
+                total_count,
+                bool(has_next_page),
+            )
+        except NodeLimitExceededError:
+            half = count // 2
+            with self._page_size_lock:
+                if half < self.reduced_page_sizes.get(connection_type, count):
+                    logger.info(
+                        f"Reducing the page size of {connection_type} to {half}, as it exceeded the node limit"
+                    )
+                    self.reduced_page_sizes[connection_type] = half
+
+            first_half, _, _ = self._get_connection_objects_page(
+                query, connection_type, query_filter, half, offset
+            )
+            second_half, total_count, has_next_page = self._get_connection_objects_page(
+                query, connection_type, query_filter, count - half, offset + half
+            )
+            return first_half + second_half, total_count, has_next_page
+
+    def _get_connection_object_pages_concurrently(
+        self,
+        query: str,
+        connection_type: str,
+        query_filter: str,
+        page_size: int,
+        offset: int,
+        total_count: int,
+    ) -> Iterable[_ConnectionObjectsPage]:
+        def page_ranges() -> Iterable[Tuple[Any, ...]]:
+            # This is consumed as pages are submitted, so that a page size reduced
+            # by a page that exceeded the node limit applies to the pages after it.
+            next_offset = offset
+            while next_offset < total_count:
+                count = min(
+                    self.reduced_page_sizes.get(connection_type, page_size),
+                    total_count - next_offset,
+                )
+                yield query, connection_type, query_filter, count, next_offset
+                next_offset += count
+
+        for future in BackpressureAwareExecutor.map_ordered(
+            self._get_connection_objects_page,
+            page_ranges(),
+            max_workers=self.config.max_workers,
+        ):
+            yield future.result()
+
     def emit_workbooks(self) -> Iterable[MetadataWorkUnit]:
         if self.tableau_project_registry:
             project_names: List[str] = [
@@ -2224,12 +2388,15 @@ class TableauSource(StatefulIngestionSourceBase):
             self._populate_projects_registry()
             yield from self.emit_project_containers()
             yield from self.emit_workbooks()
-            if self.sheet_ids:
-                yield from self.emit_sheets()
-            if self.dashboard_ids:
-                yield from self.emit_dashboards()
-            if self.embedded_datasource_ids_being_used:
-                yield from self.emit_embedded_datasources()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                if self.config.max_workers > 1:
+                    self._prefetch_workbook_contents(executor)
+                if self.sheet_ids:
+                    yield from self.emit_sheets()
+                if self.dashboard_ids:
+                    yield from self.emit_dashboards()
+                if self.embedded_datasource_ids_being_used:
+                    yield from self.emit_embedded_datasources()
             if self.datasource_ids_being_used:
                 yield from self.emit_published_datasources()
             if self.custom_sql_ids_being_used:
@@ -2240,6 +2407,37 @@ class TableauSource(StatefulIngestionSourceBase):
                 key="tableau-metadata",
                 reason=f"Unable to retrieve metadata from tableau. Information: {str(md_exception)}",
             )
+        finally:
+            self.prefetched_connection_objects.clear()
+
+    def _prefetch_workbook_contents(self, executor: ThreadPoolExecutor) -> None:
+        # The dashboards and embedded data sources only depend on the workbooks, so
+        # they are fetched while the sheets are emitted. Their workunits are still
+        # emitted in order, by emit_dashboards and emit_embedded_datasources.
+        for query, connection_type, ids in [
+            (
+                dashboard_graphql_query,
+                tableau_constant.DASHBOARDS_CONNECTION,
+                self.dashboard_ids,
+            ),
+            (
+                embedded_datasource_graphql_query,
+                tableau_constant.EMBEDDED_DATA_SOURCES_CONNECTION,
+                self.embedded_datasource_ids_being_used,
+            ),
+        ]:
+            if not ids:
+                continue
+            query_filter = f"{tableau_constant.ID_WITH_IN}: {json.dumps(ids)}"
+            self.prefetched_connection_objects[
+                (connection_type, query_filter)
+            ] = executor.submit(
+                lambda *args: list(self._query_connection_objects(*args)),
+                query,
+                connection_type,
+                query_filter,
+                self.config.page_size,
+            )
 
-    def get_report(self) -> StaleEntityRemovalSourceReport:
+    def get_report(self) -> TableauSourceReport:
         return self.report
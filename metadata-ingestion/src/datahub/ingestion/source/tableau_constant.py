@@ -6,6 +6,8 @@ DATA = "data"
 EXTENSIONS = "extensions"
 SEVERITY = "severity"
 WARNING = "WARNING"
+CODE = "code"
+NODE_LIMIT_EXCEEDED = "NODE_LIMIT_EXCEEDED"
 ERRORS = "errors"
 NODES = "nodes"
 PROJECT_NAME_WITH_IN = "projectNameWithin"
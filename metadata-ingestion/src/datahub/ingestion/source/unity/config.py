@@ -52,7 +52,17 @@ class UnityCatalogSourceConfig(StatefulIngestionConfigBase, DatasetSourceConfigM
 
     include_column_lineage: Optional[bool] = pydantic.Field(
         default=True,
-        description="Option to enable/disable lineage generation. Currently we have to call a rest call per column to get column level lineage due to the Databrick api which can slow down ingestion. ",
+        description="Option to enable/disable lineage generation. Currently we have to call a rest call per column to get column level lineage due to the Databrick api which can slow down ingestion. The columns are only requested for tables with upstream tables.",
+    )
+
+    max_workers: pydantic.PositiveInt = pydantic.Field(
+        default=1,
+        description="Number of threads used to fetch the lineage of the tables of a schema concurrently. Tables are still emitted in the same order.",
+    )
+
+    lineage_cache_path: Optional[str] = pydantic.Field(
+        default=None,
+        description="Path of a SQLite file caching the lineage of tables. Reusing the file across runs skips fetching the lineage of the tables that were not updated since, according to their updated_at timestamp.",
     )
 
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = pydantic.Field(
@@ -1,8 +1,12 @@
 """
 Manage the communication with DataBricks Server and provide equivalent dataclasses for dependent modules
 """
+import contextlib
 import datetime
+import json
 import logging
+import sqlite3
+import threading
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Optional
 
@@ -113,13 +117,60 @@ class Table(CommonProperty):
     # lineage: Optional[Lineage]
 
 
+class LineageCache:
+    """
+    Persists the lineage of tables in a SQLite database, so that later runs don't fetch
+    it again for the tables that were not updated since.
+
+    The lineage of a table is cached with its updated_at timestamp, and only returned
+    for the same timestamp. It is safe to use from several threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        with contextlib.closing(sqlite3.connect(path)) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS table_lineage "
+                "(key TEXT PRIMARY KEY, updated_at TEXT NOT NULL, upstreams TEXT NOT NULL)"
+            )
+            conn.commit()
+
+    def get(
+        self, key: str, updated_at: datetime.datetime
+    ) -> Optional[Dict[str, Dict[str, List[str]]]]:
+        with self._lock, contextlib.closing(sqlite3.connect(self.path)) as conn:
+            row = conn.execute(
+                "SELECT upstreams FROM table_lineage WHERE key = ? AND updated_at = ?",
+                (key, updated_at.isoformat()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(
+        self,
+        key: str,
+        updated_at: datetime.datetime,
+        upstreams: Dict[str, Dict[str, List[str]]],
+    ) -> None:
+        with self._lock, contextlib.closing(sqlite3.connect(self.path)) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO table_lineage VALUES (?, ?, ?)",
+                (key, updated_at.isoformat(), json.dumps(upstreams)),
+            )
+            conn.commit()
+
+
 class UnityCatalogApiProxy:
     _unity_catalog_api: UnityCatalogApi
     _workspace_url: str
     report: UnityCatalogReport
 
     def __init__(
-        self, workspace_url: str, personal_access_token: str, report: UnityCatalogReport
+        self,
+        workspace_url: str,
+        personal_access_token: str,
+        report: UnityCatalogReport,
+        lineage_cache_path: Optional[str] = None,
     ):
         self._unity_catalog_api = UnityCatalogApi(
             ApiClient(
@@ -129,6 +180,11 @@ class UnityCatalogApiProxy:
         )
         self._workspace_url = workspace_url
         self.report = report
+        self._lineage_cache: Optional[LineageCache] = (
+            LineageCache(lineage_cache_path) if lineage_cache_path else None
+        )
+        # The lineage of several tables may be fetched at once.
+        self._report_lock = threading.Lock()
 
     def check_connectivity(self) -> bool:
         self._unity_catalog_api.list_metastores()
@@ -227,26 +283,66 @@ class UnityCatalogApiProxy:
             version="2.0",
         )
 
+    def _get_cached_lineage(self, table: Table, include_column_lineage: bool) -> bool:
+        if self._lineage_cache is None or table.updated_at is None:
+            return False
+        upstreams = self._lineage_cache.get(
+            self._lineage_cache_key(table, include_column_lineage), table.updated_at
+        )
+        if upstreams is None:
+            return False
+        table.upstreams = upstreams
+        with self._report_lock:
+            self.report.num_lineage_cache_hits += 1
+        return True
+
+    def _cache_lineage(self, table: Table, include_column_lineage: bool) -> None:
+        if self._lineage_cache is None or table.updated_at is None:
+            return
+        self._lineage_cache.put(
+            self._lineage_cache_key(table, include_column_lineage),
+            table.updated_at,
+            table.upstreams,
+        )
+
+    @staticmethod
+    def _lineage_cache_key(table: Table, include_column_lineage: bool) -> str:
+        kind = "column" if include_column_lineage else "table"
+        return f"{kind}:{table.schema.catalog.metastore.metastore_id}:{table.table_id}"
+
+    def _list_upstream_tables(self, table: Table) -> List[str]:
+        with self._report_lock:
+            self.report.num_table_lineage_requests += 1
+        response: dict = self.list_lineages_by_table(
+            table_name=f"{table.schema.catalog.name}.{table.schema.name}.{table.name}"
+        )
+        return [
+            f"{item['catalog_name']}.{item['schema_name']}.{item['name']}"
+            for item in response.get("upstream_tables", [])
+        ]
+
     def table_lineage(self, table: Table) -> None:
+        if self._get_cached_lineage(table, include_column_lineage=False):
+            return
         # Lineage endpoint doesn't exists on 2.1 version
         try:
-            response: dict = self.list_lineages_by_table(
-                table_name=f"{table.schema.catalog.name}.{table.schema.name}.{table.name}"
-            )
             table.upstreams = {
-                f"{item['catalog_name']}.{item['schema_name']}.{item['name']}": {}
-                for item in response.get("upstream_tables", [])
+                upstream: {} for upstream in self._list_upstream_tables(table)
             }
+            self._cache_lineage(table, include_column_lineage=False)
         except Exception as e:
             logger.error(f"Error getting lineage: {e}")
 
     def get_column_lineage(self, table: Table) -> None:
+        if self._get_cached_lineage(table, include_column_lineage=True):
+            return
         try:
-            table_lineage_response: dict = self.list_lineages_by_table(
-                table_name=f"{table.schema.catalog.name}.{table.schema.name}.{table.name}"
-            )
-            if table_lineage_response:
+            # The columns of a table without upstream tables can't have upstream
+            # columns, so their lineage is only requested for the other tables.
+            if self._list_upstream_tables(table):
                 for column in table.columns:
+                    with self._report_lock:
+                        self.report.num_column_lineage_requests += 1
                     response: dict = self.list_lineages_by_column(
                         table_name=f"{table.schema.catalog.name}.{table.schema.name}.{table.name}",
                         column_name=column.name,
@@ -263,6 +359,7 @@ class UnityCatalogApiProxy:
                                 )
                             else:
                                 table.upstreams[table_name][column.name] = [col_name]
+            self._cache_lineage(table, include_column_lineage=True)
 
         except Exception as e:
             logger.error(f"Error getting lineage: {e}")
@@ -12,3 +12,7 @@ class UnityCatalogReport(StaleEntityRemovalSourceReport):
     catalogs: EntityFilterReport = EntityFilterReport.field(type="catalog")
     schemas: EntityFilterReport = EntityFilterReport.field(type="schema")
     tables: EntityFilterReport = EntityFilterReport.field(type="table/view")
+
+    num_table_lineage_requests: int = 0
+    num_column_lineage_requests: int = 0
+    num_lineage_cache_hits: int = 0
@@ -63,6 +63,7 @@ from datahub.metadata.schema_classes import (
     UpstreamClass,
     UpstreamLineageClass,
 )
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.hive_schema_to_avro import get_schema_fields_for_hive_column
 from datahub.utilities.registries.domain_registry import DomainRegistry
 from datahub.utilities.source_helpers import (
@@ -111,7 +112,10 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
         self.config = config
         self.report: UnityCatalogReport = UnityCatalogReport()
         self.unity_catalog_api_proxy = proxy.UnityCatalogApiProxy(
-            config.workspace_url, config.token, report=self.report
+            config.workspace_url,
+            config.token,
+            report=self.report,
+            lineage_cache_path=config.lineage_cache_path,
         )
 
         # Determine the platform_instance_name
@@ -216,6 +220,12 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
             self.report.schemas.processed(schema.id)
 
     def process_tables(self, schema: proxy.Schema) -> Iterable[MetadataWorkUnit]:
+        for table in self._tables_with_lineage(schema):
+            yield from self.process_table(table, schema)
+
+            self.report.tables.processed(table.id, type=table.type)
+
+    def _allowed_tables(self, schema: proxy.Schema) -> Iterable[proxy.Table]:
         for table in self.unity_catalog_api_proxy.tables(schema=schema):
             filter_table_name = (
                 f"{table.schema.catalog.name}.{table.schema.name}.{table.name}"
@@ -225,9 +235,32 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
                 self.report.tables.dropped(table.id, type=table.type)
                 continue
 
-            yield from self.process_table(table, schema)
-
-            self.report.tables.processed(table.id, type=table.type)
+            yield table
+
+    def _tables_with_lineage(self, schema: proxy.Schema) -> Iterable[proxy.Table]:
+        """
+        Yields the allowed tables of the schema, in order, once their lineage is fetched.
+        With max_workers > 1, the lineage of the next tables is fetched concurrently.
+        """
+        if self.config.max_workers == 1:
+            for table in self._allowed_tables(schema):
+                self._fetch_lineage(table)
+                yield table
+            return
+
+        for future in BackpressureAwareExecutor.map_ordered(
+            self._fetch_lineage,
+            ((table,) for table in self._allowed_tables(schema)),
+            max_workers=self.config.max_workers,
+        ):
+            yield future.result()
+
+    def _fetch_lineage(self, table: proxy.Table) -> proxy.Table:
+        if self.config.include_column_lineage:
+            self.unity_catalog_api_proxy.get_column_lineage(table)
+        else:
+            self.unity_catalog_api_proxy.table_lineage(table)
+        return table
 
     def process_table(
         self, table: proxy.Table, schema: proxy.Schema
@@ -255,10 +288,8 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
         )
 
         if self.config.include_column_lineage:
-            self.unity_catalog_api_proxy.get_column_lineage(table)
             lineage = self._generate_column_lineage_aspect(dataset_urn, table)
         else:
-            self.unity_catalog_api_proxy.table_lineage(table)
             lineage = self._generate_lineage_aspect(dataset_urn, table)
 
         yield from [
@@ -26,6 +26,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.clickhouse import ClickHouseConfig
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
+    ColumnarUsageAggregator,
     GenericAggregatedDataset,
 )
 
@@ -212,6 +213,9 @@ class ClickHouseUsageSource(Source):
     def _aggregate_access_events(
         self, events: List[ClickHouseJoinedAccessEvent]
     ) -> Dict[datetime, Dict[ClickHouseTableRef, AggregatedDataset]]:
+        if self.config.columnar_aggregation:
+            return self._aggregate_access_events_columnar(events)
+
         datasets: Dict[
             datetime, Dict[ClickHouseTableRef, AggregatedDataset]
         ] = collections.defaultdict(dict)
@@ -219,20 +223,14 @@ class ClickHouseUsageSource(Source):
         for event in events:
             floored_ts = get_time_bucket(event.starttime, self.config.bucket_duration)
 
-            resource = (
-                f'{self.config.platform_instance+"." if self.config.platform_instance else ""}'
-                f"{event.schema_}.{event.table}"
-            )
+            resource = self._get_resource(event)
 
             agg_bucket = datasets[floored_ts].setdefault(
                 resource,
                 AggregatedDataset(bucket_start_time=floored_ts, resource=resource),
             )
 
-            # current limitation in user stats UI, we need to provide email to show users
-            user_email = f"{event.usename if event.usename else 'unknown'}"
-            if "@" not in user_email:
-                user_email += f"@{self.config.email_domain}"
+            user_email = self._get_user_email(event)
             logger.info(f"user_email: {user_email}")
             agg_bucket.add_read_entry(
                 user_email,
@@ -241,6 +239,34 @@ class ClickHouseUsageSource(Source):
             )
         return datasets
 
+    def _aggregate_access_events_columnar(
+        self, events: List[ClickHouseJoinedAccessEvent]
+    ) -> Dict[datetime, Dict[ClickHouseTableRef, AggregatedDataset]]:
+        aggregator: ColumnarUsageAggregator[
+            ClickHouseTableRef
+        ] = ColumnarUsageAggregator(self.config.bucket_duration)
+        aggregator.add_batch(
+            [event.starttime for event in events],
+            [self._get_resource(event) for event in events],
+            [self._get_user_email(event) for event in events],
+            [event.query for event in events],
+            [event.columns for event in events],
+        )
+        return aggregator.get_aggregated_datasets()
+
+    def _get_resource(self, event: ClickHouseJoinedAccessEvent) -> ClickHouseTableRef:
+        return (
+            f'{self.config.platform_instance+"." if self.config.platform_instance else ""}'
+            f"{event.schema_}.{event.table}"
+        )
+
+    def _get_user_email(self, event: ClickHouseJoinedAccessEvent) -> str:
+        # current limitation in user stats UI, we need to provide email to show users
+        user_email = f"{event.usename if event.usename else 'unknown'}"
+        if "@" not in user_email:
+            user_email += f"@{self.config.email_domain}"
+        return user_email
+
     def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
         return agg.make_usage_workunit(
             self.config.bucket_duration,
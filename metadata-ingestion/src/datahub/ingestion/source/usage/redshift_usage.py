@@ -28,6 +28,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.redshift import RedshiftConfig
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
+    ColumnarUsageAggregator,
     GenericAggregatedDataset,
 )
 from datahub.metadata.schema_classes import OperationClass, OperationTypeClass
@@ -361,12 +362,28 @@ class RedshiftUsageSource(Source):
     def _aggregate_access_events(
         self, events_iterable: Iterable[RedshiftAccessEvent]
     ) -> AggregatedAccessEvents:
+        aggregator: Optional[ColumnarUsageAggregator[str]] = None
+        if self.config.columnar_aggregation:
+            aggregator = ColumnarUsageAggregator(
+                self.config.bucket_duration,
+                user_email_pattern=self.config.user_email_pattern,
+            )
+
         datasets: AggregatedAccessEvents = collections.defaultdict(dict)
         for event in events_iterable:
+            resource: str = f"{event.database}.{event.schema_}.{event.table}"
+            user_email: str = self._get_user_email(event)
+            # TODO: not currently supported by redshift; find column level changes
+            fields: List[str] = []
+            if aggregator is not None:
+                aggregator.add_read_entry(
+                    event.starttime, resource, user_email, event.text, fields
+                )
+                continue
+
             floored_ts: datetime = get_time_bucket(
                 event.starttime, self.config.bucket_duration
             )
-            resource: str = f"{event.database}.{event.schema_}.{event.table}"
             # Get a reference to the bucket value(or initialize not yet in dict) and update it.
             agg_bucket: AggregatedDataset = datasets[floored_ts].setdefault(
                 resource,
@@ -375,19 +392,25 @@ class RedshiftUsageSource(Source):
                     resource=resource,
                 ),
             )
-            # current limitation in user stats UI, we need to provide email to show users
-            user_email: str = f"{event.username if event.username else 'unknown'}"
-            if "@" not in user_email:
-                user_email += f"@{self.config.email_domain}"
             logger.info(f"user_email: {user_email}")
             agg_bucket.add_read_entry(
                 user_email,
                 event.text,
-                [],  # TODO: not currently supported by redshift; find column level changes
+                fields,
                 user_email_pattern=self.config.user_email_pattern,
             )
+
+        if aggregator is not None:
+            return aggregator.get_aggregated_datasets()
         return datasets
 
+    def _get_user_email(self, event: RedshiftAccessEvent) -> str:
+        # current limitation in user stats UI, we need to provide email to show users
+        user_email: str = f"{event.username if event.username else 'unknown'}"
+        if "@" not in user_email:
+            user_email += f"@{self.config.email_domain}"
+        return user_email
+
     def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
         return agg.make_usage_workunit(
             self.config.bucket_duration,
@@ -25,6 +25,7 @@ from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.sql.trino import TrinoConfig
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
+    ColumnarUsageAggregator,
     GenericAggregatedDataset,
 )
 
@@ -225,6 +226,9 @@ class TrinoUsageSource(Source):
     def _aggregate_access_events(
         self, events: List[TrinoJoinedAccessEvent]
     ) -> Dict[datetime, Dict[TrinoTableRef, AggregatedDataset]]:
+        if self.config.columnar_aggregation:
+            return self._aggregate_access_events_columnar(events)
+
         datasets: Dict[
             datetime, Dict[TrinoTableRef, AggregatedDataset]
         ] = collections.defaultdict(dict)
@@ -232,17 +236,7 @@ class TrinoUsageSource(Source):
         for event in events:
             floored_ts = get_time_bucket(event.starttime, self.config.bucket_duration)
             for metadata in event.accessed_metadata:
-                # Skipping queries starting with $system@
-                if metadata.catalog_name and metadata.catalog_name.startswith(
-                    "$system@"
-                ):
-                    logging.debug(
-                        f"Skipping system query for {metadata.catalog_name}..."
-                    )
-                    continue
-
-                # Filtering down queries to the selected catalog
-                if metadata.catalog_name != self.config.database:
+                if not self._is_allowed_catalog(metadata):
                     continue
 
                 resource = (
@@ -257,21 +251,51 @@ class TrinoUsageSource(Source):
                     ),
                 )
 
-                # add @unknown.com to username
-                # current limitation in user stats UI, we need to provide email to show users
-                if event.usr and "@" in parseaddr(event.usr)[1]:
-                    username = event.usr
-                else:
-                    username = f"{event.usr if event.usr else 'unknown'}@{self.config.email_domain}"
-
                 agg_bucket.add_read_entry(
-                    username,
+                    self._get_username(event),
                     event.query,
                     metadata.columns,
                     user_email_pattern=self.config.user_email_pattern,
                 )
         return datasets
 
+    def _aggregate_access_events_columnar(
+        self, events: List[TrinoJoinedAccessEvent]
+    ) -> Dict[datetime, Dict[TrinoTableRef, AggregatedDataset]]:
+        aggregator: ColumnarUsageAggregator[TrinoTableRef] = ColumnarUsageAggregator(
+            self.config.bucket_duration,
+            user_email_pattern=self.config.user_email_pattern,
+        )
+        for event in events:
+            username = self._get_username(event)
+            for metadata in event.accessed_metadata:
+                if not self._is_allowed_catalog(metadata):
+                    continue
+                aggregator.add_read_entry(
+                    event.starttime,
+                    f"{metadata.catalog_name}.{metadata.schema_name}.{metadata.table}",
+                    username,
+                    event.query,
+                    metadata.columns,
+                )
+        return aggregator.get_aggregated_datasets()
+
+    def _is_allowed_catalog(self, metadata: TrinoAccessedMetadata) -> bool:
+        # Skipping queries starting with $system@
+        if metadata.catalog_name and metadata.catalog_name.startswith("$system@"):
+            logging.debug(f"Skipping system query for {metadata.catalog_name}...")
+            return False
+
+        # Filtering down queries to the selected catalog
+        return metadata.catalog_name == self.config.database
+
+    def _get_username(self, event: TrinoJoinedAccessEvent) -> str:
+        # add @unknown.com to username
+        # current limitation in user stats UI, we need to provide email to show users
+        if event.usr and "@" in parseaddr(event.usr)[1]:
+            return event.usr
+        return f"{event.usr if event.usr else 'unknown'}@{self.config.email_domain}"
+
     def _make_usage_stat(self, agg: AggregatedDataset) -> MetadataWorkUnit:
         return agg.make_usage_workunit(
             self.config.bucket_duration,
@@ -1,8 +1,21 @@
 import collections
 import dataclasses
+import itertools
 import logging
+import operator
 from datetime import datetime
-from typing import Callable, Counter, Generic, List, Optional, TypeVar
+from typing import (
+    Callable,
+    Counter,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 import pydantic
 from pydantic.fields import Field
@@ -12,6 +25,7 @@ from datahub.configuration.common import AllowDenyPattern
 from datahub.configuration.time_window_config import (
     BaseTimeWindowConfig,
     BucketDuration,
+    get_time_bucket,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -26,10 +40,14 @@ from datahub.utilities.sql_formatter import format_sql_query, trim_query
 logger = logging.getLogger(__name__)
 
 ResourceType = TypeVar("ResourceType")
+_T = TypeVar("_T")
 
 # The total number of characters allowed across all queries in a single workunit.
 TOTAL_BUDGET_FOR_QUERY_LIST = 24000
 
+# The number of buffered access events after which ColumnarUsageAggregator aggregates.
+DEFAULT_COLUMNAR_BATCH_SIZE = 100_000
+
 
 @dataclasses.dataclass
 class GenericAggregatedDataset(Generic[ResourceType]):
@@ -119,6 +137,169 @@ class GenericAggregatedDataset(Generic[ResourceType]):
         )
 
 
+def _take(values: Sequence[_T], indices: List[int]) -> Sequence[_T]:
+    if len(indices) == 1:
+        return (values[indices[0]],)
+    return operator.itemgetter(*indices)(values)
+
+
+class ColumnarUsageAggregator(Generic[ResourceType]):
+    """
+    Aggregates read events into GenericAggregatedDatasets in batches, as an alternative
+    to calling GenericAggregatedDataset.add_read_entry() for every single event.
+
+    Events are buffered column by column. Each batch is grouped by bucket and resource
+    once, and the columns of every group are then counted in bulk. The user email
+    pattern is evaluated once per distinct user instead of once per event. The resulting
+    datasets hold the same counts as with row by row aggregation.
+    """
+
+    def __init__(
+        self,
+        bucket_duration: BucketDuration,
+        user_email_pattern: AllowDenyPattern = AllowDenyPattern.allow_all(),
+        batch_size: int = DEFAULT_COLUMNAR_BATCH_SIZE,
+    ):
+        self.bucket_duration = bucket_duration
+        self.user_email_pattern = user_email_pattern
+        self.batch_size = batch_size
+        self.datasets: Dict[
+            datetime, Dict[ResourceType, GenericAggregatedDataset[ResourceType]]
+        ] = collections.defaultdict(dict)
+
+        self._timestamps: List[datetime] = []
+        self._resources: List[ResourceType] = []
+        self._user_emails: List[str] = []
+        self._queries: List[Optional[str]] = []
+        self._fields: List[Sequence[str]] = []
+        self._allowed_users: Dict[str, bool] = {}
+
+    def add_read_entry(
+        self,
+        timestamp: datetime,
+        resource: ResourceType,
+        user_email: str,
+        query: Optional[str],
+        fields: Sequence[str],
+    ) -> None:
+        self._timestamps.append(timestamp)
+        self._resources.append(resource)
+        self._user_emails.append(user_email)
+        self._queries.append(query)
+        self._fields.append(fields)
+        if len(self._timestamps) >= self.batch_size:
+            self.flush()
+
+    def add_batch(
+        self,
+        timestamps: Sequence[datetime],
+        resources: Sequence[ResourceType],
+        user_emails: Sequence[str],
+        queries: Sequence[Optional[str]],
+        fields: Sequence[Sequence[str]],
+    ) -> None:
+        assert (
+            len(timestamps)
+            == len(resources)
+            == len(user_emails)
+            == len(queries)
+            == len(fields)
+        )
+        self._timestamps.extend(timestamps)
+        self._resources.extend(resources)
+        self._user_emails.extend(user_emails)
+        self._queries.extend(queries)
+        self._fields.extend(fields)
+        if len(self._timestamps) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._timestamps:
+            return
+
+        timestamps, resources, user_emails, queries, fields = (
+            self._timestamps,
+            self._resources,
+            self._user_emails,
+            self._queries,
+            self._fields,
+        )
+        self._timestamps = []
+        self._resources = []
+        self._user_emails = []
+        self._queries = []
+        self._fields = []
+
+        allowed_users = self._allowed_users
+        for user_email in set(user_emails).difference(allowed_users):
+            allowed_users[user_email] = self.user_email_pattern.allowed(user_email)
+
+        # Group the indices of the events by bucket and resource. The per-event work
+        # is done by iterators implemented in C, the loop only appends indices.
+        # The bucket start time is determined by the date, the hour (when bucketing
+        # by hour) and the timezone of the timestamp.
+        bucket_keys: Iterable[tuple]
+        if self.bucket_duration == BucketDuration.HOUR:
+            bucket_keys = zip(
+                map(datetime.date, timestamps),
+                map(operator.attrgetter("hour"), timestamps),
+                map(operator.attrgetter("tzinfo"), timestamps),
+            )
+        else:
+            bucket_keys = zip(
+                map(datetime.date, timestamps),
+                map(operator.attrgetter("tzinfo"), timestamps),
+            )
+        groups: Dict[Tuple[tuple, ResourceType], List[int]] = collections.defaultdict(
+            list
+        )
+        for i, key in enumerate(zip(bucket_keys, resources)):
+            groups[key].append(i)
+
+        # Like add_read_entry(), events of users that are not allowed still create
+        # their dataset, but are not counted.
+        allowed = list(map(allowed_users.__getitem__, user_emails))
+        all_allowed = all(allowed)
+
+        # Counter.update() counts an iterable in C, so each group is aggregated
+        # without any per-event Python code.
+        for (_, resource), indices in groups.items():
+            bucket = get_time_bucket(timestamps[indices[0]], self.bucket_duration)
+            dataset = self._get_dataset(bucket, resource)
+            if not all_allowed:
+                indices = list(
+                    itertools.compress(indices, map(allowed.__getitem__, indices))
+                )
+                if not indices:
+                    continue
+            dataset.readCount += len(indices)
+            dataset.userFreq.update(_take(user_emails, indices))
+            dataset_queries = [query for query in _take(queries, indices) if query]
+            dataset.queryCount += len(dataset_queries)
+            dataset.queryFreq.update(dataset_queries)
+            dataset.columnFreq.update(
+                itertools.chain.from_iterable(_take(fields, indices))
+            )
+
+    def _get_dataset(
+        self, bucket: datetime, resource: ResourceType
+    ) -> GenericAggregatedDataset[ResourceType]:
+        datasets = self.datasets[bucket]
+        dataset = datasets.get(resource)
+        if dataset is None:
+            dataset = GenericAggregatedDataset(
+                bucket_start_time=bucket, resource=resource
+            )
+            datasets[resource] = dataset
+        return dataset
+
+    def get_aggregated_datasets(
+        self,
+    ) -> Dict[datetime, Dict[ResourceType, GenericAggregatedDataset[ResourceType]]]:
+        self.flush()
+        return self.datasets
+
+
 class BaseUsageConfig(BaseTimeWindowConfig):
     top_n_queries: pydantic.PositiveInt = Field(
         default=10, description="Number of top queries to save to each table."
@@ -142,6 +323,10 @@ class BaseUsageConfig(BaseTimeWindowConfig):
     include_top_n_queries: bool = Field(
         default=True, description="Whether to ingest the top_n_queries."
     )
+    columnar_aggregation: bool = Field(
+        default=False,
+        description="Whether to aggregate access events in columnar batches instead of one event at a time. Produces the same usage statistics, but is considerably faster for large query logs. Currently supported by the redshift-usage, clickhouse-usage and starburst-trino-usage sources.",
+    )
 
     @pydantic.validator("top_n_queries")
     def ensure_top_n_queries_is_not_too_big(cls, v: int) -> int:
@@ -20,6 +20,10 @@ class CSVEnricherConfig(ConfigModel):
         default="|",
         description="Delimiter to use when parsing array fields (tags, terms and owners)",
     )
+    max_workers: pydantic.PositiveInt = pydantic.Field(
+        default=5,
+        description="With PATCH semantics, the number of threads used to read the existing aspects of entities from DataHub concurrently.",
+    )
 
     @pydantic.validator("write_semantics")
     def validate_write_semantics(cls, write_semantics: str) -> str:
@@ -0,0 +1,193 @@
+import contextlib
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_R = TypeVar("_R")
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    An additive-increase/multiplicative-decrease limit on the number of concurrent calls
+    to a rate limited API. The limit is halved whenever the API throttles a call, and grows
+    by one after every `limit` successful calls, up to `max_concurrency`.
+
+    The limit is either applied by BackpressureAwareExecutor.map(), or by holding a slot()
+    for the duration of each call.
+
+    This class is thread-safe.
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1):
+        assert 1 <= min_concurrency <= max_concurrency
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.throttled_calls = 0
+        self._limit = max_concurrency
+        self._successes = 0
+        self._active = 0
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._successes = 0
+                self._limit = min(self._limit + 1, self.max_concurrency)
+                self._condition.notify_all()
+
+    def on_throttled(self, retry_after_sec: Optional[float] = None) -> None:
+        """
+        Reports a throttled call. If the API asked to retry after some delay, no new slot
+        is given out until the delay has passed.
+        """
+        with self._lock:
+            self.throttled_calls += 1
+            self._successes = 0
+            new_limit = max(self._limit // 2, self.min_concurrency)
+            if new_limit != self._limit:
+                logger.info(
+                    f"Throttled by the API, reducing concurrency from {self._limit} to {new_limit}"
+                )
+            self._limit = new_limit
+            if retry_after_sec is not None:
+                self._resume_at = max(
+                    self._resume_at, time.monotonic() + retry_after_sec
+                )
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Waits until fewer than `limit` calls hold a slot and the retry-after delay of the
+        API has passed, then holds a slot until the end of the block.
+        """
+        with self._condition:
+            while True:
+                delay = self._resume_at - time.monotonic()
+                if delay <= 0 and self._active < self._limit:
+                    break
+                self._condition.wait(timeout=delay if delay > 0 else None)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+
+class BackpressureAwareExecutor:
+    @classmethod
+    def map(
+        cls,
+        fn: Callable[..., _R],
+        args_list: Iterable[Tuple[Any, ...]],
+        max_workers: int,
+        max_pending: Optional[int] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    ) -> Iterator["Future[_R]"]:
+        """
+        Similar to Executor.map(), but with backpressure and in completion order.
+
+        At most `max_pending` calls are submitted at a time, and new calls are only submitted
+        as the caller consumes completed futures. This keeps both the number of outstanding
+        calls and the number of buffered results bounded, no matter how long args_list is.
+        If a concurrency_limiter is provided, the number of outstanding calls is further
+        capped by its current limit, and each completed call is reported to it as a success.
+
+        Args:
+            fn: The function to call.
+            args_list: The list of arguments to pass to the function.
+            max_workers: The maximum number of threads to use.
+            max_pending: The maximum number of outstanding calls. Defaults to max_workers.
+            concurrency_limiter: An optional adaptive limit on the outstanding calls.
+
+        Returns:
+            An iterator of completed futures, in the order they completed.
+        """
+        bound: int = max_pending if max_pending is not None else max_workers
+        assert bound >= 1
+
+        def window() -> int:
+            if concurrency_limiter is None:
+                return bound
+            return min(bound, concurrency_limiter.limit)
+
+        def completed(futures: Set["Future[_R]"]) -> Iterator["Future[_R]"]:
+            for future in futures:
+                if concurrency_limiter is not None and future.exception() is None:
+                    concurrency_limiter.on_success()
+                yield future
+
+        pending: Set["Future[_R]"] = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for args in args_list:
+                while len(pending) >= window():
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from completed(done)
+                pending.add(executor.submit(fn, *args))
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from completed(done)
+
+    @classmethod
+    def map_ordered(
+        cls,
+        fn: Callable[..., _R],
+        args_list: Iterable[Tuple[Any, ...]],
+        max_workers: int,
+        max_pending: Optional[int] = None,
+    ) -> Iterator["Future[_R]"]:
+        """
+        Like map(), but yields the completed futures in the order of args_list.
+
+        Calls are still submitted ahead of the caller, at most `max_pending` at a time,
+        so a single slow call delays the results behind it, but not the calls behind it.
+
+        Args:
+            fn: The function to call.
+            args_list: The list of arguments to pass to the function.
+            max_workers: The maximum number of threads to use.
+            max_pending: The maximum number of outstanding calls. Defaults to max_workers.
+
+        Returns:
+            An iterator of completed futures, in the order of args_list.
+        """
+        bound: int = max_pending if max_pending is not None else max_workers
+        assert bound >= 1
+
+        pending: Deque["Future[_R]"] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for args in args_list:
+                if len(pending) >= bound:
+                    future = pending.popleft()
+                    wait([future])
+                    yield future
+                pending.append(executor.submit(fn, *args))
+
+            while pending:
+                future = pending.popleft()
+                wait([future])
+                yield future
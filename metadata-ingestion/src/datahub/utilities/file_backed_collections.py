@@ -56,14 +56,21 @@ class ConnectionWrapper:
     filename: pathlib.Path
     _directory: Optional[tempfile.TemporaryDirectory]
 
-    def __init__(self, filename: Optional[pathlib.Path] = None):
+    def __init__(
+        self,
+        filename: Optional[pathlib.Path] = None,
+        allow_cross_thread: bool = False,
+    ):
         self._directory = None
         # Warning: If filename is provided, the file will not be automatically cleaned up
         if not filename:
             self._directory = tempfile.TemporaryDirectory()
             filename = pathlib.Path(self._directory.name) / _DEFAULT_FILE_NAME
 
-        self.conn = sqlite3.connect(filename, isolation_level=None)
+        # With allow_cross_thread, callers must serialize access to the connection themselves.
+        self.conn = sqlite3.connect(
+            filename, isolation_level=None, check_same_thread=not allow_cross_thread
+        )
         self.filename = filename
 
         # These settings are optimized for performance.
@@ -0,0 +1,82 @@
+import collections
+import math
+import threading
+from typing import Dict, Optional
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """
+    A thread-safe histogram with logarithmically sized buckets, similar to an HDR histogram.
+
+    The bounds of consecutive buckets grow by a constant factor, so the memory use only
+    depends on the range of the recorded values, and every quantile is accurate to
+    within `relative_accuracy` of the true value. Values <= 0 are counted separately.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        assert 0 < relative_accuracy < 1
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = collections.defaultdict(int)
+        self._non_positive_count = 0
+        self._lock = threading.Lock()
+
+        self.count = 0
+        self.sum = 0.0
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            if self.max is None or value > self.max:
+                self.max = value
+
+            if value <= 0:
+                self._non_positive_count += 1
+            else:
+                # Bucket i holds the values in (gamma^(i-1), gamma^i].
+                self._buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        assert 0 <= q <= 1
+        with self._lock:
+            if self.count == 0:
+                return None
+            assert self.max is not None
+
+            rank = q * (self.count - 1)
+            seen = self._non_positive_count
+            if rank < seen:
+                return min(0.0, self.max)
+            for index in sorted(self._buckets):
+                seen += self._buckets[index]
+                if rank < seen:
+                    # This estimate is within relative_accuracy of every value in the bucket.
+                    return min(2 * self._gamma**index / (self._gamma + 1), self.max)
+            return self.max
+
+    def mean(self) -> Optional[float]:
+        if self.count == 0:
+            return None
+        return self.sum / self.count
+
+    def as_obj(self) -> dict:
+        def _round(value: Optional[float]) -> Optional[float]:
+            return round(value, 4) if value is not None else None
+
+        obj: dict = {
+            "count": self.count,
+            "sum": _round(self.sum),
+            "mean": _round(self.mean()),
+        }
+        for q in DEFAULT_QUANTILES:
+            obj[f"p{round(q * 100)}"] = _round(self.quantile(q))
+        obj["max"] = _round(self.max)
+        return obj
+
+    def __repr__(self) -> str:
+        return repr(self.as_obj())
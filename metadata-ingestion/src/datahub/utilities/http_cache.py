@@ -0,0 +1,341 @@
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from datahub.configuration.http_cache import HttpCacheConfig, HttpCacheMode
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Response headers that are never persisted.
+_EXCLUDED_RESPONSE_HEADERS = {"set-cookie", "www-authenticate", "proxy-authenticate"}
+# Request headers that identify the caller, see _get_credentials_fingerprint.
+_CREDENTIAL_REQUEST_HEADERS = ["Authorization", "Proxy-Authorization", "Cookie"]
+
+# The stats may be shared by the adapters of several sessions.
+_stats_lock = threading.Lock()
+
+
+class HttpCacheMissError(requests.exceptions.ConnectionError):
+    """Raised in replay mode for requests that are not in the recording."""
+
+
+@dataclass
+class HttpCacheStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    stored: int = 0
+    bypassed: int = 0
+    in_flight_waits: int = 0
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status_code: int
+    reason: str
+    url: str
+    headers: Dict[str, str]
+    content: bytes
+    created_at: float
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "CachedResponse":
+        return cls(
+            status_code=response.status_code,
+            reason=response.reason or "",
+            url=response.url,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _EXCLUDED_RESPONSE_HEADERS
+            },
+            # Reading the content also releases the connection back to the pool.
+            content=response.content,
+            created_at=time.time(),
+        )
+
+    def to_response(
+        self, request: requests.PreparedRequest, adapter: HTTPAdapter
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = self.reason
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = self.content
+        response._content_consumed = True  # type: ignore[attr-defined]
+        response.request = request
+        response.connection = adapter  # type: ignore[attr-defined]
+        return response
+
+
+class HttpResponseStore:
+    """
+    A thread-safe, SQLite backed store of HTTP responses that persists across runs.
+
+    Unlike the FileBacked* collections, the file is not temporary and can be opened
+    by several sources and pipelines, one after another.
+    """
+
+    def __init__(self, path: str):
+        filename = pathlib.Path(os.path.expanduser(path))
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            filename, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute('PRAGMA journal_mode = "WAL"')
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                created_at REAL,
+                status_code INTEGER,
+                reason TEXT,
+                url TEXT,
+                headers TEXT,
+                content BLOB
+            )"""
+        )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, status_code, reason, url, headers, content FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        created_at, status_code, reason, url, headers, content = row
+        return CachedResponse(
+            status_code=status_code,
+            reason=reason,
+            url=url,
+            headers=json.loads(headers),
+            content=content,
+            created_at=created_at,
+        )
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.created_at,
+                    response.status_code,
+                    response.reason,
+                    response.url,
+                    json.dumps(response.headers),
+                    response.content,
+                ),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """
+    A requests transport adapter that serves responses from a persistent cache.
+
+    Cache keys are built from the method, the url, the body, a small set of request
+    headers and the identity of the caller, so that callers with different
+    credentials never share responses. The identity is the namespace given by the
+    source, e.g. its tenant, or otherwise a hash of the credentials of the request.
+    Concurrent identical requests are deduplicated: only the first one goes to the
+    network and the others wait for its response.
+    """
+
+    def __init__(
+        self,
+        config: HttpCacheConfig,
+        store: Optional[HttpResponseStore] = None,
+        namespace: Optional[str] = None,
+        stats: Optional[HttpCacheStats] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.config = config
+        self.store = store or HttpResponseStore(config.path)
+        self.namespace = namespace
+        self.stats = stats or HttpCacheStats()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, "Future[CachedResponse]"] = {}
+
+    def get_cache_key(self, request: requests.PreparedRequest) -> str:
+        assert request.url is not None
+        scheme, netloc, path, query, _ = urlsplit(request.url)
+        ignored_params = set(self.config.ignored_query_params)
+        query = urlencode(
+            sorted(
+                (name, value)
+                for name, value in parse_qsl(query, keep_blank_values=True)
+                if name not in ignored_params
+            )
+        )
+
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        key_parts: List[Any] = [
+            self.namespace
+            if self.namespace is not None
+            else self._get_credentials_fingerprint(request),
+            request.method,
+            urlunsplit((scheme, netloc, path, query, "")),
+            hashlib.sha256(body).hexdigest(),
+            [(name, request.headers.get(name)) for name in self.config.key_headers],
+        ]
+        return hashlib.sha256(json.dumps(key_parts).encode("utf-8")).hexdigest()
+
+    def _get_credentials_fingerprint(self, request: requests.PreparedRequest) -> str:
+        assert request.url is not None
+        ignored_params = set(self.config.ignored_query_params)
+        credentials = [
+            (name, request.headers.get(name)) for name in _CREDENTIAL_REQUEST_HEADERS
+        ] + sorted(
+            (name, value)
+            for name, value in parse_qsl(
+                urlsplit(request.url).query, keep_blank_values=True
+            )
+            if name in ignored_params
+        )
+        return hashlib.sha256(json.dumps(credentials).encode("utf-8")).hexdigest()
+
+    def _increment(self, stat: str) -> None:
+        with _stats_lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+    def _is_cacheable_request(
+        self, request: requests.PreparedRequest, stream: bool
+    ) -> bool:
+        return (
+            not stream
+            and request.method in self.config.methods
+            and isinstance(request.body, (str, bytes, type(None)))
+        )
+
+    @staticmethod
+    def _is_cacheable_response(response: CachedResponse) -> bool:
+        # Only persist successful responses. Errors, e.g. throttling or an expired
+        # token, are transient and must not be replayed.
+        return 200 <= response.status_code < 300
+
+    def _get_cached(self, key: str) -> Optional[CachedResponse]:
+        if self.config.mode == HttpCacheMode.RECORD:
+            return None
+        cached = self.store.get(key)
+        if (
+            cached is not None
+            and self.config.mode == HttpCacheMode.CACHE
+            and self.config.ttl_seconds is not None
+            and time.time() - cached.created_at > self.config.ttl_seconds
+        ):
+            self._increment("expired")
+            return None
+        return cached
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, stream: bool = False, **kwargs: Any
+    ) -> requests.Response:
+        if not self._is_cacheable_request(request, stream):
+            self._increment("bypassed")
+            return super().send(request, stream=stream, **kwargs)
+
+        key = self.get_cache_key(request)
+        cached = self._get_cached(key)
+        if cached is not None:
+            self._increment("hits")
+            return cached.to_response(request, self)
+
+        if self.config.mode == HttpCacheMode.REPLAY:
+            self._increment("misses")
+            raise HttpCacheMissError(
+                f"No recorded response for {request.method} {request.url}",
+                request=request,
+            )
+
+        future, is_owner = self._claim_in_flight(key)
+        if not is_owner:
+            self._increment("in_flight_waits")
+            return future.result().to_response(request, self)
+
+        self._increment("misses")
+        try:
+            response = super().send(request, stream=stream, **kwargs)
+            entry = CachedResponse.from_response(response)
+            if self._is_cacheable_response(entry):
+                self.store.put(key, entry)
+                self._increment("stored")
+            future.set_result(entry)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _claim_in_flight(self, key: str) -> Tuple["Future[CachedResponse]", bool]:
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            return future, True
+
+    def close(self) -> None:
+        super().close()
+        self.store.close()
+
+
+def mount_http_cache(
+    session: requests.Session,
+    config: Optional[HttpCacheConfig],
+    namespace: Optional[str] = None,
+    stats: Optional[HttpCacheStats] = None,
+) -> Optional[CachingHTTPAdapter]:
+    """
+    Mounts a caching adapter for http and https on the session, keeping the retry
+    settings of the adapter it replaces. Returns None if no cache is configured.
+
+    The namespace should identify the account the session authenticates as, e.g. the
+    tenant and client id, when its credentials change between runs. Otherwise the
+    responses are keyed by the credentials of each request.
+    """
+    if config is None:
+        return None
+
+    current_adapter = session.get_adapter("https://")
+    adapter = CachingHTTPAdapter(
+        config,
+        namespace=namespace,
+        stats=stats,
+        max_retries=current_adapter.max_retries
+        if isinstance(current_adapter, HTTPAdapter)
+        else 0,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    logger.info(
+        f"Using HTTP response cache at {adapter.store.filename} in {config.mode.value} mode"
+    )
+    return adapter
@@ -0,0 +1,59 @@
+import hashlib
+import math
+
+_HASH_BITS = 64
+
+
+class HyperLogLog:
+    """
+    Estimates the number of distinct strings added to it in constant memory.
+
+    With the default precision of 14, the sketch uses 16KB of memory and the
+    standard error of the estimate is about 0.8%. Small cardinalities are counted
+    almost exactly.
+
+    See https://en.wikipedia.org/wiki/HyperLogLog.
+    """
+
+    def __init__(self, precision: int = 14):
+        assert 4 <= precision <= 18, "precision must be between 4 and 18"
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self._registers = bytearray(self.num_registers)
+        self._remaining_bits = _HASH_BITS - precision
+        self._remaining_mask = (1 << self._remaining_bits) - 1
+
+    def add(self, value: str) -> bool:
+        """
+        Adds a value to the sketch. Returns True if the sketch changed, which
+        implies that the value was not added before.
+        """
+        hashed = int.from_bytes(
+            hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        index = hashed >> self._remaining_bits
+        remaining = hashed & self._remaining_mask
+        # The position of the leftmost 1 bit in the remaining bits.
+        rank = self._remaining_bits - remaining.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+            return True
+        return False
+
+    def count(self) -> int:
+        m = self.num_registers
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+
+        estimate = alpha * m * m / sum(2.0**-register for register in self._registers)
+
+        empty_registers = self._registers.count(0)
+        if estimate <= 2.5 * m and empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * math.log(m / empty_registers)
+        return round(estimate)
+
+    def __len__(self) -> int:
+        return self.count()
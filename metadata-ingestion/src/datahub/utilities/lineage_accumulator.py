@@ -0,0 +1,104 @@
+from dataclasses import dataclass, field
+from typing import Dict, Generic, Iterable, Iterator, Mapping, Set, Tuple, TypeVar
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.file_backed_collections import FileBackedDict
+
+_EdgeT = TypeVar("_EdgeT")
+_ColumnEdgeT = TypeVar("_ColumnEdgeT")
+
+_DEFAULT_CACHE_MAX_SIZE = 1000
+
+
+@dataclass
+class TableLineage(Generic[_EdgeT, _ColumnEdgeT]):
+    edges: Set[_EdgeT] = field(default_factory=set)
+    # key: downstream column name
+    column_edges: Dict[str, Set[_ColumnEdgeT]] = field(default_factory=dict)
+
+
+class LineageAccumulator(
+    Mapping[str, Set[_EdgeT]], Generic[_EdgeT, _ColumnEdgeT], Closeable
+):
+    """
+    Accumulates the upstream edges, and optionally the column level edges, of each
+    downstream dataset in a FileBackedDict, so that only the lineage of the most
+    recently updated datasets is kept in memory regardless of how many edges are
+    collected.
+
+    The edges of a dataset are deduplicated, so they must be hashable and picklable.
+    As a mapping, it maps each downstream dataset to its edges.
+
+    This class is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        tablename: str = "lineage",
+        cache_max_size: int = _DEFAULT_CACHE_MAX_SIZE,
+    ) -> None:
+        self._lineage = FileBackedDict[TableLineage[_EdgeT, _ColumnEdgeT]](
+            tablename=tablename,
+            cache_max_size=cache_max_size,
+            cache_eviction_batch_size=max(1, cache_max_size // 10),
+        )
+
+    def _get_table_lineage(self, downstream: str) -> TableLineage[_EdgeT, _ColumnEdgeT]:
+        try:
+            return self._lineage[downstream]
+        except KeyError:
+            table_lineage: TableLineage[_EdgeT, _ColumnEdgeT] = TableLineage()
+            self._lineage[downstream] = table_lineage
+            return table_lineage
+
+    def add_edges(self, downstream: str, edges: Iterable[_EdgeT]) -> None:
+        table_lineage = self._get_table_lineage(downstream)
+        table_lineage.edges.update(edges)
+        self._lineage.mark_dirty(downstream)
+
+    def add_edge(self, downstream: str, edge: _EdgeT) -> None:
+        self.add_edges(downstream, [edge])
+
+    def set_edges(self, downstream: str, edges: Iterable[_EdgeT]) -> None:
+        table_lineage = self._get_table_lineage(downstream)
+        table_lineage.edges = set(edges)
+        self._lineage.mark_dirty(downstream)
+
+    def add_column_edge(
+        self, downstream: str, downstream_column: str, edge: _ColumnEdgeT
+    ) -> None:
+        table_lineage = self._get_table_lineage(downstream)
+        table_lineage.column_edges.setdefault(downstream_column, set()).add(edge)
+        self._lineage.mark_dirty(downstream)
+
+    def get_edges(self, downstream: str) -> Set[_EdgeT]:
+        try:
+            return self._lineage[downstream].edges
+        except KeyError:
+            return set()
+
+    def get_column_edges(self, downstream: str) -> Dict[str, Set[_ColumnEdgeT]]:
+        try:
+            return self._lineage[downstream].column_edges
+        except KeyError:
+            return {}
+
+    def __getitem__(self, downstream: str) -> Set[_EdgeT]:
+        return self._lineage[downstream].edges
+
+    def __iter__(self) -> Iterator[str]:
+        # The keys are read upfront, so that the lineage can be read and updated while
+        # iterating over them.
+        return iter(list(self._lineage))
+
+    def __len__(self) -> int:
+        return len(self._lineage)
+
+    def table_lineages(
+        self,
+    ) -> Iterator[Tuple[str, TableLineage[_EdgeT, _ColumnEdgeT]]]:
+        """Iterates over the lineage of each downstream dataset, reading it from disk."""
+        return self._lineage.items_snapshot()
+
+    def close(self) -> None:
+        self._lineage.close()
@@ -1,6 +1,9 @@
 import time
-from contextlib import AbstractContextManager
-from typing import Any, Optional
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 class PerfTimer(AbstractContextManager):
@@ -42,3 +45,88 @@ class PerfTimer(AbstractContextManager):
             return time.perf_counter() - self.start_time
         else:
             return self.end_time - self.start_time
+
+
+@dataclass
+class _StageStats:
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+
+
+class _StageFrame:
+    def __init__(self) -> None:
+        self.timer = PerfTimer()
+        self.cpu_start_time = time.thread_time()
+        self.child_wall_time = 0.0
+        self.child_cpu_time = 0.0
+        self.timer.start()
+
+
+class StageTimer:
+    """
+    Accumulates the wall clock time, the CPU time and the number of calls of named stages.
+
+    Stages can be nested, e.g. when a timed generator pulls items from another timed
+    generator. The time spent in a nested stage is only attributed to the nested stage,
+    so the times of all stages add up to the total time spent in any of them.
+
+    This class is not thread-safe, and only measures the CPU time of the calling thread.
+    """
+
+    def __init__(self) -> None:
+        self._stats: Dict[str, _StageStats] = {}
+        self._stack: List[_StageFrame] = []
+
+    def _enter(self) -> _StageFrame:
+        frame = _StageFrame()
+        self._stack.append(frame)
+        return frame
+
+    def _exit(self, stage: str, frame: _StageFrame) -> None:
+        wall_time = frame.timer.elapsed_seconds()
+        cpu_time = time.thread_time() - frame.cpu_start_time
+        assert self._stack.pop() is frame
+
+        stats = self._stats.get(stage)
+        if stats is None:
+            stats = self._stats[stage] = _StageStats()
+        stats.calls += 1
+        stats.wall_time += wall_time - frame.child_wall_time
+        stats.cpu_time += cpu_time - frame.child_cpu_time
+
+        if self._stack:
+            self._stack[-1].child_wall_time += wall_time
+            self._stack[-1].child_cpu_time += cpu_time
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        frame = self._enter()
+        try:
+            yield
+        finally:
+            self._exit(stage, frame)
+
+    def time_iterator(self, stage: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Times each step of the iteration, but not the time between the steps."""
+
+        iterator = iter(iterable)
+        while True:
+            frame = self._enter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit(stage, frame)
+            yield item
+
+    def as_obj(self) -> dict:
+        return {
+            stage: {
+                "calls": stats.calls,
+                "wall_time_in_seconds": round(stats.wall_time, 2),
+                "cpu_time_in_seconds": round(stats.cpu_time, 2),
+            }
+            for stage, stats in self._stats.items()
+        }
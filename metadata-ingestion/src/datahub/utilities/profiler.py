@@ -0,0 +1,55 @@
+import contextlib
+import cProfile
+import logging
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@contextlib.contextmanager
+def profile_to_file(filename: Optional[str]) -> Iterator[None]:
+    """
+    Profiles the code in the context on the current thread and writes the profile to
+    the file, if a file is given.
+
+    Files ending in `.html` or `.speedscope.json` are written by the pyinstrument
+    sampling profiler, which must be installed separately. All other files are
+    written by cProfile, in the format read by pstats, snakeviz and similar tools.
+    """
+
+    if filename is None:
+        yield
+        return
+
+    if filename.endswith((".html", ".speedscope.json")):
+        try:
+            from pyinstrument import Profiler
+        except ImportError as e:
+            raise ImportError(
+                "Writing html or speedscope profiles requires pyinstrument. Install it with `pip install pyinstrument`."
+            ) from e
+
+        sampling_profiler = Profiler()
+        sampling_profiler.start()
+        try:
+            yield
+        finally:
+            sampling_profiler.stop()
+            if filename.endswith(".html"):
+                output = sampling_profiler.output_html()
+            else:
+                from pyinstrument.renderers import SpeedscopeRenderer
+
+                output = sampling_profiler.output(renderer=SpeedscopeRenderer())
+            with open(filename, "w") as f:
+                f.write(output)
+            logger.info(f"Wrote profile to {filename}")
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(filename)
+            logger.info(f"Wrote profile to {filename}")
@@ -0,0 +1,77 @@
+import email.utils
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+import requests
+
+from datahub.utilities.backpressure_aware_executor import AdaptiveConcurrencyLimiter
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_MAX_BACKOFF_SEC = 60
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header, given either in seconds or as an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class ThrottledSession(requests.Session):
+    """
+    A requests session that shares an AdaptiveConcurrencyLimiter between all the threads
+    using it, so that at most `limiter.limit` requests are in flight at a time.
+
+    Throttled requests (HTTP 429) are retried up to `max_attempts` times in total. Each
+    of them reduces the limit, and pauses all the requests for the delay given by the
+    Retry-After header of the response.
+    """
+
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter, max_attempts: int = 5):
+        super().__init__()
+        self.limiter = limiter
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        # Redirects are followed by nested calls, which run within the slot of the
+        # original request.
+        if getattr(self._local, "in_slot", False):
+            return super().send(request, **kwargs)
+
+        attempt = 1
+        while True:
+            with self.limiter.slot():
+                self._local.in_slot = True
+                try:
+                    response = super().send(request, **kwargs)
+                finally:
+                    self._local.in_slot = False
+            if response.status_code != 429:
+                self.limiter.on_success()
+                return response
+            if attempt >= self.max_attempts:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                retry_after = min(2.0 ** (attempt - 1), _MAX_BACKOFF_SEC)
+            logger.info(
+                f"Throttled on {request.method} {request.url}, retrying in {retry_after:.1f} seconds"
+            )
+            self.limiter.on_throttled(retry_after)
+            response.close()
+            attempt += 1
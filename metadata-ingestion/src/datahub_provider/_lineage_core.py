@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 import datahub.emitter.mce_builder as builder
 from datahub.api.entities.dataprocess.dataprocess_instance import InstanceRunResult
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
     from airflow.models.dagrun import DagRun
     from airflow.models.taskinstance import TaskInstance
 
+    from datahub.emitter.kafka_emitter import DatahubKafkaEmitter
+    from datahub.emitter.rest_emitter import DatahubRestEmitter
+    from datahub.emitter.spool_emitter import DatahubSpoolEmitter
     from datahub_provider._airflow_shims import Operator
     from datahub_provider.hooks.datahub import DatahubGenericHook
 
@@ -38,12 +41,25 @@ class DatahubBasicLineageConfig(ConfigModel):
 
     capture_executions: bool = False
 
+    # If set, metadata is written to a local spool at this path and sent to DataHub
+    # from a background thread, so that slow or unavailable DataHub servers do not
+    # delay or fail tasks. Otherwise, metadata is sent synchronously.
+    spool_path: Optional[str] = None
+
     def make_emitter_hook(self) -> "DatahubGenericHook":
         # This is necessary to avoid issues with circular imports.
         from datahub_provider.hooks.datahub import DatahubGenericHook
 
         return DatahubGenericHook(self.datahub_conn_id)
 
+    def make_emitter(
+        self,
+    ) -> Union["DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"]:
+        hook = self.make_emitter_hook()
+        if self.spool_path:
+            return hook.make_spool_emitter(self.spool_path)
+        return hook.make_emitter()
+
 
 def send_lineage_to_datahub(
     config: DatahubBasicLineageConfig,
@@ -59,8 +75,7 @@ def send_lineage_to_datahub(
     task: "Operator" = context["task"]
     ti: "TaskInstance" = context["task_instance"]
 
-    hook = config.make_emitter_hook()
-    emitter = hook.make_emitter()
+    emitter = config.make_emitter()
 
     dataflow = AirflowGenerator.generate_dataflow(
         cluster=config.cluster,
@@ -15,7 +15,6 @@ from cattr import structure
 from datahub.api.entities.dataprocess.dataprocess_instance import InstanceRunResult
 from datahub_provider._airflow_shims import MappedOperator, Operator
 from datahub_provider.client.airflow_generator import AirflowGenerator
-from datahub_provider.hooks.datahub import DatahubGenericHook
 from datahub_provider.lineage.datahub import DatahubLineageConfig
 
 assert AIRFLOW_PATCHED
@@ -37,6 +36,7 @@ def get_lineage_config() -> DatahubLineageConfig:
         "datahub", "capture_ownership_info", fallback=True
     )
     capture_executions = conf.get("datahub", "capture_executions", fallback=True)
+    spool_path = conf.get("datahub", "spool_path", fallback=None)
     return DatahubLineageConfig(
         enabled=enabled,
         datahub_conn_id=datahub_conn_id,
@@ -45,6 +45,7 @@ def get_lineage_config() -> DatahubLineageConfig:
         capture_ownership_info=capture_ownership_info,
         capture_tags_info=capture_tags_info,
         capture_executions=capture_executions,
+        spool_path=spool_path,
     )
 
 
@@ -132,11 +133,7 @@ def datahub_task_status_callback(context, status):
     # https://github.com/apache/airflow/blob/main/airflow/lineage/__init__.py
     inlets = get_inlets_from_task(task, context)
 
-    emitter = (
-        DatahubGenericHook(context["_datahub_config"].datahub_conn_id)
-        .get_underlying_hook()
-        .make_emitter()
-    )
+    emitter = context["_datahub_config"].make_emitter()
 
     dataflow = AirflowGenerator.generate_dataflow(
         cluster=context["_datahub_config"].cluster,
@@ -198,11 +195,7 @@ def datahub_pre_execution(context):
 
     task.log.info("Running Datahub pre_execute method")
 
-    emitter = (
-        DatahubGenericHook(context["_datahub_config"].datahub_conn_id)
-        .get_underlying_hook()
-        .make_emitter()
-    )
+    emitter = context["_datahub_config"].make_emitter()
 
     # This code is from the original airflow lineage code ->
     # https://github.com/apache/airflow/blob/main/airflow/lineage/__init__.py
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 
     from datahub.emitter.kafka_emitter import DatahubKafkaEmitter
     from datahub.emitter.rest_emitter import DatahubRestEmitter
+    from datahub.emitter.spool_emitter import DatahubSpoolEmitter
     from datahub_provider._airflow_shims import Operator
 
 
@@ -291,7 +292,9 @@ class AirflowGenerator:
 
     @staticmethod
     def run_dataflow(
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         cluster: str,
         dag_run: "DagRun",
         start_timestamp_millis: Optional[int] = None,
@@ -339,7 +342,9 @@ class AirflowGenerator:
 
     @staticmethod
     def complete_dataflow(
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         cluster: str,
         dag_run: "DagRun",
         end_timestamp_millis: Optional[int] = None,
@@ -385,7 +390,9 @@ class AirflowGenerator:
 
     @staticmethod
     def run_datajob(
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         cluster: str,
         ti: "TaskInstance",
         dag: "DAG",
@@ -457,7 +464,9 @@ class AirflowGenerator:
 
     @staticmethod
     def complete_datajob(
-        emitter: Union["DatahubRestEmitter", "DatahubKafkaEmitter"],
+        emitter: Union[
+            "DatahubRestEmitter", "DatahubKafkaEmitter", "DatahubSpoolEmitter"
+        ],
         cluster: str,
         ti: "TaskInstance",
         dag: "DAG",
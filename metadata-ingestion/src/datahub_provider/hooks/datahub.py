@@ -1,3 +1,5 @@
+import os
+import threading
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from airflow.exceptions import AirflowException
@@ -13,9 +15,15 @@ if TYPE_CHECKING:
 
     from datahub.emitter.kafka_emitter import DatahubKafkaEmitter
     from datahub.emitter.rest_emitter import DatahubRestEmitter
+    from datahub.emitter.spool_emitter import DatahubSpoolEmitter
     from datahub.ingestion.sink.datahub_kafka import KafkaSinkConfig
 
 
+# The spool emitters of this process, by process id, connection id and spool path.
+_spool_emitters: Dict[Tuple[int, str, str], "DatahubSpoolEmitter"] = {}
+_spool_emitters_lock = threading.Lock()
+
+
 class DatahubRestHook(BaseHook):
     """
     Creates a DataHub Rest API connection used to send metadata to DataHub.
@@ -206,5 +214,22 @@ class DatahubGenericHook(BaseHook):
     def make_emitter(self) -> Union["DatahubRestEmitter", "DatahubKafkaEmitter"]:
         return self.get_underlying_hook().make_emitter()
 
+    def make_spool_emitter(self, spool_path: str) -> "DatahubSpoolEmitter":
+        """
+        Returns an emitter that writes to the given local spool, and sends the spooled
+        metadata from a background thread. All tasks that run in the same process share
+        the emitter, along with its background thread and connection.
+        """
+        from datahub.emitter.spool_emitter import DatahubSpoolEmitter
+
+        # Threads do not survive a fork, so forked task processes get their own emitter.
+        key = (os.getpid(), self.datahub_conn_id, spool_path)
+        with _spool_emitters_lock:
+            emitter = _spool_emitters.get(key)
+            if emitter is None:
+                emitter = DatahubSpoolEmitter(self.make_emitter, spool_path)
+                _spool_emitters[key] = emitter
+            return emitter
+
     def emit_mces(self, mces: List[MetadataChangeEvent]) -> None:
         return self.get_underlying_hook().emit_mces(mces)
@@ -1,10 +1,14 @@
 import json
 import logging
 import os
+from typing import cast
+from unittest.mock import patch
 
 import pytest
 
 from datahub.ingestion.run.pipeline import Pipeline
+from datahub.ingestion.source.delta_lake import source as delta_lake_source
+from datahub.ingestion.source.delta_lake.source import DeltaLakeSource
 from tests.test_helpers import mce_helpers
 
 FROZEN_TIME = "2020-04-14 07:00:00"
@@ -71,3 +75,112 @@ def test_delta_lake_incorrect_config_raises_error(tmp_path, mock_time):
         pipeline.raise_from_status()
 
     logging.debug(e_info)
+
+
+def _get_urn(record: dict) -> str:
+    if "proposedSnapshot" in record:
+        # {"com.linkedin.pegasus2avro.metadata.snapshot.DatasetSnapshot": {"urn": ...}}
+        return next(iter(record["proposedSnapshot"].values()))["urn"]
+    return record["entityUrn"]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_delta_lake_table_load_failure_is_reported(tmp_path, mock_time, max_workers):
+    read_delta_table = delta_lake_source.read_delta_table
+
+    def read_delta_table_or_fail(path, delta_lake_config):
+        if path.endswith("/sales"):
+            raise OSError("Failed to read the transaction log")
+        return read_delta_table(path, delta_lake_config)
+
+    pipeline = Pipeline.create(
+        {
+            "run_id": "delta-lake-test",
+            "source": {
+                "type": "delta-lake",
+                "config": {
+                    "base_path": "tests/integration/delta_lake/test_data/delta_tables",
+                    "max_workers": max_workers,
+                },
+            },
+            "sink": {"type": "file", "config": {"filename": f"{tmp_path}/mces.json"}},
+        }
+    )
+    with patch.object(
+        delta_lake_source, "read_delta_table", side_effect=read_delta_table_or_fail
+    ):
+        pipeline.run()
+
+    # The other tables are still ingested.
+    failures = pipeline.source.get_report().failures
+    assert list(failures.keys()) == [
+        "tests/integration/delta_lake/test_data/delta_tables/sales"
+    ]
+    with open(f"{tmp_path}/mces.json") as f:
+        urns = {_get_urn(record) for record in json.load(f)}
+    assert any("my_table_basic" in urn for urn in urns)
+    assert not any("sales" in urn for urn in urns)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_delta_lake_skips_unchanged_tables(
+    tmp_path, mock_time, mock_datahub_graph, max_workers
+):
+    def run(run_id: str) -> DeltaLakeSource:
+        pipeline = Pipeline.create(
+            {
+                "run_id": run_id,
+                "pipeline_name": "delta-lake-incremental-test",
+                "source": {
+                    "type": "delta-lake",
+                    "config": {
+                        "base_path": "tests/integration/delta_lake/test_data/delta_tables",
+                        "max_workers": max_workers,
+                        "incremental_extraction": True,
+                        "stateful_ingestion": {
+                            "enabled": True,
+                            "state_provider": {
+                                "type": "datahub",
+                                "config": {"datahub_api": {"server": "http://gms"}},
+                            },
+                        },
+                    },
+                },
+                "sink": {
+                    "type": "file",
+                    "config": {"filename": f"{tmp_path}/{run_id}.json"},
+                },
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+        return cast(DeltaLakeSource, pipeline.source)
+
+    def get_entities(source: DeltaLakeSource) -> dict:
+        checkpoint = source.get_current_checkpoint(
+            source.incremental_extraction_handler.job_id
+        )
+        assert checkpoint is not None and checkpoint.state is not None
+        return checkpoint.state.entities
+
+    with patch(
+        "datahub.ingestion.source.state_provider.datahub_ingestion_checkpointing_provider.DataHubGraph",
+        mock_datahub_graph,
+    ) as mock_checkpoint:
+        mock_checkpoint.return_value = mock_datahub_graph
+
+        source1 = run("delta-lake-incremental-run-1")
+        assert source1.report.tables_skipped_unchanged == 0
+        entities1 = get_entities(source1)
+        assert len(entities1) == 4
+        assert all(entity.urns for entity in entities1.values())
+
+        source2 = run("delta-lake-incremental-run-2")
+        assert source2.report.tables_skipped_unchanged == 4
+        # The unchanged tables are carried forward with their urns and versions.
+        assert get_entities(source2) == entities1
+
+    with open(f"{tmp_path}/delta-lake-incremental-run-2.json") as f:
+        assert not any(
+            _get_urn(record).startswith("urn:li:dataset:") for record in json.load(f)
+        )
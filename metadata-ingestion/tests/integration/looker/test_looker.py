@@ -5,6 +5,7 @@ from typing import List, Optional, cast
 from unittest import mock
 
 from freezegun import freeze_time
+from looker_sdk.error import SDKError
 from looker_sdk.rtl import transport
 from looker_sdk.rtl.transport import TransportOptions
 from looker_sdk.sdk.api40.models import (
@@ -81,6 +82,67 @@ def test_looker_ingest(pytestconfig, tmp_path, mock_time):
         )
 
 
+def throttle_once(mocked_method: mock.MagicMock) -> None:
+    return_value = mocked_method.return_value
+    responses = [SDKError("429 Too Many Requests")]
+
+    def side_effect(*args, **kwargs):
+        if responses:
+            raise responses.pop()
+        return return_value
+
+    mocked_method.side_effect = side_effect
+
+
+@freeze_time(FROZEN_TIME)
+def test_looker_ingest_retries_rate_limited_calls(pytestconfig, tmp_path, mock_time):
+    mocked_client = mock.MagicMock()
+    # freezegun also freezes time.monotonic(), so the backoff must not wait.
+    with mock.patch("looker_sdk.init40") as mock_sdk, mock.patch(
+        "datahub.ingestion.source.looker.looker_lib_wrapper._MAX_RATE_LIMIT_BACKOFF_SEC",
+        0,
+    ):
+        mock_sdk.return_value = mocked_client
+        setup_mock_dashboard(mocked_client)
+        setup_mock_explore(mocked_client)
+        throttle_once(mocked_client.dashboard)
+        throttle_once(mocked_client.lookml_model_explore)
+
+        test_resources_dir = pytestconfig.rootpath / "tests/integration/looker"
+
+        pipeline = Pipeline.create(
+            {
+                "run_id": "looker-test",
+                "source": {
+                    "type": "looker",
+                    "config": {
+                        "base_url": "https://looker.company.com",
+                        "client_id": "foo",
+                        "client_secret": "bar",
+                        "extract_usage_history": False,
+                    },
+                },
+                "sink": {
+                    "type": "file",
+                    "config": {
+                        "filename": f"{tmp_path}/looker_mces.json",
+                    },
+                },
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+        source = cast(LookerDashboardSource, pipeline.source)
+        assert source.looker_api.client_stats.rate_limited_calls == 2
+        assert source.concurrency_limiter.throttled_calls == 2
+        mce_helpers.check_golden_file(
+            pytestconfig,
+            output_path=tmp_path / "looker_mces.json",
+            golden_path=f"{test_resources_dir}/golden_test_ingest.json",
+        )
+
+
 @freeze_time(FROZEN_TIME)
 def test_looker_ingest_joins(pytestconfig, tmp_path, mock_time):
     mocked_client = mock.MagicMock()
@@ -6,7 +6,10 @@ from tests.test_helpers.docker_helpers import wait_for_port
 
 
 @pytest.mark.integration
-def test_mongodb_ingest(docker_compose_runner, pytestconfig, tmp_path, mock_time):
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_mongodb_ingest(
+    docker_compose_runner, pytestconfig, tmp_path, mock_time, max_workers
+):
     test_resources_dir = pytestconfig.rootpath / "tests/integration/mongodb"
 
     with docker_compose_runner(
@@ -25,6 +28,7 @@ def test_mongodb_ingest(docker_compose_runner, pytestconfig, tmp_path, mock_time
                         "username": "mongoadmin",
                         "password": "examplepass",
                         "maxDocumentSize": 25000,
+                        "max_workers": max_workers,
                     },
                 },
                 "sink": {
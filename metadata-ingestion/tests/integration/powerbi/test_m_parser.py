@@ -570,3 +570,33 @@ def test_redshift_native_query():
         data_platform_tables[0].data_platform_pair.powerbi_data_platform_name
         == SupportedDataPlatform.AMAZON_REDSHIFT.value.powerbi_data_platform_name
     )
+
+
+@pytest.mark.integration
+def test_parse_timeout():
+    reporter = PowerBiDashboardSourceReport()
+    parse_pool = parser.MQueryParsePool(parse_timeout=0.001)
+
+    try:
+        for i in range(2):
+            table: powerbi_data_classes.Table = powerbi_data_classes.Table(
+                expression=M_QUERIES[1],
+                name=f"table_{i}",
+                full_name=f"OrderDataSet.table_{i}",
+            )
+
+            data_platform_tables: List[DataPlatformTable] = parser.get_upstream_tables(
+                table, reporter, parse_pool=parse_pool
+            )
+
+            assert data_platform_tables == []
+            assert list(reporter.warnings[table.full_name]) == [
+                "Timed out parsing m-query expression"
+            ]
+    finally:
+        parse_pool.close()
+
+    # The expression of the second table is not parsed again, so it does not time out again.
+    assert reporter.m_query_parse_timeouts == 1
+    assert reporter.num_m_query_parsed == 2
+    assert reporter.num_m_query_parse_cache_hits == 1
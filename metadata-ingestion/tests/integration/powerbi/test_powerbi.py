@@ -796,6 +796,71 @@ def test_scan_all_workspaces(
     )
 
 
+@freeze_time(FROZEN_TIME)
+@mock.patch("msal.ConfidentialClientApplication", side_effect=mock_msal_cca)
+@pytest.mark.integration
+def test_scan_all_workspaces_concurrently(
+    mock_msal, pytestconfig, tmp_path, mock_time, requests_mock
+):
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/powerbi"
+
+    register_mock_api(request_mock=requests_mock)
+    # The throttled request is retried once the Retry-After delay has passed.
+    tiles_url = "https://api.powerbi.com/v1.0/myorg/groups/64ED5CAD-7C22-4684-8180-826122881108/dashboards/7D668CAD-8FFC-4505-9215-655BCA5BEBAE/tiles"
+    requests_mock.register_uri(
+        "GET",
+        tiles_url,
+        [
+            {"status_code": 429, "headers": {"Retry-After": "0"}},
+            {"status_code": 200, "json": {"value": []}},
+        ],
+    )
+
+    pipeline = Pipeline.create(
+        {
+            "run_id": "powerbi-test",
+            "source": {
+                "type": "powerbi",
+                "config": {
+                    **default_source_config(),
+                    "extract_reports": False,
+                    "extract_ownership": False,
+                    "workspace_id_pattern": {
+                        "deny": ["64ED5CAD-7322-4684-8180-826122881108"],
+                    },
+                    "max_workers": 4,
+                },
+            },
+            "sink": {
+                "type": "file",
+                "config": {
+                    "filename": f"{tmp_path}/powerbi_mces_scan_all_workspaces_concurrently.json",
+                },
+            },
+        }
+    )
+
+    pipeline.run()
+    pipeline.raise_from_status()
+
+    assert (
+        len(
+            [
+                r
+                for r in requests_mock.request_history
+                if r.url.lower() == tiles_url.lower()
+            ]
+        )
+        == 2
+    )
+
+    mce_helpers.check_golden_file(
+        pytestconfig,
+        output_path=tmp_path / "powerbi_mces_scan_all_workspaces_concurrently.json",
+        golden_path=f"{test_resources_dir}/golden_test_scan_all_workspaces.json",
+    )
+
+
 @freeze_time(FROZEN_TIME)
 @mock.patch("msal.ConfidentialClientApplication", side_effect=mock_msal_cca)
 @pytest.mark.integration
@@ -1,6 +1,7 @@
 import json
 import logging
 import pathlib
+import re
 import sys
 from typing import Optional, cast
 from unittest import mock
@@ -143,6 +144,63 @@ def side_effect_datasource_data(*arg, **kwargs):
     ], mock_pagination
 
 
+def side_effect_paginated_query_metadata(pytestconfig, node_limit: int):
+    # Serves the sheets, dashboards and embedded data sources page by page, and
+    # truncates the pages of more than node_limit objects like the Metadata API does.
+    responses = {
+        connection_type: read_response(pytestconfig, f"{connection_type}_all.json")
+        for connection_type in [
+            "workbooksConnection",
+            "sheetsConnection",
+            "dashboardsConnection",
+            "embeddedDatasourcesConnection",
+            "publishedDatasourcesConnection",
+            "customSQLTablesConnection",
+        ]
+    }
+    paginated_connection_types = [
+        "sheetsConnection",
+        "dashboardsConnection",
+        "embeddedDatasourcesConnection",
+    ]
+
+    def side_effect(query):
+        match = re.search(r"(\w+) \(first:(\d+), offset:(\d+)", query)
+        assert match
+        connection_type = match.group(1)
+        first, offset = int(match.group(2)), int(match.group(3))
+        if connection_type not in paginated_connection_types:
+            return responses[connection_type]
+
+        nodes = responses[connection_type]["data"][connection_type]["nodes"]
+        page = {
+            "data": {
+                connection_type: {
+                    "nodes": nodes[offset : offset + min(first, node_limit)],
+                    "pageInfo": {
+                        "hasNextPage": offset + first < len(nodes),
+                        "endCursor": None,
+                    },
+                    "totalCount": len(nodes),
+                }
+            }
+        }
+        if first > node_limit:
+            page["errors"] = [
+                {
+                    "message": "Showing partial results. The request exceeded the 20000 node limit.",
+                    "extensions": {
+                        "severity": "WARNING",
+                        "code": "NODE_LIMIT_EXCEEDED",
+                        "properties": {"nodeLimit": 20000},
+                    },
+                }
+            ]
+        return page
+
+    return side_effect
+
+
 def tableau_ingest_common(
     pytestconfig,
     tmp_path,
@@ -241,6 +299,33 @@ def test_tableau_ingest(pytestconfig, tmp_path, mock_datahub_graph):
     )
 
 
+@freeze_time(FROZEN_TIME)
+@pytest.mark.integration
+def test_tableau_ingest_concurrent_paging(pytestconfig, tmp_path, mock_datahub_graph):
+    enable_logging()
+    output_file_name: str = "tableau_concurrent_paging_mces.json"
+    golden_file_name: str = "tableau_mces_golden.json"
+
+    new_config = config_source_default.copy()
+    new_config["max_workers"] = 4
+
+    pipeline = tableau_ingest_common(
+        pytestconfig,
+        tmp_path,
+        side_effect_paginated_query_metadata(pytestconfig, node_limit=3),
+        golden_file_name,
+        output_file_name,
+        mock_datahub_graph,
+        pipeline_config=new_config,
+        pipeline_name="test_tableau_ingest_concurrent_paging",
+    )
+
+    tableau_source = cast(TableauSource, pipeline.source)
+    assert not tableau_source.get_report().warnings
+    assert tableau_source.reduced_page_sizes["sheetsConnection"] == 2
+    assert tableau_source.reduced_page_sizes["dashboardsConnection"] == 2
+
+
 @freeze_time(FROZEN_TIME)
 @pytest.mark.integration
 def test_project_pattern(pytestconfig, tmp_path, mock_datahub_graph):
@@ -210,7 +210,7 @@ def test_ingestion(pytestconfig, tmp_path, requests_mock):
     output_file_name = "unity_catalog_mcps.json"
 
     with mock.patch(
-        "databricks_cli.unity_catalog.api.UnityCatalogApi"
+        "datahub.ingestion.source.unity.proxy.UnityCatalogApi"
     ) as UnityCatalogApi:
         unity_catalog_api_instance: mock.MagicMock = mock.MagicMock()
         UnityCatalogApi.return_value = unity_catalog_api_instance
@@ -0,0 +1,103 @@
+import json
+import pathlib
+import uuid
+from typing import List
+
+import pytest
+
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.delta_lake.config import DeltaLakeSourceConfig
+from datahub.ingestion.source.delta_lake.source import DeltaLakeSource
+from datahub.utilities.perf_timer import PerfTimer
+
+pytestmark = pytest.mark.performance
+
+SCHEMA_STRING = json.dumps(
+    {
+        "type": "struct",
+        "fields": [
+            {"name": "id", "type": "long", "nullable": True, "metadata": {}},
+            {"name": "name", "type": "string", "nullable": True, "metadata": {}},
+        ],
+    }
+)
+
+
+def generate_delta_table(path: pathlib.Path, num_commits: int) -> None:
+    # Only the transaction log is written, since loading a table doesn't read its data files.
+    log_path = path / "_delta_log"
+    log_path.mkdir(parents=True)
+    for version in range(num_commits):
+        timestamp = 1600000000000 + version * 1000
+        actions: List[dict] = []
+        if version == 0:
+            actions.append({"protocol": {"minReaderVersion": 1, "minWriterVersion": 2}})
+            actions.append(
+                {
+                    "metaData": {
+                        "id": str(uuid.uuid4()),
+                        "name": path.name,
+                        "format": {"provider": "parquet", "options": {}},
+                        "schemaString": SCHEMA_STRING,
+                        "partitionColumns": [],
+                        "configuration": {},
+                        "createdTime": timestamp,
+                    }
+                }
+            )
+        actions.append(
+            {
+                "add": {
+                    "path": f"part-{version:05d}.snappy.parquet",
+                    "partitionValues": {},
+                    "size": 1024,
+                    "modificationTime": timestamp,
+                    "dataChange": True,
+                }
+            }
+        )
+        actions.append(
+            {
+                "commitInfo": {
+                    "timestamp": timestamp,
+                    "operation": "WRITE",
+                    "operationParameters": {"mode": "Append"},
+                }
+            }
+        )
+        (log_path / f"{version:020d}.json").write_text(
+            "\n".join(json.dumps(action) for action in actions)
+        )
+
+
+def ingest(base_path: pathlib.Path, max_workers: int) -> List[str]:
+    source = DeltaLakeSource(
+        DeltaLakeSourceConfig(
+            base_path=str(base_path),
+            version_history_lookback=10,
+            max_workers=max_workers,
+        ),
+        PipelineContext(run_id="delta-lake-performance"),
+    )
+    return [wu.id for wu in source.get_workunits()]
+
+
+def test_delta_lake_concurrent_loading(tmp_path):
+    for i in range(40):
+        generate_delta_table(
+            tmp_path / f"schema_{i % 4}" / f"table_{i}", num_commits=200
+        )
+
+    with PerfTimer() as timer:
+        workunit_ids = ingest(tmp_path, max_workers=1)
+    sequential_seconds = timer.elapsed_seconds()
+    print(f"Sequential: {sequential_seconds:.2f} seconds")
+
+    with PerfTimer() as timer:
+        concurrent_workunit_ids = ingest(tmp_path, max_workers=8)
+    concurrent_seconds = timer.elapsed_seconds()
+    print(f"8 workers: {concurrent_seconds:.2f} seconds")
+    print(f"Speedup: {sequential_seconds / concurrent_seconds:.2f}x")
+
+    assert concurrent_workunit_ids == workunit_ids
+    assert len(workunit_ids) > 40
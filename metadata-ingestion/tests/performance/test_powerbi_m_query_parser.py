@@ -0,0 +1,64 @@
+import random
+from typing import List
+
+import pytest
+
+from datahub.ingestion.source.powerbi.m_query import parser
+from datahub.utilities.perf_timer import PerfTimer
+
+pytestmark = pytest.mark.performance
+
+# The shapes of the expressions generated by the PowerBI navigator and of the native
+# queries of the datasets.
+EXPRESSION_TEMPLATES = [
+    'let\n    Source = Snowflake.Databases("xy12345.snowflakecomputing.com","{warehouse}",[Role="{role}"]),\n    {database}_Database = Source{{[Name="{database}",Kind="Database"]}}[Data],\n    {schema}_Schema = {database}_Database{{[Name="{schema}",Kind="Schema"]}}[Data],\n    {table}_Table = {schema}_Schema{{[Name="{table}",Kind="Table"]}}[Data]\nin\n    {table}_Table',
+    'let\n    Source = Sql.Database("{server}", "{database}"),\n    {schema}_{table} = Source{{[Schema="{schema}",Item="{table}"]}}[Data],\n    #"Changed Type" = Table.TransformColumnTypes({schema}_{table},{{{{"MONTH_WID", type text}}}})\nin\n    #"Changed Type"',
+    'let\n    Source = Sql.Database("{server}", "{database}", [Query="select *#(lf)from {schema}.{table}#(lf)where YEAR_TARGET >= 2022", CommandTimeout=#duration(0, 1, 30, 0)]),\n    #"Added Custom" = Table.AddColumn(Source, "Month", each Date.Month([MONTH_DATE]))\nin\n    #"Added Custom"',
+    'let\n    Source = Value.NativeQuery(Snowflake.Databases("xy12345.snowflakecomputing.com","{warehouse}",[Role="{role}"]){{[Name="{database}"]}}[Data], "select *#(lf)from {database}.{schema}.{table}", null, [EnableFolding=true])\nin\n    Source',
+]
+
+
+def generate_expressions(num_tables: int, num_distinct_tables: int) -> List[str]:
+    # Large tenants share the same few source tables across many datasets.
+    rng = random.Random(0)
+    distinct_expressions = [
+        rng.choice(EXPRESSION_TEMPLATES).format(
+            warehouse="ANALYTICS_WH",
+            role="ANALYST",
+            server="sqlserver.example.com",
+            database="ANALYTICS",
+            schema=f"SCHEMA_{i % 3}",
+            table=f"TABLE_{i}",
+        )
+        for i in range(num_distinct_tables)
+    ]
+    return [rng.choice(distinct_expressions) for _ in range(num_tables)]
+
+
+def test_m_query_parser_cache():
+    expressions = generate_expressions(num_tables=60, num_distinct_tables=6)
+
+    with PerfTimer() as timer:
+        parse_trees = [
+            parser._parse_expression(expression) for expression in expressions
+        ]
+    uncached_seconds = timer.elapsed_seconds()
+    print(f"Without cache: {uncached_seconds:.2f} seconds")
+
+    parser._parse_normalized_expression.cache_clear()
+    parse_pool = parser.MQueryParsePool(parse_timeout=60)
+    try:
+        with PerfTimer() as timer:
+            cached_parse_trees = [
+                parser._parse_expression_with_cache(expression, parse_pool=parse_pool)
+                for expression in expressions
+            ]
+    finally:
+        parse_pool.close()
+    cached_seconds = timer.elapsed_seconds()
+    print(f"With cache and timeout: {cached_seconds:.2f} seconds")
+
+    speedup = uncached_seconds / cached_seconds
+    print(f"Speedup: {speedup:.2f}x")
+    assert cached_parse_trees == parse_trees
+    assert cached_seconds < uncached_seconds
@@ -0,0 +1,83 @@
+import collections
+from datetime import timedelta
+from typing import Callable, Dict, List
+
+import pytest
+
+from datahub.configuration.common import AllowDenyPattern
+from datahub.configuration.time_window_config import BucketDuration, get_time_bucket
+from datahub.ingestion.source.usage.usage_common import (
+    ColumnarUsageAggregator,
+    GenericAggregatedDataset,
+)
+from datahub.utilities.perf_timer import PerfTimer
+from tests.performance.data_generation import generate_data, generate_queries
+
+pytestmark = pytest.mark.performance
+
+USER_EMAIL_PATTERN = AllowDenyPattern(deny=["user-0@xyz.com"])
+
+
+def aggregate_row_by_row(events: List[tuple]) -> Dict:
+    datasets: Dict = collections.defaultdict(dict)
+    for timestamp, resource, user, text, fields in events:
+        floored_ts = get_time_bucket(timestamp, BucketDuration.DAY)
+        agg_bucket = datasets[floored_ts].setdefault(
+            resource,
+            GenericAggregatedDataset(bucket_start_time=floored_ts, resource=resource),
+        )
+        agg_bucket.add_read_entry(
+            user, text, fields, user_email_pattern=USER_EMAIL_PATTERN
+        )
+    return datasets
+
+
+def aggregate_columnar(columns: List[list]) -> Dict:
+    aggregator: ColumnarUsageAggregator[str] = ColumnarUsageAggregator(
+        BucketDuration.DAY, user_email_pattern=USER_EMAIL_PATTERN
+    )
+    aggregator.add_batch(*columns)
+    return aggregator.get_aggregated_datasets()
+
+
+def best_of(runs: int, fn: Callable[[], Dict]) -> float:
+    timings = []
+    for _ in range(runs):
+        with PerfTimer() as timer:
+            fn()
+        timings.append(timer.elapsed_seconds())
+    return min(timings)
+
+
+def test_columnar_usage_aggregation():
+    seed_metadata = generate_data(
+        num_containers=100,
+        num_tables=250,
+        num_views=100,
+        time_range=timedelta(days=7),
+    )
+    queries = generate_queries(
+        seed_metadata, num_selects=100000, num_operations=0, num_users=50
+    )
+    # One read event per table accessed by a query, as emitted by the usage sources.
+    events = []
+    for query in queries:
+        fields_by_table: Dict[str, List[str]] = collections.defaultdict(list)
+        for field in query.fields_accessed:
+            fields_by_table[field.table.name].append(field.column)
+        for table, fields in fields_by_table.items():
+            events.append((query.timestamp, table, query.actor, query.text, fields))
+    print(f"Events generated: {len(events)}")
+    # The same events, as a columnar fetch would return them.
+    columns = [[event[i] for event in events] for i in range(5)]
+
+    assert aggregate_columnar(columns) == aggregate_row_by_row(events)
+
+    row_seconds = best_of(3, lambda: aggregate_row_by_row(events))
+    print(f"Row by row aggregation: {row_seconds:.2f} seconds")
+    columnar_seconds = best_of(3, lambda: aggregate_columnar(columns))
+    print(f"Columnar aggregation: {columnar_seconds:.2f} seconds")
+
+    speedup = row_seconds / columnar_seconds
+    print(f"Speedup: {speedup:.1f}x")
+    assert speedup >= 5
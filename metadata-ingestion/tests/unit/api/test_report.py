@@ -1,6 +1,18 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-from datahub.ingestion.api.source import SourceReport
+import pytest
+
+from datahub.emitter.mce_builder import make_dataset_urn
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.source import EntityTrackingMode, SourceReport
+from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.metadata.schema_classes import (
+    DatasetPropertiesClass,
+    DatasetSnapshotClass,
+    MetadataChangeEventClass,
+    StatusClass,
+)
 
 
 def test_report_to_string_unsampled():
@@ -23,3 +35,55 @@ def test_report_to_string_sampled():
     print(str)
     report_as_dict = json.loads(str)
     assert len(report_as_dict["warnings"]) == 11
+
+
+@pytest.mark.parametrize("entity_tracking", list(EntityTrackingMode))
+def test_report_entities(entity_tracking: EntityTrackingMode) -> None:
+    source_report = SourceReport(_entity_tracking=entity_tracking)
+    for i in range(0, 100):
+        urn = make_dataset_urn("hive", f"db.table{i % 40}")
+        source_report.report_workunit(
+            MetadataWorkUnit(
+                id=f"mce-{i}",
+                mce=MetadataChangeEventClass(
+                    proposedSnapshot=DatasetSnapshotClass(
+                        urn=urn,
+                        aspects=[
+                            StatusClass(removed=False),
+                            DatasetPropertiesClass(description="test"),
+                        ],
+                    )
+                ),
+            )
+        )
+        source_report.report_workunit(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=StatusClass(removed=False)
+            ).as_workunit()
+        )
+
+    report = source_report.as_obj()
+    assert report["entities"]["dataset"][-1] == "... sampled of 40 total elements"
+    assert len(report["entities"]["dataset"]) == 11
+    assert report["aspects"] == {"dataset": {"status": 200, "datasetProperties": 100}}
+
+
+def test_report_entities_on_disk_from_threads() -> None:
+    source_report = SourceReport()
+    source_report.set_entity_tracking(EntityTrackingMode.DISK)
+
+    def report(i: int) -> None:
+        urn = make_dataset_urn("hive", f"db.table{i % 40}")
+        source_report.report_workunit(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=StatusClass(removed=False)
+            ).as_workunit()
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(report, range(100)))
+    source_report.close()
+
+    report_obj = source_report.as_obj()
+    assert report_obj["entities"]["dataset"][-1] == "... sampled of 40 total elements"
+    assert report_obj["aspects"] == {"dataset": {"status": 100}}
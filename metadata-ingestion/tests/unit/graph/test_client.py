@@ -1,7 +1,22 @@
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
 from unittest.mock import Mock, patch
 
-from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
-from datahub.metadata.schema_classes import CorpUserEditableInfoClass
+import pytest
+
+from datahub.ingestion.graph.client import (
+    _MAX_BATCH_GET_URL_LENGTH,
+    DatahubClientConfig,
+    DataHubGraph,
+)
+from datahub.metadata.schema_classes import (
+    CorpUserEditableInfoClass,
+    DatasetPropertiesClass,
+    StatusClass,
+)
 
 
 @patch("datahub.ingestion.graph.client.telemetry_enabled", False)
@@ -21,3 +36,110 @@ def test_get_aspect(mock_test_connection):
         mock_get.return_value = mock_response
         editable = graph.get_aspect(user_urn, CorpUserEditableInfoClass)
         assert editable is not None
+
+
+def _dataset_urn(i: int) -> str:
+    return f"urn:li:dataset:(urn:li:dataPlatform:hive,db.table_{i},PROD)"
+
+
+@pytest.fixture
+def mock_gms() -> Iterator[Dict[str, Any]]:
+    """A local GMS serving the batch get endpoint, for even-numbered datasets only."""
+    state: Dict[str, Any] = {"requests": []}
+
+    class BatchGetHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            # ids=List(urn1,urn2)&aspects=List(a,b), with each urn url-encoded.
+            query = self.path.split("?", 1)[1]
+            ids_param, aspects_param = query.split("&")
+            urns = [
+                urllib.parse.unquote(urn)
+                for urn in ids_param[len("ids=List(") : -1].split(",")
+            ]
+            aspects = aspects_param[len("aspects=List(") : -1].split(",")
+            state["requests"].append((urns, aspects))
+
+            results = {}
+            for urn in urns:
+                i = int(urn.split("table_")[1].split(",")[0])
+                if i % 2 == 0:
+                    results[urn] = {
+                        "urn": urn,
+                        "aspects": {
+                            "datasetProperties": {
+                                "name": "datasetProperties",
+                                "value": {"name": f"table_{i}", "customProperties": {}},
+                            }
+                        },
+                    }
+            body = json.dumps({"results": results}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("localhost", 0), BatchGetHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["server"] = f"http://localhost:{server.server_port}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@patch("datahub.ingestion.graph.client.telemetry_enabled", False)
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_entities_aspects(mock_test_connection, mock_gms):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig(server=mock_gms["server"]))
+    urns = [_dataset_urn(i) for i in range(25)]
+
+    result = graph.get_entities_aspects(
+        urns + urns[:3],
+        [DatasetPropertiesClass, StatusClass],
+        batch_size=10,
+        max_workers=3,
+    )
+
+    requests: List = mock_gms["requests"]
+    assert sorted(len(batch_urns) for batch_urns, _ in requests) == [5, 10, 10]
+    assert sorted(urn for batch_urns, _ in requests for urn in batch_urns) == sorted(
+        urns
+    )
+    assert all(aspects == ["datasetProperties", "status"] for _, aspects in requests)
+
+    assert sorted(result) == sorted(urns[::2])
+    entity = result[_dataset_urn(4)]
+    assert entity.aspect_names == ["datasetProperties"]
+    properties = entity.get_aspect(DatasetPropertiesClass)
+    assert properties is not None and properties.name == "table_4"
+    assert entity.get_aspect(DatasetPropertiesClass) is properties
+    assert entity.has_aspect(DatasetPropertiesClass)
+    assert entity.get_aspect(StatusClass) is None
+
+
+@patch("datahub.ingestion.graph.client.telemetry_enabled", False)
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_entities_aspects_bounds_url_length(mock_test_connection, mock_gms):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig(server=mock_gms["server"]))
+    # Urns of deeply nested tables can be several hundred characters long once encoded.
+    urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:hive,{'nested_schema.' * 20}table_{i},PROD)"
+        for i in range(50)
+    ]
+
+    with patch.object(graph, "_get_generic", wraps=graph._get_generic) as mock_get:
+        result = graph.get_entities_aspects(urns, [DatasetPropertiesClass])
+
+    assert len(mock_get.call_args_list) > 1
+    assert all(
+        len(url) <= _MAX_BATCH_GET_URL_LENGTH for (url,), _ in mock_get.call_args_list
+    )
+    assert sorted(
+        urn for batch_urns, _ in mock_gms["requests"] for urn in batch_urns
+    ) == sorted(urns)
+    assert sorted(result) == sorted(urns[::2])
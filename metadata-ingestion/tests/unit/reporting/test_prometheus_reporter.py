@@ -0,0 +1,74 @@
+import datetime
+
+import requests
+
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.api.sink import SinkReport
+from datahub.ingestion.reporting.prometheus_reporter import (
+    PrometheusReporter,
+    render_metrics,
+)
+
+
+def _structured_report() -> dict:
+    sink_report = SinkReport()
+    for millis in [10, 20, 30, 400]:
+        sink_report.report_write_latency(datetime.timedelta(milliseconds=millis))
+    sink_report.report_bytes_sent(1024)
+    return {
+        "source": {"type": "file", "report": {"events_produced": 4, "failures": {}}},
+        "sink": {"type": "datahub-rest", "report": sink_report.as_obj()},
+    }
+
+
+def test_render_metrics() -> None:
+    metrics = render_metrics(
+        _structured_report(), "datahub_ingestion", {"pipeline_name": 'my "pipeline"'}
+    )
+    labels = 'pipeline_name="my \\"pipeline\\""'
+
+    assert "# TYPE datahub_ingestion_sink_bytes_sent gauge" in metrics
+    assert (
+        f'datahub_ingestion_sink_bytes_sent{{{labels},type="datahub-rest"}} 1024'
+        in metrics
+    )
+    assert (
+        f'datahub_ingestion_source_events_produced{{{labels},type="file"}} 4' in metrics
+    )
+    assert "# TYPE datahub_ingestion_sink_write_latency_seconds summary" in metrics
+    assert (
+        f'datahub_ingestion_sink_write_latency_seconds{{{labels},type="datahub-rest",quantile="0.5"}} 0.02'
+        in metrics
+    )
+    assert (
+        f'datahub_ingestion_sink_write_latency_seconds_count{{{labels},type="datahub-rest"}} 4'
+        in metrics
+    )
+    assert "failures" not in metrics
+
+
+def test_prometheus_reporter_serves_metrics() -> None:
+    ctx = PipelineContext(run_id="test", pipeline_name="test_pipeline")
+    reporter = PrometheusReporter.create({"host": "127.0.0.1", "port": 0}, ctx)
+    assert isinstance(reporter, PrometheusReporter)
+    reporter.on_start(ctx)
+    try:
+        assert reporter._server is not None
+        url = f"http://127.0.0.1:{reporter._server.server_port}"
+
+        reporter.on_progress(_structured_report(), ctx)
+        response = requests.get(f"{url}/metrics")
+        assert response.status_code == 200
+        assert "datahub_ingestion_sink_bytes_sent" in response.text
+
+        assert requests.get(f"{url}/other").status_code == 404
+    finally:
+        reporter.on_completion("SUCCESS", _structured_report(), ctx)
+    assert reporter._server is None
+
+
+def test_prometheus_reporter_listens_on_localhost_by_default() -> None:
+    ctx = PipelineContext(run_id="test")
+    reporter = PrometheusReporter.create({}, ctx)
+    assert isinstance(reporter, PrometheusReporter)
+    assert reporter.config.host == "127.0.0.1"
@@ -0,0 +1,119 @@
+from typing import Optional
+from unittest.mock import MagicMock
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.state.checkpoint import Checkpoint
+from datahub.ingestion.source.state.incremental_extraction_handler import (
+    IncrementalExtractionHandler,
+)
+from datahub.ingestion.source.state.incremental_extraction_state import (
+    IncrementalEntityState,
+    IncrementalExtractionCheckpointState,
+)
+from datahub.ingestion.source.state.stateful_ingestion_base import (
+    StatefulIncrementalExtractionConfigMixin,
+    StatefulIngestionConfig,
+    StatefulIngestionConfigBase,
+)
+
+DAY_MILLIS = 24 * 60 * 60 * 1000
+
+
+class _TestConfig(
+    StatefulIngestionConfigBase, StatefulIncrementalExtractionConfigMixin
+):
+    pass
+
+
+def _make_handler(
+    last_state: Optional[IncrementalExtractionCheckpointState],
+) -> IncrementalExtractionHandler:
+    config = _TestConfig.parse_obj(
+        {
+            "stateful_ingestion": StatefulIngestionConfig(enabled=True),
+            "incremental_extraction": True,
+            "full_extraction_interval_days": 7,
+        }
+    )
+    source = MagicMock()
+    source.platform = "looker"
+    source.is_stateful_ingestion_configured.return_value = True
+    source.get_last_checkpoint.return_value = (
+        Checkpoint(
+            job_name="looker_incremental_extraction",
+            pipeline_name="test_pipeline",
+            run_id="run_1",
+            state=last_state,
+        )
+        if last_state
+        else None
+    )
+    handler = IncrementalExtractionHandler(
+        source=source, config=config, pipeline_name="test_pipeline", run_id="run_2"
+    )
+    current_checkpoint = handler.create_checkpoint()
+    source.get_current_checkpoint.return_value = current_checkpoint
+    return handler
+
+
+def test_first_run_is_full_extraction() -> None:
+    handler = _make_handler(last_state=None)
+
+    assert handler.job_id == "looker_incremental_extraction"
+    assert handler.is_full_extraction()
+    assert not handler.is_unchanged("1", 1000)
+
+    handler.add_entity("1", 1000, urns=["urn:li:dashboard:(looker,dashboards.1)"])
+    current_state = handler.get_current_state()
+    assert current_state is not None
+    assert current_state.last_full_extraction is not None
+    assert current_state.entities["1"].urns == [
+        "urn:li:dashboard:(looker,dashboards.1)"
+    ]
+
+
+def test_unchanged_entities_are_carried_forward() -> None:
+    last_state = IncrementalExtractionCheckpointState(
+        last_full_extraction=get_sys_time() - DAY_MILLIS,
+        entities={
+            "1": IncrementalEntityState(
+                last_modified=1000,
+                urns=["urn:li:dashboard:(looker,dashboards.1)"],
+                references=["explore:model:explore"],
+            ),
+            "2": IncrementalEntityState(last_modified=1000),
+        },
+    )
+    handler = _make_handler(last_state)
+
+    assert not handler.is_full_extraction()
+    assert handler.is_unchanged("1", 1000)
+    assert not handler.is_unchanged("2", 2000)
+    assert not handler.is_unchanged("3", 1000)
+    assert not handler.is_unchanged("1", None)
+
+    carried = handler.carry_forward("1")
+    assert carried is not None
+    assert carried.references == ["explore:model:explore"]
+
+    current_state = handler.get_current_state()
+    assert current_state is not None
+    assert set(current_state.entities.keys()) == {"1"}
+    # The timestamp of the last full extraction is kept until the next full extraction.
+    assert current_state.last_full_extraction == last_state.last_full_extraction
+
+
+def test_full_extraction_is_forced_periodically() -> None:
+    last_state = IncrementalExtractionCheckpointState(
+        last_full_extraction=get_sys_time() - 8 * DAY_MILLIS,
+        entities={"1": IncrementalEntityState(last_modified=1000)},
+    )
+    handler = _make_handler(last_state)
+
+    assert handler.is_full_extraction()
+    assert not handler.is_unchanged("1", 1000)
+
+
+def test_incremental_extraction_requires_stateful_ingestion() -> None:
+    config = _TestConfig.parse_obj({"incremental_extraction": True})
+    assert not config.incremental_extraction
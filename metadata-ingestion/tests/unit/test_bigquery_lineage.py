@@ -90,3 +90,49 @@ def test_create_statement_with_multiple_table():
     assert 2 == len(tables)
     assert "my_project_2.my_dataset_2.sometable" == tables[0].get_table_name()
     assert "my_project_2.my_dataset_2.sometable2" == tables[1].get_table_name()
+
+
+def test_parse_views_lineage_with_cache(tmp_path):
+    config = BigQueryV2Config(
+        lineage_parse_view_ddl_max_workers=2,
+        lineage_parse_view_ddl_cache_path=str(tmp_path / "view_lineage.db"),
+    )
+    report = BigQueryV2Report()
+    extractor = BigqueryLineageExtractor(config, report)
+
+    views = [
+        (
+            dataset,
+            BigqueryView(
+                name="test",
+                created=datetime.datetime.now(),
+                last_altered=datetime.datetime.now(),
+                comment="",
+                view_definition=ddl,
+            ),
+        )
+        for dataset, ddl in [
+            ("dataset_1", "CREATE VIEW my_view as select * from sometable as a"),
+            ("dataset_2", "CREATE VIEW my_view as select * from sometable as a"),
+            ("dataset_3", "CREATE VIEW my_view as select * from other.sometable"),
+        ]
+    ]
+    views_lineage = extractor.parse_views_lineage("my_project", views)
+    assert [
+        [table.get_table_name() for table in tables or []] for tables in views_lineage
+    ] == [
+        ["my_project.dataset_1.sometable"],
+        ["my_project.dataset_2.sometable"],
+        ["my_project.other.sometable"],
+    ]
+    # The identical definitions are only parsed once.
+    assert report.num_view_definitions_parsed == 2
+    assert report.num_view_definition_parse_cache_hits == 1
+
+    # A later run reads the parsed tables from the cache file.
+    report = BigQueryV2Report()
+    extractor = BigqueryLineageExtractor(config, report)
+    assert extractor.parse_views_lineage("my_project", views) == views_lineage
+    assert report.num_view_definitions_parsed == 0
+    assert report.num_view_definition_parse_cache_hits == 3
+    assert report.view_definition_parse_cache_hit_rate == 1.0
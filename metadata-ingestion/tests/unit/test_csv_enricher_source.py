@@ -185,3 +185,52 @@ def test_get_resource_domain_work_unit_produced():
     new_domain = "domain"
     maybe_domain_wu = source.get_resource_domain_work_unit(DATASET_URN, new_domain)
     assert maybe_domain_wu
+
+
+def test_get_workunits_reads_aspects_once_per_resource(tmp_path):
+    csv_file = tmp_path / "enrichment.csv"
+    csv_file.write_text(
+        "resource,subresource,glossary_terms,tags,owners,ownership_type,description,domain\n"
+        f'"{DATASET_URN}",,[urn:li:glossaryTerm:newterm1],[urn:li:tag:oldtag1],,,,\n'
+        f'"{DATASET_URN}",field_foo,,[urn:li:tag:newtag1],,,,\n'
+        f'"{DATASET_URN}",,[urn:li:glossaryTerm:newterm2],,,,new description,\n'
+    )
+
+    ctx = PipelineContext("test-run-id")
+    graph = mock.MagicMock()
+    graph.get_aspects_for_entity.return_value = {
+        "glossaryTerms": mce_builder.make_glossary_terms_aspect_from_urn_list(
+            ["urn:li:glossaryTerm:oldterm1"]
+        ),
+        "globalTags": mce_builder.make_global_tag_aspect_with_tag_list(["oldtag1"]),
+        "editableDatasetProperties": None,
+    }
+    graph.get_aspect.return_value = None
+    ctx.graph = graph
+    source = CSVEnricherSource(
+        CSVEnricherConfig(
+            **{**create_base_csv_enricher_config(), "filename": str(csv_file)}
+        ),
+        ctx,
+    )
+
+    workunits = list(source.get_workunits())
+
+    # The two rows of the resource are merged into a single read of all aspects.
+    graph.get_aspects_for_entity.assert_called_once()
+    assert graph.get_aspects_for_entity.call_args.kwargs["aspects"] == [
+        "glossaryTerms",
+        "globalTags",
+        "editableDatasetProperties",
+    ]
+    assert [wu.metadata.aspectName for wu in workunits] == [
+        "glossaryTerms",
+        "editableDatasetProperties",
+        "editableSchemaMetadata",
+    ]
+    terms = workunits[0].metadata.aspect
+    assert [term.urn for term in terms.terms] == [
+        "urn:li:glossaryTerm:oldterm1",
+        "urn:li:glossaryTerm:newterm1",
+        "urn:li:glossaryTerm:newterm2",
+    ]
@@ -0,0 +1,38 @@
+import json
+
+from datahub.ingestion.source.delta_lake.config import DeltaLakeSourceConfig
+from datahub.ingestion.source.delta_lake.delta_lake_utils import (
+    can_list_delta_log,
+    get_latest_version,
+    is_delta_table_path,
+)
+
+
+def test_get_latest_version(tmp_path):
+    config = DeltaLakeSourceConfig(base_path=str(tmp_path))
+    assert not is_delta_table_path(str(tmp_path), config)
+
+    log_path = tmp_path / "_delta_log"
+    log_path.mkdir()
+    assert is_delta_table_path(str(tmp_path), config)
+    assert get_latest_version(str(tmp_path), config) is None
+
+    for version in range(3):
+        (log_path / f"{version:020d}.json").write_text("{}")
+    (log_path / f"{2:020d}.checkpoint.parquet").write_text("")
+    (log_path / "00000000000000000003.json.tmp").write_text("")
+    assert get_latest_version(str(tmp_path), config) == 2
+
+    # Old commits may be cleaned up once a checkpoint is written.
+    for version in range(2):
+        (log_path / f"{version:020d}.json").unlink()
+    (log_path / f"{2:020d}.json").unlink()
+    (log_path / "_last_checkpoint").write_text(json.dumps({"version": 2, "size": 1}))
+    assert get_latest_version(str(tmp_path), config) == 2
+
+
+def test_delta_log_can_not_be_listed_on_s3_without_aws_config():
+    config = DeltaLakeSourceConfig(base_path="s3://bucket/table")
+    assert not can_list_delta_log(config)
+    assert not is_delta_table_path("s3://bucket/table", config)
+    assert get_latest_version("s3://bucket/table", config) is None
@@ -2,15 +2,25 @@ import json
 import logging
 import re
 from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock
 
 import pydantic
 import pytest
 
+from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.source.elastic_search import (
+    CollapseUrns,
+    ElasticsearchSource,
     ElasticsearchSourceConfig,
     ElasticToSchemaFieldConverter,
+    batch_index_names,
+    collapse_name,
 )
-from datahub.metadata.com.linkedin.pegasus2avro.schema import SchemaField
+from datahub.metadata.com.linkedin.pegasus2avro.schema import (
+    SchemaField,
+    SchemaMetadata,
+)
+from datahub.metadata.schema_classes import DatasetPropertiesClass
 
 logger = logging.getLogger(__name__)
 
@@ -2470,3 +2480,90 @@ def test_host_port_parsing() -> None:
 
         with pytest.raises(pydantic.ValidationError):
             ElasticsearchSourceConfig.parse_obj(config_dict)
+
+
+def test_collapse_name() -> None:
+    collapse_urns = CollapseUrns(
+        urns_suffix_regex=[r"-\d{4}\.\d{2}\.\d{2}$", r"_\d{10}$"]
+    )
+    assert collapse_name("logs-2023.01.01", collapse_urns) == "logs"
+    assert collapse_name("events_1672531200", collapse_urns) == "events"
+    assert collapse_name("customers", collapse_urns) == "customers"
+    assert collapse_name("logs-2023.01.01", CollapseUrns()) == "logs-2023.01.01"
+
+
+def test_batch_index_names() -> None:
+    indices = [f"index_{i}" for i in range(10)]
+    batches = list(batch_index_names(indices, max_length=24))
+    assert batches == [
+        ["index_0", "index_1", "index_2"],
+        ["index_3", "index_4", "index_5"],
+        ["index_6", "index_7", "index_8"],
+        ["index_9"],
+    ]
+    assert all(len(",".join(batch)) <= 24 for batch in batches)
+    assert list(batch_index_names(["a" * 30], max_length=24)) == [["a" * 30]]
+
+
+def test_get_workunits_collapses_indices() -> None:
+    mappings = {"properties": {"message": {"type": "text"}}}
+    raw_indices = {
+        f"logs-2023.01.{day:02d}": {"mappings": mappings, "settings": {}}
+        for day in range(1, 31)
+    }
+    # An index named like the collapsed indices is part of the same dataset.
+    raw_indices["logs"] = {"mappings": mappings, "settings": {}}
+    for index in ["customers", "orders"]:
+        raw_indices[index] = {
+            "mappings": {"properties": {"name": {"type": "keyword"}}},
+            "settings": {},
+        }
+
+    source = ElasticsearchSource(
+        ElasticsearchSourceConfig.parse_obj(
+            {
+                "collapse_urns": {"urns_suffix_regex": [r"-\d{4}\.\d{2}\.\d{2}$"]},
+                "max_workers": 4,
+            }
+        ),
+        PipelineContext(run_id="elasticsearch-test"),
+    )
+    source.client = MagicMock()
+    source.client.indices.get_alias.return_value = {index: {} for index in raw_indices}
+    # One index is deleted after it is listed.
+    deleted_index = "logs-2023.01.15"
+    source.client.indices.get.side_effect = lambda index, ignore_unavailable: {
+        name: raw_indices[name]
+        for name in index.split(",")
+        if ignore_unavailable and name != deleted_index
+    }
+
+    workunits = list(source.get_workunits())
+
+    schema_workunits = [
+        wu for wu in workunits if isinstance(wu.metadata.aspect, SchemaMetadata)
+    ]
+    assert len(schema_workunits) == 3
+    schemas = {wu.metadata.entityUrn: wu.metadata.aspect for wu in schema_workunits}
+    assert sorted(schemas) == [
+        "urn:li:dataset:(urn:li:dataPlatform:elasticsearch,customers,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:elasticsearch,logs,PROD)",
+        "urn:li:dataset:(urn:li:dataPlatform:elasticsearch,orders,PROD)",
+    ]
+    # Indices with the same mappings share their schema, but not the field objects.
+    customers_fields = schemas[
+        "urn:li:dataset:(urn:li:dataPlatform:elasticsearch,customers,PROD)"
+    ].fields
+    orders_fields = schemas[
+        "urn:li:dataset:(urn:li:dataPlatform:elasticsearch,orders,PROD)"
+    ].fields
+    assert customers_fields == orders_fields
+    assert customers_fields[0] is not orders_fields[0]
+
+    assert DatasetPropertiesClass(customProperties={"numPartitions": "30"}) in [
+        wu.metadata.aspect for wu in workunits
+    ]
+    report = source.get_report()
+    assert report.index_scanned == 33
+    assert report.index_metadata_requests == 1
+    assert report.index_mappings_reused == 1
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, Type, cast
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pydantic
 import pytest
@@ -54,7 +54,9 @@ GMS_PORT = 8080
 GMS_SERVER = f"http://localhost:{GMS_PORT}"
 
 
-def glue_source(platform_instance: Optional[str] = None) -> GlueSource:
+def glue_source(
+    platform_instance: Optional[str] = None, max_workers: int = 1
+) -> GlueSource:
     return GlueSource(
         ctx=PipelineContext(run_id="glue-source-test"),
         config=GlueSourceConfig(
@@ -63,6 +65,7 @@ def glue_source(platform_instance: Optional[str] = None) -> GlueSource:
             platform_instance=platform_instance,
             use_s3_bucket_tags=True,
             use_s3_object_tags=True,
+            max_workers=max_workers,
         ),
     )
 
@@ -181,6 +184,42 @@ def test_glue_ingest(
     )
 
 
+def test_glue_concurrent_listing() -> None:
+    glue_source_instance = glue_source(max_workers=4)
+
+    def paginate(**kwargs: Any) -> Any:
+        if "DatabaseName" not in kwargs:
+            return [get_databases_response]
+        return {
+            "flights-database": [get_tables_response_1],
+            "test-database": [get_tables_response_2],
+        }[kwargs["DatabaseName"]]
+
+    glue_client = MagicMock()
+    glue_client.get_paginator.return_value.paginate.side_effect = paginate
+    glue_source_instance.glue_client = glue_client
+
+    databases, tables = glue_source_instance.get_all_tables_and_databases()
+    assert list(databases) == ["flights-database", "test-database"]
+    # The tables are listed concurrently, but returned in the order of the databases.
+    assert list(tables) == (
+        get_tables_response_1["TableList"] + get_tables_response_2["TableList"]
+    )
+
+    # Each distinct job script is only downloaded once.
+    with patch.object(
+        glue_source_instance, "get_dataflow_graph", side_effect=lambda path: path
+    ) as get_dataflow_graph:
+        graphs = glue_source_instance._get_dataflow_graphs(
+            ["s3://bucket/a.py", "s3://bucket/b.py", "s3://bucket/a.py"]
+        )
+    assert graphs == {
+        "s3://bucket/a.py": "s3://bucket/a.py",
+        "s3://bucket/b.py": "s3://bucket/b.py",
+    }
+    assert get_dataflow_graph.call_count == 2
+
+
 def test_platform_config():
     source = GlueSource(
         ctx=PipelineContext(run_id="glue-source-test"),
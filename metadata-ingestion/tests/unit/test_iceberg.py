@@ -1,4 +1,6 @@
+from collections import Counter
 from typing import Any, Optional
+from unittest.mock import MagicMock, patch
 
 import pytest
 from iceberg.api import types as IcebergTypes
@@ -8,6 +10,14 @@ from datahub.configuration.common import ConfigurationError
 from datahub.ingestion.api.common import PipelineContext
 from datahub.ingestion.source.azure.azure_common import AdlsSourceConfig
 from datahub.ingestion.source.iceberg.iceberg import IcebergSource, IcebergSourceConfig
+from datahub.ingestion.source.iceberg.iceberg_common import (
+    IcebergProfilingConfig,
+    IcebergSourceReport,
+)
+from datahub.ingestion.source.iceberg.iceberg_profiler import (
+    IcebergProfiler,
+    ManifestStats,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.schema import ArrayType, SchemaField
 from datahub.metadata.schema_classes import (
     ArrayTypeClass,
@@ -403,3 +413,58 @@ def test_avro_decimal_bytes_nullable():
     print(
         f"After avro parsing, _nullable attribute is preserved:  {boolean_avro_schema}"
     )
+
+
+def test_profiler_aggregates_manifest_stats(tmp_path):
+    manifest_stats = {
+        "manifest-1.avro": ManifestStats(
+            record_count=10,
+            null_counts=Counter({1: 2, 2: 1}),
+            min_bounds={1: 5},
+            max_bounds={1: 50},
+        ),
+        "manifest-2.avro": ManifestStats(
+            record_count=20,
+            null_counts=Counter({1: 3}),
+            min_bounds={1: 1, 2: 7},
+            max_bounds={1: 40, 2: 70},
+        ),
+    }
+    manifests = []
+    for path in manifest_stats:
+        manifest = MagicMock()
+        manifest.manifest_path = path
+        manifests.append(manifest)
+    table = MagicMock()
+    table.schema.return_value._id_to_name = {}
+
+    def profile(report: IcebergSourceReport) -> ManifestStats:
+        profiler = IcebergProfiler(
+            report,
+            IcebergProfilingConfig(
+                enabled=True,
+                max_workers=2,
+                manifest_stats_cache_path=str(tmp_path / "manifest_stats.db"),
+            ),
+        )
+        with patch.object(
+            profiler,
+            "_read_manifest_stats",
+            side_effect=lambda table, manifest, numeric_fields: manifest_stats[
+                manifest.manifest_path
+            ],
+        ):
+            return profiler._aggregate_manifest_stats(table, manifests)
+
+    report = IcebergSourceReport()
+    stats = profile(report)
+    assert stats.record_count == 30
+    assert stats.null_counts == {1: 5, 2: 1}
+    assert stats.min_bounds == {1: 1, 2: 7}
+    assert stats.max_bounds == {1: 50, 2: 70}
+    assert (report.manifests_read, report.manifests_cached) == (2, 0)
+
+    # A later run reuses the stats of the manifests it already read.
+    report = IcebergSourceReport()
+    assert profile(report) == stats
+    assert (report.manifests_read, report.manifests_cached) == (0, 2)
@@ -1,15 +1,25 @@
+import threading
 import unittest
+from unittest.mock import MagicMock
 
 import pydantic
 import pytest
+from confluent_kafka.schema_registry.avro import AvroSerializer
+from confluent_kafka.serialization import MessageField, SerializationContext
 
+import datahub.emitter.mce_builder as builder
 from datahub.emitter.kafka_emitter import (
     DEFAULT_MCE_KAFKA_TOPIC,
     DEFAULT_MCP_KAFKA_TOPIC,
     MCE_KEY,
     MCP_KEY,
+    AvroValueSerializer,
+    DatahubKafkaEmitter,
     KafkaEmitterConfig,
 )
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.metadata.schema_classes import StatusClass
+from datahub.metadata.schemas import getMetadataChangeProposalSchema
 
 
 class KafkaEmitterTest(unittest.TestCase):
@@ -46,3 +56,51 @@ class KafkaEmitterTest(unittest.TestCase):
         assert (
             emitter_config.topic_routes[MCP_KEY] == DEFAULT_MCP_KAFKA_TOPIC
         )  # No change to MCP
+
+
+def test_avro_value_serializer_matches_avro_serializer():
+    schema_registry_client = MagicMock()
+    schema_registry_client.register_schema.return_value = 42
+    mcp = MetadataChangeProposalWrapper(
+        entityUrn=builder.make_dataset_urn("hive", "db.table"),
+        aspect=StatusClass(removed=False),
+    )
+
+    avro_serializer = AvroSerializer(
+        schema_str=getMetadataChangeProposalSchema(),
+        schema_registry_client=schema_registry_client,
+        to_dict=lambda obj, ctx: obj.to_obj(tuples=True),
+    )
+    expected = avro_serializer(
+        mcp,
+        SerializationContext(DEFAULT_MCP_KAFKA_TOPIC, MessageField.VALUE),
+    )
+
+    serializer = AvroValueSerializer(
+        schema_registry_client,
+        getMetadataChangeProposalSchema(),
+        DEFAULT_MCP_KAFKA_TOPIC,
+    )
+    assert serializer.schema_id == 42
+    assert serializer(mcp.to_obj(tuples=True)) == expected
+    subject = schema_registry_client.register_schema.call_args[0][0]
+    assert subject == f"{DEFAULT_MCP_KAFKA_TOPIC}-value"
+
+
+def test_poll_loop_survives_callback_errors():
+    emitter = DatahubKafkaEmitter.__new__(DatahubKafkaEmitter)
+    emitter._closed = threading.Event()
+
+    def poll(timeout: float) -> None:
+        if producer.poll.call_count == 1:
+            # poll() re-raises the exceptions raised by the delivery callbacks.
+            raise RuntimeError("callback failed")
+        emitter._closed.set()
+
+    producer = MagicMock()
+    producer.poll.side_effect = poll
+    emitter.producers = {MCP_KEY: producer}
+
+    emitter._poll_loop()
+
+    assert producer.poll.call_count == 2
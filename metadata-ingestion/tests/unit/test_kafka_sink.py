@@ -1,10 +1,12 @@
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 from unittest.mock import MagicMock, call, patch
 
 import datahub.emitter.mce_builder as builder
 import datahub.metadata.schema_classes as models
-from datahub.emitter.kafka_emitter import MCE_KEY
+from datahub.emitter.kafka_emitter import MCE_KEY, MCP_KEY
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
 from datahub.ingestion.api.sink import SinkReport, WriteCallback
@@ -107,6 +109,54 @@ class KafkaSinkTest(unittest.TestCase):
         kafka_sink.close()
         mock_producer_instance.flush.assert_has_calls([call(), call()])
 
+    @patch("datahub.emitter.kafka_emitter.SchemaRegistryClient", autospec=True)
+    @patch("datahub.emitter.kafka_emitter.Producer", autospec=True)
+    def test_kafka_sink_high_throughput(self, mock_producer, mock_schema_registry):
+        mock_schema_registry.return_value.register_schema.return_value = 1
+        # The background thread polls for delivery reports.
+        mock_producer.return_value.poll.side_effect = time.sleep
+        callback = MagicMock(spec=WriteCallback)
+        kafka_sink = DatahubKafkaSink.create(
+            {
+                "connection": {
+                    "bootstrap": "foobar:9092",
+                    "producer_config": {"linger.ms": 5},
+                },
+                "high_throughput": True,
+                "serialization_workers": 2,
+            },
+            PipelineContext(run_id="test"),
+        )
+        producer_config = mock_producer.call_args[0][0]
+        assert producer_config["linger.ms"] == 5
+        assert producer_config["compression.type"] == "lz4"
+
+        mock_producer_instance = kafka_sink.emitter.producers[MCP_KEY]
+        urns = [builder.make_dataset_urn("hive", f"db.table_{i}") for i in range(10)]
+        for urn in urns:
+            kafka_sink.write_record_async(
+                RecordEnvelope(
+                    record=MetadataChangeProposalWrapper(
+                        entityUrn=urn, aspect=models.StatusClass(removed=False)
+                    ),
+                    metadata={},
+                ),
+                callback,
+            )
+            kafka_sink.handle_work_unit_end(MagicMock())
+        kafka_sink.close()
+
+        # The records are produced in order, already serialized, and without
+        # flushing after every workunit.
+        produced = mock_producer_instance.produce.call_args_list
+        assert [kwargs["key"] for _, kwargs in produced] == [
+            urn.encode("utf-8") for urn in urns
+        ]
+        assert all(isinstance(kwargs["value"], bytes) for _, kwargs in produced)
+        assert mock_producer_instance.flush.call_count == len(
+            kafka_sink.emitter.producers
+        )
+
     @patch("datahub.ingestion.sink.datahub_kafka.RecordEnvelope", autospec=True)
     @patch("datahub.ingestion.sink.datahub_kafka.WriteCallback", autospec=True)
     def test_kafka_callback_class(self, mock_w_callback, mock_re):
@@ -122,3 +172,27 @@ class KafkaSinkTest(unittest.TestCase):
         callback.kafka_callback(None, mock_message)
         mock_w_callback.on_success.assert_called_once()
         assert mock_w_callback.on_success.call_args[0][0] == mock_re
+
+    def test_kafka_callbacks_from_delivery_threads(self):
+        # In the high throughput mode, delivery reports are served by the poller
+        # thread while the main thread keeps submitting records.
+        report = SinkReport()
+        callbacks = [
+            _KafkaCallback(
+                report,
+                record_envelope=MagicMock(),
+                write_callback=MagicMock(spec=WriteCallback),
+            )
+            for _ in range(1000)
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(
+                executor.map(
+                    lambda callback: callback.kafka_callback(None, "message"),
+                    callbacks,
+                )
+            )
+        assert report.pending_requests == 0
+        assert report.total_records_written == 1000
+        assert report.write_latency_seconds.count == 1000
+        assert report.bytes_sent == 1000 * len("message")
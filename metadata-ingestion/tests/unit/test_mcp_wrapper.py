@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 import datahub.metadata.schema_classes as models
@@ -33,3 +35,35 @@ def test_mcpw_from_obj():
 
     assert isinstance(mcpw2, MetadataChangeProposalWrapper)
     assert mcpw == mcpw2
+
+
+def test_mcpw_to_obj_simplified_structure():
+    mcpw = MetadataChangeProposalWrapper(
+        entityUrn="urn:li:dataset:(urn:li:dataPlatform:bigquery,harshal-playground-306419.test_schema.excess_deaths_derived,PROD)",
+        aspect=models.SchemaMetadataClass(
+            schemaName="excess_deaths_derived",
+            platform="urn:li:dataPlatform:bigquery",
+            version=0,
+            hash="",
+            platformSchema=models.MySqlDDLClass(tableSchema=""),
+            fields=[
+                models.SchemaFieldClass(
+                    fieldPath="deaths",
+                    type=models.SchemaFieldDataTypeClass(type=models.NumberTypeClass()),
+                    nativeDataType="INT64",
+                    description=None,
+                )
+            ],
+        ),
+    )
+
+    # The simplified structure is the same as unpacking the JSON string of the
+    # serialized aspect.
+    expected = mcpw.to_obj()
+    expected["aspect"] = {"json": json.loads(expected["aspect"]["value"])}
+    assert mcpw.to_obj(simplified_structure=True) == expected
+
+    assert (
+        MetadataChangeProposalWrapper.from_obj(mcpw.to_obj(simplified_structure=True))
+        == mcpw
+    )
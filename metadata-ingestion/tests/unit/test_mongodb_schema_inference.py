@@ -0,0 +1,50 @@
+from datahub.ingestion.source.mongodb import construct_schema_from_type_counts
+from datahub.ingestion.source.schema_inference.object import construct_schema
+
+
+def test_construct_schema_from_stream():
+    documents = (
+        {
+            "name": f"name_{i}",
+            "score": i if i % 2 else float(i),
+            "address": {"city": "city", "zip": None if i % 3 else i},
+            "tags": [{"key": "key", "value": i}] if i % 4 else [],
+        }
+        for i in range(10)
+    )
+
+    schema = construct_schema(documents, delimiter=".")
+
+    assert schema[("name",)]["type"] == str
+    assert not schema[("name",)]["nullable"]
+    assert schema[("score",)]["type"] == float
+    assert schema[("address", "city")]["delimited_name"] == "address.city"
+    assert not schema[("address", "city")]["nullable"]
+    assert schema[("address", "zip")]["count"] == 4
+    assert schema[("address", "zip")]["nullable"]
+    # empty lists count as nullable
+    assert schema[("tags", "key")]["nullable"]
+    assert schema[("tags", "key")]["count"] == 7
+
+
+def test_construct_schema_from_type_counts():
+    schema = construct_schema_from_type_counts(
+        10,
+        [
+            {"_id": {"name": "_id", "type": "objectId"}, "count": 10},
+            {"_id": {"name": "score", "type": "int"}, "count": 6},
+            {"_id": {"name": "score", "type": "double"}, "count": 4},
+            {"_id": {"name": "value", "type": "string"}, "count": 5},
+            {"_id": {"name": "value", "type": "bool"}, "count": 2},
+            {"_id": {"name": "value", "type": "null"}, "count": 3},
+            {"_id": {"name": "always_null", "type": "null"}, "count": 10},
+        ],
+    )
+
+    assert set(schema) == {("_id",), ("score",), ("value",)}
+    assert not schema[("_id",)]["nullable"]
+    assert schema[("score",)]["type"] == float
+    assert not schema[("score",)]["nullable"]
+    assert schema[("value",)]["type"] == "mixed"
+    assert schema[("value",)]["count"] == 7
+    assert schema[("value",)]["nullable"]
@@ -1,4 +1,5 @@
-from typing import Any, Iterable, List, Optional, cast
+import json
+from typing import Any, Dict, Iterable, List, Optional, cast
 from unittest.mock import patch
 
 import pytest
@@ -7,6 +8,7 @@ from freezegun import freeze_time
 from datahub.configuration.common import DynamicTypedConfig
 from datahub.ingestion.api.committable import CommitPolicy, Committable
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
+from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -311,6 +313,74 @@ class TestPipeline(object):
             else:
                 mock_commit.assert_not_called()
 
+    @freeze_time(FROZEN_TIME)
+    def test_print_progress_as_json(self, capsys):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.test_pipeline.FakeSourceWithWarnings"},
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "progress_format": "json",
+            }
+        )
+        pipeline.run()
+        capsys.readouterr()
+
+        # The progress only reads counters, and does not render the full reports.
+        with patch.object(SourceReport, "as_obj") as mock_as_obj:
+            pipeline._print_progress()
+            mock_as_obj.assert_not_called()
+
+        progress = json.loads(capsys.readouterr().out)
+        assert progress["run_id"] == "pipeline_test"
+        assert progress["records_written"] == 1
+        assert progress["failures"] == 0
+        assert progress["warnings"] >= 1
+
+    @freeze_time(FROZEN_TIME)
+    def test_structured_report_only_built_for_progress_reporters(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.test_pipeline.FakeSource"},
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+            }
+        )
+        pipeline.reporters = [FakeReporter()]
+        with patch.object(
+            Pipeline, "_get_structured_report", return_value={}
+        ) as mock_get_structured_report:
+            pipeline._notify_reporters_on_ingestion_progress()
+            mock_get_structured_report.assert_not_called()
+
+            progress_reporter = FakeProgressReporter()
+            pipeline.reporters.append(progress_reporter)
+            pipeline._notify_reporters_on_ingestion_progress()
+            mock_get_structured_report.assert_called_once()
+            assert progress_reporter.reports == [{}]
+
+
+class FakeReporter(PipelineRunListener):
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "FakeReporter":
+        return cls()
+
+    def on_start(self, ctx: PipelineContext) -> None:
+        pass
+
+    def on_completion(
+        self, status: str, report: Dict[str, Any], ctx: PipelineContext
+    ) -> None:
+        pass
+
+
+class FakeProgressReporter(FakeReporter):
+    def __init__(self) -> None:
+        self.reports: List[Dict[str, Any]] = []
+
+    def on_progress(self, report: Dict[str, Any], ctx: PipelineContext) -> None:
+        self.reports.append(report)
+
 
 class AddStatusRemovedTransformer(Transformer):
     @classmethod
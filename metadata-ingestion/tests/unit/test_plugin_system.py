@@ -51,7 +51,7 @@ from tests.test_helpers.click_helpers import run_datahub_cmd
                 "pattern_add_dataset_schema_tags",
             ],
         ),
-        (reporting_provider_registry, ["datahub", "file"]),
+        (reporting_provider_registry, ["datahub", "file", "prometheus"]),
         (ingestion_checkpoint_provider_registry, ["datahub"]),
         (lite_registry, ["duckdb"]),
     ],
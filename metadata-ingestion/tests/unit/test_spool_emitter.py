@@ -0,0 +1,102 @@
+import contextlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.spool_emitter import DatahubSpoolEmitter
+from datahub.metadata.schema_classes import StatusClass
+
+_URN = "urn:li:dataset:(urn:li:dataPlatform:hive,SampleHiveDataset,PROD)"
+
+
+class _RecordingEmitter:
+    def __init__(self, fail: bool = False, delay_sec: float = 0) -> None:
+        self.fail = fail
+        self.delay_sec = delay_sec
+        self.items: List[Any] = []
+
+    def emit(self, item: Any, callback: Optional[Any] = None) -> None:
+        time.sleep(self.delay_sec)
+        if self.fail:
+            raise ConnectionError("DataHub is unavailable")
+        self.items.append(item)
+
+
+def _count_spooled(spool_path: str) -> int:
+    with contextlib.closing(sqlite3.connect(spool_path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+
+
+def test_spool_emitter_sends_spooled_items(tmp_path: Path) -> None:
+    spool_path = str(tmp_path / "spool.db")
+    recording_emitter = _RecordingEmitter()
+    emitter = DatahubSpoolEmitter(lambda: recording_emitter, spool_path, batch_size=2)
+
+    for removed in (False, True, False):
+        emitter.emit(
+            MetadataChangeProposalWrapper(
+                entityUrn=_URN, aspect=StatusClass(removed=removed)
+            )
+        )
+    emitter.close()
+
+    assert _count_spooled(spool_path) == 0
+    assert [(item.entityUrn, item.aspectName) for item in recording_emitter.items] == [
+        (_URN, "status")
+    ] * 3
+
+
+def test_spool_emitter_keeps_failed_items(tmp_path: Path) -> None:
+    spool_path = str(tmp_path / "spool.db")
+    emitter = DatahubSpoolEmitter(
+        lambda: _RecordingEmitter(fail=True), spool_path, flush_timeout_sec=0.5
+    )
+    emitter.emit(MetadataChangeProposalWrapper(entityUrn=_URN, aspect=StatusClass()))
+    emitter.close()
+    assert _count_spooled(spool_path) == 1
+
+    # The next emitter using the spool sends the items left behind, once their retry
+    # interval has passed.
+    with contextlib.closing(sqlite3.connect(spool_path)) as conn:
+        conn.execute("UPDATE spool SET available_at = 0")
+        conn.commit()
+    recording_emitter = _RecordingEmitter()
+    make_emitter = MagicMock(return_value=recording_emitter)
+    emitter = DatahubSpoolEmitter(make_emitter, spool_path)
+    emitter.close()
+
+    assert _count_spooled(spool_path) == 0
+    assert len(recording_emitter.items) == 1
+    make_emitter.assert_called_once()
+
+
+def test_spool_emitter_close_respects_flush_timeout(tmp_path: Path) -> None:
+    spool_path = str(tmp_path / "spool.db")
+    recording_emitter = _RecordingEmitter(delay_sec=0.1)
+    make_emitter = MagicMock(return_value=recording_emitter)
+    emitter = DatahubSpoolEmitter(make_emitter, spool_path, flush_timeout_sec=0.5)
+    for _ in range(40):
+        emitter.emit(
+            MetadataChangeProposalWrapper(entityUrn=_URN, aspect=StatusClass())
+        )
+
+    start = time.time()
+    emitter.close()
+
+    assert time.time() - start < 1.5
+    make_emitter.assert_called_once()
+    # The items that could not be sent in time stay in the spool, and are available
+    # to the next emitter right away.
+    pending = _count_spooled(spool_path)
+    assert pending > 0
+    assert pending + len(recording_emitter.items) >= 40
+    with contextlib.closing(sqlite3.connect(spool_path)) as conn:
+        assert (
+            conn.execute(
+                "SELECT COUNT(*) FROM spool WHERE attempts > 0 OR available_at > 0"
+            ).fetchone()[0]
+            == 0
+        )
@@ -1,8 +1,12 @@
-from typing import Dict
+import collections
+import pathlib
+from typing import Dict, List
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.pool import QueuePool
 
 from datahub.ingestion.source.sql.sql_common import (
     PipelineContext,
@@ -13,8 +17,10 @@ from datahub.ingestion.source.sql.sql_config import SQLAlchemyConfig
 
 
 class _TestSQLAlchemyConfig(SQLAlchemyConfig):
+    sqlalchemy_uri: str = ""
+
     def get_sql_alchemy_url(self):
-        pass
+        return self.sqlalchemy_uri
 
 
 class _TestSQLAlchemySource(SQLAlchemySource):
@@ -103,3 +109,43 @@ PLATFORM_FROM_SQLALCHEMY_URI_TEST_CASES: Dict[str, str] = {
 def test_get_platform_from_sqlalchemy_uri(uri: str, expected_platform: str) -> None:
     platform: str = get_platform_from_sqlalchemy_uri(uri)
     assert platform == expected_platform
+
+
+def _workunits_by_urn(source: SQLAlchemySource) -> Dict[str, List[str]]:
+    workunits: Dict[str, List[str]] = collections.defaultdict(list)
+    for wu in source.get_workunits_internal():
+        workunits[wu.get_urn()].append(wu.id)
+    return workunits
+
+
+def test_parallel_extraction_matches_sequential_extraction(
+    tmp_path: pathlib.Path,
+) -> None:
+    uri = f"sqlite:///{tmp_path / 'test.db'}"
+    with create_engine(uri).connect() as conn:
+        for i in range(20):
+            conn.execute(f"CREATE TABLE table_{i} (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.execute(f"CREATE VIEW view_{i} AS SELECT name FROM table_{i}")
+
+    def run(max_workers: int) -> SQLAlchemySource:
+        config = _TestSQLAlchemyConfig(
+            sqlalchemy_uri=uri,
+            max_workers=max_workers,
+            # SQLite uses a NullPool by default, and checks that a connection is
+            # only used by the thread that created it.
+            options={
+                "poolclass": QueuePool,
+                "connect_args": {"check_same_thread": False},
+            },
+        )
+        return _TestSQLAlchemySource(
+            config=config, ctx=PipelineContext(run_id="test_ctx"), platform="sqlite"
+        )
+
+    sequential = run(max_workers=1)
+    parallel = run(max_workers=4)
+
+    assert _workunits_by_urn(parallel) == _workunits_by_urn(sequential)
+    assert parallel.report.tables_scanned == sequential.report.tables_scanned == 20
+    assert parallel.report.views_scanned == sequential.report.views_scanned == 20
+    assert not parallel.report.warnings and not parallel.report.failures
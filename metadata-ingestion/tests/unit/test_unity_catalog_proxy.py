@@ -0,0 +1,137 @@
+import datetime
+from typing import Any, Dict, List
+from unittest import mock
+
+from datahub.ingestion.source.unity.proxy import (
+    Catalog,
+    Column,
+    Metastore,
+    Schema,
+    Table,
+    UnityCatalogApiProxy,
+)
+from datahub.ingestion.source.unity.report import UnityCatalogReport
+
+UPSTREAM_TABLES: Dict[str, List[Dict[str, str]]] = {
+    "main.default.orders": [
+        {"catalog_name": "main", "schema_name": "default", "name": "raw_orders"}
+    ],
+    "main.default.raw_orders": [],
+}
+
+
+def _table(name: str, updated_at: datetime.datetime) -> Table:
+    metastore = Metastore(
+        id="metastore",
+        name="metastore",
+        type="Metastore",
+        comment=None,
+        metastore_id="1",
+    )
+    catalog = Catalog(
+        id="metastore.main",
+        name="main",
+        type="Catalog",
+        comment=None,
+        metastore=metastore,
+    )
+    schema = Schema(
+        id="metastore.main.default",
+        name="default",
+        type="Schema",
+        comment=None,
+        catalog=catalog,
+    )
+    return Table(
+        id=f"metastore.main.default.{name}",
+        name=name,
+        type="table",
+        comment=None,
+        schema=schema,
+        columns=[
+            Column(
+                id=f"metastore.main.default.{name}.{column}",
+                name=column,
+                type="Column",
+                comment=None,
+                type_text="string",
+                type_name=mock.MagicMock(),
+                type_precision=0,
+                type_scale=0,
+                position=position,
+                nullable=True,
+            )
+            for position, column in enumerate(["id", "amount"])
+        ],
+        storage_location=None,
+        data_source_format=None,
+        table_type="MANAGED",
+        owner="owner",
+        generation=1,
+        created_at=updated_at,
+        created_by="owner",
+        updated_at=updated_at,
+        updated_by="owner",
+        table_id=f"id-{name}",
+        view_definition=None,
+        properties={},
+    )
+
+
+def _proxy(report: UnityCatalogReport, **kwargs: Any) -> UnityCatalogApiProxy:
+    with mock.patch("datahub.ingestion.source.unity.proxy.UnityCatalogApi"):
+        proxy = UnityCatalogApiProxy(
+            "https://dummy.cloud.databricks.com", "fake", report=report, **kwargs
+        )
+
+    def list_lineages_by_table(table_name: str) -> dict:
+        return {"upstream_tables": UPSTREAM_TABLES[table_name]}
+
+    def list_lineages_by_column(table_name: str, column_name: str) -> dict:
+        return {
+            "upstream_cols": [
+                {
+                    "catalog_name": "main",
+                    "schema_name": "default",
+                    "table_name": "raw_orders",
+                    "name": column_name,
+                }
+            ]
+        }
+
+    proxy.list_lineages_by_table = list_lineages_by_table  # type: ignore[assignment]
+    proxy.list_lineages_by_column = list_lineages_by_column  # type: ignore[assignment]
+    return proxy
+
+
+def test_column_lineage_only_requested_for_tables_with_upstreams(tmp_path):
+    updated_at = datetime.datetime(2023, 1, 1)
+    cache_path = str(tmp_path / "lineage.db")
+
+    report = UnityCatalogReport()
+    proxy = _proxy(report, lineage_cache_path=cache_path)
+    orders = _table("orders", updated_at)
+    raw_orders = _table("raw_orders", updated_at)
+    proxy.get_column_lineage(orders)
+    proxy.get_column_lineage(raw_orders)
+
+    expected_upstreams = {
+        "main.default.raw_orders": {"id": ["id"], "amount": ["amount"]}
+    }
+    assert orders.upstreams == expected_upstreams
+    assert raw_orders.upstreams == {}
+    assert report.num_table_lineage_requests == 2
+    assert report.num_column_lineage_requests == 2
+
+    # A later run reads the lineage of the tables that were not updated from the cache.
+    report = UnityCatalogReport()
+    proxy = _proxy(report, lineage_cache_path=cache_path)
+    orders = _table("orders", updated_at)
+    updated_raw_orders = _table("raw_orders", updated_at + datetime.timedelta(days=1))
+    proxy.get_column_lineage(orders)
+    proxy.get_column_lineage(updated_raw_orders)
+
+    assert orders.upstreams == expected_upstreams
+    assert report.num_lineage_cache_hits == 1
+    assert report.num_table_lineage_requests == 1
+    assert report.num_column_lineage_requests == 0
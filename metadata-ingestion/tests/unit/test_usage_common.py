@@ -1,4 +1,5 @@
-from datetime import datetime
+import collections
+from datetime import datetime, timedelta
 from unittest import mock
 
 import pytest
@@ -11,6 +12,7 @@ from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.usage.usage_common import (
     BaseUsageConfig,
+    ColumnarUsageAggregator,
     GenericAggregatedDataset,
 )
 from datahub.metadata.schema_classes import DatasetUsageStatisticsClass
@@ -277,3 +279,44 @@ def test_make_usage_workunit_include_top_n_queries():
     du: DatasetUsageStatisticsClass = wu.get_metadata()["metadata"].aspect
     assert du.totalSqlQueries == 1
     assert du.topSqlQueries is None
+
+
+def test_columnar_aggregation_matches_row_by_row_aggregation():
+    user_email_pattern = AllowDenyPattern(deny=["denied@test.com"])
+    users = ["a@test.com", "b@test.com", "denied@test.com"]
+    resources = ["db.schema.t1", "db.schema.t2", "db.schema.t3"]
+    events = [
+        (
+            datetime(2020, 1, 1) + timedelta(hours=7 * i),
+            resources[i % 3],
+            users[i % 5 % 3],
+            f"select {i % 4} from test" if i % 6 else None,
+            [f"col{j}" for j in range(i % 4)],
+        )
+        for i in range(100)
+    ]
+
+    expected = collections.defaultdict(dict)
+    for timestamp, resource, user, query, fields in events:
+        floored_ts = get_time_bucket(timestamp, BucketDuration.DAY)
+        expected[floored_ts].setdefault(
+            resource,
+            _TestAggregatedDataset(bucket_start_time=floored_ts, resource=resource),
+        ).add_read_entry(user, query, fields, user_email_pattern=user_email_pattern)
+
+    aggregator: ColumnarUsageAggregator[_TestTableRef] = ColumnarUsageAggregator(
+        BucketDuration.DAY, user_email_pattern=user_email_pattern, batch_size=30
+    )
+    for event in events[:50]:
+        aggregator.add_read_entry(*event)
+    aggregator.add_batch(*(list(column) for column in zip(*events[50:])))
+    actual = aggregator.get_aggregated_datasets()
+
+    assert actual == expected
+    for bucket, datasets in expected.items():
+        for resource, dataset in datasets.items():
+            assert actual[bucket][resource].make_usage_workunit(
+                BucketDuration.DAY, _simple_urn_builder, 10, False, True
+            ) == dataset.make_usage_workunit(
+                BucketDuration.DAY, _simple_urn_builder, 10, False, True
+            )
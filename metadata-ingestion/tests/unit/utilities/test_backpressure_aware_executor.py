@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Iterator, List, Tuple
+
+from datahub.utilities.backpressure_aware_executor import (
+    AdaptiveConcurrencyLimiter,
+    BackpressureAwareExecutor,
+)
+
+
+class _Tracker:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def task(self, x: int, y: int) -> int:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.01)
+        with self.lock:
+            self.running -= 1
+        return x + y
+
+
+def test_backpressure_aware_executor_bounds_pending_calls() -> None:
+    tracker = _Tracker()
+    submitted: List[int] = []
+
+    def args() -> Iterator[Tuple[int, int]]:
+        for i in range(20):
+            submitted.append(i)
+            yield i, i
+
+    results = []
+    for future in BackpressureAwareExecutor.map(
+        tracker.task, args(), max_workers=4, max_pending=2
+    ):
+        # Arguments are only consumed as results are consumed: at most max_pending
+        # calls are outstanding, plus the next argument waiting to be submitted.
+        assert len(submitted) - len(results) <= 3
+        results.append(future.result())
+
+    assert sorted(results) == [2 * i for i in range(20)]
+    assert tracker.max_running <= 2
+
+
+def test_backpressure_aware_executor_respects_concurrency_limiter() -> None:
+    tracker = _Tracker()
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8)
+    limiter.on_throttled()
+    limiter.on_throttled()
+    assert limiter.limit == 2
+
+    results = [
+        future.result()
+        for future in BackpressureAwareExecutor.map(
+            tracker.task,
+            ((i, 1) for i in range(3)),
+            max_workers=8,
+            concurrency_limiter=limiter,
+        )
+    ]
+
+    assert sorted(results) == [1, 2, 3]
+    assert tracker.max_running <= 2
+    assert limiter.limit == 3
+
+
+def test_adaptive_concurrency_limiter() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4, min_concurrency=2)
+    for _ in range(3):
+        limiter.on_throttled()
+    assert limiter.limit == 2
+    assert limiter.throttled_calls == 3
+
+    for _ in range(2):
+        limiter.on_success()
+    assert limiter.limit == 3
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.limit == 4
+
+
+def test_adaptive_concurrency_limiter_slot() -> None:
+    tracker = _Tracker()
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=2)
+
+    def task() -> None:
+        with limiter.slot():
+            tracker.task(0, 0)
+
+    threads = [threading.Thread(target=task) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tracker.max_running == 2
+
+    # All the slots wait for the Retry-After delay of a throttled call.
+    limiter.on_throttled(retry_after_sec=0.2)
+    assert limiter.limit == 1
+    start = time.perf_counter()
+    with limiter.slot():
+        pass
+    assert time.perf_counter() - start >= 0.15
+
+
+def test_backpressure_aware_executor_map_ordered() -> None:
+    tracker = _Tracker()
+
+    def slow_first(x: int) -> int:
+        time.sleep(0.05 if x == 0 else 0)
+        return tracker.task(x, x)
+
+    results = [
+        future.result()
+        for future in BackpressureAwareExecutor.map_ordered(
+            slow_first, ((i,) for i in range(20)), max_workers=4, max_pending=3
+        )
+    ]
+
+    assert results == [2 * i for i in range(20)]
+    assert tracker.max_running <= 3
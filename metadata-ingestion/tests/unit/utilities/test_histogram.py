@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from datahub.utilities.histogram import Histogram
+
+
+def test_histogram_quantiles() -> None:
+    values = [random.lognormvariate(0, 2) for _ in range(10_000)] + [0.0] * 100
+    histogram = Histogram(relative_accuracy=0.01)
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    for q in [0.0, 0.01, 0.5, 0.95, 0.99, 1.0]:
+        expected = values[int(q * (len(values) - 1))]
+        assert histogram.quantile(q) == pytest.approx(expected, rel=0.01)
+
+    assert histogram.count == len(values)
+    assert histogram.max == values[-1]
+    assert histogram.as_obj().keys() == {
+        "count",
+        "sum",
+        "mean",
+        "p50",
+        "p95",
+        "p99",
+        "max",
+    }
+
+
+def test_histogram_empty() -> None:
+    histogram = Histogram()
+    assert histogram.quantile(0.5) is None
+    assert histogram.as_obj()["p99"] is None
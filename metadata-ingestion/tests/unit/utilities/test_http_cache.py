@@ -0,0 +1,152 @@
+import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from datahub.configuration.http_cache import HttpCacheConfig, HttpCacheMode
+from datahub.utilities.http_cache import HttpCacheMissError, mount_http_cache
+
+
+class FakeServer:
+    def __init__(self, delay: float = 0.0, status_code: int = 200) -> None:
+        self.requests: List[requests.PreparedRequest] = []
+        self.delay = delay
+        self.status_code = status_code
+        self._lock = threading.Lock()
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        with self._lock:
+            self.requests.append(request)
+        time.sleep(self.delay)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = request.url or ""
+        response.headers["Content-Type"] = "application/json"
+        response.headers["Set-Cookie"] = "session=secret"
+        response._content = f'{{"count": {len(self.requests)}}}'.encode()
+        response.request = request
+        return response
+
+
+def _session(
+    tmp_path: pathlib.Path, namespace: Optional[str] = None, **config: Any
+) -> requests.Session:
+    session = requests.Session()
+    mount_http_cache(
+        session,
+        HttpCacheConfig(path=str(tmp_path / "cache.db"), **config),
+        namespace=namespace,
+    )
+    return session
+
+
+def test_http_cache_hit_ignores_auth_in_namespace(tmp_path: pathlib.Path) -> None:
+    server = FakeServer()
+    session = _session(tmp_path, namespace="tenant")
+    with patch.object(HTTPAdapter, "send", server.send):
+        first = session.get(
+            "https://api.example.com/items?b=2&a=1&access_token=one",
+            headers={"Authorization": "Bearer one"},
+        )
+        second = session.get(
+            "https://api.example.com/items?a=1&b=2&access_token=two",
+            headers={"Authorization": "Bearer two"},
+        )
+        other = session.get("https://api.example.com/items?a=2")
+
+    assert len(server.requests) == 2
+    assert first.json() == second.json() == {"count": 1}
+    assert other.json() == {"count": 2}
+    assert "Set-Cookie" not in second.headers
+
+    # Another tenant doesn't see the responses of the first one.
+    with patch.object(HTTPAdapter, "send", server.send):
+        _session(tmp_path, namespace="other-tenant").get(
+            "https://api.example.com/items?a=1&b=2"
+        )
+    assert len(server.requests) == 3
+
+
+def test_http_cache_keyed_by_credentials(tmp_path: pathlib.Path) -> None:
+    server = FakeServer()
+    session = _session(tmp_path)
+    with patch.object(HTTPAdapter, "send", server.send):
+        first = session.get(
+            "https://api.example.com/items", headers={"Authorization": "Bearer one"}
+        )
+        second = session.get(
+            "https://api.example.com/items", headers={"Authorization": "Bearer one"}
+        )
+        other = session.get(
+            "https://api.example.com/items", headers={"Authorization": "Bearer two"}
+        )
+        session.get("https://api.example.com/items?access_token=three")
+
+    assert len(server.requests) == 3
+    assert first.json() == second.json() == {"count": 1}
+    assert other.json() == {"count": 2}
+
+
+def test_http_cache_persists_and_replays(tmp_path: pathlib.Path) -> None:
+    server = FakeServer()
+    with patch.object(HTTPAdapter, "send", server.send):
+        _session(tmp_path, mode=HttpCacheMode.RECORD).get("https://api.example.com/a")
+
+    replay = _session(tmp_path, mode="replay")
+    with patch.object(HTTPAdapter, "send", server.send):
+        assert replay.get("https://api.example.com/a").json() == {"count": 1}
+        with pytest.raises(HttpCacheMissError):
+            replay.get("https://api.example.com/b")
+    assert len(server.requests) == 1
+
+
+def test_http_cache_ttl_and_errors(tmp_path: pathlib.Path) -> None:
+    server = FakeServer(status_code=503)
+    session = _session(tmp_path, ttl_seconds=1)
+    with patch.object(HTTPAdapter, "send", server.send):
+        # Errors are never cached.
+        session.get("https://api.example.com/a")
+        session.get("https://api.example.com/a")
+        assert len(server.requests) == 2
+        server.status_code = 404
+        session.get("https://api.example.com/a")
+        session.get("https://api.example.com/a")
+        assert len(server.requests) == 4
+
+        server.status_code = 200
+        session.get("https://api.example.com/a")
+        session.get("https://api.example.com/a")
+        assert len(server.requests) == 5
+
+        with patch("time.time", return_value=time.time() + 10):
+            session.get("https://api.example.com/a")
+        assert len(server.requests) == 6
+
+        # POST is not cached by default.
+        session.post("https://api.example.com/a", json={})
+        session.post("https://api.example.com/a", json={})
+        assert len(server.requests) == 8
+
+
+def test_http_cache_dedups_in_flight_requests(tmp_path: pathlib.Path) -> None:
+    server = FakeServer(delay=0.2)
+    session = _session(tmp_path)
+    with patch.object(HTTPAdapter, "send", server.send), ThreadPoolExecutor(
+        max_workers=5
+    ) as executor:
+        responses = list(
+            executor.map(
+                lambda _: session.get("https://api.example.com/slow"), range(5)
+            )
+        )
+
+    assert len(server.requests) == 1
+    assert all(response.json() == {"count": 1} for response in responses)
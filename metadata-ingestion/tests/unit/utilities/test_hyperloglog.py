@@ -0,0 +1,16 @@
+import pytest
+
+from datahub.utilities.hyperloglog import HyperLogLog
+
+
+@pytest.mark.parametrize("num_distinct", [0, 10, 1000, 100_000])
+def test_hyperloglog_estimate(num_distinct: int) -> None:
+    sketch = HyperLogLog()
+    for i in range(num_distinct):
+        assert sketch.add(f"urn:li:corpuser:user{i}") or num_distinct > 10
+
+    # Adding values again never changes the sketch.
+    for i in range(num_distinct):
+        assert not sketch.add(f"urn:li:corpuser:user{i}")
+
+    assert len(sketch) == pytest.approx(num_distinct, rel=0.02)
@@ -0,0 +1,32 @@
+from datahub.utilities.lineage_accumulator import LineageAccumulator
+
+
+def test_lineage_accumulator() -> None:
+    lineage = LineageAccumulator[str, str](cache_max_size=5)
+
+    for i in range(100):
+        downstream = f"table_{i % 20}"
+        lineage.add_edge(downstream, f"upstream_{i}")
+        # Duplicated edges are only kept once.
+        lineage.add_edge(downstream, f"upstream_{i}")
+        lineage.add_column_edge(downstream, "column", f"upstream_{i}.column")
+
+    assert len(lineage) == 20
+    assert sorted(lineage) == sorted(f"table_{i}" for i in range(20))
+    assert lineage["table_3"] == {f"upstream_{i}" for i in range(3, 100, 20)}
+    assert lineage.get_column_edges("table_3") == {
+        "column": {f"upstream_{i}.column" for i in range(3, 100, 20)}
+    }
+
+    lineage.set_edges("table_3", ["upstream_3"])
+    assert lineage.get_edges("table_3") == {"upstream_3"}
+
+    assert "missing_table" not in lineage
+    assert lineage.get_edges("missing_table") == set()
+    assert lineage.get_column_edges("missing_table") == {}
+
+    assert sum(
+        len(table_lineage.edges) for _, table_lineage in lineage.table_lineages()
+    ) == (100 - 5 + 1)
+
+    lineage.close()
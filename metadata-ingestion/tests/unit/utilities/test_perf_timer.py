@@ -0,0 +1,38 @@
+import time
+from typing import Iterable, Iterator
+
+from datahub.utilities.perf_timer import StageTimer
+
+
+def _slow_range(n: int, delay: float) -> Iterator[int]:
+    for i in range(n):
+        time.sleep(delay)
+        yield i
+
+
+def _slow_double(items: Iterable[int], delay: float) -> Iterator[int]:
+    for item in items:
+        time.sleep(delay)
+        yield 2 * item
+
+
+def test_stage_timer_nested_iterators() -> None:
+    timer = StageTimer()
+    source = timer.time_iterator("source", _slow_range(5, 0.01))
+    doubled = timer.time_iterator("double", _slow_double(source, 0.02))
+    for _ in doubled:
+        with timer.time("sink"):
+            time.sleep(0.01)
+
+    stats = timer.as_obj()
+    assert list(stats.keys()) == ["source", "double", "sink"]
+
+    # Each stage only includes its own time, not the time of the stages it pulls from.
+    assert stats["source"]["calls"] == 6
+    assert 0.05 <= stats["source"]["wall_time_in_seconds"] < 0.1
+    assert stats["double"]["calls"] == 6
+    assert 0.1 <= stats["double"]["wall_time_in_seconds"] < 0.15
+    assert stats["sink"]["calls"] == 5
+    assert 0.05 <= stats["sink"]["wall_time_in_seconds"] < 0.1
+    # Sleeping does not use any CPU time.
+    assert stats["double"]["cpu_time_in_seconds"] < 0.05
@@ -0,0 +1,47 @@
+import email.utils
+import time
+
+import requests_mock
+
+from datahub.utilities.backpressure_aware_executor import AdaptiveConcurrencyLimiter
+from datahub.utilities.throttled_session import ThrottledSession, parse_retry_after
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("soon") is None
+
+    retry_at = email.utils.formatdate(time.time() + 30, usegmt=True)
+    retry_after = parse_retry_after(retry_at)
+    assert retry_after is not None and 25 <= retry_after <= 30
+
+
+def test_throttled_session_retries_throttled_requests() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+    session = ThrottledSession(limiter, max_attempts=3)
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(
+            "https://example.com/throttled",
+            [
+                {"status_code": 429, "headers": {"Retry-After": "0"}},
+                {"status_code": 200, "json": {"value": 1}},
+            ],
+        )
+        mocker.get(
+            "https://example.com/always-throttled",
+            status_code=429,
+            headers={"Retry-After": "0"},
+        )
+
+        response = session.get("https://example.com/throttled")
+        assert response.status_code == 200
+        assert response.json() == {"value": 1}
+        assert mocker.call_count == 2
+        assert limiter.throttled_calls == 1
+
+        response = session.get("https://example.com/always-throttled")
+        assert response.status_code == 429
+        assert mocker.call_count == 2 + 3